@@ -0,0 +1,56 @@
+"""Add (owner, created_at, id) indexes for keyset pagination
+
+Revision ID: 20261018_keyset_idx
+Revises: 57743a2ae4e1
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_keyset_idx"
+down_revision: str | Sequence[str] | None = "57743a2ae4e1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, table, columns)
+KEYSET_INDEXES = [
+    ("ix_sessions_user_created_id", "sessions", ["user_id", "created_at", "id"]),
+    ("ix_tasks_session_created_id", "tasks", ["session_id", "created_at", "id"]),
+    (
+        "ix_episodic_memories_user_created_id",
+        "episodic_memories",
+        ["user_id", "created_at", "id"],
+    ),
+    ("ix_mcp_logs_user_created_id", "mcp_tool_execution_logs", ["user_id", "created_at", "id"]),
+    (
+        "ix_mcp_logs_session_created_id",
+        "mcp_tool_execution_logs",
+        ["session_id", "created_at", "id"],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so large log tables stay writable during the migration
+    with op.get_context().autocommit_block():
+        for name, table, columns in KEYSET_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(KEYSET_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
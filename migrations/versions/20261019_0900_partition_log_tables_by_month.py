@@ -0,0 +1,189 @@
+"""Partition log tables by month on created_at
+
+Converts agent_steps, llm_usage_logs and mcp_tool_execution_logs to range
+partitioned tables with one partition per month (<table>_pYYYYMM) and a
+<table>_default partition, and installs the partition maintenance
+routines used by bsai.db.partitions.
+
+Existing rows are copied into the new tables, so the log tables are
+locked for the duration of the migration.
+
+Revision ID: 20261019_log_partitions
+Revises: 20261018_keyset_idx
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_log_partitions"
+down_revision: str | Sequence[str] | None = "20261018_keyset_idx"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Months created ahead of the current one (the application keeps this up)
+MONTHS_AHEAD = 3
+
+# table -> (indexes as (name, columns), foreign keys as (column, referenced table))
+LOG_TABLES: dict[str, tuple[list[tuple[str, list[str]]], list[tuple[str, str]]]] = {
+    "agent_steps": (
+        [
+            ("ix_agent_steps_agent_type", ["agent_type"]),
+            ("ix_agent_steps_milestone_id", ["milestone_id"]),
+            ("ix_agent_steps_status", ["status"]),
+            ("ix_agent_steps_task_id", ["task_id"]),
+        ],
+        [("task_id", "tasks"), ("milestone_id", "milestones")],
+    ),
+    "llm_usage_logs": (
+        [
+            ("ix_llm_usage_logs_agent_type", ["agent_type"]),
+            ("ix_llm_usage_logs_llm_model", ["llm_model"]),
+            ("ix_llm_usage_logs_llm_provider", ["llm_provider"]),
+            ("ix_llm_usage_logs_milestone_id", ["milestone_id"]),
+            ("ix_llm_usage_logs_session_id", ["session_id"]),
+        ],
+        [("session_id", "sessions"), ("milestone_id", "milestones")],
+    ),
+    "mcp_tool_execution_logs": (
+        [
+            ("ix_mcp_tool_execution_logs_user_id", ["user_id"]),
+            ("ix_mcp_logs_user_created_id", ["user_id", "created_at", "id"]),
+            ("ix_mcp_logs_session_created_id", ["session_id", "created_at", "id"]),
+        ],
+        [
+            ("session_id", "sessions"),
+            ("task_id", "tasks"),
+            ("milestone_id", "milestones"),
+            ("mcp_server_id", "mcp_server_configs"),
+        ],
+    ),
+}
+
+# Creates the monthly partitions from from_month to to_month (inclusive).
+# Rows of a new month that landed in the default partition are moved into
+# it, otherwise attaching the partition would fail.
+CREATE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION bsai_create_log_partitions(
+    parent text, from_month date, to_month date
+) RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+    cur_month date := date_trunc('month', from_month)::date;
+    next_month date;
+    part_name text;
+    created integer := 0;
+BEGIN
+    WHILE cur_month <= to_month LOOP
+        next_month := (cur_month + interval '1 month')::date;
+        part_name := format('%s_p%s', parent, to_char(cur_month, 'YYYYMM'));
+        IF to_regclass(part_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                part_name, parent
+            );
+            IF to_regclass(parent || '_default') IS NOT NULL THEN
+                EXECUTE format(
+                    'WITH moved AS (DELETE FROM %I WHERE created_at >= %L AND created_at < %L RETURNING *) INSERT INTO %I SELECT * FROM moved',
+                    parent || '_default', cur_month, next_month, part_name
+                );
+            END IF;
+            EXECUTE format(
+                'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                parent, part_name, cur_month, next_month
+            );
+            created := created + 1;
+        END IF;
+        cur_month := next_month;
+    END LOOP;
+    RETURN created;
+END
+$$;
+"""
+
+# Drops the monthly partitions that end before before_month
+DROP_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION bsai_drop_log_partitions(
+    parent text, before_month date
+) RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+    part_name text;
+    dropped integer := 0;
+BEGIN
+    FOR part_name IN
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass(parent)
+          AND CASE
+                WHEN c.relname ~ ('^' || parent || '_p[0-9]{6}$')
+                THEN to_date(right(c.relname, 6), 'YYYYMM') < date_trunc('month', before_month)
+                ELSE false
+              END
+        ORDER BY c.relname
+    LOOP
+        EXECUTE format('DROP TABLE %I', part_name);
+        dropped := dropped + 1;
+    END LOOP;
+    RETURN dropped;
+END
+$$;
+"""
+
+
+def _rebuild(
+    table: str,
+    indexes: list[tuple[str, list[str]]],
+    foreign_keys: list[tuple[str, str]],
+    partitioned: bool,
+) -> None:
+    """Recreate a table as (un)partitioned and copy its rows over."""
+    old = f"{table}_old"
+    op.rename_table(table, old)
+    # Index names are schema-wide: free them for the new table
+    op.execute(f"ALTER TABLE {old} RENAME CONSTRAINT {table}_pkey TO {old}_pkey")
+    for name, _ in indexes:
+        op.drop_index(name, table_name=old)
+
+    partition_by = " PARTITION BY RANGE (created_at)" if partitioned else ""
+    op.execute(
+        f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)" + partition_by
+    )
+    # The partition key must be part of the primary key
+    op.create_primary_key(f"{table}_pkey", table, ["id", "created_at"] if partitioned else ["id"])
+    for column, referenced in foreign_keys:
+        op.create_foreign_key(f"{table}_{column}_fkey", table, referenced, [column], ["id"])
+    for name, columns in indexes:
+        op.create_index(name, table, columns, unique=False)
+
+    if partitioned:
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+        op.execute(
+            f"SELECT bsai_create_log_partitions('{table}', "
+            f"coalesce((SELECT min(created_at) FROM {old}), now())::date, "
+            f"greatest((SELECT max(created_at) FROM {old}), "
+            f"now() + interval '{MONTHS_AHEAD} months')::date)"
+        )
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    op.drop_table(old)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(CREATE_PARTITIONS_FUNCTION)
+    op.execute(DROP_PARTITIONS_FUNCTION)
+    for table, (indexes, foreign_keys) in LOG_TABLES.items():
+        _rebuild(table, indexes, foreign_keys, partitioned=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, (indexes, foreign_keys) in reversed(LOG_TABLES.items()):
+        _rebuild(table, indexes, foreign_keys, partitioned=False)
+    op.execute("DROP FUNCTION IF EXISTS bsai_drop_log_partitions(text, date)")
+    op.execute("DROP FUNCTION IF EXISTS bsai_create_log_partitions(text, date, date)")
@@ -8,7 +8,11 @@ LangGraph nodes receive user_id after authentication, no direct Keycloak access.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any
 
 import httpx
@@ -24,6 +28,235 @@ from .exceptions import AuthenticationError
 logger = structlog.get_logger()
 
 
+class JWKSCache:
+    """Process-wide cache of the Keycloak realm JWKS.
+
+    Keys are fetched through a shared HTTP client and reused for ``ttl`` seconds.
+    A token signed with an unknown ``kid`` forces an early refresh, rate limited
+    by ``min_refresh_interval`` so forged key ids cannot hammer Keycloak.
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        ttl: float = 300.0,
+        min_refresh_interval: float = 10.0,
+        timeout: float = 5.0,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize JWKS cache.
+
+        Args:
+            jwks_url: Keycloak certs endpoint URL
+            ttl: Seconds to reuse fetched keys
+            min_refresh_interval: Minimum seconds between forced refreshes
+            timeout: HTTP timeout for fetching keys
+            client: Optional HTTP client (created lazily if not provided)
+        """
+        self.jwks_url = jwks_url
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+        self._client = client
+        self._owns_client = client is None
+        self._jwks: JWKSet | None = None
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self, max_age: float) -> bool:
+        """Check whether cached keys are younger than max_age seconds."""
+        return self._jwks is not None and time.monotonic() - self._fetched_at < max_age
+
+    async def get_keys(self, force_refresh: bool = False) -> JWKSet:
+        """Get the realm key set, fetching it when missing or stale.
+
+        Args:
+            force_refresh: Refresh even if the TTL has not expired
+                (used when a token references an unknown key id)
+
+        Returns:
+            Cached or freshly fetched JWKSet
+        """
+        max_age = self.min_refresh_interval if force_refresh else self.ttl
+        if self._jwks is not None and self._is_fresh(max_age):
+            return self._jwks
+
+        async with self._lock:
+            # Another coroutine may have refreshed while we waited
+            if self._jwks is not None and self._is_fresh(max_age):
+                return self._jwks
+
+            try:
+                self._jwks = await self._fetch()
+                self._fetched_at = time.monotonic()
+                logger.debug("jwks_refreshed", force_refresh=force_refresh)
+            except Exception as e:
+                if self._jwks is None:
+                    raise
+                # Keycloak hiccup: keep serving the last known keys
+                logger.warning("jwks_refresh_failed", error=str(e))
+            return self._jwks
+
+    async def _fetch(self) -> JWKSet:
+        """Download the key set from Keycloak."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        response = await self._client.get(self.jwks_url)
+        response.raise_for_status()
+        return JWKSet.from_json(response.text)
+
+    def invalidate(self) -> None:
+        """Drop cached keys so the next lookup fetches them again."""
+        self._jwks = None
+        self._fetched_at = 0.0
+
+    async def close(self) -> None:
+        """Close the shared HTTP client if owned by this cache."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+
+class VerifiedTokenCache:
+    """Small LRU of verified token -> claims.
+
+    Entries are keyed by a SHA-256 digest of the token and never outlive the
+    token's ``exp`` claim, so reconnects with the same token skip signature
+    verification without extending its validity.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """Initialize token cache.
+
+        Args:
+            max_size: Maximum number of cached tokens (0 disables caching)
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """Get cached claims for a token that has not yet expired.
+
+        Args:
+            token: JWT token string
+
+        Returns:
+            Claims dictionary or None if not cached or expired
+        """
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        claims, expires_at = entry
+        if time.time() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return claims
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        """Cache claims for a verified token.
+
+        Tokens without a numeric ``exp`` claim are not cached.
+
+        Args:
+            token: JWT token string
+            claims: Verified claims
+        """
+        if self.max_size <= 0:
+            return
+        expires_at = claims.get("exp")
+        if not isinstance(expires_at, int | float) or expires_at <= time.time():
+            return
+
+        key = self._key(token)
+        self._entries[key] = (claims, float(expires_at))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached tokens."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@lru_cache(maxsize=1)
+def get_jwks_cache() -> JWKSCache:
+    """Get the process-wide JWKS cache (cached singleton).
+
+    Returns:
+        JWKSCache for the configured Keycloak realm
+    """
+    settings = get_auth_settings()
+    return JWKSCache(
+        jwks_url=f"{settings.keycloak_url}/realms/{settings.keycloak_realm}/protocol/openid-connect/certs",
+        ttl=settings.jwks_cache_ttl,
+        min_refresh_interval=settings.jwks_min_refresh_interval,
+        timeout=settings.jwks_fetch_timeout,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_token_cache() -> VerifiedTokenCache:
+    """Get the process-wide verified token cache (cached singleton).
+
+    Returns:
+        VerifiedTokenCache instance
+    """
+    return VerifiedTokenCache(max_size=get_auth_settings().token_cache_size)
+
+
+async def close_auth_caches() -> None:
+    """Close the shared JWKS client and drop cached tokens (call in lifespan)."""
+    if get_jwks_cache.cache_info().currsize:
+        await get_jwks_cache().close()
+    get_jwks_cache.cache_clear()
+    get_token_cache.cache_clear()
+
+
+async def verify_token(token: str) -> dict[str, Any]:
+    """Verify a JWT against the cached realm keys.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        Verified claims dictionary
+
+    Raises:
+        Exception: If the token signature or claims are invalid
+    """
+    token_cache = get_token_cache()
+    cached = token_cache.get(token)
+    if cached is not None:
+        return dict(cached)
+
+    jwks_cache = get_jwks_cache()
+    keys = await jwks_cache.get_keys()
+    try:
+        decoded = jwt.JWT(key=keys, jwt=token)
+    except jwt.JWTMissingKey:
+        # Signing key may have been rotated since the last fetch
+        keys = await jwks_cache.get_keys(force_refresh=True)
+        decoded = jwt.JWT(key=keys, jwt=token)
+
+    claims = decoded.claims
+    if isinstance(claims, str):
+        claims = json.loads(claims)
+
+    token_cache.put(token, claims)
+    return dict(claims)
+
+
 async def user_mapper(userinfo: dict[str, Any]) -> str:
     """Extract user_id (sub claim) from token.
 
@@ -76,6 +309,9 @@ async def get_current_user_id(request: Request) -> str:
 async def authenticate_websocket(token: str) -> str:
     """Authenticate WebSocket with token.
 
+    Uses the process-wide JWKS and verified token caches, so reconnects
+    do not trigger a round-trip to Keycloak.
+
     Args:
         token: JWT token string
 
@@ -86,18 +322,7 @@ async def authenticate_websocket(token: str) -> str:
         AuthenticationError: If token is invalid
     """
     try:
-        settings = get_auth_settings()
-
-        async with httpx.AsyncClient() as client:
-            jwks_url = f"{settings.keycloak_url}/realms/{settings.keycloak_realm}/protocol/openid-connect/certs"
-            response = await client.get(jwks_url)
-            jwks = JWKSet.from_json(response.text)
-
-        decoded = jwt.JWT(key=jwks, jwt=token)
-        claims = decoded.claims
-        if isinstance(claims, str):
-            claims = json.loads(claims)
-
+        claims = await verify_token(token)
         return str(claims.get("sub", ""))
     except Exception as e:
         logger.warning("ws_token_invalid", error=str(e))
@@ -18,6 +18,24 @@ class DatabaseSettings(BaseSettings):
         description="PostgreSQL connection URL (must use asyncpg driver)",
     )
 
+    # Read replicas (optional): read-only endpoints are served from these
+    database_replica_urls: list[str] = Field(
+        default_factory=list,
+        description="Read replica connection URLs (asyncpg driver); empty reads from the primary",
+    )
+    database_replica_max_lag: float = Field(
+        default=5.0,
+        description="Replication lag in seconds beyond which reads fall back to the primary",
+    )
+    database_replica_lag_check_interval: float = Field(
+        default=2.0,
+        description="Seconds a measured replica lag is reused before it is checked again",
+    )
+    database_replica_sticky_seconds: float = Field(
+        default=5.0,
+        description="Seconds a user's reads stay on the primary after one of their writes",
+    )
+
     model_config = SettingsConfigDict(env_file=".env", env_prefix="", extra="ignore")
 
 
@@ -45,6 +63,28 @@ class AuthSettings(BaseSettings):
         description="Enable Keycloak authentication. Set to False for testing.",
     )
 
+    # JWKS / verified token caching (WebSocket authentication)
+    jwks_cache_ttl: float = Field(
+        default=300.0,
+        ge=0.0,
+        description="Seconds to reuse the fetched JWKS before refreshing it",
+    )
+    jwks_min_refresh_interval: float = Field(
+        default=10.0,
+        ge=0.0,
+        description="Minimum seconds between refreshes triggered by an unknown key id",
+    )
+    jwks_fetch_timeout: float = Field(
+        default=5.0,
+        gt=0.0,
+        description="Timeout in seconds for fetching the JWKS",
+    )
+    token_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description="Maximum verified tokens kept in memory (0 disables the cache)",
+    )
+
     model_config = SettingsConfigDict(env_file=".env", env_prefix="AUTH_", extra="ignore")
 
 
@@ -66,6 +106,37 @@ class CacheSettings(BaseSettings):
     task_progress_ttl: int = Field(default=900, description="Task progress TTL")
     user_sessions_ttl: int = Field(default=600, description="User sessions TTL")
 
+    # Exact-match LLM response cache (opt-in)
+    llm_response_cache_enabled: bool = Field(
+        default=False,
+        description="Reuse responses to byte-identical tool-free LLM requests",
+    )
+    llm_response_cache_ttl: int = Field(
+        default=3600,
+        ge=1,
+        description="LLM response cache entry TTL in seconds",
+    )
+    llm_response_cache_max_entries: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum cached LLM responses (oldest evicted first)",
+    )
+    llm_response_cache_max_entry_bytes: int = Field(
+        default=262144,
+        ge=1,
+        description="Largest serialized LLM response that is cached",
+    )
+    llm_response_cache_max_temperature: float = Field(
+        default=0.3,
+        ge=0.0,
+        le=2.0,
+        description="Only requests at or below this temperature are cached",
+    )
+    llm_response_cache_agents: list[str] = Field(
+        default=["architect", "qa", "responder"],
+        description="Agents whose LLM calls may be served from the cache",
+    )
+
     model_config = SettingsConfigDict(env_file=".env", env_prefix="CACHE_", extra="ignore")
 
 
@@ -178,6 +249,28 @@ class AgentSettings(BaseSettings):
         le=50,
         description="Maximum tool calling iterations in LLM completion",
     )
+    qa_max_concurrent_commands: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Maximum QA validation subprocesses running at once per worker process",
+    )
+    qa_workspace_root: str = Field(
+        default="",
+        description="Directory for per-task QA workspaces (system temp dir if empty)",
+    )
+    qa_max_workspaces: int = Field(
+        default=32,
+        ge=1,
+        le=1000,
+        description="Maximum task workspaces kept on disk before the oldest is removed",
+    )
+    qa_result_cache_size: int = Field(
+        default=256,
+        ge=0,
+        le=10000,
+        description="Maximum cached validation results keyed by snapshot hash and command",
+    )
 
     model_config = SettingsConfigDict(env_file=".env", env_prefix="AGENT_", extra="ignore")
 
@@ -248,6 +341,20 @@ class McpSettings(BaseSettings):
         description="Blocked URL patterns for SSRF prevention",
     )
 
+    # DNS resolution cache for SSRF validation
+    dns_cache_ttl: int = Field(
+        default=60,
+        ge=0,
+        le=3600,
+        description="Seconds a resolved hostname's addresses are reused (0 disables caching)",
+    )
+    dns_negative_cache_ttl: int = Field(
+        default=10,
+        ge=0,
+        le=600,
+        description="Seconds an unresolvable hostname is remembered",
+    )
+
     # Rate limiting
     tool_calls_per_hour: int = Field(
         default=100,
@@ -271,6 +378,12 @@ class McpSettings(BaseSettings):
         default=1024 * 1024,  # 1MB
         description="Maximum tool output size in bytes",
     )
+    auth_header_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        le=100_000,
+        description="Maximum decrypted auth header sets kept in memory (0 disables the cache)",
+    )
 
     # Risk assessment keywords
     high_risk_keywords: list[str] = Field(
@@ -376,6 +489,311 @@ def get_langfuse_settings() -> LangfuseSettings:
     return LangfuseSettings()
 
 
+class TelemetrySettings(BaseSettings):
+    """Write-behind telemetry settings for LLM usage and agent step logs.
+
+    Records are buffered in memory and flushed with multi-row INSERTs on a
+    separate database session, so the workflow hot path never waits on them.
+    """
+
+    enabled: bool = Field(
+        default=True,
+        description="Record LLM usage and agent steps to the database",
+    )
+    flush_at: int = Field(
+        default=100,
+        ge=1,
+        le=10000,
+        description="Number of buffered records that triggers an immediate flush",
+    )
+    flush_interval: float = Field(
+        default=2.0,
+        ge=0.1,
+        le=300.0,
+        description="Maximum time in seconds between flushes",
+    )
+    max_buffer_size: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum buffered records before the oldest are dropped",
+    )
+
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="TELEMETRY_", extra="ignore")
+
+
+@lru_cache
+def get_telemetry_settings() -> TelemetrySettings:
+    """Get cached telemetry settings.
+
+    Returns:
+        TelemetrySettings instance
+    """
+    return TelemetrySettings()
+
+
+class RateLimitSettings(BaseSettings):
+    """Per-provider LLM rate limiting (admission control).
+
+    Each (provider, model) pair gets a Redis token bucket for requests per
+    minute and one for tokens per minute, shared by all API processes.
+    Budgets are looked up as ``provider/model``, then ``provider``, then
+    the defaults.
+    """
+
+    enabled: bool = Field(
+        default=False,
+        description="Queue LLM calls against per-provider RPM/TPM budgets",
+    )
+    default_rpm: int = Field(
+        default=500,
+        ge=1,
+        description="Requests per minute for models without a configured budget",
+    )
+    default_tpm: int = Field(
+        default=200000,
+        ge=1,
+        description="Tokens per minute for models without a configured budget",
+    )
+    budgets: dict[str, dict[str, int]] = Field(
+        default_factory=dict,
+        description='Budgets by "provider/model" or "provider", e.g. {"anthropic": {"rpm": 50}}',
+    )
+    max_wait: float = Field(
+        default=120.0,
+        ge=0.0,
+        description="Maximum seconds a call may queue before failing",
+    )
+
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="LLM_RATE_LIMIT_", extra="ignore")
+
+
+@lru_cache
+def get_rate_limit_settings() -> RateLimitSettings:
+    """Get cached LLM rate limit settings.
+
+    Returns:
+        RateLimitSettings instance
+    """
+    return RateLimitSettings()
+
+
+class RoutingSettings(BaseSettings):
+    """Latency-aware model routing with hedged requests.
+
+    ``fallback_chains`` maps a TaskComplexity name to an ordered list of
+    models. With routing enabled, the router picks the first healthy model
+    of the chain, and a tool-free call that runs longer than the model's
+    recent p95 latency (counted from rate-limiter admission) is hedged with
+    the next model in the chain. The first response wins; the slower
+    request still runs to completion when it was already sent, so a hedge
+    can be billed for both calls (its usage is recorded). Failed calls fall
+    through to the next model immediately.
+    """
+
+    enabled: bool = Field(
+        default=False,
+        description="Use fallback chains, hedged requests and latency-aware ordering",
+    )
+    fallback_chains: dict[str, list[str]] = Field(
+        default_factory=dict,
+        description='Ordered models per complexity, e.g. {"MODERATE": ["gpt-4o", "claude-..."]}',
+    )
+    hedge_percentile: float = Field(
+        default=0.95,
+        gt=0.0,
+        le=1.0,
+        description="Latency percentile after which a hedged request is sent",
+    )
+    hedge_default_delay: float = Field(
+        default=20.0,
+        gt=0.0,
+        description="Hedge delay in seconds while a model has too few latency samples",
+    )
+    hedge_min_delay: float = Field(
+        default=1.0,
+        ge=0.0,
+        description="Lower bound of the hedge delay in seconds",
+    )
+    hedge_max_delay: float = Field(
+        default=120.0,
+        gt=0.0,
+        description="Upper bound of the hedge delay in seconds",
+    )
+    window_size: int = Field(
+        default=100,
+        ge=1,
+        le=10000,
+        description="Recent calls per model kept for latency and error statistics",
+    )
+    min_samples: int = Field(
+        default=10,
+        ge=1,
+        description="Samples needed before a model's statistics are trusted",
+    )
+    max_error_rate: float = Field(
+        default=0.5,
+        ge=0.0,
+        le=1.0,
+        description="Models failing more often than this are tried last",
+    )
+
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="LLM_ROUTING_", extra="ignore")
+
+
+@lru_cache
+def get_routing_settings() -> RoutingSettings:
+    """Get cached model routing settings.
+
+    Returns:
+        RoutingSettings instance
+    """
+    return RoutingSettings()
+
+
+class ContextWindowSettings(BaseSettings):
+    """Context-window preflight for LLM requests.
+
+    Every request is counted before it is sent. If it does not fit the
+    model's context window minus the output budget, low-priority messages
+    (conversation history, file lists) are trimmed; if the rest still does
+    not fit, the request is escalated to a known model with a larger window.
+    """
+
+    enabled: bool = Field(
+        default=True,
+        description="Trim or escalate requests that would overflow the context window",
+    )
+    output_reserve: int = Field(
+        default=4096,
+        ge=0,
+        description="Output tokens reserved when a request sets no max_tokens",
+    )
+    safety_margin: float = Field(
+        default=0.02,
+        ge=0.0,
+        lt=0.5,
+        description="Share of the context window kept free for tokenizer differences",
+    )
+    min_kept_tokens: int = Field(
+        default=256,
+        ge=0,
+        description="Smallest remainder worth keeping when shortening a message",
+    )
+    escalate: bool = Field(
+        default=True,
+        description="Switch to a larger-window model when trimming is not enough",
+    )
+    escalation_models: list[str] = Field(
+        default_factory=list,
+        description="Extra models considered for escalation (besides mapped and chained models)",
+    )
+
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="LLM_CONTEXT_", extra="ignore")
+
+
+@lru_cache
+def get_context_window_settings() -> ContextWindowSettings:
+    """Get cached context window settings.
+
+    Returns:
+        ContextWindowSettings instance
+    """
+    return ContextWindowSettings()
+
+
+class CircuitBreakerSettings(BaseSettings):
+    """Circuit breakers for LLM models and MCP servers.
+
+    After ``failure_threshold`` consecutive transient failures a circuit
+    opens and calls to that model or server fail fast. Once
+    ``recovery_timeout`` has passed, a single probe call is let through
+    (half-open); its success closes the circuit, its failure reopens it.
+    State is shared across workers through Redis.
+    """
+
+    enabled: bool = Field(
+        default=False,
+        description="Fail fast on models and MCP servers that keep failing",
+    )
+    failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        le=100,
+        description="Consecutive transient failures that open a circuit",
+    )
+    failure_window: float = Field(
+        default=60.0,
+        gt=0.0,
+        description="Seconds without failures after which the failure count resets",
+    )
+    recovery_timeout: float = Field(
+        default=30.0,
+        gt=0.0,
+        description="Seconds a circuit stays open before a probe call is allowed",
+    )
+    probe_timeout: float = Field(
+        default=120.0,
+        gt=0.0,
+        description="Seconds a probe may run before another worker may probe",
+    )
+
+    model_config = SettingsConfigDict(
+        env_file=".env", env_prefix="CIRCUIT_BREAKER_", extra="ignore"
+    )
+
+
+@lru_cache
+def get_circuit_breaker_settings() -> CircuitBreakerSettings:
+    """Get cached circuit breaker settings.
+
+    Returns:
+        CircuitBreakerSettings instance
+    """
+    return CircuitBreakerSettings()
+
+
+class LogPartitionSettings(BaseSettings):
+    """Monthly partitions of the agent step, LLM usage and MCP log tables.
+
+    Every API process periodically creates the partitions of the coming
+    months and, with a retention set, drops partitions past it. Only one
+    process does the work at a time (advisory lock).
+    """
+
+    enabled: bool = Field(
+        default=True,
+        description="Run partition maintenance in the background",
+    )
+    months_ahead: int = Field(
+        default=3,
+        ge=1,
+        le=24,
+        description="Months to create partitions for ahead of the current one",
+    )
+    retention_months: int = Field(
+        default=0,
+        ge=0,
+        description="Full months of logs to keep before the current one (0 keeps all)",
+    )
+    check_interval: float = Field(
+        default=6 * 3600.0,
+        ge=60.0,
+        description="Seconds between maintenance runs",
+    )
+
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="LOG_PARTITIONS_", extra="ignore")
+
+
+@lru_cache
+def get_log_partition_settings() -> LogPartitionSettings:
+    """Get cached log partition settings.
+
+    Returns:
+        LogPartitionSettings instance
+    """
+    return LogPartitionSettings()
+
+
 class MemorySettings(BaseSettings):
     """Long-term memory configuration settings.
 
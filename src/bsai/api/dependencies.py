@@ -3,26 +3,95 @@
 from collections.abc import AsyncGenerator
 from typing import Annotated
 
+import structlog
 from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bsai.cache import SessionCache, get_redis
-from bsai.db.session import get_db_session
+from bsai.db.session import (
+    STICKY_KEY_INFO,
+    get_db_session,
+    get_read_db_session,
+    get_session_manager,
+    session_has_writes,
+)
 from bsai.events.bus import EventBus
 from bsai.services import BreakpointService
 
 from .auth import get_current_user_id
 from .websocket import ConnectionManager
 
+logger = structlog.get_logger()
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Database session dependency.
+
+def _request_user_id(request: Request) -> str | None:
+    """Get the authenticated user's ID without requiring authentication."""
+    user = request.scope.get("user")
+    return str(user) if user is not None else None
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Database session dependency (primary database).
+
+    Writes made by an authenticated user pin the user's reads to the
+    primary for a short window (read-your-writes, see get_read_db).
+
+    Args:
+        request: FastAPI request
 
     Yields:
         AsyncSession for database operations
     """
+    user_id = _request_user_id(request)
     async for session in get_db_session():
+        if user_id is not None:
+            session.info[STICKY_KEY_INFO] = user_id
         yield session
+        if user_id is not None and session_has_writes(session):
+            await _share_recent_write(user_id)
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Read-only database session dependency.
+
+    Served by a read replica when one is configured and caught up, unless
+    the user wrote recently in this or another worker.
+
+    Args:
+        request: FastAPI request
+
+    Yields:
+        AsyncSession for read-only queries
+    """
+    user_id = _request_user_id(request)
+    use_primary = user_id is not None and await _has_shared_recent_write(user_id)
+    async for session in get_read_db_session(user_id, use_primary):
+        yield session
+
+
+async def _share_recent_write(user_id: str) -> None:
+    """Pin the user's reads to the primary in every worker (best effort)."""
+    manager = get_session_manager()
+    if not manager.has_replicas:
+        return
+    try:
+        await SessionCache(get_redis()).mark_recent_write(user_id, manager.sticky_seconds)
+    except Exception as e:
+        logger.warning("recent_write_share_failed", user_id=user_id, error=str(e))
+
+
+async def _has_shared_recent_write(user_id: str) -> bool:
+    """Check whether another worker recorded a recent write of the user."""
+    manager = get_session_manager()
+    if not manager.has_replicas or manager.is_pinned(user_id):
+        # No replica to avoid, or pinned in this worker already
+        return False
+    try:
+        return await SessionCache(get_redis()).has_recent_write(user_id)
+    except Exception as e:
+        # Without the shared marker, the primary is the consistent choice
+        logger.warning("recent_write_check_failed", user_id=user_id, error=str(e))
+        return True
 
 
 def get_cache() -> SessionCache:
@@ -75,6 +144,7 @@ def get_breakpoint_service(request: Request) -> BreakpointService:
 
 # Type aliases for cleaner route signatures
 DBSession = Annotated[AsyncSession, Depends(get_db)]
+ReadDBSession = Annotated[AsyncSession, Depends(get_read_db)]
 Cache = Annotated[SessionCache, Depends(get_cache)]
 CurrentUserId = Annotated[str, Depends(get_current_user_id)]
 WSManager = Annotated[ConnectionManager, Depends(get_ws_manager)]
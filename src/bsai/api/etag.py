@@ -0,0 +1,67 @@
+"""ETag helpers for conditional GET requests.
+
+Polling endpoints hash their response body into a strong ETag and answer
+``If-None-Match`` hits with ``304 Not Modified`` and no body.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+
+def compute_etag(model: BaseModel) -> str:
+    """Compute a strong ETag for a response model.
+
+    Args:
+        model: Response model
+
+    Returns:
+        Quoted ETag value
+    """
+    digest = hashlib.sha256(model.model_dump_json().encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag.
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current quoted ETag
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    # Weak comparison (RFC 9110 13.1.2): W/ prefixes are ignored
+    return "*" in candidates or etag in (c.removeprefix("W/") for c in candidates)
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    model: BaseModel,
+) -> Response | None:
+    """Apply ETag handling to a GET response.
+
+    Sets the ETag header on ``response`` and returns a 304 response if
+    the request's If-None-Match matches.
+
+    Args:
+        request: Incoming request
+        response: Response FastAPI will send for the model
+        model: Response body
+
+    Returns:
+        304 response to return instead of the model, or None
+    """
+    etag = compute_etag(model)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return None
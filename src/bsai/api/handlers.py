@@ -3,7 +3,9 @@
 import structlog
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+
+from bsai.db.repository.base import InvalidCursorError
+from bsai.serialization import FastJSONResponse
 
 from .exceptions import APIError
 from .schemas import ErrorResponse
@@ -22,7 +24,7 @@ def register_exception_handlers(app: FastAPI) -> None:
     async def api_error_handler(
         request: Request,
         exc: APIError,
-    ) -> JSONResponse:
+    ) -> FastJSONResponse:
         """Handle custom API errors.
 
         Args:
@@ -49,7 +51,7 @@ def register_exception_handlers(app: FastAPI) -> None:
         elif isinstance(exc.detail, str):
             detail_str = exc.detail
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=exc.status_code,
             content=ErrorResponse(
                 error=exc.message,
@@ -63,7 +65,7 @@ def register_exception_handlers(app: FastAPI) -> None:
     async def http_exception_handler(
         request: Request,
         exc: HTTPException,
-    ) -> JSONResponse:
+    ) -> FastJSONResponse:
         """Handle HTTP exceptions.
 
         Args:
@@ -82,7 +84,7 @@ def register_exception_handlers(app: FastAPI) -> None:
             detail=exc.detail,
         )
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=exc.status_code,
             content=ErrorResponse(
                 error=str(exc.detail),
@@ -96,7 +98,7 @@ def register_exception_handlers(app: FastAPI) -> None:
     async def validation_error_handler(
         request: Request,
         exc: RequestValidationError,
-    ) -> JSONResponse:
+    ) -> FastJSONResponse:
         """Handle request validation errors.
 
         Args:
@@ -122,7 +124,7 @@ def register_exception_handlers(app: FastAPI) -> None:
             errors=exc.errors(),
         )
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=422,
             content=ErrorResponse(
                 error="Validation error",
@@ -132,11 +134,39 @@ def register_exception_handlers(app: FastAPI) -> None:
             ).model_dump(),
         )
 
+    @app.exception_handler(InvalidCursorError)
+    async def invalid_cursor_handler(
+        request: Request,
+        exc: InvalidCursorError,
+    ) -> FastJSONResponse:
+        """Handle malformed pagination cursors.
+
+        Args:
+            request: Request instance
+            exc: InvalidCursorError
+
+        Returns:
+            JSON error response
+        """
+        request_id = getattr(request.state, "request_id", "unknown")
+
+        logger.warning("invalid_cursor", request_id=request_id, error=str(exc))
+
+        return FastJSONResponse(
+            status_code=422,
+            content=ErrorResponse(
+                error="Validation error",
+                detail="cursor: invalid pagination cursor",
+                code="VALIDATION_ERROR",
+                request_id=request_id,
+            ).model_dump(),
+        )
+
     @app.exception_handler(Exception)
     async def unhandled_exception_handler(
         request: Request,
         exc: Exception,
-    ) -> JSONResponse:
+    ) -> FastJSONResponse:
         """Handle unhandled exceptions.
 
         Args:
@@ -155,7 +185,7 @@ def register_exception_handlers(app: FastAPI) -> None:
             error=str(exc),
         )
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=500,
             content=ErrorResponse(
                 error="Internal server error",
@@ -6,7 +6,6 @@ from contextlib import asynccontextmanager
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 from fastapi_keycloak_middleware import setup_keycloak_middleware
 
 from bsai.cache import SessionCache
@@ -14,12 +13,17 @@ from bsai.cache.redis_client import close_redis, get_redis, init_redis
 from bsai.db import close_db, init_db
 from bsai.events import EventBus
 from bsai.events.handlers import LoggingEventHandler, WebSocketEventHandler
-from bsai.services import BreakpointService
+from bsai.services import (
+    BreakpointService,
+    get_cancellation_service,
+    get_partition_maintenance_service,
+)
+from bsai.telemetry import close_telemetry, init_telemetry
 
-from .auth import get_keycloak_config, user_mapper
+from .auth import close_auth_caches, get_keycloak_config, user_mapper
 from .config import get_api_settings, get_auth_settings, get_database_settings
 from .handlers import register_exception_handlers
-from .middleware import LoggingMiddleware, RequestIDMiddleware
+from .middleware import LoggingMiddleware, RequestIDMiddleware, SelectiveGZipMiddleware
 from .routers import (
     artifacts_router,
     health_router,
@@ -51,10 +55,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     logger.info("starting_application")
     db_settings = get_database_settings()
-    init_db(db_settings.database_url)
-    logger.info("database_initialized")
+    init_db(
+        db_settings.database_url,
+        replica_urls=db_settings.database_replica_urls,
+        max_replica_lag=db_settings.database_replica_max_lag,
+        replica_lag_check_interval=db_settings.database_replica_lag_check_interval,
+        sticky_seconds=db_settings.database_replica_sticky_seconds,
+    )
+    logger.info("database_initialized", replicas=len(db_settings.database_replica_urls))
     await init_redis()
     logger.info("redis_initialized")
+    await get_cancellation_service().start()
+    await get_partition_maintenance_service().start()
+    init_telemetry()
 
     # Initialize WebSocket manager
     cache = SessionCache(get_redis())
@@ -78,6 +91,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     logger.info("shutting_down_application")
+    await close_auth_caches()
+    await close_telemetry()
+    await get_cancellation_service().stop()
+    await get_partition_maintenance_service().stop()
     await close_redis()
     await close_db()
     logger.info("shutdown_complete")
@@ -114,7 +131,7 @@ def create_app() -> FastAPI:
     # Register middleware (order matters - last added = first to process request)
     # Per docs: "Add Keycloak middleware first, then CORS middleware, so CORS processes requests initially"
 
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    app.add_middleware(SelectiveGZipMiddleware, minimum_size=1000)
     app.add_middleware(LoggingMiddleware)
     app.add_middleware(RequestIDMiddleware)
 
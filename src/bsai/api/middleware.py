@@ -1,4 +1,10 @@
-"""FastAPI middleware components."""
+"""FastAPI middleware components.
+
+The request ID, logging and compression middleware are plain ASGI
+middleware: unlike BaseHTTPMiddleware they do not run the app in a separate
+task behind a memory stream, so they add little per-request overhead and
+leave streaming responses (and their backpressure) untouched.
+"""
 
 from __future__ import annotations
 
@@ -7,13 +13,14 @@ import uuid
 from typing import Any
 
 import structlog
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = structlog.get_logger()
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """Middleware to add request ID to each request.
 
     Adds a unique request ID to each request for tracing and logging.
@@ -21,91 +28,145 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     the X-Request-ID response header.
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        """Process request and add request ID.
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize middleware.
 
         Args:
-            request: Incoming request
-            call_next: Next middleware/handler
+            app: Next ASGI application
+        """
+        self.app = app
 
-        Returns:
-            Response with X-Request-ID header
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request and add request ID.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Get existing request ID from header or generate new one
-        request_id = request.headers.get("X-Request-ID")
+        request_id = Headers(scope=scope).get("X-Request-ID")
         if not request_id:
             request_id = str(uuid.uuid4())
 
-        # Store in request state
-        request.state.request_id = request_id
+        # Store in request state (backs request.state)
+        scope.setdefault("state", {})["request_id"] = request_id
 
-        # Process request
-        response = await call_next(request)
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
 
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
+        await self.app(scope, receive, send_with_request_id)
 
-        return response
 
-
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """Middleware for request/response logging.
 
     Logs request details and response status with timing information.
+    The duration covers the time until the response headers are sent, so
+    streamed bodies do not inflate it.
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        """Process request and log details.
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize middleware.
 
         Args:
-            request: Incoming request
-            call_next: Next middleware/handler
+            app: Next ASGI application
+        """
+        self.app = app
 
-        Returns:
-            Response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request and log details.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.perf_counter()
 
         # Get request ID from state (set by RequestIDMiddleware)
-        request_id = getattr(request.state, "request_id", "unknown")
+        request_id = scope.get("state", {}).get("request_id", "unknown")
+        method = scope["method"]
+        path = scope["path"]
 
         # Log request
         logger.info(
             "request_started",
             request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            query=str(request.query_params),
+            method=method,
+            path=path,
+            query=scope.get("query_string", b"").decode("latin-1"),
         )
 
-        # Process request
-        response = await call_next(request)
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                duration_ms = (time.perf_counter() - start_time) * 1000
 
-        # Calculate duration
-        duration_ms = (time.perf_counter() - start_time) * 1000
+                # Log response
+                logger.info(
+                    "request_completed",
+                    request_id=request_id,
+                    method=method,
+                    path=path,
+                    status_code=message["status"],
+                    duration_ms=round(duration_ms, 2),
+                )
 
-        # Log response
-        logger.info(
-            "request_completed",
-            request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
-            duration_ms=round(duration_ms, 2),
-        )
+                # Add timing header
+                MutableHeaders(scope=message)["X-Response-Time"] = f"{duration_ms:.2f}ms"
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
+
+
+class SelectiveGZipMiddleware:
+    """GZip compression that skips already-compressed downloads.
+
+    Requests whose path ends with one of ``skip_path_suffixes`` (ZIP
+    archive downloads by default) and non-HTTP connections such as
+    WebSockets go straight to the app, without a compression responder
+    buffering or re-compressing their bodies.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        skip_path_suffixes: tuple[str, ...] = ("/download/zip",),
+    ) -> None:
+        """Initialize middleware.
+
+        Args:
+            app: Next ASGI application
+            minimum_size: Minimum response size to compress (bytes)
+            skip_path_suffixes: Path suffixes served uncompressed
+        """
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+        self.skip_path_suffixes = skip_path_suffixes
 
-        # Add timing header
-        response.headers["X-Response-Time"] = f"{duration_ms:.2f}ms"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Compress the response unless the request is exempt.
 
-        return response
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http" or scope["path"].endswith(self.skip_path_suffixes):
+            await self.app(scope, receive, send)
+            return
+        await self.gzip(scope, receive, send)
 
 
 class CORSMiddleware:
@@ -6,20 +6,32 @@ Each task creates a complete snapshot of all artifacts.
 
 import io
 import zipfile
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 from fastapi.responses import StreamingResponse
 
+from bsai.db.models.artifact import Artifact
 from bsai.db.repository.artifact_repo import ArtifactRepository
 from bsai.db.repository.session_repo import SessionRepository
 
-from ..dependencies import CurrentUserId, DBSession
+from ..dependencies import CurrentUserId, ReadDBSession
 from ..exceptions import AccessDeniedError, NotFoundError
 from ..schemas import ArtifactResponse, PaginatedResponse
 
 router = APIRouter(prefix="/sessions/{session_id}/artifacts", tags=["artifacts"])
 
+# Response fields readable from a listing row whose content was not loaded
+_SUMMARY_FIELDS = [name for name in ArtifactResponse.model_fields if name != "content"]
+
+
+def _to_summary(artifact: Artifact) -> ArtifactResponse:
+    """Build a response without touching the unloaded content column."""
+    return ArtifactResponse.model_validate(
+        {name: getattr(artifact, name) for name in _SUMMARY_FIELDS if hasattr(artifact, name)}
+    )
+
 
 @router.get(
     "",
@@ -28,12 +40,13 @@ router = APIRouter(prefix="/sessions/{session_id}/artifacts", tags=["artifacts"]
 )
 async def list_artifacts(
     session_id: UUID,
-    db: DBSession,
+    db: ReadDBSession,
     user_id: CurrentUserId,
     task_id: UUID | None = None,
     all_tasks: bool = False,
-    limit: int = 100,
-    offset: int = 0,
+    include_content: bool = True,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+    offset: Annotated[int, Query(ge=0)] = 0,
 ) -> PaginatedResponse[ArtifactResponse]:
     """List artifacts for a session.
 
@@ -42,12 +55,17 @@ async def list_artifacts(
     - With task_id: Returns that specific task's snapshot (for version history)
     - Without task_id: Returns latest completed task's snapshot (default)
 
+    Pagination and the total count are computed in SQL. File browsers
+    should pass include_content=false: items then carry only their size,
+    and content is fetched per artifact from the detail endpoint.
+
     Args:
         session_id: Session UUID
         db: Database session
         user_id: Current user ID
         task_id: Optional task UUID to get specific snapshot
         all_tasks: If True, return artifacts from ALL tasks in the session
+        include_content: If False, omit artifact content from the items
         limit: Maximum results per page
         offset: Offset for pagination
 
@@ -63,23 +81,30 @@ async def list_artifacts(
 
     artifact_repo = ArtifactRepository(db)
 
-    # Get artifacts based on parameters
+    # Get one page of artifacts based on parameters
+    artifacts: list[Artifact] = []
+    total = 0
     if task_id:
         # Get specific task's snapshot
-        artifacts = await artifact_repo.get_by_task_id(task_id, limit=1000)
+        artifacts, total = await artifact_repo.list_task_page(
+            task_id, limit=limit, offset=offset, include_content=include_content
+        )
     elif all_tasks:
         # Get ALL artifacts from all tasks in the session
-        artifacts = await artifact_repo.get_all_session_artifacts(session_id)
+        artifacts, total = await artifact_repo.list_session_page(
+            session_id, limit=limit, offset=offset, include_content=include_content
+        )
     else:
         # Get latest snapshot (current state) - backward compatible default
-        artifacts = await artifact_repo.get_latest_snapshot(session_id)
-
-    # Apply pagination
-    total = len(artifacts)
-    paginated = artifacts[offset : offset + limit]
+        latest_task_id = await artifact_repo.get_latest_task_id(session_id)
+        if latest_task_id:
+            artifacts, total = await artifact_repo.list_task_page(
+                latest_task_id, limit=limit, offset=offset, include_content=include_content
+            )
 
+    to_response = ArtifactResponse.model_validate if include_content else _to_summary
     return PaginatedResponse(
-        items=[ArtifactResponse.model_validate(a) for a in paginated],
+        items=[to_response(a) for a in artifacts],
         total=total,
         limit=limit,
         offset=offset,
@@ -95,7 +120,7 @@ async def list_artifacts(
 async def get_artifact(
     session_id: UUID,
     artifact_id: UUID,
-    db: DBSession,
+    db: ReadDBSession,
     user_id: CurrentUserId,
 ) -> ArtifactResponse:
     """Get a specific artifact by ID.
@@ -137,7 +162,7 @@ async def get_artifact(
 )
 async def download_artifacts_zip(
     session_id: UUID,
-    db: DBSession,
+    db: ReadDBSession,
     user_id: CurrentUserId,
     task_id: UUID | None = None,
 ) -> StreamingResponse:
@@ -1,12 +1,13 @@
 """MCP execution logs endpoints."""
 
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter
 
 from bsai.db.repository.mcp_tool_log_repo import McpToolLogRepository
 
-from ...dependencies import CurrentUserId, DBSession
+from ...dependencies import CurrentUserId, ReadDBSession
 from ...schemas.mcp import McpToolExecutionLogResponse
 from ...schemas.responses import PaginatedResponse
 
@@ -19,13 +20,16 @@ router = APIRouter()
     summary="Get MCP tool execution logs",
 )
 async def get_mcp_logs(
-    db: DBSession,
+    db: ReadDBSession,
     user_id: CurrentUserId,
     session_id: UUID | None = None,
     status_filter: str | None = None,
     agent_type: str | None = None,
     limit: int = 100,
     offset: int = 0,
+    cursor: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
 ) -> PaginatedResponse[McpToolExecutionLogResponse]:
     """Get MCP tool execution logs for the current user.
 
@@ -36,24 +40,38 @@ async def get_mcp_logs(
         status_filter: Optional status filter
         agent_type: Optional agent type filter
         limit: Maximum number of logs
-        offset: Number of logs to skip
+        offset: Number of logs to skip (ignored with cursor)
+        cursor: Cursor from the previous page (keyset pagination)
+        since: Only logs created at or after this time
+        until: Only logs created before this time
 
     Returns:
-        Paginated list of tool execution logs
+        Paginated list of tool execution logs. The total is only returned
+        without cursor, and is a planner estimate for large log volumes.
     """
     repo = McpToolLogRepository(db)
 
+    total: int | None = None
+    estimated = False
     if session_id:
-        logs = await repo.get_by_session(session_id, limit, offset)
-        total = await repo.count_by_session(session_id)
+        page = await repo.list_by_session(session_id, limit, cursor, offset, since, until)
+        if cursor is None:
+            total, estimated = await repo.total_by_session(session_id, since, until)
     else:
-        logs = await repo.get_by_user(user_id, limit, offset, status_filter, agent_type)
-        total = await repo.count_by_user(user_id, status_filter, agent_type)
+        page = await repo.list_by_user(
+            user_id, limit, cursor, offset, status_filter, agent_type, since, until
+        )
+        if cursor is None:
+            total, estimated = await repo.total_by_user(
+                user_id, status_filter, agent_type, since, until
+            )
 
     return PaginatedResponse(
-        items=[McpToolExecutionLogResponse.model_validate(log) for log in logs],
+        items=[McpToolExecutionLogResponse.model_validate(log) for log in page.items],
         total=total,
         limit=limit,
-        offset=offset,
-        has_more=offset + len(logs) < total,
+        offset=0 if cursor else offset,
+        has_more=page.next_cursor is not None,
+        next_cursor=page.next_cursor,
+        total_estimated=estimated,
     )
@@ -18,6 +18,7 @@ from bsai.db.repository.mcp_server_repo import McpServerRepository
 from bsai.mcp.security import (
     CredentialEncryption,
     McpSecurityValidator,
+    get_mcp_auth_header_cache,
     ssrf_safe_get,
     ssrf_safe_post,
 )
@@ -39,7 +40,7 @@ OAUTH_STATE_PREFIX = "mcp_oauth_state:"
 OAUTH_STATE_TTL = 600  # 10 minutes
 
 
-def _build_wellknown_url(
+async def _build_wellknown_url(
     base_url: str, wellknown_path: str, validator: McpSecurityValidator
 ) -> str:
     """Build well-known URL safely with SSRF protection."""
@@ -52,7 +53,7 @@ def _build_wellknown_url(
         raise ValueError(f"Invalid well-known path: {wellknown_path}")
 
     # Validate and get sanitized base URL
-    sanitized_base_url = validator.validate_server_url(base_url)
+    sanitized_base_url = (await validator.resolve_server_url(base_url)).url
     parsed = urlparse(sanitized_base_url)
     normalized_url = f"{parsed.scheme}://{parsed.netloc}"
 
@@ -66,7 +67,7 @@ async def _discover_oauth_metadata(server_url: str) -> dict[str, Any] | None:
 
     # Try protected resource metadata first (RFC 9728)
     try:
-        protected_resource_url = _build_wellknown_url(
+        protected_resource_url = await _build_wellknown_url(
             server_url, "/.well-known/oauth-protected-resource", validator
         )
         response = await ssrf_safe_get(protected_resource_url, validator)
@@ -74,7 +75,7 @@ async def _discover_oauth_metadata(server_url: str) -> dict[str, Any] | None:
             resource_meta = response.json()
             auth_server = resource_meta.get("authorization_servers", [None])[0]
             if auth_server:
-                auth_server_meta_url = _build_wellknown_url(
+                auth_server_meta_url = await _build_wellknown_url(
                     auth_server, "/.well-known/oauth-authorization-server", validator
                 )
                 meta_response = await ssrf_safe_get(auth_server_meta_url, validator)
@@ -90,7 +91,7 @@ async def _discover_oauth_metadata(server_url: str) -> dict[str, Any] | None:
 
     # Try standard OAuth metadata discovery (RFC 8414)
     try:
-        oauth_server_url = _build_wellknown_url(
+        oauth_server_url = await _build_wellknown_url(
             server_url, "/.well-known/oauth-authorization-server", validator
         )
         response = await ssrf_safe_get(oauth_server_url, validator)
@@ -104,7 +105,7 @@ async def _discover_oauth_metadata(server_url: str) -> dict[str, Any] | None:
 
     # Try OpenID Connect discovery
     try:
-        openid_url = _build_wellknown_url(
+        openid_url = await _build_wellknown_url(
             server_url, "/.well-known/openid-configuration", validator
         )
         response = await ssrf_safe_get(openid_url, validator)
@@ -182,7 +183,7 @@ async def _initiate_oauth_flow(
     settings = get_mcp_settings()
     validator = McpSecurityValidator(settings)
     try:
-        auth_endpoint = validator.validate_server_url(auth_endpoint)
+        auth_endpoint = (await validator.resolve_server_url(auth_endpoint)).url
     except ValueError as e:
         raise ValidationError(f"Invalid authorization endpoint URL: {e}") from e
 
@@ -193,7 +194,7 @@ async def _initiate_oauth_flow(
 
     if not client_id and registration_endpoint:
         try:
-            registration_endpoint = validator.validate_server_url(registration_endpoint)
+            registration_endpoint = (await validator.resolve_server_url(registration_endpoint)).url
         except ValueError as e:
             raise ValidationError(f"Invalid registration endpoint URL: {e}") from e
 
@@ -332,7 +333,7 @@ async def oauth_callback(
 
     validator = McpSecurityValidator(settings)
     try:
-        token_endpoint = validator.validate_server_url(token_endpoint)
+        token_endpoint = (await validator.resolve_server_url(token_endpoint)).url
     except ValueError as e:
         return McpOAuthCallbackResponse(
             success=False,
@@ -410,6 +411,8 @@ async def oauth_callback(
         auth_credentials=encrypted_credentials,
     )
     await db.commit()
+    # Drop headers derived from the previous tokens
+    get_mcp_auth_header_cache().invalidate(server.id)
 
     return McpOAuthCallbackResponse(success=True, error=None)
 
@@ -456,6 +459,7 @@ async def reauth_mcp_server(
 
     await repo.update_by_user(server_id, user_id, auth_credentials=None)
     await db.commit()
+    get_mcp_auth_header_cache().invalidate(server_id)
 
     server_url = request.server_url or server.server_url
     if not server_url:
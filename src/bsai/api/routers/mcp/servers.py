@@ -8,7 +8,11 @@ from fastapi import APIRouter, status
 from bsai.api.config import get_mcp_settings
 from bsai.api.exceptions import ConflictError, NotFoundError, ValidationError
 from bsai.db.repository.mcp_server_repo import McpServerRepository
-from bsai.mcp.security import CredentialEncryption, McpSecurityValidator
+from bsai.mcp.security import (
+    CredentialEncryption,
+    McpSecurityValidator,
+    get_mcp_auth_header_cache,
+)
 
 from ...dependencies import CurrentUserId, DBSession
 from ...schemas.mcp import (
@@ -88,7 +92,7 @@ async def create_mcp_server(
                 f"server_url is required for {request.transport_type} transport",
             )
         try:
-            validator.validate_server_url(request.server_url)
+            await validator.resolve_server_url(request.server_url)
         except ValueError as e:
             raise ValidationError(str(e)) from e
 
@@ -163,7 +167,7 @@ async def update_mcp_server(
 
     if request.server_url is not None:
         try:
-            validator.validate_server_url(request.server_url)
+            await validator.resolve_server_url(request.server_url)
         except ValueError as e:
             raise ValidationError(str(e)) from e
         update_data["server_url"] = request.server_url
@@ -208,6 +212,8 @@ async def update_mcp_server(
         raise NotFoundError("MCP server", server_id)
 
     await db.commit()
+    if "auth_type" in update_data or "auth_credentials" in update_data:
+        get_mcp_auth_header_cache().invalidate(server_id)
     return await build_server_response(server, user_id)
 
 
@@ -229,3 +235,4 @@ async def delete_mcp_server(
         raise NotFoundError("MCP server", server_id)
 
     await db.commit()
+    get_mcp_auth_header_cache().invalidate(server_id)
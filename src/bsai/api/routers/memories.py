@@ -7,9 +7,10 @@ from fastapi import APIRouter, HTTPException, Query, status
 
 from bsai.db.models.enums import MemoryType
 from bsai.db.repository.episodic_memory_repo import EpisodicMemoryRepository
+from bsai.llm import get_llm_rate_limiter
 from bsai.memory import EmbeddingService, LongTermMemoryManager
 
-from ..dependencies import Cache, CurrentUserId, DBSession
+from ..dependencies import Cache, CurrentUserId, DBSession, ReadDBSession
 from ..schemas import PaginatedResponse
 from ..schemas.memory import (
     ConsolidateResult,
@@ -38,7 +39,7 @@ def _get_memory_manager(
     Returns:
         LongTermMemoryManager instance
     """
-    embedding_service = EmbeddingService(cache=cache)
+    embedding_service = EmbeddingService(cache=cache, rate_limiter=get_llm_rate_limiter())
     return LongTermMemoryManager(
         session=db,
         embedding_service=embedding_service,
@@ -114,11 +115,12 @@ async def search_memories(
     summary="List user memories",
 )
 async def list_memories(
-    db: DBSession,
+    db: ReadDBSession,
     user_id: CurrentUserId,
     memory_type: str | None = Query(None, description="Filter by memory type"),
     limit: int = Query(20, ge=1, le=100, description="Maximum results per page"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
 ) -> PaginatedResponse[MemoryResponse]:
     """List memories for the authenticated user.
 
@@ -127,22 +129,25 @@ async def list_memories(
         user_id: Current user ID
         memory_type: Optional type filter
         limit: Maximum results per page
-        offset: Pagination offset
+        offset: Pagination offset (ignored with cursor)
+        cursor: Cursor from the previous page (keyset pagination)
 
     Returns:
-        Paginated list of memories
+        Paginated list of memories (total only without cursor)
     """
     repo = EpisodicMemoryRepository(db)
 
     memory_types = [memory_type] if memory_type else None
-    memories = await repo.get_by_user_id(
+    page = await repo.list_by_user(
         user_id=user_id,
         memory_types=memory_types,
         limit=limit,
+        cursor=cursor,
         offset=offset,
     )
 
-    total = await repo.count_by_user(user_id)
+    # Counted for the first request only; cursor pages reuse the client's total
+    total = None if cursor else await repo.count_by_user(user_id, memory_types)
 
     items = [
         MemoryResponse(
@@ -158,15 +163,16 @@ async def list_memories(
             created_at=m.created_at,
             last_accessed_at=m.last_accessed_at,
         )
-        for m in memories
+        for m in page.items
     ]
 
     return PaginatedResponse(
         items=items,
         total=total,
         limit=limit,
-        offset=offset,
-        has_more=(offset + len(items)) < total,
+        offset=0 if cursor else offset,
+        has_more=page.next_cursor is not None,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -176,7 +182,7 @@ async def list_memories(
     summary="Get memory statistics",
 )
 async def get_memory_stats(
-    db: DBSession,
+    db: ReadDBSession,
     cache: Cache,
     user_id: CurrentUserId,
 ) -> MemoryStatsResponse:
@@ -207,7 +213,7 @@ async def get_memory_stats(
 )
 async def get_memory(
     memory_id: UUID,
-    db: DBSession,
+    db: ReadDBSession,
     user_id: CurrentUserId,
 ) -> MemoryDetailResponse:
     """Get a specific memory with full details.
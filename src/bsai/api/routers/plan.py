@@ -22,7 +22,7 @@ from bsai.services.plan_service import (
     PlanService,
 )
 
-from ..dependencies import DBSession
+from ..dependencies import DBSession, ReadDBSession
 
 router = APIRouter(prefix="/sessions/{session_id}/tasks/{task_id}/plan", tags=["plan"])
 logger = structlog.get_logger()
@@ -91,7 +91,7 @@ class ActionResponse(BaseModel):
 async def get_plan(
     session_id: UUID,
     task_id: UUID,
-    db: DBSession,
+    db: ReadDBSession,
 ) -> PlanResponse:
     """Get plan details for a task.
 
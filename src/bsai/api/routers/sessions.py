@@ -4,12 +4,13 @@ from typing import Any
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, Response, status
 from pydantic import BaseModel
 
 from bsai.db.models.enums import SessionStatus
 
-from ..dependencies import Cache, CurrentUserId, DBSession
+from ..dependencies import Cache, CurrentUserId, DBSession, ReadDBSession
+from ..etag import conditional_response
 from ..schemas import (
     BulkSessionAction,
     PaginatedResponse,
@@ -66,12 +67,13 @@ async def create_session(
     summary="List user sessions",
 )
 async def list_sessions(
-    db: DBSession,
+    db: ReadDBSession,
     cache: Cache,
     user_id: CurrentUserId,
     status: SessionStatus | None = None,
     limit: int = 20,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> PaginatedResponse[SessionResponse]:
     """List sessions for the authenticated user.
 
@@ -82,6 +84,7 @@ async def list_sessions(
         status: Optional status filter
         limit: Maximum results per page
         offset: Offset for pagination
+        cursor: Cursor from the previous page (keyset pagination)
 
     Returns:
         Paginated list of sessions
@@ -92,6 +95,7 @@ async def list_sessions(
         status=status,
         limit=min(limit, 100),
         offset=offset,
+        cursor=cursor,
     )
 
 
@@ -120,34 +124,20 @@ async def bulk_session_action(
         Result with success and failed session IDs
     """
     service = SessionService(db, cache)
-    success: list[str] = []
-    failed: list[dict[str, Any]] = []
 
     logger.info(
         "bulk_action_started", action=request.action, session_count=len(request.session_ids)
     )
 
-    for session_id in request.session_ids:
-        try:
-            if request.action == "pause":
-                await service.pause_session(session_id, user_id)
-            elif request.action == "complete":
-                await service.complete_session(session_id, user_id)
-            elif request.action == "delete":
-                await service.delete_session(session_id, user_id)
-            success.append(str(session_id))
-            logger.info("bulk_action_success", action=request.action, session_id=str(session_id))
-        except Exception as e:
-            failed.append({"session_id": str(session_id), "error": str(e)})
-            logger.error(
-                "bulk_action_failed",
-                action=request.action,
-                session_id=str(session_id),
-                error=str(e),
-            )
-
-    logger.info("bulk_action_completed", success_count=len(success), failed_count=len(failed))
-    return BulkActionResult(success=success, failed=failed)
+    succeeded, errors = await service.bulk_action(request.session_ids, user_id, request.action)
+
+    logger.info("bulk_action_completed", success_count=len(succeeded), failed_count=len(errors))
+    return BulkActionResult(
+        success=[str(session_id) for session_id in succeeded],
+        failed=[
+            {"session_id": str(session_id), "error": error} for session_id, error in errors.items()
+        ],
+    )
 
 
 @router.get(
@@ -157,23 +147,31 @@ async def bulk_session_action(
 )
 async def get_session(
     session_id: UUID,
-    db: DBSession,
+    request: Request,
+    response: Response,
+    db: ReadDBSession,
     cache: Cache,
     user_id: CurrentUserId,
-) -> SessionDetailResponse:
+) -> SessionDetailResponse | Response:
     """Get detailed session information including tasks.
 
+    Served from the session cache when possible. Responses carry an ETag;
+    a matching If-None-Match yields 304 Not Modified.
+
     Args:
         session_id: Session UUID
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
         db: Database session
         cache: Session cache
         user_id: Current user ID
 
     Returns:
-        Session details with tasks
+        Session details with tasks, or an empty 304 response
     """
     service = SessionService(db, cache)
-    return await service.get_session(session_id, user_id)
+    detail = await service.get_session(session_id, user_id)
+    return conditional_response(request, response, detail) or detail
 
 
 @router.put(
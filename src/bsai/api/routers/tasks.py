@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 
 from bsai.db.models.enums import TaskStatus
 from bsai.llm.schemas import BreakpointConfig, QAConfig
@@ -15,6 +15,7 @@ from ..dependencies import (
     DBSession,
     WSManager,
 )
+from ..etag import conditional_response
 from ..schemas import (
     ActionResponse,
     BuildResultResponse,
@@ -94,6 +95,7 @@ async def list_tasks(
     status: TaskStatus | None = None,
     limit: int = 20,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> PaginatedResponse[TaskResponse]:
     """List tasks for a session.
 
@@ -108,6 +110,7 @@ async def list_tasks(
         status: Optional status filter
         limit: Maximum results per page
         offset: Offset for pagination
+        cursor: Cursor from the previous page (keyset pagination)
 
     Returns:
         Paginated list of tasks
@@ -119,6 +122,7 @@ async def list_tasks(
         status=status,
         limit=min(limit, 100),
         offset=offset,
+        cursor=cursor,
     )
 
 
@@ -284,13 +288,15 @@ async def reject_task(
 async def get_task_progress(
     session_id: UUID,
     task_id: UUID,
+    request: Request,
+    response: Response,
     db: DBSession,
     cache: Cache,
     event_bus: AppEventBus,
     ws_manager: WSManager,
     breakpoint_service: AppBreakpointService,
     user_id: CurrentUserId,
-) -> ProgressResponse:
+) -> ProgressResponse | Response:
     """Get current task execution progress.
 
     Returns progress information including:
@@ -298,9 +304,14 @@ async def get_task_progress(
     - Task/Feature/Epic level progress
     - Current breakpoint reason (if paused)
 
+    Counters are read from Redis while the task runs. Responses carry an
+    ETag; a matching If-None-Match yields 304 Not Modified.
+
     Args:
         session_id: Session UUID (for URL consistency)
         task_id: Task UUID
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
         db: Database session
         cache: Session cache
         event_bus: EventBus for event-driven notifications
@@ -309,12 +320,12 @@ async def get_task_progress(
         user_id: Current user ID
 
     Returns:
-        Progress information for the task
+        Progress information for the task, or an empty 304 response
     """
     _ = session_id
     service = TaskService(db, cache, event_bus, ws_manager, breakpoint_service)
-    progress = await service.get_progress(task_id, user_id)
-    return ProgressResponse(**progress)
+    progress = ProgressResponse(**await service.get_progress(task_id, user_id))
+    return conditional_response(request, response, progress) or progress
 
 
 @router.put(
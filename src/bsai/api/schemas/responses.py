@@ -7,7 +7,7 @@ from decimal import Decimal
 from typing import Any, Generic, TypeVar
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from bsai.db.models.enums import (
     MilestoneStatus,
@@ -158,10 +158,16 @@ class PaginatedResponse(BaseModel, Generic[T]):
     """Generic paginated response wrapper."""
 
     items: list[T]
-    total: int = Field(description="Total number of items")
+    total: int | None = Field(description="Total number of items (None on cursor pages)")
     limit: int = Field(description="Items per page")
     offset: int = Field(description="Number of items skipped")
     has_more: bool = Field(description="Whether more items exist")
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page (None on the last page)"
+    )
+    total_estimated: bool = Field(
+        default=False, description="Whether total is a planner estimate rather than a count"
+    )
 
 
 class ArtifactResponse(BaseModel):
@@ -174,7 +180,10 @@ class ArtifactResponse(BaseModel):
     artifact_type: str = Field(description="Type of artifact (code, file, document)")
     filename: str
     language: str | None = None
-    content: str
+    content: str | None = Field(
+        default=None, description="Full content (omitted when listing without content)"
+    )
+    size: int | None = Field(default=None, description="Content size in bytes")
     path: str | None = Field(default=None, description="Path within project structure")
     sequence_number: int = 0
     created_at: datetime
@@ -182,6 +191,12 @@ class ArtifactResponse(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @model_validator(mode="after")
+    def _fill_size(self) -> ArtifactResponse:
+        if self.size is None and self.content is not None:
+            self.size = len(self.content.encode())
+        return self
+
 
 class ErrorResponse(BaseModel):
     """Standardized error response."""
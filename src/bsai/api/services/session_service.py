@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, Literal
 from uuid import UUID
 
 import structlog
@@ -14,6 +15,7 @@ from bsai.db.models.enums import SessionStatus, TaskStatus
 from bsai.db.repository.memory_snapshot_repo import MemorySnapshotRepository
 from bsai.db.repository.session_repo import SessionRepository
 from bsai.db.repository.task_repo import TaskRepository
+from bsai.db.session import is_replica_session
 from bsai.llm import ChatMessage
 
 from ..exceptions import AccessDeniedError, InvalidStateError, NotFoundError
@@ -30,6 +32,19 @@ from ..websocket.manager import ConnectionManager
 
 logger = structlog.get_logger()
 
+# Session titles are the start of the first task request
+TITLE_LENGTH = 50
+
+# Bulk status changes: action -> (new status, allowed current statuses, past tense)
+_BULK_TRANSITIONS: dict[str, tuple[SessionStatus, tuple[SessionStatus, ...], str]] = {
+    "pause": (SessionStatus.PAUSED, (SessionStatus.ACTIVE,), "paused"),
+    "complete": (
+        SessionStatus.COMPLETED,
+        (SessionStatus.ACTIVE, SessionStatus.PAUSED),
+        "completed",
+    ),
+}
+
 
 class SessionService:
     """Session lifecycle management.
@@ -105,6 +120,10 @@ class SessionService:
     ) -> SessionDetailResponse:
         """Get session details.
 
+        Details read from the primary are cached; details read from a read
+        replica are not, since it may lag behind the write that invalidated
+        the cache entry.
+
         Args:
             session_id: Session ID
             user_id: User ID for access check
@@ -116,6 +135,11 @@ class SessionService:
             NotFoundError: If session not found
             AccessDeniedError: If user doesn't own session
         """
+        # Serve from the session state cache while no session or task write invalidated it
+        cached = await self.cache.get_session_state(session_id)
+        if cached and cached.get("user_id") == user_id and "detail" in cached:
+            return SessionDetailResponse.model_validate(cached["detail"])
+
         session = await self._get_session_for_user(session_id, user_id)
 
         # Get tasks
@@ -129,18 +153,36 @@ class SessionService:
                 active_task = TaskResponse.model_validate(task)
                 break
 
-        return SessionDetailResponse(
+        detail = SessionDetailResponse(
             **SessionResponse.model_validate(session).model_dump(),
             tasks=task_responses,
             active_task=active_task,
         )
 
+        # A replica may not have replayed the write that invalidated the entry
+        if is_replica_session(self.db):
+            return detail
+
+        await self.cache.set_session_state(
+            session_id,
+            {
+                "status": session.status,
+                "user_id": user_id,
+                "created_at": session.created_at.isoformat(),
+                "detail": detail.model_dump(mode="json"),
+            },
+            ttl=self.cache.SESSION_DETAIL_TTL,
+        )
+
+        return detail
+
     async def list_sessions(
         self,
         user_id: str,
         status: SessionStatus | None = None,
         limit: int = 20,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> PaginatedResponse[SessionResponse]:
         """List user sessions.
 
@@ -148,52 +190,42 @@ class SessionService:
             user_id: User ID
             status: Optional status filter
             limit: Maximum results
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored with cursor)
+            cursor: Cursor from the previous page
 
         Returns:
-            Paginated session response
+            Paginated session response (total only without cursor)
         """
-        # Get sessions
-        if status:
-            sessions = await self.session_repo.get_by_user_id(
-                user_id,
-                limit=limit + 1,  # +1 to check has_more
-                offset=offset,
-            )
-            # Filter by status
-            sessions = [s for s in sessions if s.status == status.value]
-        else:
-            sessions = await self.session_repo.get_by_user_id(
-                user_id,
-                limit=limit + 1,
-                offset=offset,
-            )
-
-        # Check if there are more
-        has_more = len(sessions) > limit
-        if has_more:
-            sessions = sessions[:limit]
+        status_value = status.value if status else None
+        page = await self.session_repo.list_by_user(
+            user_id, status=status_value, limit=limit, cursor=cursor, offset=offset
+        )
+        # Counted for the first request only; cursor pages reuse the client's total
+        total = None if cursor else await self.session_repo.count_by_user(user_id, status_value)
 
-        # Build response with titles from first task
+        # Build response with titles from first task (one query for the whole page)
+        first_requests = await self.task_repo.get_first_requests(
+            [session.id for session in page.items], max_length=TITLE_LENGTH + 1
+        )
         session_responses = []
-        for session in sessions:
+        for session in page.items:
             response = SessionResponse.model_validate(session)
-            tasks = await self.task_repo.get_by_session_id(session.id, limit=1, oldest_first=True)
-            if tasks:
-                title = tasks[0].original_request[:50]
-                if len(tasks[0].original_request) > 50:
-                    title += "..."
-                response.title = title
-            else:
+            request = first_requests.get(session.id)
+            if request is None:
                 response.title = "New session"
+            elif len(request) > TITLE_LENGTH:
+                response.title = request[:TITLE_LENGTH] + "..."
+            else:
+                response.title = request
             session_responses.append(response)
 
         return PaginatedResponse(
             items=session_responses,
-            total=len(sessions),  # Note: This is not accurate total count
+            total=total,
             limit=limit,
-            offset=offset,
-            has_more=has_more,
+            offset=0 if cursor else offset,
+            has_more=page.next_cursor is not None,
+            next_cursor=page.next_cursor,
         )
 
     async def pause_session(
@@ -390,6 +422,83 @@ class SessionService:
 
         logger.info("session_deleted", session_id=str(session_id))
 
+    async def bulk_action(
+        self,
+        session_ids: Sequence[UUID],
+        user_id: str,
+        action: Literal["pause", "complete", "delete"],
+    ) -> tuple[list[UUID], dict[UUID, str]]:
+        """Pause, complete or delete many sessions at once.
+
+        Ownership and state are checked for all sessions with one query,
+        the action is applied with one set-based statement (a handful for
+        delete) in a single transaction, and the caches are invalidated in
+        one round trip. The statements re-check ownership and state, so a
+        session changed in the meantime is reported as failed.
+
+        Args:
+            session_ids: Session IDs
+            user_id: User ID
+            action: Action to apply
+
+        Returns:
+            Tuple of (IDs the action was applied to, error message per failed ID)
+        """
+        requested = list(dict.fromkeys(session_ids))
+        transition = _BULK_TRANSITIONS.get(action)
+        allowed = [s.value for s in transition[1]] if transition else []
+
+        found = await self.session_repo.get_owners_and_statuses(requested)
+        failed: dict[UUID, str] = {}
+        eligible: list[UUID] = []
+        for session_id in requested:
+            if session_id not in found:
+                failed[session_id] = str(NotFoundError("Session", session_id))
+                continue
+            owner, current_status = found[session_id]
+            if owner != user_id:
+                failed[session_id] = str(AccessDeniedError("Session", session_id))
+            elif transition and current_status not in allowed:
+                failed[session_id] = str(
+                    InvalidStateError(
+                        resource="Session", current_state=current_status, action=transition[2]
+                    )
+                )
+            else:
+                eligible.append(session_id)
+
+        applied: list[UUID] = []
+        if eligible:
+            try:
+                if transition is None:
+                    applied = await self.session_repo.delete_many(eligible, user_id)
+                else:
+                    applied = await self.session_repo.update_status_many(
+                        eligible, user_id, transition[0].value, allowed
+                    )
+                await self.db.commit()
+            except Exception as e:
+                await self.db.rollback()
+                logger.error("bulk_action_failed", action=action, error=str(e))
+                failed.update((session_id, str(e)) for session_id in eligible)
+                applied = []
+
+        applied_set = set(applied)
+        for session_id in eligible:
+            if session_id not in applied_set and session_id not in failed:
+                failed[session_id] = "Session was modified concurrently"
+
+        if applied:
+            # Pausing does not change the user's session list
+            await self.cache.invalidate_sessions(
+                applied, user_id=None if action == "pause" else user_id
+            )
+
+        succeeded = [session_id for session_id in requested if session_id in applied_set]
+        return succeeded, {
+            session_id: failed[session_id] for session_id in requested if session_id in failed
+        }
+
     async def list_snapshots(
         self,
         session_id: UUID,
@@ -10,6 +10,8 @@ from uuid import UUID, uuid4
 import structlog
 from fastapi import WebSocketDisconnect
 
+from bsai.serialization import dumps_model
+
 from ..schemas.websocket import WSMessage
 
 
@@ -22,6 +24,8 @@ class WebSocketProtocol(Protocol):
 
     async def send_json(self, data: dict[str, Any]) -> None: ...
 
+    async def send_text(self, data: str) -> None: ...
+
     async def receive_json(self) -> dict[str, Any]: ...
 
 
@@ -244,8 +248,12 @@ class ConnectionManager:
         Returns:
             True if sent successfully
         """
+        return await self._send_payload(connection, dumps_model(message))
+
+    async def _send_payload(self, connection: Connection, payload: str) -> bool:
+        """Send an encoded message to a connection, dropping it if disconnected."""
         try:
-            await connection.websocket.send_json(message.model_dump(mode="json"))
+            await connection.websocket.send_text(payload)
             return True
         except WebSocketDisconnect:
             await self.disconnect(connection)
@@ -285,12 +293,14 @@ class ConnectionManager:
 
         sent_count = 0
         failed_connections: list[Connection] = []
+        # Encoded once for all subscribers
+        payload = dumps_model(message)
 
         for conn_id in connection_ids:
             connection = self._connections.get(conn_id)
             if connection:
                 try:
-                    await connection.websocket.send_json(message.model_dump(mode="json"))
+                    await connection.websocket.send_text(payload)
                     sent_count += 1
                 except WebSocketDisconnect:
                     failed_connections.append(connection)
@@ -338,8 +348,9 @@ class ConnectionManager:
             return 0
 
         sent_count = 0
+        payload = dumps_model(message)
         for connection in user_connections:
-            if await self.send_message(connection, message):
+            if await self._send_payload(connection, payload):
                 sent_count += 1
 
         return sent_count
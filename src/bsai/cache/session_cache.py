@@ -6,13 +6,15 @@ and WebSocket connection tracking.
 
 from __future__ import annotations
 
-import json
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Any, cast
 from uuid import UUID
 
 import structlog
 
+from bsai.serialization import dumps, loads
+
 from .redis_client import RedisClient
 
 logger = structlog.get_logger()
@@ -23,10 +25,29 @@ class SessionCache:
 
     # TTL constants (in seconds)
     SESSION_STATE_TTL = 3600  # 1 hour
+    SESSION_DETAIL_TTL = 300  # 5 minutes
     SESSION_CONTEXT_TTL = 1800  # 30 minutes
     TASK_PROGRESS_TTL = 900  # 15 minutes
     USER_SESSIONS_TTL = 600  # 10 minutes
 
+    # Plan task statuses tracked by the progress counters
+    PROGRESS_STATUSES = ("pending", "in_progress", "completed", "failed")
+
+    _PROGRESS_TRANSITION_SCRIPT = """
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        return 0
+    end
+    if ARGV[1] ~= '' then
+        redis.call('HINCRBY', KEYS[1], ARGV[1], -1)
+    end
+    if ARGV[2] ~= '' then
+        redis.call('HINCRBY', KEYS[1], ARGV[2], 1)
+    end
+    redis.call('HSET', KEYS[1], 'current_task', ARGV[3])
+    redis.call('EXPIRE', KEYS[1], ARGV[4])
+    return 1
+    """
+
     def __init__(self, redis_client: RedisClient) -> None:
         """Initialize session cache.
 
@@ -54,7 +75,7 @@ class SessionCache:
         key = f"session:{session_id}:state"
         data = await self.client.get(key)
         if data:
-            return cast(dict[str, Any], json.loads(data))
+            return cast(dict[str, Any], loads(data))
         return None
 
     async def set_session_state(
@@ -72,7 +93,7 @@ class SessionCache:
         """
         key = f"session:{session_id}:state"
         ttl = ttl or self.SESSION_STATE_TTL
-        await self.client.setex(key, ttl, json.dumps(state, default=str))
+        await self.client.setex(key, ttl, dumps(state))
         logger.debug("session_state_cached", session_id=str(session_id), ttl=ttl)
 
     async def invalidate_session_state(self, session_id: UUID) -> None:
@@ -85,6 +106,22 @@ class SessionCache:
         await self.client.delete(key)
         logger.debug("session_state_invalidated", session_id=str(session_id))
 
+    async def invalidate_sessions(
+        self, session_ids: Sequence[UUID], user_id: str | None = None
+    ) -> None:
+        """Invalidate cached state of many sessions in one round trip.
+
+        Args:
+            session_ids: Session UUIDs
+            user_id: If given, also invalidate this user's cached session list
+        """
+        keys = [f"session:{session_id}:state" for session_id in session_ids]
+        if user_id is not None:
+            keys.append(f"user:{user_id}:sessions")
+        if keys:
+            await self.client.delete(*keys)
+        logger.debug("sessions_invalidated", count=len(session_ids))
+
     # Context Caching Methods
 
     async def cache_context(
@@ -112,7 +149,7 @@ class SessionCache:
             "cached_at": datetime.now(UTC).isoformat(),
         }
         ttl = ttl or self.SESSION_CONTEXT_TTL
-        await self.client.setex(key, ttl, json.dumps(data))
+        await self.client.setex(key, ttl, dumps(data))
         logger.debug(
             "context_cached",
             session_id=str(session_id),
@@ -133,7 +170,7 @@ class SessionCache:
         key = f"session:{session_id}:context"
         data = await self.client.get(key)
         if data:
-            return cast(dict[str, Any], json.loads(data))
+            return cast(dict[str, Any], loads(data))
         return None
 
     async def invalidate_context(self, session_id: UUID) -> None:
@@ -174,7 +211,7 @@ class SessionCache:
             "updated_at": datetime.now(UTC).isoformat(),
         }
         ttl = ttl or self.TASK_PROGRESS_TTL
-        await self.client.setex(key, ttl, json.dumps(data))
+        await self.client.setex(key, ttl, dumps(data))
 
     async def get_task_progress(self, task_id: UUID) -> dict[str, Any] | None:
         """Get cached task progress.
@@ -188,17 +225,104 @@ class SessionCache:
         key = f"task:{task_id}:progress"
         data = await self.client.get(key)
         if data:
-            return cast(dict[str, Any], json.loads(data))
+            return cast(dict[str, Any], loads(data))
         return None
 
     async def invalidate_task_progress(self, task_id: UUID) -> None:
-        """Invalidate cached task progress.
+        """Invalidate cached task progress and progress counters.
 
         Args:
             task_id: Task UUID
         """
-        key = f"task:{task_id}:progress"
-        await self.client.delete(key)
+        await self.client.delete(f"task:{task_id}:progress", f"task:{task_id}:progress_counters")
+
+    # Task Progress Counter Methods
+
+    async def seed_task_progress_counters(
+        self,
+        task_id: UUID,
+        user_id: str,
+        counts: dict[str, int],
+        current_task: str | None = None,
+        ttl: int | None = None,
+    ) -> None:
+        """Write a full set of progress counters for a task.
+
+        Args:
+            task_id: Task UUID
+            user_id: Owner of the task (checked on read)
+            counts: Plan task count per status
+            current_task: Plan task currently executing
+            ttl: TTL in seconds (default: TASK_PROGRESS_TTL)
+        """
+        key = f"task:{task_id}:progress_counters"
+        mapping: dict[str, str | int] = {
+            status: counts.get(status, 0) for status in self.PROGRESS_STATUSES
+        }
+        mapping["user_id"] = user_id
+        mapping["current_task"] = current_task or ""
+        ttl = ttl or self.TASK_PROGRESS_TTL
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, ttl)
+            await pipe.execute()
+
+    async def apply_task_progress_transition(
+        self,
+        task_id: UUID,
+        previous_status: str | None,
+        new_status: str | None,
+        current_task: str | None = None,
+        ttl: int | None = None,
+    ) -> bool:
+        """Move one plan task between status counters.
+
+        Applied atomically and only if the counters exist, so a missed
+        seed never produces partial counts.
+
+        Args:
+            task_id: Task UUID
+            previous_status: Status the plan task leaves (None if new)
+            new_status: Status the plan task enters (None if removed)
+            current_task: Plan task currently executing (None clears it)
+            ttl: TTL in seconds (default: TASK_PROGRESS_TTL)
+
+        Returns:
+            True if applied, False if the counters were not cached
+        """
+        key = f"task:{task_id}:progress_counters"
+        ttl = ttl or self.TASK_PROGRESS_TTL
+        applied = await self.client.eval(
+            self._PROGRESS_TRANSITION_SCRIPT,
+            1,
+            key,
+            previous_status or "",
+            new_status or "",
+            current_task or "",
+            ttl,
+        )
+        return bool(applied)
+
+    async def get_task_progress_counters(self, task_id: UUID) -> dict[str, Any] | None:
+        """Get cached progress counters for a task.
+
+        Args:
+            task_id: Task UUID
+
+        Returns:
+            Dict with per-status counts, user_id and current_task, or None
+        """
+        key = f"task:{task_id}:progress_counters"
+        data = await self.client.hgetall(key)
+        if not data:
+            return None
+        counters: dict[str, Any] = {
+            status: int(data.get(status, 0)) for status in self.PROGRESS_STATUSES
+        }
+        counters["user_id"] = data.get("user_id", "")
+        counters["current_task"] = data.get("current_task") or None
+        return counters
 
     # User Sessions Methods
 
@@ -217,7 +341,7 @@ class SessionCache:
         """
         key = f"user:{user_id}:sessions"
         ttl = ttl or self.USER_SESSIONS_TTL
-        await self.client.setex(key, ttl, json.dumps([str(s) for s in session_ids]))
+        await self.client.setex(key, ttl, dumps([str(s) for s in session_ids]))
 
     async def get_user_sessions(self, user_id: str) -> list[UUID] | None:
         """Get cached user session IDs.
@@ -231,7 +355,7 @@ class SessionCache:
         key = f"user:{user_id}:sessions"
         data = await self.client.get(key)
         if data:
-            return [UUID(s) for s in json.loads(data)]
+            return [UUID(s) for s in loads(data)]
         return None
 
     async def invalidate_user_sessions(self, user_id: str) -> None:
@@ -243,6 +367,28 @@ class SessionCache:
         key = f"user:{user_id}:sessions"
         await self.client.delete(key)
 
+    async def mark_recent_write(self, user_id: str, ttl: float) -> None:
+        """Record that a user just wrote to the primary database.
+
+        Args:
+            user_id: User ID
+            ttl: Seconds the user's reads should stay on the primary
+        """
+        key = f"user:{user_id}:recent_write"
+        await self.client.set(key, "1", px=max(int(ttl * 1000), 1))
+
+    async def has_recent_write(self, user_id: str) -> bool:
+        """Check whether a user wrote to the primary database recently.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            True within the TTL given to mark_recent_write
+        """
+        key = f"user:{user_id}:recent_write"
+        return bool(await self.client.exists(key))
+
     # WebSocket Connection Tracking
 
     async def register_ws_connection(
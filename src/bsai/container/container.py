@@ -18,10 +18,19 @@ from dataclasses import dataclass
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from bsai.api.config import get_cache_settings
 from bsai.cache import SessionCache, get_redis
-from bsai.llm import LiteLLMClient, LLMRouter, ModelRegistry
+from bsai.llm import (
+    LiteLLMClient,
+    LLMResponseCache,
+    LLMRouter,
+    ModelRegistry,
+    get_llm_rate_limiter,
+)
 from bsai.memory import EmbeddingService
 from bsai.prompts import PromptManager
+from bsai.resilience import get_circuit_breaker
+from bsai.telemetry import get_telemetry_writer
 
 logger = structlog.get_logger()
 
@@ -68,15 +77,26 @@ async def lifespan(
     # Initialize cache and embedding service for memory operations
     redis_client = get_redis()
     cache = SessionCache(redis_client)
-    embedding_service = EmbeddingService(cache=cache)
+    rate_limiter = get_llm_rate_limiter()
+    embedding_service = EmbeddingService(cache=cache, rate_limiter=rate_limiter)
 
     prompt_manager = PromptManager()
+    router = LLMRouter(model_registry)
+    response_cache = (
+        LLMResponseCache(redis_client) if get_cache_settings().llm_response_cache_enabled else None
+    )
 
     state = ContainerState(
         prompt_manager=prompt_manager,
-        llm_client=LiteLLMClient(),
+        llm_client=LiteLLMClient(
+            telemetry=get_telemetry_writer(),
+            router=router,
+            response_cache=response_cache,
+            rate_limiter=rate_limiter,
+            circuit_breaker=get_circuit_breaker(),
+        ),
         model_registry=model_registry,
-        router=LLMRouter(model_registry),
+        router=router,
         embedding_service=embedding_service,
     )
 
@@ -105,7 +105,7 @@ class ArchitectAgent:
             memory_context=memory_context,
             project_context=project_context,
         )
-        messages = [ChatMessage(role="user", content=prompt)]
+        messages = self._build_messages(ArchitectPrompts.SYSTEM_PROMPT, prompt)
 
         # Call LLM with structured output
         settings = get_agent_settings()
@@ -207,7 +207,7 @@ class ArchitectAgent:
             current_plan=current_plan.plan_data,
             user_feedback=user_feedback,
         )
-        messages = [ChatMessage(role="user", content=prompt)]
+        messages = self._build_messages(ArchitectPrompts.SYSTEM_PROMPT, prompt)
 
         # Call LLM with structured output
         settings = get_agent_settings()
@@ -320,7 +320,7 @@ class ArchitectAgent:
             worker_observations=worker_observations,
             plan_data=current_plan.plan_data,
         )
-        messages = [ChatMessage(role="user", content=prompt)]
+        messages = self._build_messages(ArchitectPrompts.REPLAN_SYSTEM_PROMPT, prompt)
 
         # Call LLM with structured output
         settings = get_agent_settings()
@@ -365,6 +365,22 @@ class ArchitectAgent:
 
         return replan_output
 
+    def _build_messages(self, system_key: ArchitectPrompts, prompt: str) -> list[ChatMessage]:
+        """Build messages with the static instructions as a cacheable prefix.
+
+        Args:
+            system_key: Prompt key of the static system prompt
+            prompt: Request-specific user prompt
+
+        Returns:
+            System and user messages
+        """
+        system_prompt = self.prompt_manager.render("architect", system_key)
+        return [
+            ChatMessage(role="system", content=system_prompt, cache_control=True),
+            ChatMessage(role="user", content=prompt),
+        ]
+
     def _build_planning_prompt(
         self,
         original_request: str,
@@ -31,6 +31,14 @@ class ExtractionResult:
     artifacts: list[ExtractedArtifact]
     deleted_paths: list[str]
 
+    @property
+    def changed_paths(self) -> list[str]:
+        """Full paths of written files (e.g., 'src/main.py')."""
+        return [
+            f"{a.path.strip('/')}/{a.filename}" if a.path.strip("/") else a.filename
+            for a in self.artifacts
+        ]
+
 
 def extract_artifacts(response_content: str) -> ExtractionResult:
     """Extract file artifacts and deletion requests from structured Worker output.
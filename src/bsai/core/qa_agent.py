@@ -10,6 +10,8 @@ The QA Agent is responsible for:
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import suppress
 from enum import StrEnum
 from uuid import UUID
 
@@ -20,6 +22,7 @@ from bsai.api.config import get_agent_settings
 from bsai.api.websocket.manager import ConnectionManager
 from bsai.db.models.enums import MilestoneStatus, TaskComplexity
 from bsai.db.models.mcp_server_config import McpServerConfig
+from bsai.db.repository.artifact_repo import ArtifactRepository
 from bsai.db.repository.mcp_server_repo import McpServerRepository
 from bsai.db.repository.milestone_repo import MilestoneRepository
 from bsai.llm import ChatMessage, LiteLLMClient, LLMRequest, LLMRouter
@@ -36,6 +39,12 @@ from bsai.mcp.executor import McpToolExecutor
 from bsai.mcp.utils import load_user_mcp_servers
 from bsai.prompts import PromptManager, QAAgentPrompts
 from bsai.services.qa_runner import QARunner
+from bsai.services.qa_scope import IncrementalReport, ValidationScope, compute_scope
+from bsai.services.qa_workspace import (
+    QAWorkspace,
+    QAWorkspaceManager,
+    get_qa_workspace_manager,
+)
 
 logger = structlog.get_logger()
 
@@ -65,6 +74,7 @@ class AggregatedQAResult:
         typecheck_result: TypecheckResult | None = None,
         test_result: TestResult | None = None,
         build_result: BuildResult | None = None,
+        incremental: IncrementalReport | None = None,
     ) -> None:
         """Initialize aggregated result.
 
@@ -74,12 +84,14 @@ class AggregatedQAResult:
             typecheck_result: Type check validation result
             test_result: Test execution result
             build_result: Build verification result
+            incremental: Scope and time saved of the dynamic validations
         """
         self.static_result = static_result
         self.lint_result = lint_result
         self.typecheck_result = typecheck_result
         self.test_result = test_result
         self.build_result = build_result
+        self.incremental = incremental
 
     @property
     def all_passed(self) -> bool:
@@ -114,6 +126,7 @@ class QAAgent:
         ws_manager: ConnectionManager | None = None,
         qa_config: QAConfig | None = None,
         project_type: str = "python",
+        workspace_manager: QAWorkspaceManager | None = None,
     ) -> None:
         """Initialize QA agent.
 
@@ -125,6 +138,8 @@ class QAAgent:
             ws_manager: Optional WebSocket manager for MCP stdio tools
             qa_config: QA configuration for dynamic validations
             project_type: Project type for default commands (python, javascript, typescript)
+            workspace_manager: Workspace manager for dynamic validations
+                (defaults to the process-wide manager)
         """
         self.llm_client = llm_client
         self.router = router
@@ -132,9 +147,12 @@ class QAAgent:
         self.session = session
         self.milestone_repo = MilestoneRepository(session)
         self.mcp_server_repo = McpServerRepository(session)
+        self.artifact_repo = ArtifactRepository(session)
         self.ws_manager = ws_manager
         self.qa_config = qa_config or QAConfig()
         self.project_type = project_type
+        self.workspace_manager = workspace_manager or get_qa_workspace_manager()
+        self.incremental_report: IncrementalReport | None = None
 
     async def validate_output(
         self,
@@ -145,11 +163,14 @@ class QAAgent:
         user_id: str,
         session_id: UUID,
         mcp_enabled: bool = True,
+        task_id: UUID | None = None,
+        changed_files: list[str] | None = None,
+        deleted_files: list[str] | None = None,
     ) -> tuple[QADecision, str, QAOutput]:
         """Validate Worker output against acceptance criteria.
 
-        Runs both static (LLM-based) analysis and dynamic validations
-        (lint, typecheck, test, build) based on qa_config settings.
+        Runs static (LLM-based) analysis and dynamic validations
+        (lint, typecheck, test, build) concurrently based on qa_config settings.
 
         Args:
             milestone_id: Milestone ID being validated
@@ -159,6 +180,10 @@ class QAAgent:
             user_id: User ID for MCP tool ownership
             session_id: Session ID for MCP tool logging
             mcp_enabled: Enable MCP tool calling (default: True)
+            task_id: Task whose artifact snapshot dynamic validations run against
+                (current working directory if None)
+            changed_files: Paths written by the milestone (full run if None)
+            deleted_files: Paths deleted by the milestone
 
         Returns:
             Tuple of (decision, feedback, qa_output):
@@ -177,19 +202,38 @@ class QAAgent:
             validations=self.qa_config.validations,
         )
 
-        # Step 1: Run static analysis (LLM-based)
-        static_result = await self._run_static_analysis(
-            milestone_id=milestone_id,
-            milestone_description=milestone_description,
-            acceptance_criteria=acceptance_criteria,
-            worker_output=worker_output,
-            user_id=user_id,
-            session_id=session_id,
-            mcp_enabled=mcp_enabled,
+        # Load the artifact snapshot before any concurrent work (shares the DB session)
+        workspace = await self._prepare_workspace(task_id) if task_id else None
+        scope = (
+            await compute_scope(
+                self.qa_config, self.project_type, workspace, changed_files, deleted_files
+            )
+            if workspace is not None
+            else None
         )
 
-        # Step 2: Run dynamic validations (lint, typecheck, test, build)
-        dynamic_results = await self._run_dynamic_validations()
+        # Steps 1-2: Run dynamic validations (lint, typecheck, test, build) in the
+        # background while the static analysis (LLM-based) runs; they are independent
+        dynamic_task = asyncio.create_task(
+            self._run_dynamic_validations(workspace, scope), name=f"qa-dynamic-{milestone_id}"
+        )
+        try:
+            static_result = await self._run_static_analysis(
+                milestone_id=milestone_id,
+                milestone_description=milestone_description,
+                acceptance_criteria=acceptance_criteria,
+                worker_output=worker_output,
+                user_id=user_id,
+                session_id=session_id,
+                mcp_enabled=mcp_enabled,
+            )
+        except BaseException:
+            dynamic_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await dynamic_task
+            raise
+
+        dynamic_results = await dynamic_task
 
         # Step 3: Aggregate all results
         aggregated = self._aggregate_results(static_result, dynamic_results)
@@ -283,7 +327,12 @@ class QAAgent:
             worker_output,
         )
 
-        messages = [ChatMessage(role="user", content=validation_prompt)]
+        # Static instructions first (cacheable), then the output under review
+        system_prompt = self.prompt_manager.render("qa_agent", QAAgentPrompts.SYSTEM_PROMPT)
+        messages = [
+            ChatMessage(role="system", content=system_prompt, cache_control=True),
+            ChatMessage(role="user", content=validation_prompt),
+        ]
 
         # Call LLM with structured output
         settings = get_agent_settings()
@@ -357,25 +406,55 @@ class QAAgent:
 
         return output
 
-    async def _run_dynamic_validations(
-        self,
-    ) -> dict[str, LintResult | TypecheckResult | TestResult | BuildResult | None]:
-        """Run dynamic validations based on qa_config.
-
-        Executes lint, typecheck, test, and build validations as configured.
+    def _configured_dynamic_validations(self) -> list[str]:
+        """Get the dynamic validation types enabled in qa_config.
 
         Returns:
-            Dictionary of validation results keyed by type name.
+            Configured validation names excluding static analysis
         """
-        # Check if any dynamic validations are configured
         dynamic_types = {
             QAValidationType.LINT.value,
             QAValidationType.TYPECHECK.value,
             QAValidationType.TEST.value,
             QAValidationType.BUILD.value,
         }
+        return [v for v in self.qa_config.validations if v in dynamic_types]
+
+    async def _prepare_workspace(self, task_id: UUID) -> QAWorkspace | None:
+        """Materialize the task's artifact snapshot for dynamic validations.
+
+        Args:
+            task_id: Task UUID (snapshot identifier)
+
+        Returns:
+            QAWorkspace, or None if no dynamic validations are configured
+        """
+        if not self._configured_dynamic_validations():
+            return None
+
+        artifacts = await self.artifact_repo.get_by_task_id(task_id)
+        return await self.workspace_manager.materialize(task_id, artifacts)
 
-        configured_dynamic = [v for v in self.qa_config.validations if v in dynamic_types]
+    async def _run_dynamic_validations(
+        self,
+        workspace: QAWorkspace | None = None,
+        scope: ValidationScope | None = None,
+    ) -> dict[str, LintResult | TypecheckResult | TestResult | BuildResult | None]:
+        """Run dynamic validations based on qa_config.
+
+        Executes lint, typecheck, test, and build validations concurrently as configured.
+        Validations cancelled after a blocking failure are reported as None.
+
+        Args:
+            workspace: Materialized artifact snapshot to validate
+                (current working directory if None)
+            scope: Files to validate incrementally (full runs if None)
+
+        Returns:
+            Dictionary of validation results keyed by type name.
+        """
+        # Check if any dynamic validations are configured
+        configured_dynamic = self._configured_dynamic_validations()
 
         if not configured_dynamic:
             logger.debug("qa_no_dynamic_validations_configured")
@@ -388,9 +467,18 @@ class QAAgent:
         )
 
         # Create QARunner and execute validations
-        runner = QARunner(config=self.qa_config, project_type=self.project_type)
+        runner = QARunner(
+            config=self.qa_config,
+            project_type=self.project_type,
+            workspace=workspace,
+            result_cache=self.workspace_manager.result_cache if workspace else None,
+            scope=scope,
+        )
         results = await runner.run_all_validations()
 
+        if workspace is not None and scope is not None:
+            self.incremental_report = self._build_incremental_report(runner, workspace, scope)
+
         # Extract results with proper type checking
         lint_res = results.get("lint")
         typecheck_res = results.get("typecheck")
@@ -407,6 +495,47 @@ class QAAgent:
 
         return results
 
+    def _build_incremental_report(
+        self,
+        runner: QARunner,
+        workspace: QAWorkspace,
+        scope: ValidationScope,
+    ) -> IncrementalReport:
+        """Record full-run baselines and estimate time saved by scoping and caching.
+
+        Args:
+            runner: Runner that executed the validations
+            workspace: Workspace the validations ran in
+            scope: Scope the validations ran with
+
+        Returns:
+            IncrementalReport for the summary
+        """
+        saved: float | None = None
+        modes: dict[str, str] = {}
+        for name, mode in runner.modes.items():
+            seconds = runner.durations.get(name)
+            if seconds is None:
+                # Cancelled after a blocking failure
+                continue
+            modes[name] = mode
+            if mode == "full":
+                self.workspace_manager.record_full_run(workspace.task_id, name, seconds)
+                continue
+            baseline = self.workspace_manager.full_run_baseline(workspace.task_id, name)
+            if baseline is not None:
+                saved = (saved or 0.0) + max(baseline - seconds, 0.0)
+
+        report = IncrementalReport(scope=scope, modes=modes, time_saved_seconds=saved)
+        logger.info(
+            "qa_incremental_report",
+            full_run=scope.full_run,
+            reason=scope.reason,
+            modes=modes,
+            time_saved_seconds=round(saved, 2) if saved is not None else None,
+        )
+        return report
+
     def _aggregate_results(
         self,
         static_result: QAOutput,
@@ -435,6 +564,7 @@ class QAAgent:
             ),
             test_result=test_result if isinstance(test_result, TestResult) else None,
             build_result=build_result if isinstance(build_result, BuildResult) else None,
+            incremental=self.incremental_report,
         )
 
         logger.debug(
@@ -528,6 +658,10 @@ class QAAgent:
                     error_preview += "..."
                 summary_parts.append(f"    Error: {error_preview}")
 
+        # Incremental scope and time saved
+        if aggregated.incremental is not None:
+            summary_parts.append(aggregated.incremental.summary_line())
+
         # Overall result
         overall = "PASS" if aggregated.all_passed else "RETRY"
         summary_parts.append(f"\nOVERALL: {overall}")
@@ -22,7 +22,7 @@ from bsai.db.repository.mcp_server_repo import McpServerRepository
 from bsai.db.repository.milestone_repo import MilestoneRepository
 from bsai.llm import ChatMessage, LiteLLMClient, LLMRequest, LLMResponse, LLMRouter
 from bsai.llm.builtin_tools import BuiltinToolExecutor
-from bsai.llm.schemas import WorkerOutput
+from bsai.llm.schemas import MessagePriority, WorkerOutput
 from bsai.mcp.executor import McpToolExecutor
 from bsai.mcp.utils import load_user_mcp_servers
 from bsai.prompts import PromptManager, WorkerPrompts
@@ -72,6 +72,7 @@ class WorkerAgent:
         task_id: UUID | None = None,
         preferred_model: str | None = None,
         context_messages: list[ChatMessage] | None = None,
+        artifacts_context: ChatMessage | None = None,
         mcp_enabled: bool = True,
     ) -> LLMResponse:
         """Execute a milestone using the provided prompt.
@@ -85,6 +86,7 @@ class WorkerAgent:
             task_id: Optional task ID for built-in tool context
             preferred_model: Optional user-preferred model override
             context_messages: Optional conversation history for context
+            artifacts_context: Optional session file list (sent after the history)
             mcp_enabled: Enable MCP tool calling (default: True)
 
         Returns:
@@ -118,11 +120,19 @@ class WorkerAgent:
         # Get system prompt for output format guidelines
         system_prompt = self.prompt_manager.render("worker", WorkerPrompts.SYSTEM_PROMPT)
 
-        # Build messages list with system prompt
-        messages = []
-        messages.append(ChatMessage(role="system", content=system_prompt))
+        # Stable content first so providers can cache the prefix: system
+        # prompt and history carry breakpoints, per-call content follows
+        messages = [ChatMessage(role="system", content=system_prompt, cache_control=True)]
         if context_messages:
-            messages.extend(context_messages)
+            # Earlier turns may be trimmed if the request overflows the context window
+            history = [
+                msg.model_copy(update={"priority": msg.priority or MessagePriority.HISTORY})
+                for msg in context_messages
+            ]
+            history[-1].cache_control = True
+            messages.extend(history)
+        if artifacts_context:
+            messages.append(artifacts_context)
         messages.append(ChatMessage(role="user", content=prompt))
 
         # Create built-in tool executor for artifact access
@@ -192,17 +202,14 @@ class WorkerAgent:
             builtin_tool_executor=builtin_tool_executor,
         )
 
-        # Calculate cost
-        cost = self.router.calculate_cost(
-            model=model,
-            input_tokens=response.usage.input_tokens,
-            output_tokens=response.usage.output_tokens,
-        )
+        # Calculate cost (a hedged request may be served by a fallback model)
+        served = self.router.served_model(model, response.model)
+        cost = self.router.calculate_usage_cost(model=served, usage=response.usage)
 
         logger.info(
             "worker_execution_complete",
             milestone_id=str(milestone_id),
-            model=model.name,
+            model=served.name,
             input_tokens=response.usage.input_tokens,
             output_tokens=response.usage.output_tokens,
             cost_usd=float(cost),
@@ -220,9 +227,14 @@ class WorkerAgent:
         user_id: str,
         session_id: UUID,
         task_id: UUID | None = None,
+        context_messages: list[ChatMessage] | None = None,
+        artifacts_context: ChatMessage | None = None,
     ) -> LLMResponse:
         """Retry milestone execution with QA feedback.
 
+        Sends the same system prompt and history as the first attempt, so
+        the retry reuses its cached prompt prefix.
+
         Args:
             milestone_id: Milestone ID being retried
             original_prompt: Original execution prompt
@@ -232,6 +244,8 @@ class WorkerAgent:
             user_id: User ID for MCP tool ownership
             session_id: Session ID for MCP tool logging
             task_id: Optional task ID for built-in tool context
+            context_messages: Optional conversation history for context
+            artifacts_context: Optional session file list (sent after the history)
 
         Returns:
             LLM response from retry attempt
@@ -259,6 +273,8 @@ class WorkerAgent:
             user_id=user_id,
             session_id=session_id,
             task_id=task_id,
+            context_messages=context_messages,
+            artifacts_context=artifacts_context,
         )
 
         logger.info(
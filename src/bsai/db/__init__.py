@@ -5,6 +5,7 @@ from .session import (
     DatabaseSessionManager,
     close_db,
     get_db_session,
+    get_read_db_session,
     get_session_manager,
     init_db,
     session_manager,
@@ -15,6 +16,7 @@ __all__ = [
     "DatabaseSessionManager",
     "close_db",
     "get_db_session",
+    "get_read_db_session",
     "get_session_manager",
     "init_db",
     "session_manager",
@@ -10,7 +10,7 @@ from uuid import UUID, uuid4
 from sqlalchemy import DECIMAL, INTEGER, TEXT, VARCHAR, ForeignKey, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import Base
+from .base import MONTHLY_PARTITIONED, Base, add_default_partition
 
 if TYPE_CHECKING:
     from .milestone import Milestone
@@ -39,10 +39,11 @@ class AgentStep(Base):
         cost_usd: Cost in USD for this step
         error_message: Error message if failed
         metadata: Additional JSON metadata
-        created_at: Record creation timestamp
+        created_at: Record creation timestamp (part of the primary key, partition key)
     """
 
     __tablename__ = "agent_steps"
+    __table_args__ = MONTHLY_PARTITIONED
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     task_id: Mapped[UUID] = mapped_column(ForeignKey("tasks.id"), index=True)
@@ -61,7 +62,7 @@ class AgentStep(Base):
     cost_usd: Mapped[Decimal] = mapped_column(DECIMAL(10, 6), default=Decimal("0"))
     error_message: Mapped[str | None] = mapped_column(TEXT, nullable=True)
     metadata_json: Mapped[str | None] = mapped_column(TEXT, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(primary_key=True, server_default=func.now())
 
     # Relationships
     task: Mapped[Task] = relationship(back_populates="agent_steps")
@@ -69,3 +70,6 @@ class AgentStep(Base):
 
     def __repr__(self) -> str:
         return f"<AgentStep(id={self.id}, agent_type={self.agent_type}, status={self.status})>"
+
+
+add_default_partition(AgentStep.__table__)
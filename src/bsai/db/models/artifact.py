@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
 from sqlalchemy import INTEGER, TEXT, VARCHAR, ForeignKey, Index, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from .base import Base
 
@@ -37,6 +37,7 @@ class Artifact(Base):
         sequence_number: Order within task snapshot
         created_at: Creation timestamp
         updated_at: Last update timestamp
+        size: Content size in bytes (only loaded by listing queries)
     """
 
     __tablename__ = "artifacts"
@@ -60,6 +61,9 @@ class Artifact(Base):
     created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(server_default=func.now(), onupdate=func.now())
 
+    # Computed in SQL by listing queries (see ArtifactRepository), None otherwise
+    size: Mapped[int | None] = query_expression()
+
     # Relationships
     session: Mapped[Session] = relationship(back_populates="artifacts")
     task: Mapped[Task | None] = relationship(back_populates="artifacts")
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+from typing import Any
 from uuid import UUID
 
+from sqlalchemy import DDL, FromClause, event
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase, Mapped
 
+# Table options of append-only log tables, partitioned by month on created_at
+# (see bsai.db.partitions)
+MONTHLY_PARTITIONED: dict[str, Any] = {"postgresql_partition_by": "RANGE (created_at)"}
+
 
 class Base(AsyncAttrs, DeclarativeBase):
     """Base class for all database models.
@@ -19,3 +25,22 @@ class Base(AsyncAttrs, DeclarativeBase):
     """
 
     id: Mapped[UUID]
+
+
+def add_default_partition(table: FromClause) -> None:
+    """Create a DEFAULT partition whenever a partitioned table is created.
+
+    Only affects ``metadata.create_all`` (tests, local setups): a partitioned
+    table without partitions rejects every insert. Migrated databases get
+    monthly partitions from the partition maintenance routine.
+
+    Args:
+        table: Partitioned table
+    """
+    event.listen(
+        table,
+        "after_create",
+        DDL(  # type: ignore[no-untyped-call]
+            "CREATE TABLE %(table)s_default PARTITION OF %(table)s DEFAULT"
+        ),
+    )
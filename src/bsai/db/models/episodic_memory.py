@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import ARRAY, FLOAT, INTEGER, TEXT, VARCHAR, DateTime, ForeignKey, func
+from sqlalchemy import ARRAY, FLOAT, INTEGER, TEXT, VARCHAR, DateTime, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -43,6 +43,11 @@ class EpisodicMemory(Base):
 
     __tablename__ = "episodic_memories"
 
+    __table_args__ = (
+        # Keyset pagination, newest first (see BaseRepository.paginate)
+        Index("ix_episodic_memories_user_created_id", "user_id", "created_at", "id"),
+    )
+
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     user_id: Mapped[str] = mapped_column(VARCHAR(255), index=True)
     session_id: Mapped[UUID] = mapped_column(ForeignKey("sessions.id"), index=True)
@@ -10,7 +10,7 @@ from uuid import UUID, uuid4
 from sqlalchemy import DECIMAL, INTEGER, VARCHAR, ForeignKey, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import Base
+from .base import MONTHLY_PARTITIONED, Base, add_default_partition
 
 if TYPE_CHECKING:
     from .milestone import Milestone
@@ -31,10 +31,11 @@ class LLMUsageLog(Base):
         output_tokens: Output token count
         cost: Cost in USD
         latency_ms: API call latency in milliseconds
-        created_at: Creation timestamp
+        created_at: Creation timestamp (part of the primary key, partition key)
     """
 
     __tablename__ = "llm_usage_logs"
+    __table_args__ = MONTHLY_PARTITIONED
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     session_id: Mapped[UUID] = mapped_column(ForeignKey("sessions.id"), index=True)
@@ -46,7 +47,7 @@ class LLMUsageLog(Base):
     output_tokens: Mapped[int] = mapped_column(INTEGER)
     cost: Mapped[Decimal] = mapped_column(DECIMAL(10, 6))
     latency_ms: Mapped[int | None] = mapped_column(INTEGER)
-    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(primary_key=True, server_default=func.now())
 
     # Relationships
     session: Mapped[Session] = relationship(back_populates="llm_usage_logs")
@@ -54,3 +55,6 @@ class LLMUsageLog(Base):
 
     def __repr__(self) -> str:
         return f"<LLMUsageLog(id={self.id}, model={self.llm_model}, cost={self.cost})>"
+
+
+add_default_partition(LLMUsageLog.__table__)
@@ -6,11 +6,11 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import BOOLEAN, INTEGER, TEXT, VARCHAR, ForeignKey, func
+from sqlalchemy import BOOLEAN, INTEGER, TEXT, VARCHAR, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import Base
+from .base import MONTHLY_PARTITIONED, Base, add_default_partition
 
 if TYPE_CHECKING:
     from .mcp_server_config import McpServerConfig
@@ -47,11 +47,18 @@ class McpToolExecutionLog(Base):
         required_approval: Whether approval was required
         approved_by_user: Whether user approved (null if no approval required)
 
-        created_at: Execution timestamp
+        created_at: Execution timestamp (part of the primary key, partition key)
     """
 
     __tablename__ = "mcp_tool_execution_logs"
 
+    __table_args__ = (
+        # Keyset pagination, newest first (see BaseRepository.paginate)
+        Index("ix_mcp_logs_user_created_id", "user_id", "created_at", "id"),
+        Index("ix_mcp_logs_session_created_id", "session_id", "created_at", "id"),
+        MONTHLY_PARTITIONED,
+    )
+
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     user_id: Mapped[str] = mapped_column(VARCHAR(255), index=True, nullable=False)
 
@@ -78,7 +85,9 @@ class McpToolExecutionLog(Base):
     required_approval: Mapped[bool] = mapped_column(BOOLEAN, nullable=False)
     approved_by_user: Mapped[bool | None] = mapped_column(BOOLEAN)
 
-    created_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        primary_key=True, server_default=func.now(), nullable=False
+    )
 
     # Relationships
     session: Mapped[Session] = relationship("Session", foreign_keys=[session_id])
@@ -91,3 +100,6 @@ class McpToolExecutionLog(Base):
     def __repr__(self) -> str:
         """String representation."""
         return f"<McpToolExecutionLog(id={self.id}, tool={self.tool_name}, status={self.status}, agent={self.agent_type})>"
+
+
+add_default_partition(McpToolExecutionLog.__table__)
@@ -7,7 +7,7 @@ from decimal import Decimal
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import DECIMAL, FLOAT, INTEGER, VARCHAR, func
+from sqlalchemy import DECIMAL, FLOAT, INTEGER, VARCHAR, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -39,6 +39,11 @@ class Session(Base):
 
     __tablename__ = "sessions"
 
+    __table_args__ = (
+        # Keyset pagination, newest first (see BaseRepository.paginate)
+        Index("ix_sessions_user_created_id", "user_id", "created_at", "id"),
+    )
+
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     user_id: Mapped[str | None] = mapped_column(VARCHAR(255), index=True)
     status: Mapped[str] = mapped_column(VARCHAR(20), default=SessionStatus.ACTIVE.value, index=True)
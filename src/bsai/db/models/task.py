@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import TEXT, VARCHAR, ForeignKey, func
+from sqlalchemy import TEXT, VARCHAR, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -37,6 +37,11 @@ class Task(Base):
 
     __tablename__ = "tasks"
 
+    __table_args__ = (
+        # Keyset pagination, newest first (see BaseRepository.paginate)
+        Index("ix_tasks_session_created_id", "session_id", "created_at", "id"),
+    )
+
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     session_id: Mapped[UUID] = mapped_column(ForeignKey("sessions.id"), index=True)
     original_request: Mapped[str] = mapped_column(TEXT)
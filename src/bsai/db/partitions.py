@@ -0,0 +1,110 @@
+"""Monthly partitions of the append-only log tables.
+
+``agent_steps``, ``llm_usage_logs`` and ``mcp_tool_execution_logs`` are
+range partitioned on ``created_at``, one partition per month named
+``<table>_pYYYYMM``. A ``<table>_default`` partition takes rows of months
+that have no partition yet.
+
+Maintenance calls the routines installed by the partitioning migration:
+
+- ``bsai_create_log_partitions(table, from_month, to_month)`` creates the
+  missing monthly partitions, moving matching rows out of the default one.
+- ``bsai_drop_log_partitions(table, before_month)`` drops the partitions
+  that end before a month. Retention is a catalog operation instead of a
+  bulk DELETE that would bloat the table and the WAL.
+
+Queries that filter on ``created_at`` only scan the matching partitions.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+
+import structlog
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = structlog.get_logger()
+
+PARTITIONED_LOG_TABLES = ("agent_steps", "llm_usage_logs", "mcp_tool_execution_logs")
+
+# pg_try_advisory_xact_lock key: one maintenance run at a time across processes
+_MAINTENANCE_LOCK_ID = 0x6273_6169_7061_7274
+
+
+@dataclass
+class PartitionMaintenanceResult:
+    """Outcome of a maintenance run.
+
+    Attributes:
+        created: Number of partitions created
+        dropped: Number of partitions dropped by retention
+    """
+
+    created: int = 0
+    dropped: int = 0
+
+
+def add_months(month: date, months: int) -> date:
+    """Get the first day of the month ``months`` after (or before) a month.
+
+    Args:
+        month: Any day of the start month
+        months: Months to add (negative to go back)
+
+    Returns:
+        First day of the resulting month
+    """
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+async def maintain_log_partitions(
+    session: AsyncSession,
+    months_ahead: int,
+    retention_months: int = 0,
+    today: date | None = None,
+) -> PartitionMaintenanceResult | None:
+    """Create upcoming monthly partitions and drop expired ones.
+
+    Args:
+        session: Database session (committed on success)
+        months_ahead: Months to create partitions for after the current one
+        retention_months: Full months to keep before the current one (0 keeps all)
+        today: Reference day (default: today in UTC)
+
+    Returns:
+        Result, or None if another process is running maintenance
+    """
+    locked = await session.execute(
+        text("SELECT pg_try_advisory_xact_lock(:lock_id)"), {"lock_id": _MAINTENANCE_LOCK_ID}
+    )
+    if not locked.scalar_one():
+        await session.rollback()
+        return None
+
+    current = add_months(today or datetime.now(UTC).date(), 0)
+    result = PartitionMaintenanceResult()
+    for table in PARTITIONED_LOG_TABLES:
+        created = await session.execute(
+            select(
+                func.bsai_create_log_partitions(table, current, add_months(current, months_ahead))
+            )
+        )
+        result.created += int(created.scalar_one())
+        if retention_months > 0:
+            dropped = await session.execute(
+                select(func.bsai_drop_log_partitions(table, add_months(current, -retention_months)))
+            )
+            result.dropped += int(dropped.scalar_one())
+    await session.commit()
+
+    logger.info(
+        "log_partitions_maintained",
+        created=result.created,
+        dropped=result.dropped,
+        months_ahead=months_ahead,
+        retention_months=retention_months,
+    )
+    return result
@@ -1,7 +1,7 @@
 """Database repository layer."""
 
 from .artifact_repo import ArtifactRepository
-from .base import BaseRepository
+from .base import BaseRepository, InvalidCursorError, Page
 from .custom_llm_model_repo import CustomLLMModelRepository
 from .llm_usage_log_repo import LLMUsageLogRepository
 from .memory_snapshot_repo import MemorySnapshotRepository
@@ -14,6 +14,8 @@ from .user_settings_repo import UserSettingsRepository
 __all__ = [
     "ArtifactRepository",
     "BaseRepository",
+    "InvalidCursorError",
+    "Page",
     "UserSettingsRepository",
     "SessionRepository",
     "TaskRepository",
@@ -5,10 +5,10 @@ Business logic (status determination, duration calculation) is in AgentStepServi
 """
 
 from decimal import Decimal
-from typing import Any
+from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Table, Update, bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.agent_step import AgentStep
@@ -33,6 +33,56 @@ class AgentStepRepository(BaseRepository[AgentStep]):
         """
         super().__init__(AgentStep, session)
 
+    async def update_many(self, rows: list[dict[str, Any]]) -> int:
+        """Bulk update steps by primary key.
+
+        Each row must contain the full primary key (``id`` and the partition
+        key ``created_at``) plus the columns to update. Rows sharing the same
+        column set are sent as one executemany batch.
+
+        Args:
+            rows: Column values per step, including ``id`` and ``created_at``
+
+        Returns:
+            Number of rows submitted
+        """
+        batches: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in rows:
+            columns = tuple(key for key in row if key not in ("id", "created_at"))
+            batches.setdefault(columns, []).append(
+                {
+                    "b_id": row["id"],
+                    "b_created_at": row["created_at"],
+                    **{column: row[column] for column in columns},
+                }
+            )
+        for columns, params in batches.items():
+            await self.session.execute(self.update_by_key_statement(columns), params)
+        return len(rows)
+
+    @staticmethod
+    def update_by_key_statement(columns: tuple[str, ...]) -> Update:
+        """Build the executemany UPDATE used by update_many.
+
+        The WHERE clause names the partition key, so each row is looked up
+        in its own partition only.
+
+        Args:
+            columns: Columns to set (bound by their own names)
+
+        Returns:
+            Core UPDATE bound to ``b_id``, ``b_created_at`` and the columns
+        """
+        table = cast(Table, AgentStep.__table__)
+        return (
+            update(table)
+            .where(
+                table.c.id == bindparam("b_id"),
+                table.c.created_at == bindparam("b_created_at"),
+            )
+            .values({column: bindparam(column) for column in columns})
+        )
+
     async def get_steps_by_task(
         self,
         task_id: UUID,
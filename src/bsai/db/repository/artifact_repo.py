@@ -3,8 +3,10 @@
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import delete, select, tuple_
+from sqlalchemy import Select, delete, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, with_expression
+from sqlalchemy.orm.interfaces import ORMOption
 
 from ..models.artifact import Artifact
 from ..models.enums import TaskStatus
@@ -58,7 +60,21 @@ class ArtifactRepository(BaseRepository[Artifact]):
         Returns:
             List of artifacts from latest completed task snapshot
         """
-        # Find latest completed task
+        latest_task_id = await self.get_latest_task_id(session_id)
+        if not latest_task_id:
+            return []
+
+        return await self.get_by_task_id(latest_task_id)
+
+    async def get_latest_task_id(self, session_id: UUID) -> UUID | None:
+        """Get the most recent completed task of a session.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            Task UUID of the latest snapshot, or None if no task completed
+        """
         latest_task_stmt = (
             select(Task.id)
             .where(Task.session_id == session_id)
@@ -67,12 +83,93 @@ class ArtifactRepository(BaseRepository[Artifact]):
             .limit(1)
         )
         result = await self.session.execute(latest_task_stmt)
-        latest_task_id = result.scalar_one_or_none()
+        return result.scalar_one_or_none()
 
-        if not latest_task_id:
-            return []
+    async def list_task_page(
+        self,
+        task_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        include_content: bool = True,
+    ) -> tuple[list[Artifact], int]:
+        """Get one page of a task snapshot.
 
-        return await self.get_by_task_id(latest_task_id)
+        Args:
+            task_id: Task UUID (snapshot identifier)
+            limit: Maximum number of artifacts to return
+            offset: Number of artifacts to skip
+            include_content: Load the content column (False leaves it unloaded)
+
+        Returns:
+            Tuple of (artifacts with ``size`` loaded, total artifacts in the snapshot)
+        """
+        stmt = (
+            select(Artifact)
+            .where(Artifact.task_id == task_id)
+            .order_by(Artifact.sequence_number.asc(), Artifact.id.asc())
+        )
+        count_stmt = select(func.count()).select_from(Artifact).where(Artifact.task_id == task_id)
+        return await self._get_page(stmt, count_stmt, limit, offset, include_content)
+
+    async def list_session_page(
+        self,
+        session_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        include_content: bool = True,
+    ) -> tuple[list[Artifact], int]:
+        """Get one page of ALL artifacts from all tasks in a session.
+
+        Same order as get_all_session_artifacts.
+
+        Args:
+            session_id: Session UUID
+            limit: Maximum number of artifacts to return
+            offset: Number of artifacts to skip
+            include_content: Load the content column (False leaves it unloaded)
+
+        Returns:
+            Tuple of (artifacts with ``size`` loaded, total artifacts in the session)
+        """
+        stmt = (
+            select(Artifact)
+            .join(Task, Artifact.task_id == Task.id)
+            .where(Task.session_id == session_id)
+            .order_by(Task.created_at.asc(), Artifact.sequence_number.asc(), Artifact.id.asc())
+        )
+        count_stmt = (
+            select(func.count())
+            .select_from(Artifact)
+            .join(Task, Artifact.task_id == Task.id)
+            .where(Task.session_id == session_id)
+        )
+        return await self._get_page(stmt, count_stmt, limit, offset, include_content)
+
+    async def _get_page(
+        self,
+        stmt: Select[Artifact],
+        count_stmt: Select[int],
+        limit: int,
+        offset: int,
+        include_content: bool,
+    ) -> tuple[list[Artifact], int]:
+        """Count matching artifacts and load the requested page.
+
+        The page query computes ``size`` in SQL; without content, the
+        content column is not transferred and raises if accessed.
+        """
+        total = (await self.session.execute(count_stmt)).scalar_one()
+        if offset >= total:
+            return [], total
+
+        options: list[ORMOption] = [
+            with_expression(Artifact.size, func.octet_length(Artifact.content))
+        ]
+        if not include_content:
+            options.append(defer(Artifact.content, raiseload=True))
+
+        result = await self.session.execute(stmt.options(*options).limit(limit).offset(offset))
+        return list(result.scalars().all()), total
 
     async def get_by_session_id(self, session_id: UUID, limit: int = 1000) -> list[Artifact]:
         """Get latest snapshot artifacts for a session.
@@ -1,15 +1,99 @@
-"""Base repository for generic CRUD operations."""
+"""Base repository for generic CRUD operations and pagination.
 
+Listings paginate by keyset on ``(created_at, id)``, newest first. The
+cursor of a page is the position of its last row, encoded as an opaque
+string; the next page starts strictly after it. With an index on
+``(<filter columns>, created_at, id)`` every page is an index seek, so
+deep pages cost the same as the first one. OFFSET is still accepted for
+existing clients.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Any, Generic, TypeVar
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement,
+    delete,
+    func,
+    insert,
+    inspect,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql.base import PGDialect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.interfaces import ORMOption
 
 from ..models.base import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+# Planner row estimate above which count_or_estimate skips the exact COUNT
+ESTIMATE_COUNT_THRESHOLD = 10_000
+
+# Renders statements with inlined parameters for EXPLAIN
+_PG_DIALECT = PGDialect()  # type: ignore[no-untyped-call]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass
+class Page(Generic[ModelType]):
+    """One page of a listing.
+
+    Attributes:
+        items: Records on the page
+        next_cursor: Cursor of the following page (None on the last page)
+    """
+
+    items: list[ModelType]
+    next_cursor: str | None
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """Encode a keyset position as an opaque cursor.
+
+    Args:
+        created_at: Creation time of the last row on the page
+        id: ID of the last row on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([created_at.isoformat(), str(id)]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor created by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (created_at, id)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id = json.loads(payload)
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor!r}") from e
+
 
 class BaseRepository(Generic[ModelType]):
     """Generic repository for CRUD operations.
@@ -43,6 +127,22 @@ class BaseRepository(Generic[ModelType]):
         await self.session.refresh(instance)
         return instance
 
+    async def create_many(self, rows: list[dict[str, Any]]) -> int:
+        """Insert multiple records with a single multi-row INSERT.
+
+        Bypasses the identity map: no instances are returned or refreshed.
+
+        Args:
+            rows: Column values per record
+
+        Returns:
+            Number of inserted records
+        """
+        if not rows:
+            return 0
+        await self.session.execute(insert(self.model).values(rows))
+        return len(rows)
+
     async def get_by_id(self, id: UUID) -> ModelType | None:
         """Retrieve record by ID.
 
@@ -71,9 +171,120 @@ class BaseRepository(Generic[ModelType]):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def paginate(
+        self,
+        *criteria: ColumnElement[bool],
+        limit: int = 20,
+        cursor: str | None = None,
+        offset: int = 0,
+        options: Sequence[ORMOption] = (),
+    ) -> Page[ModelType]:
+        """Retrieve one page of matching records, newest first.
+
+        The model must have a ``created_at`` column.
+
+        Args:
+            *criteria: Filter conditions (applied in SQL before the limit)
+            limit: Maximum number of records to return
+            cursor: Cursor of the page to load (takes precedence over offset)
+            offset: Number of records to skip (only without cursor)
+            options: Loader options for the page query
+
+        Returns:
+            Page with the records and the cursor of the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        created_at = self.model.created_at  # type: ignore[attr-defined]
+        id_column = self.model.id
+        stmt = select(self.model).where(*criteria).options(*options)
+        if cursor is not None:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+            stmt = stmt.where(
+                tuple_(created_at, id_column) < (cursor_created_at, cursor_id),
+                # Implied by the row comparison, but lets Postgres prune partitions
+                created_at <= cursor_created_at,
+            )
+        elif offset:
+            stmt = stmt.offset(offset)
+        # One extra row tells whether a next page exists
+        stmt = stmt.order_by(created_at.desc(), id_column.desc()).limit(limit + 1)
+
+        result = await self.session.execute(stmt)
+        items = list(result.scalars().all())
+        if len(items) <= limit:
+            return Page(items=items, next_cursor=None)
+
+        items = items[:limit]
+        last = items[-1]
+        return Page(
+            items=items,
+            next_cursor=encode_cursor(last.created_at, last.id),  # type: ignore[attr-defined]
+        )
+
+    async def count(self, *criteria: ColumnElement[bool]) -> int:
+        """Count matching records.
+
+        Args:
+            *criteria: Filter conditions
+
+        Returns:
+            Exact record count
+        """
+        stmt = select(func.count()).select_from(self.model).where(*criteria)
+        result = await self.session.execute(stmt)
+        return int(result.scalar_one() or 0)
+
+    async def estimate_count(self, *criteria: ColumnElement[bool]) -> int:
+        """Estimate the number of matching records from the query planner.
+
+        Costs one planning step instead of a scan, but is only as accurate
+        as the table statistics.
+
+        Args:
+            *criteria: Filter conditions
+
+        Returns:
+            Estimated record count
+        """
+        stmt = select(self.model.id).where(*criteria)
+        sql = stmt.compile(dialect=_PG_DIALECT, compile_kwargs={"literal_binds": True})
+        # Escaped so colons in the inlined literals are not read as bind parameters
+        explain = text("EXPLAIN (FORMAT JSON) " + str(sql).replace(":", "\\:"))
+        plan = (await self.session.execute(explain)).scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def count_or_estimate(
+        self,
+        *criteria: ColumnElement[bool],
+        threshold: int = ESTIMATE_COUNT_THRESHOLD,
+    ) -> tuple[int, bool]:
+        """Count matching records, estimating when there are many.
+
+        Args:
+            *criteria: Filter conditions
+            threshold: Planner estimate above which the estimate is returned
+
+        Returns:
+            Tuple of (count, whether the count is an estimate)
+        """
+        estimate = await self.estimate_count(*criteria)
+        if estimate > threshold:
+            return estimate, True
+        return await self.count(*criteria), False
+
     async def update(self, id: UUID, **kwargs: Any) -> ModelType | None:
         """Update record by ID.
 
+        Runs a single ``UPDATE ... RETURNING`` instead of loading, flushing
+        and refreshing the instance. An instance of the record already in
+        the session gets the new values and keeps its loaded relationships;
+        otherwise the returned instance has no relationships loaded (access
+        raises) so eager loaders do not add queries.
+
         Args:
             id: Record UUID
             **kwargs: Attributes to update
@@ -81,30 +292,49 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Updated model instance or None if not found
         """
-        instance = await self.get_by_id(id)
-        if instance is None:
-            return None
-
-        for key, value in kwargs.items():
-            setattr(instance, key, value)
+        if not kwargs:
+            return await self.get_by_id(id)
 
-        await self.session.flush()
-        await self.session.refresh(instance)
-        return instance
+        id_column = self.model.id
+        stmt = (
+            update(self.model)
+            .where(id_column == id)
+            .values(**kwargs)
+            .returning(self.model)
+            .options(raiseload("*"))
+            .execution_options(synchronize_session="fetch")
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def delete(self, id: UUID) -> bool:
         """Delete record by ID.
 
+        Models without delete cascades are removed with a single
+        ``DELETE ... RETURNING``; an instance of the record already in the
+        session is marked deleted. Models with cascading relationships are
+        loaded and deleted through the ORM so their children are removed.
+
         Args:
             id: Record UUID
 
         Returns:
             True if deleted, False if not found
         """
-        instance = await self.get_by_id(id)
-        if instance is None:
-            return False
+        if self._has_delete_cascades():
+            instance = await self.get_by_id(id)
+            if instance is None:
+                return False
 
-        await self.session.delete(instance)
-        await self.session.flush()
-        return True
+            await self.session.delete(instance)
+            await self.session.flush()
+            return True
+
+        id_column = self.model.id
+        stmt = delete(self.model).where(id_column == id).returning(id_column)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    def _has_delete_cascades(self) -> bool:
+        """Check whether deleting a record cascades to related records in the ORM."""
+        return any(rel.cascade.delete for rel in inspect(self.model).relationships)
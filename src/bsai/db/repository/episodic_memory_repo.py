@@ -7,12 +7,12 @@ from typing import cast
 from uuid import UUID
 
 import structlog
-from sqlalchemy import CursorResult, func, select, update
+from sqlalchemy import ColumnElement, CursorResult, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
 from ..models.episodic_memory import EpisodicMemory
-from .base import BaseRepository
+from .base import BaseRepository, Page
 
 logger = structlog.get_logger()
 
@@ -111,6 +111,30 @@ class EpisodicMemoryRepository(BaseRepository[EpisodicMemory]):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_by_user(
+        self,
+        user_id: str,
+        memory_types: list[str] | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+        offset: int = 0,
+    ) -> Page[EpisodicMemory]:
+        """Get one page of a user's memories, newest first.
+
+        Args:
+            user_id: User identifier
+            memory_types: Optional type filter
+            limit: Maximum results
+            cursor: Cursor of the page to load
+            offset: Pagination offset (only without cursor)
+
+        Returns:
+            Page of episodic memories
+        """
+        return await self.paginate(
+            *self._user_criteria(user_id, memory_types), limit=limit, cursor=cursor, offset=offset
+        )
+
     async def get_recent_by_type(
         self,
         user_id: str,
@@ -182,23 +206,25 @@ class EpisodicMemoryRepository(BaseRepository[EpisodicMemory]):
 
         return result.rowcount if result.rowcount else 0
 
-    async def count_by_user(self, user_id: str) -> int:
+    async def count_by_user(self, user_id: str, memory_types: list[str] | None = None) -> int:
         """Count total memories for a user.
 
         Args:
             user_id: User identifier
+            memory_types: Optional type filter
 
         Returns:
             Total memory count
         """
-        stmt = (
-            select(func.count())
-            .select_from(EpisodicMemory)
-            .where(EpisodicMemory.user_id == user_id)
-        )
-        result = await self.session.execute(stmt)
-        count = result.scalar_one()
-        return int(count) if count else 0
+        return await self.count(*self._user_criteria(user_id, memory_types))
+
+    def _user_criteria(
+        self, user_id: str, memory_types: list[str] | None
+    ) -> list[ColumnElement[bool]]:
+        criteria = [EpisodicMemory.user_id == user_id]
+        if memory_types:
+            criteria.append(EpisodicMemory.memory_type.in_(memory_types))
+        return criteria
 
     async def find_similar_for_consolidation(
         self,
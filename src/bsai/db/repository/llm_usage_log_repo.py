@@ -1,6 +1,8 @@
 """LLM usage log repository for usage tracking operations."""
 
+from datetime import datetime
 from decimal import Decimal
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy import func, select
@@ -89,3 +91,39 @@ class LLMUsageLogRepository(BaseRepository[LLMUsageLog]):
         )
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
+
+    async def get_latency_stats_by_model(
+        self,
+        since: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Aggregate latency percentiles, tokens and cost per model.
+
+        Args:
+            since: Only include calls created at or after this time
+
+        Returns:
+            One dict per (provider, model) with call count, p50/p95/p99
+            latency in ms, token totals and total cost
+        """
+        latency = LLMUsageLog.latency_ms
+        stmt = (
+            select(
+                LLMUsageLog.llm_provider,
+                LLMUsageLog.llm_model,
+                func.count().label("call_count"),
+                func.percentile_cont(0.5).within_group(latency).label("p50_latency_ms"),
+                func.percentile_cont(0.95).within_group(latency).label("p95_latency_ms"),
+                func.percentile_cont(0.99).within_group(latency).label("p99_latency_ms"),
+                func.sum(LLMUsageLog.input_tokens).label("input_tokens"),
+                func.sum(LLMUsageLog.output_tokens).label("output_tokens"),
+                func.sum(LLMUsageLog.cost).label("total_cost"),
+            )
+            .where(latency.is_not(None))
+            .group_by(LLMUsageLog.llm_provider, LLMUsageLog.llm_model)
+            .order_by(LLMUsageLog.llm_model)
+        )
+        if since is not None:
+            stmt = stmt.where(LLMUsageLog.created_at >= since)
+
+        result = await self.session.execute(stmt)
+        return [dict(row._mapping) for row in result]
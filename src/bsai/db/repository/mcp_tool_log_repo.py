@@ -1,14 +1,14 @@
 """MCP tool execution log repository."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.mcp_tool_execution_log import McpToolExecutionLog
-from .base import BaseRepository
+from .base import BaseRepository, Page
 
 
 class McpToolLogRepository(BaseRepository[McpToolExecutionLog]):
@@ -136,6 +136,70 @@ class McpToolLogRepository(BaseRepository[McpToolExecutionLog]):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_by_session(
+        self,
+        session_id: UUID,
+        limit: int = 100,
+        cursor: str | None = None,
+        offset: int = 0,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Page[McpToolExecutionLog]:
+        """Get one page of a session's tool execution logs, newest first.
+
+        Args:
+            session_id: Session UUID
+            limit: Maximum number of logs to return
+            cursor: Cursor of the page to load
+            offset: Number of logs to skip (only without cursor)
+            since: Only logs created at or after this time
+            until: Only logs created before this time
+
+        Returns:
+            Page of tool execution logs
+        """
+        return await self.paginate(
+            McpToolExecutionLog.session_id == session_id,
+            *self._time_criteria(since, until),
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+        )
+
+    async def list_by_user(
+        self,
+        user_id: str,
+        limit: int = 100,
+        cursor: str | None = None,
+        offset: int = 0,
+        status_filter: str | None = None,
+        agent_type_filter: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Page[McpToolExecutionLog]:
+        """Get one page of a user's tool execution logs, newest first.
+
+        Args:
+            user_id: User identifier
+            limit: Maximum number of logs to return
+            cursor: Cursor of the page to load
+            offset: Number of logs to skip (only without cursor)
+            status_filter: Optional status filter ("success" | "error" | "rejected")
+            agent_type_filter: Optional agent type filter ("worker" | "qa")
+            since: Only logs created at or after this time
+            until: Only logs created before this time
+
+        Returns:
+            Page of tool execution logs
+        """
+        return await self.paginate(
+            *self._user_criteria(user_id, status_filter, agent_type_filter),
+            *self._time_criteria(since, until),
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+        )
+
     async def get_by_mcp_server(
         self,
         mcp_server_id: UUID,
@@ -207,20 +271,78 @@ class McpToolLogRepository(BaseRepository[McpToolExecutionLog]):
         Returns:
             Total count of matching logs
         """
-        stmt = (
-            select(func.count())
-            .select_from(McpToolExecutionLog)
-            .where(McpToolExecutionLog.user_id == user_id)
+        return await self.count(*self._user_criteria(user_id, status_filter, agent_type_filter))
+
+    async def total_by_user(
+        self,
+        user_id: str,
+        status_filter: str | None = None,
+        agent_type_filter: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> tuple[int, bool]:
+        """Count a user's tool execution logs, estimating large totals.
+
+        Args:
+            user_id: User identifier
+            status_filter: Optional status filter
+            agent_type_filter: Optional agent type filter
+            since: Only logs created at or after this time
+            until: Only logs created before this time
+
+        Returns:
+            Tuple of (count, whether the count is an estimate)
+        """
+        return await self.count_or_estimate(
+            *self._user_criteria(user_id, status_filter, agent_type_filter),
+            *self._time_criteria(since, until),
         )
 
-        if status_filter:
-            stmt = stmt.where(McpToolExecutionLog.status == status_filter)
+    async def total_by_session(
+        self,
+        session_id: UUID,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> tuple[int, bool]:
+        """Count a session's tool execution logs, estimating large totals.
 
+        Args:
+            session_id: Session UUID
+            since: Only logs created at or after this time
+            until: Only logs created before this time
+
+        Returns:
+            Tuple of (count, whether the count is an estimate)
+        """
+        return await self.count_or_estimate(
+            McpToolExecutionLog.session_id == session_id, *self._time_criteria(since, until)
+        )
+
+    def _user_criteria(
+        self,
+        user_id: str,
+        status_filter: str | None,
+        agent_type_filter: str | None,
+    ) -> list[ColumnElement[bool]]:
+        criteria = [McpToolExecutionLog.user_id == user_id]
+        if status_filter:
+            criteria.append(McpToolExecutionLog.status == status_filter)
         if agent_type_filter:
-            stmt = stmt.where(McpToolExecutionLog.agent_type == agent_type_filter)
+            criteria.append(McpToolExecutionLog.agent_type == agent_type_filter)
+        return criteria
 
-        result = await self.session.execute(stmt)
-        return result.scalar_one()
+    def _time_criteria(
+        self,
+        since: datetime | None,
+        until: datetime | None,
+    ) -> list[ColumnElement[bool]]:
+        # created_at is the partition key: these bounds prune whole months
+        criteria: list[ColumnElement[bool]] = []
+        if since is not None:
+            criteria.append(McpToolExecutionLog.created_at >= _as_utc_naive(since))
+        if until is not None:
+            criteria.append(McpToolExecutionLog.created_at < _as_utc_naive(until))
+        return criteria
 
     async def count_by_session(self, session_id: UUID) -> int:
         """Count tool execution logs for a session.
@@ -239,3 +361,10 @@ class McpToolLogRepository(BaseRepository[McpToolExecutionLog]):
 
         result = await self.session.execute(stmt)
         return result.scalar_one()
+
+
+def _as_utc_naive(value: datetime) -> datetime:
+    """Convert a datetime to naive UTC, matching the created_at column."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
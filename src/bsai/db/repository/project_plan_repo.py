@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import TEXT, cast, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.project_plan import ProjectPlan
@@ -79,3 +81,51 @@ class ProjectPlanRepository(BaseRepository[ProjectPlan]):
         stmt = stmt.order_by(ProjectPlan.created_at.desc())
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
+
+    async def update_task_fields(
+        self,
+        plan_id: UUID,
+        task_index: int,
+        task_id: str,
+        fields: dict[str, Any],
+        **values: Any,
+    ) -> bool:
+        """Update fields of one plan task in place with ``jsonb_set``.
+
+        Only the changed task fields are sent, instead of the whole
+        plan_data document. The statement checks that the task at
+        ``task_index`` still has ``task_id``, so a stale index updates
+        nothing. Instances of the plan in the session are not refreshed.
+
+        Args:
+            plan_id: ProjectPlan UUID
+            task_index: Index of the task in plan_data["tasks"]
+            task_id: Task ID expected at that index
+            fields: Task fields to set
+            **values: Other plan columns to update in the same statement
+
+        Returns:
+            True if the task was updated
+        """
+        path = ["tasks", str(task_index)]
+        task = ProjectPlan.plan_data[tuple(path)]
+        stmt = (
+            update(ProjectPlan)
+            .where(
+                ProjectPlan.id == plan_id,
+                ProjectPlan.plan_data[(*path, "id")].astext == task_id,
+            )
+            .values(
+                plan_data=func.jsonb_set(
+                    ProjectPlan.plan_data,
+                    cast(path, ARRAY(TEXT)),
+                    task.op("||", return_type=JSONB)(cast(fields, JSONB)),
+                    type_=JSONB,
+                ),
+                **values,
+            )
+            .returning(ProjectPlan.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() is not None
@@ -1,13 +1,26 @@
 """Session repository for session-specific operations."""
 
+from collections.abc import Sequence
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, delete, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
+from ..models import (
+    AgentStep,
+    Artifact,
+    EpisodicMemory,
+    LLMUsageLog,
+    McpToolExecutionLog,
+    MemorySnapshot,
+    Milestone,
+    ProjectPlan,
+    Task,
+)
 from ..models.session import Session
-from .base import BaseRepository
+from .base import BaseRepository, Page
 
 
 class SessionRepository(BaseRepository[Session]):
@@ -42,6 +55,53 @@ class SessionRepository(BaseRepository[Session]):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_by_user(
+        self,
+        user_id: str,
+        status: str | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+        offset: int = 0,
+    ) -> Page[Session]:
+        """Get one page of a user's sessions, newest first.
+
+        Args:
+            user_id: External user identifier
+            status: Optional status filter
+            limit: Maximum number of sessions to return
+            cursor: Cursor of the page to load
+            offset: Number of sessions to skip (only without cursor)
+
+        Returns:
+            Page of sessions, without their relationships loaded
+        """
+        return await self.paginate(
+            *self._user_criteria(user_id, status),
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            # Listings only need the session columns; skip the selectin relationships
+            options=[raiseload("*")],
+        )
+
+    async def count_by_user(self, user_id: str, status: str | None = None) -> int:
+        """Count a user's sessions.
+
+        Args:
+            user_id: External user identifier
+            status: Optional status filter
+
+        Returns:
+            Number of matching sessions
+        """
+        return await self.count(*self._user_criteria(user_id, status))
+
+    def _user_criteria(self, user_id: str, status: str | None) -> list[ColumnElement[bool]]:
+        criteria = [Session.user_id == user_id]
+        if status is not None:
+            criteria.append(Session.status == status)
+        return criteria
+
     async def get_active_sessions(self, user_id: str | None = None) -> list[Session]:
         """Get all active sessions, optionally filtered by user.
 
@@ -103,6 +163,108 @@ class SessionRepository(BaseRepository[Session]):
         await self.session.refresh(session_obj)
         return session_obj
 
+    async def get_owners_and_statuses(
+        self, session_ids: Sequence[UUID]
+    ) -> dict[UUID, tuple[str | None, str]]:
+        """Get owner and status of many sessions in one query.
+
+        Args:
+            session_ids: Session UUIDs
+
+        Returns:
+            Mapping of session ID to (user_id, status) for existing sessions
+        """
+        stmt = select(Session.id, Session.user_id, Session.status).where(
+            Session.id.in_(session_ids)
+        )
+        result = await self.session.execute(stmt)
+        return {session_id: (user_id, status) for session_id, user_id, status in result.all()}
+
+    async def update_status_many(
+        self,
+        session_ids: Sequence[UUID],
+        user_id: str,
+        status: str,
+        from_statuses: Sequence[str],
+    ) -> list[UUID]:
+        """Set the status of a user's sessions with a single UPDATE.
+
+        Sessions owned by another user or not in one of ``from_statuses``
+        are left unchanged.
+
+        Args:
+            session_ids: Session UUIDs
+            user_id: Owner the sessions must belong to
+            status: New status
+            from_statuses: Statuses the sessions may currently have
+
+        Returns:
+            IDs of the updated sessions
+        """
+        stmt = (
+            update(Session)
+            .where(
+                Session.id.in_(session_ids),
+                Session.user_id == user_id,
+                Session.status.in_(from_statuses),
+            )
+            .values(status=status, updated_at=func.now())
+            .returning(Session.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def delete_many(self, session_ids: Sequence[UUID], user_id: str) -> list[UUID]:
+        """Delete a user's sessions and everything that belongs to them.
+
+        Runs one DELETE per dependent table (children first) instead of
+        loading the session graph into the ORM. Sessions owned by another
+        user are not touched.
+
+        Args:
+            session_ids: Session UUIDs
+            user_id: Owner the sessions must belong to
+
+        Returns:
+            IDs of the deleted sessions
+        """
+        owned = select(Session.id).where(Session.id.in_(session_ids), Session.user_id == user_id)
+        result = await self.session.execute(owned.with_for_update())
+        owned_ids = list(result.scalars().all())
+        if not owned_ids:
+            return []
+
+        tasks = select(Task.id).where(Task.session_id.in_(owned_ids))
+        milestones = select(Milestone.id).where(Milestone.task_id.in_(tasks))
+        dependents = [
+            delete(McpToolExecutionLog).where(McpToolExecutionLog.session_id.in_(owned_ids)),
+            delete(AgentStep).where(AgentStep.task_id.in_(tasks)),
+            delete(LLMUsageLog).where(
+                or_(LLMUsageLog.session_id.in_(owned_ids), LLMUsageLog.milestone_id.in_(milestones))
+            ),
+            delete(Artifact).where(
+                or_(Artifact.session_id.in_(owned_ids), Artifact.task_id.in_(tasks))
+            ),
+            delete(EpisodicMemory).where(
+                or_(EpisodicMemory.session_id.in_(owned_ids), EpisodicMemory.task_id.in_(tasks))
+            ),
+            delete(ProjectPlan).where(ProjectPlan.session_id.in_(owned_ids)),
+            delete(MemorySnapshot).where(MemorySnapshot.session_id.in_(owned_ids)),
+            delete(Milestone).where(Milestone.task_id.in_(tasks)),
+            delete(Task).where(Task.session_id.in_(owned_ids)),
+        ]
+        for stmt in dependents:
+            await self.session.execute(stmt.execution_options(synchronize_session=False))
+
+        result = await self.session.execute(
+            delete(Session)
+            .where(Session.id.in_(owned_ids))
+            .returning(Session.id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.scalars().all())
+
     async def get_total_cost_by_user(self, user_id: str) -> Decimal:
         """Calculate total cost across all user sessions.
 
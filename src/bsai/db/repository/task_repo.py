@@ -1,13 +1,14 @@
 """Task repository for task-specific operations."""
 
+from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from ..models.task import Task
-from .base import BaseRepository
+from .base import BaseRepository, Page
 
 
 class TaskRepository(BaseRepository[Task]):
@@ -50,6 +51,74 @@ class TaskRepository(BaseRepository[Task]):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_by_session(
+        self,
+        session_id: UUID,
+        status: str | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+        offset: int = 0,
+    ) -> Page[Task]:
+        """Get one page of a session's tasks, newest first.
+
+        Args:
+            session_id: Session UUID
+            status: Optional status filter
+            limit: Maximum number of tasks to return
+            cursor: Cursor of the page to load
+            offset: Number of tasks to skip (only without cursor)
+
+        Returns:
+            Page of tasks
+        """
+        return await self.paginate(
+            *self._session_criteria(session_id, status), limit=limit, cursor=cursor, offset=offset
+        )
+
+    async def count_by_session(self, session_id: UUID, status: str | None = None) -> int:
+        """Count a session's tasks.
+
+        Args:
+            session_id: Session UUID
+            status: Optional status filter
+
+        Returns:
+            Number of matching tasks
+        """
+        return await self.count(*self._session_criteria(session_id, status))
+
+    def _session_criteria(self, session_id: UUID, status: str | None) -> list[ColumnElement[bool]]:
+        criteria = [Task.session_id == session_id]
+        if status is not None:
+            criteria.append(Task.status == status)
+        return criteria
+
+    async def get_first_requests(
+        self, session_ids: Sequence[UUID], max_length: int
+    ) -> dict[UUID, str]:
+        """Get the start of the first task request of each session.
+
+        Resolved with a single DISTINCT ON query for all sessions.
+
+        Args:
+            session_ids: Session UUIDs
+            max_length: Maximum characters returned per request
+
+        Returns:
+            Mapping of session ID to request prefix (sessions without tasks are absent)
+        """
+        if not session_ids:
+            return {}
+
+        stmt = (
+            select(Task.session_id, func.left(Task.original_request, max_length))
+            .where(Task.session_id.in_(session_ids))
+            .distinct(Task.session_id)
+            .order_by(Task.session_id, Task.created_at.asc(), Task.id.asc())
+        )
+        result = await self.session.execute(stmt)
+        return dict(result.all())
+
     async def get_with_milestones(self, task_id: UUID) -> Task | None:
         """Get task with all milestones eagerly loaded.
 
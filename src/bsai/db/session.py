@@ -1,17 +1,117 @@
-"""Async database session factory and utilities."""
-
-from collections.abc import AsyncGenerator
+"""Async database session factory and utilities.
+
+Besides the primary engine, the session manager can hold read replica
+engines. Read-only endpoints get their sessions from ``get_read_session``,
+which picks a replica round-robin and falls back to the primary when:
+
+- no replica is configured, or every replica lags more than
+  ``max_replica_lag`` seconds (lag is measured at most once per
+  ``replica_lag_check_interval`` per replica) or cannot be reached;
+- the caller wrote recently (read-your-writes): primary sessions carrying
+  a sticky key in ``Session.info[STICKY_KEY_INFO]`` pin that key to the
+  primary for ``sticky_seconds`` after every commit that wrote.
+
+Replica sessions are marked in ``Session.info`` (see ``is_replica_session``):
+their reads may predate writes other callers committed, so callers must not
+cache what they read from them.
+
+The sticky window is tracked in process memory; the API layer also shares
+it across workers through Redis.
+"""
+
+import asyncio
+import itertools
+import time
+from collections.abc import AsyncGenerator, Sequence
+from dataclasses import dataclass
 from typing import Any
 
+import structlog
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
 
 from .models.base import Base
 
+logger = structlog.get_logger()
+
+# Session.info keys for read-your-writes tracking
+STICKY_KEY_INFO = "bsai_sticky_key"
+_WROTE_INFO = "bsai_wrote"
+_MANAGER_INFO = "bsai_session_manager"
+_REPLICA_INFO = "bsai_replica"
+
+# Seconds the replica has not replayed yet. Zero when it has replayed
+# everything it received (an idle primary writes nothing to replay) and
+# when the server is not a standby (e.g. the primary's DSN in tests).
+REPLICA_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+    """)
+
+
+class PrimarySession(Session):
+    """Session class of primary sessions; records whether a session wrote."""
+
+
+@event.listens_for(PrimarySession, "after_flush")
+def _mark_flush_write(session: Session, flush_context: UOWTransaction) -> None:
+    session.info[_WROTE_INFO] = True
+
+
+@event.listens_for(PrimarySession, "do_orm_execute")
+def _mark_statement_write(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info[_WROTE_INFO] = True
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _pin_after_write(session: Session) -> None:
+    key = session.info.get(STICKY_KEY_INFO)
+    manager = session.info.get(_MANAGER_INFO)
+    if key is not None and manager is not None and session.info.get(_WROTE_INFO):
+        manager.record_write(key)
+
+
+def session_has_writes(session: AsyncSession) -> bool:
+    """Check whether a primary session has written anything.
+
+    Args:
+        session: Session from ``get_session``
+
+    Returns:
+        True once the session flushed or executed an INSERT, UPDATE or DELETE
+    """
+    return bool(session.info.get(_WROTE_INFO))
+
+
+def is_replica_session(session: AsyncSession) -> bool:
+    """Check whether a session reads from a read replica.
+
+    Args:
+        session: Session from ``get_session`` or ``get_read_session``
+
+    Returns:
+        True for replica sessions, whose reads may lag behind the primary
+    """
+    return bool(session.info.get(_REPLICA_INFO))
+
+
+@dataclass
+class _ReplicaState:
+    """Last measured lag of a replica."""
+
+    lag: float | None = None
+    checked_at: float = float("-inf")
+
 
 class DatabaseSessionManager:
     """Manages database engine and session creation.
@@ -22,6 +122,8 @@ class DatabaseSessionManager:
     Attributes:
         engine: SQLAlchemy async engine instance
         session_factory: Factory for creating async sessions
+        replica_engines: Engines of the read replicas (may be empty)
+        replica_session_factories: Session factories of the read replicas
     """
 
     def __init__(
@@ -29,6 +131,10 @@ class DatabaseSessionManager:
         database_url: str,
         pool_size: int = 10,
         max_overflow: int = 20,
+        replica_urls: Sequence[str] = (),
+        max_replica_lag: float = 5.0,
+        replica_lag_check_interval: float = 2.0,
+        sticky_seconds: float = 5.0,
         **engine_kwargs: Any,
     ) -> None:
         """Initialize database session manager.
@@ -37,26 +143,72 @@ class DatabaseSessionManager:
             database_url: PostgreSQL connection URL (must start with postgresql+asyncpg://)
             pool_size: Number of persistent connections in the pool
             max_overflow: Max additional connections beyond pool_size
+            replica_urls: Read replica connection URLs (same driver and pool settings)
+            max_replica_lag: Replication lag in seconds beyond which reads use the primary
+            replica_lag_check_interval: Seconds a measured replica lag is reused
+            sticky_seconds: Seconds a sticky key reads from the primary after a write
             **engine_kwargs: Additional arguments passed to create_async_engine
         """
-        self.engine: AsyncEngine = create_async_engine(
-            database_url,
-            pool_size=pool_size,
-            max_overflow=max_overflow,
-            pool_pre_ping=True,  # Verify connections before use
-            pool_recycle=3600,  # Recycle connections after 1 hour
-            **engine_kwargs,
+        self.engine: AsyncEngine = self._create_engine(
+            database_url, pool_size, max_overflow, **engine_kwargs
         )
         self.session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
             bind=self.engine,
             class_=AsyncSession,
+            sync_session_class=PrimarySession,
+            info={_MANAGER_INFO: self},
             expire_on_commit=False,
             autoflush=False,
             autocommit=False,
         )
 
+        self.replica_engines: list[AsyncEngine] = [
+            self._create_engine(url, pool_size, max_overflow, **engine_kwargs)
+            for url in replica_urls
+        ]
+        self.replica_session_factories: list[async_sessionmaker[AsyncSession]] = [
+            async_sessionmaker(
+                bind=engine,
+                class_=AsyncSession,
+                info={_REPLICA_INFO: True},
+                expire_on_commit=False,
+                autoflush=False,
+                autocommit=False,
+            )
+            for engine in self.replica_engines
+        ]
+        self.max_replica_lag = max_replica_lag
+        self.replica_lag_check_interval = replica_lag_check_interval
+        self.sticky_seconds = sticky_seconds
+
+        self._replica_states = [_ReplicaState() for _ in self.replica_engines]
+        self._replica_locks = [asyncio.Lock() for _ in self.replica_engines]
+        self._next_replica = itertools.count()
+        # sticky key -> monotonic time until which it reads from the primary
+        self._pinned_until: dict[str, float] = {}
+
+    @staticmethod
+    def _create_engine(
+        url: str, pool_size: int, max_overflow: int, **engine_kwargs: Any
+    ) -> AsyncEngine:
+        return create_async_engine(
+            url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=True,  # Verify connections before use
+            pool_recycle=3600,  # Recycle connections after 1 hour
+            **engine_kwargs,
+        )
+
+    @property
+    def has_replicas(self) -> bool:
+        """Whether read replicas are configured."""
+        return bool(self.replica_engines)
+
     async def close(self) -> None:
-        """Close database engine and all connections."""
+        """Close database engines and all connections."""
+        for replica_engine in self.replica_engines:
+            await replica_engine.dispose()
         if self.engine:
             await self.engine.dispose()
 
@@ -70,7 +222,33 @@ class DatabaseSessionManager:
             async with session_manager.get_session() as session:
                 result = await session.execute(select(User))
         """
-        async with self.session_factory() as session:
+        async for session in self._open(self.session_factory):
+            yield session
+
+    async def get_read_session(
+        self, sticky_key: str | None = None, use_primary: bool = False
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """Get a session for read-only work, from a replica when possible.
+
+        Args:
+            sticky_key: Key of the caller (e.g. user ID); reads use the primary
+                while it is pinned by a recent write
+            use_primary: Read from the primary regardless of replicas
+                (e.g. the caller's write was recorded by another worker)
+
+        Yields:
+            AsyncSession: Replica or primary session (never write with it)
+        """
+        factory = self.session_factory
+        if not use_primary and not (sticky_key is not None and self.is_pinned(sticky_key)):
+            factory = await self._choose_replica() or self.session_factory
+        async for session in self._open(factory):
+            yield session
+
+    async def _open(
+        self, factory: async_sessionmaker[AsyncSession]
+    ) -> AsyncGenerator[AsyncSession, None]:
+        async with factory() as session:
             try:
                 yield session
             except Exception:
@@ -79,6 +257,75 @@ class DatabaseSessionManager:
             finally:
                 await session.close()
 
+    def record_write(self, sticky_key: str) -> None:
+        """Pin a sticky key to the primary for ``sticky_seconds``.
+
+        Args:
+            sticky_key: Key of the writer (e.g. user ID)
+        """
+        if not self.has_replicas:
+            return
+        now = time.monotonic()
+        self._pinned_until[sticky_key] = now + self.sticky_seconds
+        # Drop expired pins once the map grows, so it stays bounded by active writers
+        if len(self._pinned_until) > 1024:
+            self._pinned_until = {k: t for k, t in self._pinned_until.items() if t > now}
+
+    def is_pinned(self, sticky_key: str) -> bool:
+        """Check whether a sticky key must read from the primary.
+
+        Args:
+            sticky_key: Key of the caller
+
+        Returns:
+            True within ``sticky_seconds`` of the key's last write
+        """
+        pinned_until = self._pinned_until.get(sticky_key)
+        return pinned_until is not None and pinned_until > time.monotonic()
+
+    async def _choose_replica(self) -> async_sessionmaker[AsyncSession] | None:
+        """Pick the next replica within the lag threshold (round-robin)."""
+        count = len(self.replica_engines)
+        start = next(self._next_replica)
+        for offset in range(count):
+            index = (start + offset) % count
+            lag = await self.get_replica_lag(index)
+            if lag is not None and lag <= self.max_replica_lag:
+                return self.replica_session_factories[index]
+        if count:
+            logger.warning("read_replicas_unavailable", replicas=count)
+        return None
+
+    async def get_replica_lag(self, index: int) -> float | None:
+        """Get the replication lag of a replica, measured at most once per interval.
+
+        Args:
+            index: Replica index (position in ``replica_urls``)
+
+        Returns:
+            Lag in seconds, or None if the replica cannot be queried
+        """
+        state = self._replica_states[index]
+        if time.monotonic() - state.checked_at < self.replica_lag_check_interval:
+            return state.lag
+
+        async with self._replica_locks[index]:
+            # Measured by a concurrent caller while waiting for the lock
+            if time.monotonic() - state.checked_at < self.replica_lag_check_interval:
+                return state.lag
+            try:
+                async with self.replica_engines[index].connect() as conn:
+                    value = await conn.scalar(REPLICA_LAG_QUERY)
+                state.lag = float(value) if value is not None else None
+            except Exception as e:
+                logger.warning("read_replica_lag_check_failed", replica=index, error=str(e))
+                state.lag = None
+            state.checked_at = time.monotonic()
+
+        if state.lag is not None and state.lag > self.max_replica_lag:
+            logger.warning("read_replica_lagging", replica=index, lag=state.lag)
+        return state.lag
+
     async def create_all(self) -> None:
         """Create all tables defined in Base metadata.
 
@@ -101,11 +348,13 @@ class DatabaseSessionManager:
 session_manager: DatabaseSessionManager | None = None
 
 
-def init_db(database_url: str) -> None:
+def init_db(database_url: str, **manager_kwargs: Any) -> None:
     """Initialize the global database session manager.
 
     Args:
         database_url: PostgreSQL connection URL (must use asyncpg driver)
+        **manager_kwargs: Additional DatabaseSessionManager arguments
+            (read replicas, pool sizes)
 
     Raises:
         RuntimeError: If already initialized
@@ -113,7 +362,7 @@ def init_db(database_url: str) -> None:
     global session_manager
     if session_manager is not None:
         raise RuntimeError("DatabaseSessionManager already initialized")
-    session_manager = DatabaseSessionManager(database_url)
+    session_manager = DatabaseSessionManager(database_url, **manager_kwargs)
 
 
 async def close_db() -> None:
@@ -156,3 +405,20 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     manager = get_session_manager()
     async for session in manager.get_session():
         yield session
+
+
+async def get_read_db_session(
+    sticky_key: str | None = None, use_primary: bool = False
+) -> AsyncGenerator[AsyncSession, None]:
+    """Get a read-only session from the global manager (replica when possible).
+
+    Args:
+        sticky_key: Key of the caller for read-your-writes stickiness
+        use_primary: Read from the primary regardless of replicas
+
+    Yields:
+        AsyncSession: Replica or primary session
+    """
+    manager = get_session_manager()
+    async for session in manager.get_read_session(sticky_key, use_primary):
+        yield session
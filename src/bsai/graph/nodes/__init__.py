@@ -14,6 +14,7 @@ that LangGraph merges with the existing state.
 from __future__ import annotations
 
 from enum import StrEnum
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 import structlog
@@ -21,13 +22,20 @@ from langchain_core.runnables import RunnableConfig
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bsai.api.websocket.manager import ConnectionManager
+from bsai.cache import SessionCache
 from bsai.container import ContainerState
 from bsai.db.models.enums import TaskStatus
 from bsai.db.repository.task_repo import TaskRepository
 from bsai.events import AgentActivityEvent, AgentStatus, EventBus, EventType
+from bsai.graph.utils import count_task_statuses, get_plan_task_index
 from bsai.mcp.executor import McpToolExecutor
 from bsai.memory import LongTermMemoryManager
 from bsai.services import BreakpointService
+from bsai.services.cancellation import get_cancellation_service
+
+if TYPE_CHECKING:
+    from bsai.db.models.project_plan import ProjectPlan
+    from bsai.db.repository.project_plan_repo import ProjectPlanRepository
 
 _logger = structlog.get_logger()
 
@@ -367,6 +375,98 @@ def get_ws_manager_optional(config: RunnableConfig) -> ConnectionManager | None:
     return configurable.get("ws_manager")
 
 
+def get_session_cache_optional(config: RunnableConfig) -> SessionCache | None:
+    """Extract SessionCache from config (optional).
+
+    Args:
+        config: LangGraph RunnableConfig
+
+    Returns:
+        SessionCache instance or None if not available
+    """
+    configurable = config.get("configurable", {})
+    return configurable.get("cache")
+
+
+async def update_progress_counters(
+    config: RunnableConfig,
+    task_id: UUID,
+    user_id: str,
+    tasks: list[dict[str, Any]],
+    previous_status: str | None,
+    new_status: str,
+    current_task: str | None = None,
+) -> None:
+    """Apply a plan task status change to the cached progress counters.
+
+    Seeds the counters from ``tasks`` (which must already reflect the
+    change) when they are not cached yet. Cache errors are logged and
+    never fail the node.
+
+    Args:
+        config: LangGraph RunnableConfig
+        task_id: Task UUID
+        user_id: Task owner
+        tasks: Plan tasks after the change
+        previous_status: Status the plan task leaves
+        new_status: Status the plan task enters
+        current_task: Plan task executing after the change (None if idle)
+    """
+    cache = get_session_cache_optional(config)
+    if cache is None:
+        return
+
+    try:
+        applied = await cache.apply_task_progress_transition(
+            task_id, previous_status, new_status, current_task
+        )
+        if not applied:
+            counts, _ = count_task_statuses(tasks)
+            await cache.seed_task_progress_counters(task_id, user_id, counts, current_task)
+    except Exception as e:
+        _logger.warning(
+            "progress_counters_update_failed",
+            task_id=str(task_id),
+            error=str(e),
+        )
+
+
+async def save_plan_task_fields(
+    plan_repo: ProjectPlanRepository,
+    project_plan: ProjectPlan,
+    task_id: str,
+    fields: dict[str, Any],
+    **values: Any,
+) -> None:
+    """Persist fields already set on one plan task (see set_plan_task_fields).
+
+    Only the task fields are written. If the stored plan does not have the
+    task at its in-memory index (the plan changed in the database), the
+    whole plan_data of ``project_plan`` is written instead, so the change
+    is never lost.
+
+    Args:
+        plan_repo: Project plan repository (its session is not committed)
+        project_plan: ProjectPlan holding the updated task
+        task_id: Plan task ID
+        fields: Task fields to persist
+        **values: Other plan columns to update in the same statement
+    """
+    task_index = get_plan_task_index(project_plan, task_id)
+    if task_index >= 0 and await plan_repo.update_task_fields(
+        project_plan.id, task_index, task_id, fields, **values
+    ):
+        return
+
+    _logger.warning(
+        "plan_task_update_missed",
+        plan_id=str(project_plan.id),
+        plan_task_id=task_id,
+        task_index=task_index,
+    )
+    await plan_repo.update(project_plan.id, plan_data=project_plan.plan_data, **values)
+
+
 def get_memory_manager(
     config: RunnableConfig,
     session: AsyncSession,
@@ -397,6 +497,10 @@ async def check_task_cancelled(
 ) -> bool:
     """Check if task has been cancelled.
 
+    Uses the task's in-process cancellation token when this process runs
+    the task and receives cancellations over Redis; otherwise falls back
+    to reading the task status from the database.
+
     Args:
         session: Database session
         task_id: Task UUID to check
@@ -404,6 +508,15 @@ async def check_task_cancelled(
     Returns:
         True if task is cancelled/failed, False otherwise
     """
+    cancellation = get_cancellation_service()
+    token = cancellation.get(task_id)
+    if token is not None:
+        if token.is_cancelled:
+            _logger.info("task_cancelled_detected", task_id=str(task_id), source="token")
+            return True
+        if cancellation.listening:
+            return False
+
     task_repo = TaskRepository(session)
     task = await task_repo.get_by_id(task_id)
 
@@ -449,6 +562,9 @@ __all__ = [
     "get_mcp_executor",
     "get_event_bus",
     "get_ws_manager_optional",
+    "get_session_cache_optional",
+    "update_progress_counters",
+    "save_plan_task_fields",
     "get_memory_manager",
     "check_task_cancelled",
     # Plan review breakpoint
@@ -16,14 +16,21 @@ from bsai.db.models.enums import MilestoneStatus, TaskStatus
 from bsai.db.repository.project_plan_repo import ProjectPlanRepository
 from bsai.events import EventType, MilestoneRetryEvent, MilestoneStatusChangedEvent
 from bsai.graph.utils import (
-    get_task_index,
+    get_plan_task,
+    get_plan_task_index,
     get_tasks_from_plan,
+    set_plan_task_fields,
     update_task_status,
 )
 from bsai.memory import store_task_memory
 
 from ..state import AgentState
-from . import get_event_bus, get_memory_manager
+from . import (
+    get_event_bus,
+    get_memory_manager,
+    save_plan_task_fields,
+    update_progress_counters,
+)
 
 if TYPE_CHECKING:
     from bsai.db.models.project_plan import ProjectPlan
@@ -87,6 +94,7 @@ async def advance_node(
     if qa_decision == "retry":
         return await _handle_retry(
             state=state,
+            config=config,
             event_bus=event_bus,
             milestone_id=milestone_id,
             idx=idx,
@@ -96,6 +104,7 @@ async def advance_node(
     elif qa_decision == "fail":
         return await _handle_fail(
             state=state,
+            config=config,
             event_bus=event_bus,
             milestone_id=milestone_id,
             idx=idx,
@@ -174,25 +183,38 @@ async def _handle_pass(
     """
     # Mark current task as completed
     if current_task_id:
-        updated_plan_data = update_task_status(
-            project_plan.plan_data,
-            current_task_id,
-            "completed",
-        )
+        current_task = get_plan_task(project_plan, current_task_id)
+        previous_status = current_task.get("status", "pending") if current_task else None
+        task_index = set_plan_task_fields(project_plan, current_task_id, {"status": "completed"})
 
-        # Persist to database
+        # Persist to database (only the changed task field is written)
         plan_repo = ProjectPlanRepository(session)
-        await plan_repo.update(
-            project_plan.id,
-            plan_data=updated_plan_data,
-            completed_tasks=project_plan.completed_tasks + 1,
-        )
+        if task_index >= 0:
+            await save_plan_task_fields(
+                plan_repo,
+                project_plan,
+                current_task_id,
+                {"status": "completed"},
+                completed_tasks=project_plan.completed_tasks + 1,
+            )
+        else:
+            await plan_repo.update(
+                project_plan.id, completed_tasks=project_plan.completed_tasks + 1
+            )
         await session.commit()
 
         # Update project_plan reference
-        project_plan.plan_data = updated_plan_data
         project_plan.completed_tasks += 1
 
+        await update_progress_counters(
+            config,
+            state["task_id"],
+            state["user_id"],
+            get_tasks_from_plan(project_plan),
+            previous_status,
+            "completed",
+        )
+
         # Emit task completed event
         await event_bus.emit(
             MilestoneStatusChangedEvent(
@@ -260,7 +282,7 @@ async def _handle_pass(
             "should_continue": False,
         }
 
-    next_idx = get_task_index(updated_tasks, next_task_id)
+    next_idx = get_plan_task_index(project_plan, next_task_id)
 
     logger.info(
         "task_advanced",
@@ -284,6 +306,7 @@ async def _handle_pass(
 
 async def _handle_retry(
     state: AgentState,
+    config: RunnableConfig,
     event_bus: Any,
     milestone_id: Any,
     idx: int,
@@ -293,6 +316,7 @@ async def _handle_retry(
 
     Args:
         state: Current workflow state
+        config: LangGraph config
         event_bus: Event bus for emitting events
         milestone_id: Milestone/task ID for events
         idx: Current index
@@ -315,6 +339,8 @@ async def _handle_retry(
             max_retries=max_retries,
         )
 
+        await _record_failed_progress(state, config, task_id)
+
         # Emit task failed event due to max retries
         await event_bus.emit(
             MilestoneStatusChangedEvent(
@@ -370,6 +396,7 @@ async def _handle_retry(
 
 async def _handle_fail(
     state: AgentState,
+    config: RunnableConfig,
     event_bus: Any,
     milestone_id: Any,
     idx: int,
@@ -379,6 +406,7 @@ async def _handle_fail(
 
     Args:
         state: Current workflow state
+        config: LangGraph config
         event_bus: Event bus for emitting events
         milestone_id: Milestone/task ID for events
         idx: Current index
@@ -393,6 +421,8 @@ async def _handle_fail(
         milestone_index=idx,
     )
 
+    await _record_failed_progress(state, config, task_id)
+
     # Emit task failed event
     await event_bus.emit(
         MilestoneStatusChangedEvent(
@@ -413,3 +443,32 @@ async def _handle_fail(
         "workflow_complete": True,
         "should_continue": False,
     }
+
+
+async def _record_failed_progress(
+    state: AgentState,
+    config: RunnableConfig,
+    task_id: str | None,
+) -> None:
+    """Count the current plan task as failed in the progress counters.
+
+    Args:
+        state: Current workflow state
+        config: LangGraph config
+        task_id: Plan task ID that failed
+    """
+    project_plan = state.get("project_plan")
+    if not task_id or not project_plan or project_plan.plan_data is None:
+        return
+
+    current_task = get_plan_task(project_plan, task_id)
+    previous_status = current_task.get("status", "pending") if current_task else None
+    failed_plan_data = update_task_status(project_plan.plan_data, task_id, "failed")
+    await update_progress_counters(
+        config,
+        state["task_id"],
+        state["user_id"],
+        failed_plan_data.get("tasks", []),
+        previous_status,
+        "failed",
+    )
@@ -20,11 +20,23 @@ from bsai.db.models.enums import TaskComplexity, TaskStatus
 from bsai.db.repository.artifact_repo import ArtifactRepository
 from bsai.db.repository.project_plan_repo import ProjectPlanRepository
 from bsai.events import AgentActivityEvent, AgentStatus, EventType
-from bsai.graph.utils import get_task_by_id, get_tasks_from_plan, update_task_status
-from bsai.llm import ChatMessage
+from bsai.graph.utils import (
+    get_plan_task,
+    get_plan_task_index,
+    get_tasks_from_plan,
+    set_plan_task_fields,
+)
+from bsai.llm import ChatMessage, MessagePriority
 
 from ..state import AgentState
-from . import check_task_cancelled, get_container, get_event_bus, get_ws_manager_optional
+from . import (
+    check_task_cancelled,
+    get_container,
+    get_event_bus,
+    get_ws_manager_optional,
+    save_plan_task_fields,
+    update_progress_counters,
+)
 
 logger = structlog.get_logger()
 
@@ -83,7 +95,7 @@ def _build_artifacts_context_message(artifacts: list[Artifact]) -> ChatMessage |
         "## Session Files\n"
         f"Total: {len(artifacts)} files, ~{total_chars} chars\n\n" + "\n".join(file_list)
     )
-    return ChatMessage(role="system", content=content)
+    return ChatMessage(role="system", content=content, priority=MessagePriority.CONTEXT)
 
 
 async def _copy_previous_snapshot_to_task(
@@ -186,6 +198,33 @@ async def _save_task_artifacts(
     ]
 
 
+def _track_changed_files(
+    state: AgentState,
+    retry_count: int,
+    extraction_result: ExtractionResult,
+) -> tuple[list[str], list[str]]:
+    """Accumulate files written and deleted across attempts of the current task.
+
+    QA validates incrementally against this set, so files touched by an
+    earlier failed attempt stay in scope on retries.
+
+    Returns:
+        Tuple of (changed_files, deleted_files)
+    """
+    changed = set(state.get("changed_files") or []) if retry_count > 0 else set()
+    deleted = set(state.get("deleted_files") or []) if retry_count > 0 else set()
+
+    for path in extraction_result.deleted_paths:
+        path = path.strip("/")
+        deleted.add(path)
+        changed.discard(path)
+    for path in extraction_result.changed_paths:
+        changed.add(path)
+        deleted.discard(path)
+
+    return sorted(changed), sorted(deleted)
+
+
 def _prepare_worker_prompt(
     state: AgentState,
     task: dict[str, Any],
@@ -217,14 +256,6 @@ def _get_complexity_from_task(task: dict[str, Any]) -> TaskComplexity:
         return TaskComplexity.MODERATE
 
 
-def _get_task_index(tasks: list[dict[str, Any]], task_id: str) -> int:
-    """Get index of task in list."""
-    for i, task in enumerate(tasks):
-        if task.get("id") == task_id:
-            return i
-    return 0
-
-
 async def execute_worker_node(
     state: AgentState,
     config: RunnableConfig,
@@ -263,8 +294,7 @@ async def execute_worker_node(
             return {"error": "No project_plan available", "error_node": "execute_worker"}
 
         current_task_id = state.get("current_task_id")
-        tasks = get_tasks_from_plan(project_plan)
-        task = get_task_by_id(tasks, current_task_id) if current_task_id else None
+        task = get_plan_task(project_plan, current_task_id) if current_task_id else None
 
         if task is None:
             return {
@@ -273,7 +303,7 @@ async def execute_worker_node(
             }
 
         task_complexity = _get_complexity_from_task(task)
-        task_idx = _get_task_index(tasks, current_task_id) if current_task_id else 0
+        task_idx = get_plan_task_index(project_plan, current_task_id) if current_task_id else 0
         retry_count = state.get("retry_count", 0)
 
         logger.debug(
@@ -316,16 +346,11 @@ async def execute_worker_node(
             await _load_artifacts_for_context(artifact_repo, state["task_id"], state["session_id"])
         )
 
-        # Build context messages
+        # Build context messages. The file list changes with every task, so it
+        # is sent after the (cacheable) history rather than in front of it.
         context_messages = list(state.get("context_messages", []))
         artifacts_context = _build_artifacts_context_message(merged_artifacts)
         if artifacts_context:
-            context_messages = [
-                msg
-                for msg in context_messages
-                if not (msg.role == "system" and "Artifacts" in msg.content)
-            ]
-            context_messages.insert(0, artifacts_context)
             logger.info(
                 "artifacts_loaded_for_context",
                 task_id=str(state["task_id"]),
@@ -349,6 +374,8 @@ async def execute_worker_node(
                 user_id=state["user_id"],
                 session_id=state["session_id"],
                 task_id=state["task_id"],
+                context_messages=context_messages,
+                artifacts_context=artifacts_context,
             )
         else:
             response = await worker.execute_milestone(
@@ -360,21 +387,25 @@ async def execute_worker_node(
                 task_id=state["task_id"],
                 preferred_model=None,
                 context_messages=context_messages,
+                artifacts_context=artifacts_context,
             )
 
-        # Update project_plan task status
+        # Update project_plan task status and store worker output in task
+        task_fields = {"status": "in_progress", "worker_output": response.content}
         if current_task_id:
-            updated_plan_data = update_task_status(
-                project_plan.plan_data,
-                current_task_id,
-                "in_progress",
-            )
-            # Store worker output in task
-            for t in updated_plan_data.get("tasks", []):
-                if t.get("id") == current_task_id:
-                    t["worker_output"] = response.content
-                    break
-            project_plan.plan_data = updated_plan_data
+            previous_status = task.get("status", "pending")
+            set_plan_task_fields(project_plan, current_task_id, task_fields)
+
+            if previous_status != "in_progress":
+                await update_progress_counters(
+                    config,
+                    state["task_id"],
+                    state["user_id"],
+                    get_tasks_from_plan(project_plan),
+                    previous_status,
+                    "in_progress",
+                    current_task=current_task_id,
+                )
 
         # Update context with new exchange
         context_messages = list(state.get("context_messages", []))
@@ -386,12 +417,10 @@ async def execute_worker_node(
         total_input = state.get("total_input_tokens", 0) + response.usage.input_tokens
         total_output = state.get("total_output_tokens", 0) + response.usage.output_tokens
 
-        model = container.router.select_model(complexity=task_complexity)
-        call_cost = container.router.calculate_cost(
-            model=model,
-            input_tokens=response.usage.input_tokens,
-            output_tokens=response.usage.output_tokens,
+        model = container.router.served_model(
+            container.router.select_model(complexity=task_complexity), response.model
         )
+        call_cost = container.router.calculate_usage_cost(model=model, usage=response.usage)
         total_cost = Decimal(state.get("total_cost_usd", "0")) + call_cost
 
         logger.info(
@@ -419,9 +448,10 @@ async def execute_worker_node(
                 "project_plan": project_plan,
             }
 
-        # Persist plan data update
-        plan_repo = ProjectPlanRepository(session)
-        await plan_repo.update(project_plan.id, plan_data=project_plan.plan_data)
+        # Persist the task update (only the changed task fields are written)
+        if current_task_id:
+            plan_repo = ProjectPlanRepository(session)
+            await save_plan_task_fields(plan_repo, project_plan, current_task_id, task_fields)
         await session.commit()
 
         # Extract and save artifacts
@@ -443,6 +473,8 @@ async def execute_worker_node(
             previous_snapshot=previous_snapshot,
         )
 
+        changed_files, deleted_files = _track_changed_files(state, retry_count, extraction_result)
+
         # Build and emit worker completed event
         output_preview = (
             response.content[:500] + "..." if len(response.content) > 500 else response.content
@@ -482,6 +514,8 @@ async def execute_worker_node(
             "total_output_tokens": total_output,
             "total_cost_usd": str(total_cost),
             "project_plan": project_plan,
+            "changed_files": changed_files,
+            "deleted_files": deleted_files,
         }
 
     except Exception as e:
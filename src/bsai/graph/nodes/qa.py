@@ -6,13 +6,16 @@ Validates worker output using the QA agent.
 from __future__ import annotations
 
 from typing import Any
+from uuid import UUID
 
 import structlog
 from langchain_core.runnables import RunnableConfig
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from bsai.cache import get_redis
 from bsai.core import QAAgent, QADecision
 from bsai.graph.utils import get_task_by_id, get_tasks_from_plan
+from bsai.llm.schemas import QAConfig
 from bsai.memory import store_qa_learning
 
 from ..state import AgentState
@@ -21,6 +24,23 @@ from . import NodeContext
 logger = structlog.get_logger()
 
 
+async def _load_qa_config(task_id: UUID) -> QAConfig | None:
+    """Load the QA configuration set for a task via the API.
+
+    Args:
+        task_id: Task UUID
+
+    Returns:
+        QAConfig stored by TaskService.update_qa_config, or None if unset/unavailable
+    """
+    try:
+        raw = await get_redis().client.get(f"task:{task_id}:qa_config")
+        return QAConfig.model_validate_json(raw) if raw else None
+    except Exception as e:
+        logger.warning("qa_config_load_failed", task_id=str(task_id), error=str(e))
+        return None
+
+
 async def verify_qa_node(
     state: AgentState,
     config: RunnableConfig,
@@ -83,6 +103,7 @@ async def verify_qa_node(
             prompt_manager=ctx.container.prompt_manager,
             session=session,
             ws_manager=ctx.ws_manager,
+            qa_config=await _load_qa_config(state["task_id"]),
         )
 
         decision, feedback, qa_output = await qa.validate_output(
@@ -92,6 +113,9 @@ async def verify_qa_node(
             worker_output=worker_output,
             user_id=state["user_id"],
             session_id=state["session_id"],
+            task_id=state["task_id"],
+            changed_files=state.get("changed_files"),
+            deleted_files=state.get("deleted_files"),
         )
 
         logger.info(
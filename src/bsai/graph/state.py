@@ -77,6 +77,12 @@ class AgentState(TypedDict):
     retry_count: NotRequired[int]
     """Number of retry attempts for current task (max 3)."""
 
+    changed_files: NotRequired[list[str]]
+    """Files written by the Worker across attempts of the current task."""
+
+    deleted_files: NotRequired[list[str]]
+    """Files deleted by the Worker across attempts of the current task."""
+
     # =========================================================================
     # 4. CONTEXT MANAGEMENT (Memory and tokens)
     # =========================================================================
@@ -11,6 +11,9 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from bsai.db.models.project_plan import ProjectPlan
 
+# Attribute caching (tasks list, {task id: index}) on a ProjectPlan instance
+_TASK_INDEX_ATTR = "_task_index"
+
 
 def get_task_by_id(tasks: list[dict[str, Any]], task_id: str) -> dict[str, Any] | None:
     """Find task by ID in task list.
@@ -59,6 +62,73 @@ def get_tasks_from_plan(project_plan: ProjectPlan) -> list[dict[str, Any]]:
     return tasks
 
 
+def get_plan_task_index(project_plan: ProjectPlan, task_id: str) -> int:
+    """Get the index of a task in the plan's task list.
+
+    The id -> index map is built once per task list and cached on the plan
+    instance, so repeated lookups during a workflow are O(1). The map is
+    rebuilt when a lookup misses or hits a task with another ID, which
+    happens after tasks were inserted or removed in place.
+
+    Args:
+        project_plan: ProjectPlan model instance
+        task_id: Task ID to find
+
+    Returns:
+        Index of task, or -1 if not found
+    """
+    tasks = get_tasks_from_plan(project_plan)
+    cached = getattr(project_plan, _TASK_INDEX_ATTR, None)
+    if isinstance(cached, tuple) and cached[0] is tasks:
+        index: int = cached[1].get(task_id, -1)
+        if 0 <= index < len(tasks) and tasks[index].get("id") == task_id:
+            return index
+    cached = (tasks, {task.get("id"): i for i, task in enumerate(tasks)})
+    setattr(project_plan, _TASK_INDEX_ATTR, cached)
+    index = cached[1].get(task_id, -1)
+    return index
+
+
+def get_plan_task(project_plan: ProjectPlan, task_id: str) -> dict[str, Any] | None:
+    """Find task by ID using the plan's cached index.
+
+    Args:
+        project_plan: ProjectPlan model instance
+        task_id: Task ID to find
+
+    Returns:
+        Task dict or None if not found
+    """
+    index = get_plan_task_index(project_plan, task_id)
+    return get_tasks_from_plan(project_plan)[index] if index >= 0 else None
+
+
+def set_plan_task_fields(
+    project_plan: ProjectPlan,
+    task_id: str,
+    fields: dict[str, Any],
+) -> int:
+    """Update fields of one task in the plan's task list.
+
+    The task dict is replaced by an updated copy; the task list itself is
+    kept, so the cached index stays valid. Persist the change with
+    ``bsai.graph.nodes.save_plan_task_fields``.
+
+    Args:
+        project_plan: ProjectPlan model instance
+        task_id: Task ID to update
+        fields: Task fields to set (e.g. {"status": "completed"})
+
+    Returns:
+        Index of the updated task, or -1 if not found
+    """
+    index = get_plan_task_index(project_plan, task_id)
+    if index >= 0:
+        tasks = get_tasks_from_plan(project_plan)
+        tasks[index] = {**tasks[index], **fields}
+    return index
+
+
 def update_task_status(
     plan_data: dict[str, Any],
     task_id: str,
@@ -89,9 +159,32 @@ def update_task_status(
     return {**plan_data, "tasks": updated_tasks}
 
 
+def count_task_statuses(tasks: list[dict[str, Any]]) -> tuple[dict[str, int], str | None]:
+    """Count plan tasks per status.
+
+    Args:
+        tasks: List of task dictionaries
+
+    Returns:
+        Tuple of (count per status, ID of the first in-progress task or None)
+    """
+    counts: dict[str, int] = {}
+    current_task: str | None = None
+    for task in tasks:
+        status = task.get("status", "pending")
+        counts[status] = counts.get(status, 0) + 1
+        if status == "in_progress" and current_task is None:
+            current_task = task.get("id")
+    return counts, current_task
+
+
 __all__ = [
+    "count_task_statuses",
+    "get_plan_task",
+    "get_plan_task_index",
     "get_task_by_id",
     "get_task_index",
     "get_tasks_from_plan",
+    "set_plan_task_fields",
     "update_task_status",
 ]
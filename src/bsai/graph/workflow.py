@@ -12,11 +12,13 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from decimal import Decimal
 from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID
 
 import structlog
 from langchain_core.runnables import RunnableConfig
+from langgraph.errors import GraphBubbleUp
 from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -24,13 +26,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from bsai.api.websocket.manager import ConnectionManager
 from bsai.cache import SessionCache
 from bsai.container import lifespan
-from bsai.db.models.enums import TaskStatus
+from bsai.db.models.enums import AgentType, TaskStatus
 from bsai.db.repository.memory_snapshot_repo import MemorySnapshotRepository
 from bsai.db.repository.session_repo import SessionRepository
 from bsai.db.repository.task_repo import TaskRepository
 from bsai.events import EventBus
-from bsai.llm import ChatMessage
+from bsai.llm import ChatMessage, MessagePriority
 from bsai.services import BreakpointService
+from bsai.telemetry import get_telemetry_writer, telemetry_context
 from bsai.tracing import get_langfuse_callback, get_langfuse_tracer
 
 from .checkpointer import get_checkpointer
@@ -70,23 +73,61 @@ class WorkflowResult:
 
 logger = structlog.get_logger()
 
+# Agent attributed to each node in telemetry; other nodes are recorded by node name
+NODE_AGENT_TYPES: dict[str, str] = {
+    Node.ANALYZE_TASK: AgentType.ARCHITECT,
+    Node.EXECUTE_WORKER: AgentType.WORKER,
+    Node.VERIFY_QA: AgentType.QA,
+    Node.GENERATE_RESPONSE: AgentType.RESPONDER,
+}
+
+
+def _step_usage(state: AgentState, result: dict[str, Any]) -> dict[str, Any]:
+    """Derive a node's token and cost usage from its state update.
+
+    Args:
+        state: State the node received
+        result: Partial state update the node returned
+
+    Returns:
+        Keyword arguments for TelemetryWriter.complete_step
+    """
+    prev_input = state.get("total_input_tokens", 0)
+    prev_output = state.get("total_output_tokens", 0)
+    prev_cost = Decimal(state.get("total_cost_usd", "0"))
+    error = result.get("error")
+    return {
+        "input_tokens": max(result.get("total_input_tokens", prev_input) - prev_input, 0),
+        "output_tokens": max(result.get("total_output_tokens", prev_output) - prev_output, 0),
+        "cost_usd": max(Decimal(result.get("total_cost_usd", prev_cost)) - prev_cost, Decimal("0")),
+        "error_message": str(error) if error else None,
+    }
+
 
 def _create_node_with_session(
     node_func: Callable[..., Any],
     session: AsyncSession,
+    node_name: str | None = None,
 ) -> Callable[..., Any]:
     """Create a node function with session bound.
 
     LangGraph nodes receive (state, config), so we wrap the original
     node function to inject the session as the third argument.
 
+    The wrapper also sets the telemetry context for LLM usage attribution
+    and records the node as an agent step (write-behind, off the node's
+    transaction).
+
     Args:
         node_func: The node function to wrap
         session: Database session to bind
+        node_name: Workflow node name (defaults to the function name)
 
     Returns:
         Wrapped async function compatible with LangGraph
     """
+    name = node_name or node_func.__name__
+    agent_type = NODE_AGENT_TYPES.get(name, name)
 
     async def wrapper(state: AgentState, config: RunnableConfig) -> dict[str, Any]:
         # Check if session is in an invalid state from a previous error
@@ -94,7 +135,30 @@ def _create_node_with_session(
         if not session.is_active:
             await session.rollback()
 
-        result: dict[str, Any] = await node_func(state, config, session)
+        session_id = state.get("session_id")
+        task_id = state.get("task_id")
+        if session_id is None or task_id is None:
+            result: dict[str, Any] = await node_func(state, config, session)
+            return result
+
+        telemetry = get_telemetry_writer()
+        with telemetry_context(session_id=session_id, task_id=task_id, agent_type=agent_type):
+            step_id = telemetry.start_step(
+                task_id=task_id,
+                agent_type=agent_type,
+                metadata={"node": name},
+            )
+            try:
+                result = await node_func(state, config, session)
+            except GraphBubbleUp:
+                # Interrupts (HITL breakpoints) are control flow, not failures
+                telemetry.complete_step(step_id, output_summary="interrupted")
+                raise
+            except Exception as e:
+                telemetry.complete_step(step_id, error_message=str(e))
+                raise
+
+            telemetry.complete_step(step_id, **_step_usage(state, result))
         return result
 
     # Preserve the original function name for debugging
@@ -149,7 +213,7 @@ def build_workflow(session: AsyncSession) -> StateGraph[AgentState]:
 
     # Add all nodes with session bound
     for node, func in node_functions.items():
-        graph.add_node(node, _create_node_with_session(func, session))
+        graph.add_node(node, _create_node_with_session(func, session, node))
 
     # Set entry point: architect (analyze_task) creates the project plan
     graph.set_entry_point(Node.ANALYZE_TASK)
@@ -324,6 +388,7 @@ class WorkflowRunner:
                 ChatMessage(
                     role="system",
                     content=f"Previous conversation summary:\n{context_summary}",
+                    priority=MessagePriority.CONTEXT,
                 )
             ]
             logger.info(
@@ -428,6 +493,7 @@ class WorkflowRunner:
             handover_message = ChatMessage(
                 role="system",
                 content=f"Context from previous task in this session:\n{previous_task_handover}",
+                priority=MessagePriority.CONTEXT,
             )
             context_messages = [handover_message] + context_messages
 
@@ -498,6 +564,7 @@ class WorkflowRunner:
                         "trace_url": trace_url,
                         "event_bus": self.event_bus,
                         "breakpoint_service": self.breakpoint_service,
+                        "cache": self.cache,
                     },
                 }
 
@@ -568,6 +635,7 @@ class WorkflowRunner:
                         "container": container,
                         "event_bus": self.event_bus,
                         "breakpoint_service": self.breakpoint_service,
+                        "cache": self.cache,
                     },
                 }
 
@@ -9,15 +9,32 @@ Pricing is loaded dynamically from LiteLLM API via ModelRegistry.
 from .client import LiteLLMClient
 from .logger import LLMUsageLogger
 from .models import FALLBACK_MODEL_NAME, LLMModel
+from .rate_limiter import (
+    LLMPriority,
+    LLMRateLimiter,
+    LLMRateLimitTimeoutError,
+    get_llm_rate_limiter,
+)
 from .registry import ModelRegistry
+from .response_cache import LLMResponseCache
 from .router import LLMRouter
-from .schemas import ChatMessage, LLMRequest, LLMResponse, UsageInfo
+from .routing import ModelHealth, get_model_health
+from .schemas import ChatMessage, LLMRequest, LLMResponse, MessagePriority, UsageInfo
 
 __all__ = [
     # Client
     "LiteLLMClient",
+    # Response cache
+    "LLMResponseCache",
+    # Rate limiting
+    "LLMPriority",
+    "LLMRateLimiter",
+    "LLMRateLimitTimeoutError",
+    "get_llm_rate_limiter",
     # Router
     "LLMRouter",
+    "ModelHealth",
+    "get_model_health",
     # Logger
     "LLMUsageLogger",
     # Registry
@@ -29,5 +46,6 @@ __all__ = [
     "ChatMessage",
     "LLMRequest",
     "LLMResponse",
+    "MessagePriority",
     "UsageInfo",
 ]
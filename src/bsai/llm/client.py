@@ -5,20 +5,24 @@ Async wrapper around LiteLLM with error handling and retries.
 
 from __future__ import annotations
 
+import asyncio
 import json
-from collections.abc import AsyncIterator
-from typing import Any, cast
+import time
+from collections.abc import AsyncIterator, Callable
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, cast
 
 import litellm
 import structlog
+from litellm.utils import supports_prompt_caching
 from tenacity import (
     retry,
-    retry_if_exception_type,
+    retry_if_exception,
     stop_after_attempt,
     wait_exponential,
 )
 
-from bsai.api.config import get_agent_settings
+from bsai.api.config import get_agent_settings, get_context_window_settings
 from bsai.db.models.mcp_server_config import McpServerConfig
 from bsai.llm.builtin_tools import (
     BUILTIN_TOOL_DEFINITIONS,
@@ -27,12 +31,81 @@ from bsai.llm.builtin_tools import (
 )
 from bsai.mcp.executor import McpToolCall, McpToolExecutor
 from bsai.mcp.utils import load_tools_from_mcp_server
+from bsai.resilience import ErrorClass, circuit_guard, classify_error, is_retryable
+from bsai.telemetry.context import get_telemetry_context
 
-from .schemas import LLMRequest, LLMResponse, UsageInfo
+from .context_window import count_prompt_tokens, count_tool_tokens, fit_messages
+from .rate_limiter import priority_for_agent, provider_for_model
+from .schemas import ChatMessage, LLMRequest, LLMResponse, UsageInfo
+
+if TYPE_CHECKING:
+    from bsai.resilience import CircuitBreaker
+    from bsai.telemetry.writer import TelemetryWriter
+
+    from .models import LLMModel
+    from .rate_limiter import LLMRateLimiter, RateLimitReservation
+    from .response_cache import LLMResponseCache
+    from .router import LLMRouter
 
 logger = structlog.get_logger()
 
 
+def _supports_prompt_caching(model: str) -> bool:
+    """Check whether LiteLLM knows the model to accept cache-control breakpoints."""
+    try:
+        return bool(supports_prompt_caching(model=model))
+    except Exception:
+        return False
+
+
+def _to_provider_messages(request: LLMRequest) -> list[dict[str, Any]]:
+    """Convert request messages to LiteLLM's dict format.
+
+    Messages marked with ``cache_control`` become single text content blocks
+    carrying an ephemeral cache-control breakpoint, for models that support
+    prompt caching. Other models get plain string content.
+
+    Args:
+        request: LLM request
+
+    Returns:
+        Messages in LiteLLM format
+    """
+    use_breakpoints = any(msg.cache_control for msg in request.messages) and (
+        _supports_prompt_caching(request.model)
+    )
+
+    def convert(msg: ChatMessage) -> dict[str, Any]:
+        if not (use_breakpoints and msg.cache_control):
+            return {"role": msg.role, "content": msg.content}
+        block = {"type": "text", "text": msg.content, "cache_control": {"type": "ephemeral"}}
+        return {"role": msg.role, "content": [block]}
+
+    return [convert(msg) for msg in request.messages]
+
+
+def _cached_prompt_tokens(usage: Any) -> int:
+    """Extract prompt tokens read from the provider's prompt cache.
+
+    LiteLLM reports them as ``prompt_tokens_details.cached_tokens``
+    (OpenAI style) or ``cache_read_input_tokens`` (Anthropic style).
+
+    Args:
+        usage: Provider usage object (may be None)
+
+    Returns:
+        Number of cached prompt tokens (0 if not reported)
+    """
+    details = getattr(usage, "prompt_tokens_details", None)
+    for value in (
+        getattr(details, "cached_tokens", None),
+        getattr(usage, "cache_read_input_tokens", None),
+    ):
+        if isinstance(value, int) and value > 0:
+            return value
+    return 0
+
+
 class LiteLLMClient:
     """Async LiteLLM client with automatic retry logic.
 
@@ -40,12 +113,54 @@ class LiteLLMClient:
     - OPENAI_API_KEY
     - ANTHROPIC_API_KEY
     - GOOGLE_API_KEY
+
+    When a telemetry writer is provided, every provider round-trip made
+    inside a workflow node is recorded to ``llm_usage_logs`` (write-behind).
+
+    When a response cache is provided, cacheable tool-free requests are
+    answered from it if an identical request was made before.
+
+    When a rate limiter is provided, every round-trip first waits for room
+    in its provider's RPM/TPM budget, in agent priority order.
+
+    Before every round-trip the prompt is counted against the model's
+    context window; low-priority messages are trimmed, or the request is
+    escalated to a larger-window model, instead of overflowing.
+
+    Only transient errors are retried (see ``classify_error``). When a
+    circuit breaker is provided, models that keep failing are skipped
+    without a round-trip until their circuit recovers.
     """
 
+    def __init__(
+        self,
+        telemetry: TelemetryWriter | None = None,
+        router: LLMRouter | None = None,
+        response_cache: LLMResponseCache | None = None,
+        rate_limiter: LLMRateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
+        """Initialize LiteLLM client.
+
+        Args:
+            telemetry: Optional write-behind writer for usage records
+            router: Optional router used to resolve provider and pricing
+            response_cache: Optional exact-match response cache
+            rate_limiter: Optional per-provider admission control
+            circuit_breaker: Optional per-model circuit breaker
+        """
+        self.telemetry = telemetry
+        self.router = router
+        self.response_cache = response_cache
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        # Hedged attempts that lost but still run to record their usage
+        self._hedge_losers: set[asyncio.Task[LLMResponse]] = set()
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(Exception),
+        retry=retry_if_exception(is_retryable),
         reraise=True,
     )
     async def chat_completion(
@@ -71,7 +186,8 @@ class LiteLLMClient:
             LLM completion response
 
         Raises:
-            Exception: If all retry attempts fail
+            Exception: If all retry attempts fail, or immediately for
+                errors that are not transient
         """
         use_mcp_tools = len(mcp_servers) > 0 and tool_executor is not None
         use_builtin_tools = builtin_tool_executor is not None
@@ -85,8 +201,8 @@ class LiteLLMClient:
             mcp_server_count=len(mcp_servers),
         )
 
-        # Convert Pydantic messages to dict format
-        messages = [{"role": msg.role, "content": msg.content} for msg in request.messages]
+        # Convert Pydantic messages to dict format (with cache breakpoints)
+        messages = _to_provider_messages(request)
 
         # Build request parameters
         params: dict[str, Any] = {
@@ -143,20 +259,46 @@ class LiteLLMClient:
             settings = get_agent_settings()
             max_tool_iterations = settings.max_tool_iterations
 
-        # Execute with unified completion logic
-        return await self._execute_completion(
-            params=params,
-            request=request,
-            tool_to_server=tool_to_server,
-            tool_executor=tool_executor if use_mcp_tools else None,
-            builtin_tool_executor=builtin_tool_executor,
-            max_iterations=max_tool_iterations if use_tools else 1,
+        # Serve identical tool-free requests from the response cache
+        cache_key: str | None = None
+        if self.response_cache is not None and not use_tools:
+            context = get_telemetry_context()
+            agent_type = (context.agent_type if context else None) or "unknown"
+            if self.response_cache.is_cacheable(params, agent_type):
+                cache_key = self.response_cache.make_key(params)
+                cached = await self.response_cache.get(cache_key, agent_type)
+                if cached is not None:
+                    return cached
+
+        # Tool calls have side effects, so only tool-free calls are hedged
+        alternates = (
+            list(self.router.fallback_models(request.model))
+            if self.router is not None and not use_tools
+            else []
         )
 
+        # Execute with unified completion logic
+        if alternates and self.router is not None:
+            response = await self._execute_hedged(self.router, params, request, alternates)
+        else:
+            response = await self._execute_completion(
+                params=params,
+                request=request,
+                tool_to_server=tool_to_server,
+                tool_executor=tool_executor if use_mcp_tools else None,
+                builtin_tool_executor=builtin_tool_executor,
+                max_iterations=max_tool_iterations if use_tools else 1,
+            )
+
+        if cache_key is not None and self.response_cache is not None and response.content:
+            await self.response_cache.put(cache_key, response)
+
+        return response
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(Exception),
+        retry=retry_if_exception(is_retryable),
         reraise=True,
     )
     async def stream_completion(
@@ -180,8 +322,8 @@ class LiteLLMClient:
             message_count=len(request.messages),
         )
 
-        # Convert Pydantic messages to dict format
-        messages = [{"role": msg.role, "content": msg.content} for msg in request.messages]
+        # Convert Pydantic messages to dict format (with cache breakpoints)
+        messages = _to_provider_messages(request)
 
         # Build request parameters
         params: dict[str, Any] = {
@@ -201,14 +343,24 @@ class LiteLLMClient:
             params["api_key"] = request.api_key
 
         # Make streaming API call through LiteLLM
-        stream = cast(Any, await litellm.acompletion(**params))
-
+        params, request = self._preflight(params, request)
         chunk_count = 0
-        async for chunk in stream:
-            if chunk.choices and chunk.choices[0].delta and chunk.choices[0].delta.content:
-                content = chunk.choices[0].delta.content
-                chunk_count += 1
-                yield content
+        stream_usage = None
+        async with circuit_guard(self.circuit_breaker, f"llm:{request.model}"):
+            reservation = await self._admit(params, request)
+            start = time.monotonic()
+            stream = cast(Any, await litellm.acompletion(**params))
+
+            async for chunk in stream:
+                # Some providers attach usage to the final chunk
+                stream_usage = getattr(chunk, "usage", None) or stream_usage
+                if chunk.choices and chunk.choices[0].delta and chunk.choices[0].delta.content:
+                    content = chunk.choices[0].delta.content
+                    chunk_count += 1
+                    yield content
+
+        self._record_usage(request, stream_usage, start)
+        await self._settle(reservation, stream_usage)
 
         logger.info(
             "llm_stream_completion_success",
@@ -224,6 +376,7 @@ class LiteLLMClient:
         tool_executor: McpToolExecutor | None,
         builtin_tool_executor: BuiltinToolExecutor | None,
         max_iterations: int,
+        on_admitted: Callable[[], None] | None = None,
     ) -> LLMResponse:
         """Execute LLM completion with optional tool calling loop.
 
@@ -236,6 +389,7 @@ class LiteLLMClient:
             tool_executor: Optional MCP tool executor for handling tool calls
             builtin_tool_executor: Optional executor for built-in tools
             max_iterations: Maximum iterations (1 for simple, 5 for tool mode)
+            on_admitted: Called when the first round-trip passes rate limiting
 
         Returns:
             LLM completion response
@@ -244,6 +398,7 @@ class LiteLLMClient:
         iteration = 0
         total_input_tokens = 0
         total_output_tokens = 0
+        total_cached_input_tokens = 0
         use_mcp_tools = len(tool_to_server) > 0 and tool_executor is not None
         use_builtin_tools = builtin_tool_executor is not None
         use_tools = use_mcp_tools or use_builtin_tools
@@ -259,7 +414,8 @@ class LiteLLMClient:
                 )
 
             # Make API call through LiteLLM
-            response = cast(Any, await litellm.acompletion(**params))
+            response = await self._acompletion(params, request, on_admitted)
+            on_admitted = None
 
             # Extract response data
             choice = response.choices[0]
@@ -269,6 +425,7 @@ class LiteLLMClient:
             response_usage = response.usage
             total_input_tokens += response_usage.prompt_tokens
             total_output_tokens += response_usage.completion_tokens
+            total_cached_input_tokens += _cached_prompt_tokens(response_usage)
 
             # Check if tool calls present (only in tool mode)
             tool_calls = getattr(choice.message, "tool_calls", None) if use_tools else None
@@ -291,6 +448,7 @@ class LiteLLMClient:
                     input_tokens=total_input_tokens,
                     output_tokens=total_output_tokens,
                     total_tokens=total_input_tokens + total_output_tokens,
+                    cached_input_tokens=min(total_cached_input_tokens, total_input_tokens),
                 )
 
                 logger.info(
@@ -299,6 +457,7 @@ class LiteLLMClient:
                     iterations=iteration,
                     input_tokens=usage.input_tokens,
                     output_tokens=usage.output_tokens,
+                    cached_input_tokens=usage.cached_input_tokens,
                     finish_reason=finish_reason,
                     tool_mode=use_tools,
                 )
@@ -425,7 +584,7 @@ class LiteLLMClient:
             final_params["response_format"] = params["response_format"]
 
         logger.info("llm_final_response_after_max_iterations")
-        final_response = cast(Any, await litellm.acompletion(**final_params))
+        final_response = await self._acompletion(final_params, request)
 
         final_choice = final_response.choices[0]
         final_content: str = final_choice.message.content or ""
@@ -434,11 +593,13 @@ class LiteLLMClient:
         # Add final response tokens
         total_input_tokens += final_response.usage.prompt_tokens
         total_output_tokens += final_response.usage.completion_tokens
+        total_cached_input_tokens += _cached_prompt_tokens(final_response.usage)
 
         usage = UsageInfo(
             input_tokens=total_input_tokens,
             output_tokens=total_output_tokens,
             total_tokens=total_input_tokens + total_output_tokens,
+            cached_input_tokens=min(total_cached_input_tokens, total_input_tokens),
         )
 
         return LLMResponse(
@@ -448,6 +609,406 @@ class LiteLLMClient:
             finish_reason="max_iterations",
         )
 
+    async def _execute_hedged(
+        self,
+        router: LLMRouter,
+        params: dict[str, Any],
+        request: LLMRequest,
+        alternates: list[LLMModel],
+    ) -> LLMResponse:
+        """Execute a tool-free completion over a fallback chain.
+
+        The request goes to its own model first. If no answer arrives within
+        that model's hedge delay, counted from when the rate limiter admitted
+        the request, the same request is also sent to the next model; the
+        first successful response wins. A losing attempt already sent to its
+        provider finishes in the background so its usage is recorded, one
+        still waiting for admission is cancelled. A failed attempt
+        immediately starts the next model, unless the error is fatal to the
+        request itself.
+
+        Args:
+            router: Router providing hedge delays and model health
+            params: Pre-built request parameters (without tools)
+            request: Original LLM request
+            alternates: Fallback models in routing order
+
+        Returns:
+            LLM completion response, named after the model that served it
+
+        Raises:
+            Exception: First fatal error, or the last error if every model failed
+        """
+        attempts = [(request, params)] + [
+            self._retarget(request, params, model) for model in alternates
+        ]
+        # Attempt index of each in-flight task, and when each attempt was admitted
+        pending: dict[asyncio.Task[LLMResponse], int] = {}
+        admitted_at: list[float | None] = [None] * len(attempts)
+        admission = asyncio.Event()
+        errors: list[BaseException] = []
+        launched = 0
+
+        def launch(event: str | None) -> None:
+            nonlocal launched
+            index = launched
+            attempt_request, attempt_params = attempts[index]
+            launched += 1
+            if event is not None:
+                router.health.record_event(attempt_request.model, event)
+                logger.info(
+                    "llm_route_attempt_started",
+                    model=attempt_request.model,
+                    reason=event,
+                    primary=request.model,
+                )
+
+            def on_admitted() -> None:
+                admitted_at[index] = time.monotonic()
+                admission.set()
+
+            task = asyncio.create_task(
+                self._execute_completion(
+                    params=attempt_params,
+                    request=attempt_request,
+                    tool_to_server={},
+                    tool_executor=None,
+                    builtin_tool_executor=None,
+                    max_iterations=1,
+                    on_admitted=on_admitted,
+                )
+            )
+            pending[task] = index
+
+        launch(None)
+        try:
+            while pending:
+                waiters: set[asyncio.Task[Any]] = set(pending)
+                admission_wait: asyncio.Task[Any] | None = None
+                delay: float | None = None
+                # At most one hedged request is in flight at a time, and the
+                # hedge delay only runs once the latest attempt was admitted
+                if launched < len(attempts) and len(pending) < 2:
+                    latest_admitted = admitted_at[launched - 1]
+                    if latest_admitted is None:
+                        admission.clear()
+                        admission_wait = asyncio.create_task(admission.wait())
+                        waiters.add(admission_wait)
+                    else:
+                        hedge_at = latest_admitted + router.hedge_delay(
+                            attempts[launched - 1][0].model
+                        )
+                        delay = max(hedge_at - time.monotonic(), 0.0)
+                done, _ = await asyncio.wait(
+                    waiters, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if admission_wait is not None:
+                    admission_wait.cancel()
+                    done.discard(admission_wait)
+                    if not done:
+                        continue
+                if not done:
+                    launch("hedged")
+                    continue
+
+                for task in done:
+                    model_name = attempts[pending.pop(task)][0].model
+                    error = task.exception()
+                    if error is None:
+                        response: LLMResponse = task.result()
+                        if model_name != request.model:
+                            won = "hedge_won" if pending else "fallback_won"
+                            router.health.record_event(model_name, won)
+                            logger.info(
+                                "llm_route_alternate_won",
+                                model=model_name,
+                                primary=request.model,
+                            )
+                        for loser, index in list(pending.items()):
+                            if admitted_at[index] is not None:
+                                del pending[loser]
+                                self._finish_loser(loser, attempts[index][0].model)
+                        return response
+                    errors.append(error)
+                    error_class = classify_error(error)
+                    logger.warning(
+                        "llm_route_attempt_failed",
+                        model=model_name,
+                        error=str(error),
+                        error_class=error_class,
+                    )
+                    # Another model would reject the same request
+                    if error_class is ErrorClass.FATAL:
+                        raise error
+
+                if not pending and launched < len(attempts):
+                    launch("fallback")
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        raise errors[-1]
+
+    def _finish_loser(self, task: asyncio.Task[LLMResponse], model_name: str) -> None:
+        """Let a losing hedged attempt run to completion in the background.
+
+        The provider already processes and bills the request; completing it
+        records its usage and settles its rate limit reservation.
+
+        Args:
+            task: In-flight attempt
+            model_name: Model the attempt was sent to
+        """
+        self._hedge_losers.add(task)
+
+        def finished(done: asyncio.Task[LLMResponse]) -> None:
+            self._hedge_losers.discard(done)
+            error = None if done.cancelled() else done.exception()
+            logger.debug(
+                "llm_route_loser_finished",
+                model=model_name,
+                error=str(error) if error is not None else None,
+            )
+
+        task.add_done_callback(finished)
+
+    @staticmethod
+    def _retarget(
+        request: LLMRequest, params: dict[str, Any], model: LLMModel
+    ) -> tuple[LLMRequest, dict[str, Any]]:
+        """Copy a request and its parameters for another model.
+
+        Args:
+            request: Original LLM request
+            params: Original request parameters
+            model: Model to send the request to
+
+        Returns:
+            Tuple of (request, parameters) for the model
+        """
+        retargeted = request.model_copy(
+            update={"model": model.name, "api_base": model.api_base, "api_key": model.api_key}
+        )
+        new_params = {**params, "model": model.name, "messages": list(params["messages"])}
+        for key, value in (("api_base", model.api_base), ("api_key", model.api_key)):
+            if value is None:
+                new_params.pop(key, None)
+            else:
+                new_params[key] = value
+        return retargeted, new_params
+
+    async def _acompletion(
+        self,
+        params: dict[str, Any],
+        request: LLMRequest,
+        on_admitted: Callable[[], None] | None = None,
+    ) -> Any:
+        """Make one LiteLLM round-trip and record its usage.
+
+        Args:
+            params: LiteLLM completion parameters
+            request: Original LLM request (for model attribution)
+            on_admitted: Called once the rate limiter admitted the round-trip
+
+        Returns:
+            Raw LiteLLM response, named after the model it was sent to
+
+        Raises:
+            CircuitOpenError: If the model's circuit is open
+        """
+        params, request = self._preflight(params, request)
+        async with circuit_guard(self.circuit_breaker, f"llm:{request.model}"):
+            reservation = await self._admit(params, request)
+            if on_admitted is not None:
+                on_admitted()
+            start = time.monotonic()
+            try:
+                response = cast(Any, await litellm.acompletion(**params))
+            except Exception:
+                if self.router is not None:
+                    self.router.health.record_failure(request.model)
+                raise
+        if self.router is not None:
+            self.router.health.record_success(request.model, time.monotonic() - start)
+        usage = getattr(response, "usage", None)
+        self._record_usage(request, usage, start)
+        await self._settle(reservation, usage)
+        # Preflight may have escalated the request to a larger-window model;
+        # callers price the response by this name
+        response.model = request.model
+        return response
+
+    def _preflight(
+        self, params: dict[str, Any], request: LLMRequest
+    ) -> tuple[dict[str, Any], LLMRequest]:
+        """Fit a request into its model's context window.
+
+        Counts the prompt with the model's tokenizer. If it does not fit
+        ``context_window - max_tokens``, messages with a trimmable priority
+        are trimmed. If that is not enough, the request is sent to a known
+        model with a larger window instead (untrimmed if it fits there).
+        Otherwise it is sent as is and the provider decides.
+
+        Args:
+            params: LiteLLM completion parameters (not modified)
+            request: Original LLM request
+
+        Returns:
+            Tuple of (parameters, request) to send
+        """
+        settings = get_context_window_settings()
+        model = self.router.registry.get(request.model) if self.router else None
+        if not settings.enabled or self.router is None or model is None:
+            return params, request
+
+        reserve = params.get("max_tokens") or settings.output_reserve
+        tool_tokens = count_tool_tokens(params.get("tools"), request.model)
+        budget = int(model.context_window * (1 - settings.safety_margin)) - reserve - tool_tokens
+        messages: list[dict[str, Any]] = params["messages"]
+        tokens = count_prompt_tokens(messages, request.model)
+        if tokens <= budget:
+            return params, request
+
+        priorities = [int(msg.priority) for msg in request.messages]
+        trimmed, trimmed_tokens = fit_messages(
+            messages, priorities, budget, request.model, settings.min_kept_tokens
+        )
+        if trimmed_tokens <= budget:
+            logger.info(
+                "llm_context_trimmed",
+                model=request.model,
+                prompt_tokens=tokens,
+                trimmed_tokens=trimmed_tokens,
+                budget=budget,
+                dropped_messages=len(messages) - len(trimmed),
+            )
+            return {**params, "messages": trimmed}, request
+
+        if settings.escalate:
+            required = int((tokens + reserve + tool_tokens) / (1 - settings.safety_margin))
+            larger = self.router.larger_context_model(
+                request.model, required, settings.escalation_models
+            )
+            if larger is not None:
+                logger.info(
+                    "llm_context_escalated",
+                    model=request.model,
+                    escalated_to=larger.name,
+                    prompt_tokens=tokens,
+                    context_window=model.context_window,
+                )
+                escalated_request, escalated_params = self._retarget(request, params, larger)
+                return escalated_params, escalated_request
+
+        logger.warning(
+            "llm_context_window_exceeded",
+            model=request.model,
+            prompt_tokens=trimmed_tokens,
+            budget=budget,
+        )
+        return {**params, "messages": trimmed}, request
+
+    def _resolve_model(self, model_name: str) -> tuple[str, LLMModel | None]:
+        """Resolve a model's provider and registry entry.
+
+        Args:
+            model_name: Model name from the request
+
+        Returns:
+            Tuple of (provider, registry model or None)
+        """
+        model = self.router.registry.get(model_name) if self.router else None
+        if model is not None:
+            return model.provider, model
+        return provider_for_model(model_name), None
+
+    async def _admit(
+        self, params: dict[str, Any], request: LLMRequest
+    ) -> RateLimitReservation | None:
+        """Wait for room in the model's rate limit budget.
+
+        Reserves one request and the estimated input tokens.
+
+        Args:
+            params: LiteLLM completion parameters
+            request: Original LLM request
+
+        Returns:
+            Reservation to settle after the call, or None without a limiter
+        """
+        if self.rate_limiter is None:
+            return None
+
+        provider, _ = self._resolve_model(request.model)
+        prompt = json.dumps(params["messages"], ensure_ascii=False, default=str)
+        if "tools" in params:
+            prompt += json.dumps(params["tools"], ensure_ascii=False, default=str)
+        tokens = self.router.estimate_tokens(prompt) if self.router else len(prompt) // 4
+        context = get_telemetry_context()
+        priority = priority_for_agent(context.agent_type if context else None)
+        return await self.rate_limiter.acquire(provider, request.model, tokens, priority)
+
+    async def _settle(self, reservation: RateLimitReservation | None, usage: Any) -> None:
+        """Reconcile a rate limit reservation with the reported usage.
+
+        Args:
+            reservation: Reservation from _admit() (None without a limiter)
+            usage: Provider usage object (None keeps the estimate)
+        """
+        if reservation is None or self.rate_limiter is None or usage is None:
+            return
+        actual = int(getattr(usage, "prompt_tokens", 0) or 0) + int(
+            getattr(usage, "completion_tokens", 0) or 0
+        )
+        await self.rate_limiter.reconcile(reservation, actual)
+
+    def _record_usage(self, request: LLMRequest, usage: Any, start: float) -> None:
+        """Buffer a usage record for the current workflow node, if any.
+
+        Never raises: telemetry must not affect the LLM call.
+
+        Args:
+            request: LLM request that was sent
+            usage: Provider usage object (may be None for streams)
+            start: time.monotonic() taken before the call
+        """
+        if self.telemetry is None:
+            return
+        context = get_telemetry_context()
+        if context is None:
+            return
+
+        try:
+            latency_ms = int((time.monotonic() - start) * 1000)
+            input_tokens = int(getattr(usage, "prompt_tokens", 0) or 0)
+            output_tokens = int(getattr(usage, "completion_tokens", 0) or 0)
+            cached_input_tokens = min(_cached_prompt_tokens(usage), input_tokens)
+
+            provider, model = self._resolve_model(request.model)
+            cost = Decimal("0")
+            if model is not None and self.router is not None:
+                cost = self.router.calculate_cost(
+                    model,
+                    input_tokens,
+                    output_tokens,
+                    cached_input_tokens=cached_input_tokens,
+                )
+
+            self.telemetry.record_llm_call(
+                session_id=context.session_id,
+                agent_type=context.agent_type or "unknown",
+                provider=provider,
+                model=request.model,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cost_usd=cost,
+                latency_ms=latency_ms,
+                milestone_id=context.milestone_id,
+            )
+        except Exception as e:
+            logger.warning("llm_usage_record_failed", model=request.model, error=str(e))
+
     async def _build_tools_from_mcp_servers(
         self,
         mcp_servers: list[McpServerConfig],
@@ -0,0 +1,247 @@
+"""Token counting and context-window fitting for LLM requests.
+
+Before a request is sent, its messages are counted with the tokenizer of
+the target model (OpenAI models get their exact tiktoken encoding, other
+providers the cl100k_base approximation). Encoders are cached per model,
+so the BPE tables are loaded once per process.
+
+If the prompt does not fit ``context_window - max_tokens``, messages with a
+trimmable priority are removed, lowest priority (highest value) and oldest
+first. Messages carrying a prompt-cache breakpoint are trimmed last, so the
+cached prefix survives while anything else can go. The last message needed
+to fit is shortened in the middle instead of dropped when enough of it
+would remain (for content blocks, its largest text block is shortened).
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
+
+import structlog
+import tiktoken
+from tiktoken import Encoding
+
+logger = structlog.get_logger()
+
+# Per-message framing tokens (role, separators) and reply priming
+MESSAGE_OVERHEAD_TOKENS = 3
+REPLY_OVERHEAD_TOKENS = 3
+
+TRIM_MARKER = "\n\n[... {count} tokens omitted to fit the context window ...]\n\n"
+
+
+@lru_cache(maxsize=64)
+def get_encoding(model: str) -> Encoding | None:
+    """Get the tokenizer for a model (cached).
+
+    Args:
+        model: Model name (optionally "provider/model")
+
+    Returns:
+        Encoding, or None if no tiktoken encoding can be loaded
+    """
+    try:
+        return tiktoken.encoding_for_model(model.rsplit("/", 1)[-1])
+    except KeyError:
+        # Not an OpenAI model: cl100k_base is a close approximation
+        pass
+    except Exception as e:
+        logger.debug("tiktoken_model_encoding_unavailable", model=model, error=str(e))
+    return get_default_encoding()
+
+
+@lru_cache(maxsize=1)
+def get_default_encoding() -> Encoding | None:
+    """Get the cl100k_base tokenizer (cached).
+
+    Returns:
+        Encoding, or None if tiktoken cannot load it
+    """
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning("tiktoken_unavailable", error=str(e))
+        return None
+
+
+def count_text_tokens(text: str, encoding: Encoding | None) -> int:
+    """Count tokens of a text.
+
+    Args:
+        text: Text to count
+        encoding: Tokenizer (None for the 4-characters-per-token estimate)
+
+    Returns:
+        Token count
+    """
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(message: dict[str, Any], encoding: Encoding | None) -> int:
+    """Count tokens of one LiteLLM-format message.
+
+    Args:
+        message: Message dict (string or content-block content, optional tool calls)
+        encoding: Tokenizer
+
+    Returns:
+        Token count including per-message framing
+    """
+    tokens = MESSAGE_OVERHEAD_TOKENS
+    content = message.get("content")
+    if isinstance(content, str):
+        tokens += count_text_tokens(content, encoding)
+    elif isinstance(content, list):
+        for block in content:
+            if isinstance(block, dict) and isinstance(block.get("text"), str):
+                tokens += count_text_tokens(block["text"], encoding)
+    if message.get("tool_calls"):
+        tokens += count_text_tokens(json.dumps(message["tool_calls"], default=str), encoding)
+    return tokens
+
+
+def count_prompt_tokens(
+    messages: Sequence[dict[str, Any]],
+    model: str,
+    tools: Sequence[dict[str, Any]] | None = None,
+) -> int:
+    """Count the prompt tokens of a request.
+
+    Args:
+        messages: Messages in LiteLLM format
+        model: Target model
+        tools: Tool definitions sent with the request
+
+    Returns:
+        Estimated prompt tokens
+    """
+    encoding = get_encoding(model)
+    tokens = REPLY_OVERHEAD_TOKENS + sum(count_message_tokens(m, encoding) for m in messages)
+    return tokens + count_tool_tokens(tools, model)
+
+
+def count_tool_tokens(tools: Sequence[dict[str, Any]] | None, model: str) -> int:
+    """Count the tokens of tool definitions.
+
+    Args:
+        tools: Tool definitions sent with the request
+        model: Target model
+
+    Returns:
+        Estimated tokens (0 without tools)
+    """
+    if not tools:
+        return 0
+    return count_text_tokens(json.dumps(list(tools), default=str), get_encoding(model))
+
+
+def fit_messages(
+    messages: list[dict[str, Any]],
+    priorities: Sequence[int],
+    budget: int,
+    model: str,
+    min_kept_tokens: int = 256,
+) -> tuple[list[dict[str, Any]], int]:
+    """Trim low-priority messages until the prompt fits the budget.
+
+    Messages with priority 0 (and messages beyond ``priorities``, such as
+    tool-loop turns) are never touched, messages with a ``cache_control``
+    block are trimmed after all others. The input list is not modified.
+
+    Args:
+        messages: Messages in LiteLLM format
+        priorities: Trim priority per message (0 = keep, higher = trimmed first)
+        budget: Prompt token budget (excluding tool definitions)
+        model: Target model (selects the tokenizer)
+        min_kept_tokens: Minimum tokens a shortened message must keep,
+            otherwise it is dropped entirely
+
+    Returns:
+        Tuple of (messages, prompt tokens); tokens may still exceed the
+        budget if the untrimmable messages alone do not fit
+    """
+    encoding = get_encoding(model)
+    counts = [count_message_tokens(m, encoding) for m in messages]
+    total = REPLY_OVERHEAD_TOKENS + sum(counts)
+
+    trimmable = [i for i, priority in enumerate(priorities[: len(messages)]) if priority > 0]
+    # Cached prefix last, then lowest priority first, oldest first within a priority
+    trimmable.sort(key=lambda i: (_has_cache_breakpoint(messages[i]), -priorities[i], i))
+
+    result: list[dict[str, Any] | None] = list(messages)
+    for index in trimmable:
+        excess = total - budget
+        if excess <= 0:
+            break
+        shortened = _shorten_message(messages[index], excess, min_kept_tokens, encoding)
+        result[index] = shortened
+        new_count = count_message_tokens(shortened, encoding) if shortened is not None else 0
+        total -= counts[index] - new_count
+
+    return [m for m in result if m is not None], total
+
+
+def _has_cache_breakpoint(message: dict[str, Any]) -> bool:
+    """Check whether a message carries a prompt-cache breakpoint."""
+    content = message.get("content")
+    return isinstance(content, list) and any(
+        isinstance(block, dict) and "cache_control" in block for block in content
+    )
+
+
+def _shorten_message(
+    message: dict[str, Any], excess: int, min_kept_tokens: int, encoding: Encoding | None
+) -> dict[str, Any] | None:
+    """Shorten a message's text by ``excess`` tokens.
+
+    String content is shortened as a whole; for content blocks the largest
+    text block is shortened and keeps its other keys (e.g. ``cache_control``).
+
+    Returns:
+        Shortened copy, or None if less than ``min_kept_tokens`` would remain
+    """
+    content = message.get("content")
+    if isinstance(content, str):
+        keep = count_text_tokens(content, encoding) - excess
+        if keep < min_kept_tokens:
+            return None
+        return {**message, "content": _shorten(content, keep, encoding)}
+
+    if isinstance(content, list):
+        texts = [
+            (count_text_tokens(block["text"], encoding), i)
+            for i, block in enumerate(content)
+            if isinstance(block, dict) and isinstance(block.get("text"), str)
+        ]
+        if texts:
+            tokens, i = max(texts)
+            keep = tokens - excess
+            if keep >= min_kept_tokens:
+                blocks = list(content)
+                blocks[i] = {**content[i], "text": _shorten(content[i]["text"], keep, encoding)}
+                return {**message, "content": blocks}
+    return None
+
+
+def _shorten(text: str, max_tokens: int, encoding: Encoding | None) -> str:
+    """Keep the head and tail of a text within ``max_tokens``."""
+    marker_tokens = count_text_tokens(TRIM_MARKER.format(count=0), encoding) + 2
+    keep = max(max_tokens - marker_tokens, 0)
+    head = keep * 2 // 3
+    tail = keep - head
+
+    if encoding is None:
+        total = len(text) // 4
+        omitted = max(total - keep, 0)
+        end = text[len(text) - tail * 4 :] if tail else ""
+        return text[: head * 4] + TRIM_MARKER.format(count=omitted) + end
+
+    tokens = encoding.encode(text, disallowed_special=())
+    omitted = max(len(tokens) - keep, 0)
+    end = encoding.decode(tokens[len(tokens) - tail :]) if tail else ""
+    return encoding.decode(tokens[:head]) + TRIM_MARKER.format(count=omitted) + end
@@ -24,6 +24,7 @@ class LLMModel:
     supports_streaming: bool
     api_base: str | None = None  # Optional custom API base URL
     api_key: str | None = None  # Optional custom API key
+    cached_input_price_per_1k: Decimal | None = None  # USD per 1k prompt-cache reads
 
 
 # Fallback model name (used when no model is available)
@@ -0,0 +1,362 @@
+"""Per-provider rate limiting and admission control for LLM calls.
+
+Every (provider, model) pair has two token buckets shared through Redis:
+one for requests per minute and one for tokens per minute. Before a call
+is sent, one request and the estimated input tokens are taken from the
+buckets; if they do not fit, the caller sleeps until the buckets refill
+instead of hitting the provider and getting a 429. Once the response
+arrives, the reservation is reconciled against the tokens actually used,
+so output tokens and estimation errors are charged to the budget.
+
+Within a process, callers waiting for the same model are admitted in
+priority order: interactive agents first, workflow agents next and
+background memory work last. Without a Redis connection the buckets are
+kept in process memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from typing import Any, cast
+
+import litellm
+import structlog
+
+from bsai.api.config import RateLimitSettings, get_rate_limit_settings
+from bsai.cache import RedisClient, get_redis
+
+logger = structlog.get_logger()
+
+
+class LLMPriority(IntEnum):
+    """Admission priority for LLM calls (lower is admitted first)."""
+
+    INTERACTIVE = 0
+    WORKFLOW = 1
+    BACKGROUND = 2
+
+
+# Agents whose output the user is waiting on directly
+AGENT_PRIORITIES: dict[str, LLMPriority] = {
+    "architect": LLMPriority.INTERACTIVE,
+    "responder": LLMPriority.INTERACTIVE,
+    "worker": LLMPriority.WORKFLOW,
+    "qa": LLMPriority.WORKFLOW,
+}
+
+
+def priority_for_agent(agent_type: str | None) -> LLMPriority:
+    """Get the admission priority of an agent's LLM calls.
+
+    Args:
+        agent_type: Agent making the call (None outside workflow nodes)
+
+    Returns:
+        Priority for the call
+    """
+    return AGENT_PRIORITIES.get(agent_type or "", LLMPriority.WORKFLOW)
+
+
+def provider_for_model(model: str) -> str:
+    """Resolve a model's provider through LiteLLM.
+
+    Args:
+        model: Model name (optionally "provider/model")
+
+    Returns:
+        Provider name, or "unknown" if LiteLLM cannot resolve it
+    """
+    try:
+        return str(litellm.get_llm_provider(model)[1])
+    except Exception:
+        return model.split("/", 1)[0] if "/" in model else "unknown"
+
+
+class LLMRateLimitTimeoutError(Exception):
+    """Raised when a call cannot be admitted within the maximum wait."""
+
+    def __init__(self, bucket: str, wait: float) -> None:
+        """Initialize error.
+
+        Args:
+            bucket: Rate limit bucket (provider/model)
+            wait: Seconds the call would still have to wait
+        """
+        self.bucket = bucket
+        self.wait = wait
+        super().__init__(f"Rate limit for {bucket} not available within the maximum wait")
+
+
+@dataclass(frozen=True)
+class RateBudget:
+    """Requests and tokens allowed per minute."""
+
+    rpm: int
+    tpm: int
+
+
+@dataclass(frozen=True)
+class RateLimitReservation:
+    """Budget taken for one admitted call, reconciled after the response."""
+
+    bucket: str
+    budget: RateBudget
+    reserved_tokens: int
+
+
+@dataclass
+class _LocalBucket:
+    """In-process bucket pair, used when Redis is unavailable."""
+
+    requests: float
+    tokens: float
+    updated_at: float
+
+    def refill(self, budget: RateBudget, now: float) -> None:
+        elapsed = max(now - self.updated_at, 0.0)
+        self.requests = min(budget.rpm, self.requests + elapsed * budget.rpm / 60)
+        self.tokens = min(budget.tpm, self.tokens + elapsed * budget.tpm / 60)
+        self.updated_at = now
+
+
+# Same arithmetic as _LocalBucket, atomically on a Redis hash.
+# KEYS[1] = bucket hash; ARGV = rpm, tpm, tokens. Returns seconds to wait (0 = admitted).
+_TAKE_SCRIPT = """
+local rpm = tonumber(ARGV[1])
+local tpm = tonumber(ARGV[2])
+local need = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local b = redis.call('HMGET', KEYS[1], 'req', 'tok', 'ts')
+local req = tonumber(b[1]) or rpm
+local tok = tonumber(b[2]) or tpm
+local ts = tonumber(b[3]) or now
+local elapsed = math.max(now - ts, 0)
+req = math.min(rpm, req + elapsed * rpm / 60)
+tok = math.min(tpm, tok + elapsed * tpm / 60)
+local wait = 0
+if req < 1 then wait = (1 - req) * 60 / rpm end
+if tok < need then wait = math.max(wait, (need - tok) * 60 / tpm) end
+if wait == 0 then
+  req = req - 1
+  tok = tok - need
+end
+redis.call('HSET', KEYS[1], 'req', req, 'tok', tok, 'ts', now)
+redis.call('EXPIRE', KEYS[1], 120)
+return tostring(wait)
+"""
+
+# KEYS[1] = bucket hash; ARGV = token delta (refund if positive), tpm
+_ADJUST_SCRIPT = """
+local tok = tonumber(redis.call('HGET', KEYS[1], 'tok'))
+if tok == nil then return 0 end
+tok = math.min(tonumber(ARGV[2]), tok + tonumber(ARGV[1]))
+redis.call('HSET', KEYS[1], 'tok', tok)
+return 1
+"""
+
+
+class _AdmissionQueue:
+    """Grants one waiter at a time, lowest priority value first, FIFO within a priority."""
+
+    def __init__(self) -> None:
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+        self._busy = False
+
+    @asynccontextmanager
+    async def turn(self, priority: LLMPriority) -> AsyncIterator[None]:
+        if self._busy or self._waiters:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (int(priority), next(self._counter), future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                # Granted and cancelled at the same time: pass the turn on
+                if future.done() and not future.cancelled():
+                    self._release()
+                raise
+        else:
+            self._busy = True
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._busy = False
+
+
+class LLMRateLimiter:
+    """Token-bucket admission control per (provider, model)."""
+
+    KEY_PREFIX = "llm:ratelimit:"
+
+    def __init__(
+        self,
+        redis_client: RedisClient | None = None,
+        settings: RateLimitSettings | None = None,
+    ) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            redis_client: Redis client for shared buckets (None for process-local buckets)
+            settings: Rate limit settings (default: get_rate_limit_settings())
+        """
+        self.redis_client = redis_client
+        self.settings = settings or get_rate_limit_settings()
+        self._queues: dict[str, _AdmissionQueue] = {}
+        self._local: dict[str, _LocalBucket] = {}
+
+    def budget_for(self, provider: str, model: str) -> RateBudget:
+        """Resolve the budget of a model.
+
+        Args:
+            provider: Provider name (e.g. "openai")
+            model: Model name
+
+        Returns:
+            RPM/TPM budget
+        """
+        budgets = self.settings.budgets
+        configured = budgets.get(f"{provider}/{model}") or budgets.get(provider) or {}
+        return RateBudget(
+            rpm=configured.get("rpm", self.settings.default_rpm),
+            tpm=configured.get("tpm", self.settings.default_tpm),
+        )
+
+    async def acquire(
+        self,
+        provider: str,
+        model: str,
+        tokens: int,
+        priority: LLMPriority = LLMPriority.WORKFLOW,
+    ) -> RateLimitReservation:
+        """Wait until a call fits the model's budget and reserve it.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            tokens: Estimated input tokens to reserve
+            priority: Admission priority among local waiters
+
+        Returns:
+            Reservation to pass to reconcile() once usage is known
+
+        Raises:
+            LLMRateLimitTimeoutError: If the call would wait longer than max_wait
+        """
+        bucket = f"{provider}/{model}"
+        budget = self.budget_for(provider, model)
+        # Requests larger than the whole bucket only wait for a full bucket
+        tokens = min(max(tokens, 0), budget.tpm)
+        queue = self._queues.setdefault(bucket, _AdmissionQueue())
+        deadline = time.monotonic() + self.settings.max_wait
+
+        async with queue.turn(priority):
+            while True:
+                wait = await self._take(bucket, budget, tokens)
+                if wait <= 0:
+                    break
+                if time.monotonic() + wait > deadline:
+                    logger.warning("llm_rate_limit_timeout", bucket=bucket, wait=wait)
+                    raise LLMRateLimitTimeoutError(bucket, wait)
+                logger.debug(
+                    "llm_rate_limit_wait",
+                    bucket=bucket,
+                    wait=round(wait, 3),
+                    priority=priority.name,
+                )
+                await asyncio.sleep(wait)
+
+        return RateLimitReservation(bucket=bucket, budget=budget, reserved_tokens=tokens)
+
+    async def reconcile(self, reservation: RateLimitReservation, actual_tokens: int) -> None:
+        """Charge the difference between reserved and actually used tokens.
+
+        Args:
+            reservation: Reservation returned by acquire()
+            actual_tokens: Input plus output tokens reported by the provider
+        """
+        delta = reservation.reserved_tokens - max(actual_tokens, 0)
+        if delta == 0:
+            return
+
+        if self._use_redis() and self.redis_client is not None:
+            try:
+                await cast(Any, self.redis_client.client).eval(
+                    _ADJUST_SCRIPT,
+                    1,
+                    self._key(reservation.bucket),
+                    delta,
+                    reservation.budget.tpm,
+                )
+                return
+            except Exception as e:
+                logger.warning("llm_rate_limit_reconcile_failed", error=str(e))
+
+        local = self._local.get(reservation.bucket)
+        if local is not None:
+            local.tokens = min(reservation.budget.tpm, local.tokens + delta)
+
+    async def _take(self, bucket: str, budget: RateBudget, tokens: int) -> float:
+        """Try to take one request and ``tokens`` tokens; return seconds to wait."""
+        if self._use_redis() and self.redis_client is not None:
+            try:
+                wait = await cast(Any, self.redis_client.client).eval(
+                    _TAKE_SCRIPT, 1, self._key(bucket), budget.rpm, budget.tpm, tokens
+                )
+                return float(wait)
+            except Exception as e:
+                logger.warning("llm_rate_limit_redis_failed", error=str(e))
+
+        return self._take_local(bucket, budget, tokens)
+
+    def _take_local(self, bucket: str, budget: RateBudget, tokens: int) -> float:
+        now = time.monotonic()
+        local = self._local.get(bucket)
+        if local is None:
+            local = _LocalBucket(requests=budget.rpm, tokens=budget.tpm, updated_at=now)
+            self._local[bucket] = local
+        local.refill(budget, now)
+
+        wait = 0.0
+        if local.requests < 1:
+            wait = (1 - local.requests) * 60 / budget.rpm
+        if local.tokens < tokens:
+            wait = max(wait, (tokens - local.tokens) * 60 / budget.tpm)
+        if wait == 0:
+            local.requests -= 1
+            local.tokens -= tokens
+        return wait
+
+    def _use_redis(self) -> bool:
+        return self.redis_client is not None and self.redis_client.is_connected
+
+    def _key(self, bucket: str) -> str:
+        return f"{self.KEY_PREFIX}{bucket}"
+
+
+@lru_cache(maxsize=1)
+def get_llm_rate_limiter() -> LLMRateLimiter | None:
+    """Get the process-wide LLM rate limiter (cached singleton).
+
+    Returns:
+        LLMRateLimiter using the shared Redis client, or None if disabled
+    """
+    if not get_rate_limit_settings().enabled:
+        return None
+    return LLMRateLimiter(get_redis())
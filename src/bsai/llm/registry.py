@@ -68,6 +68,11 @@ class ModelRegistry:
 
             supports_streaming: bool = bool(info.get("supports_streaming", True))
 
+            cache_read_cost = info.get("cache_read_input_token_cost")
+            cached_input_price = (
+                Decimal(str(cache_read_cost * 1000)) if cache_read_cost is not None else None
+            )
+
             model = LLMModel(
                 name=model_name,
                 provider=str(info["litellm_provider"]),
@@ -75,6 +80,7 @@ class ModelRegistry:
                 output_price_per_1k=Decimal(str(info["output_cost_per_token"] * 1000)),
                 context_window=context_window,
                 supports_streaming=supports_streaming,
+                cached_input_price_per_1k=cached_input_price,
             )
 
             # Cache for future use
@@ -0,0 +1,223 @@
+"""Exact-match LLM response cache.
+
+Stores responses to tool-free completion requests in Redis, keyed by a
+canonical hash of everything that influences the output (model, messages,
+tools, response format, temperature, max tokens, endpoint). Replays of
+byte-identical requests - re-planning, retried responder calls, resumed
+workflows - are answered without a provider round-trip.
+
+Only low-temperature calls from allow-listed agents are cached. Entries
+expire after a TTL; the total number of entries and the size of a single
+entry are capped. Hit/miss counts and saved tokens are kept per agent.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from typing import Any
+
+import structlog
+
+from bsai.api.config import CacheSettings, get_cache_settings
+from bsai.cache import RedisClient
+
+from .schemas import LLMResponse, UsageInfo
+
+logger = structlog.get_logger()
+
+# Request parameters that determine the completion (never api_key)
+KEY_PARAMS = (
+    "model",
+    "messages",
+    "tools",
+    "response_format",
+    "temperature",
+    "max_tokens",
+    "api_base",
+)
+
+
+class LLMResponseCache:
+    """Redis-backed cache of LLM responses for identical requests."""
+
+    KEY_PREFIX = "llm:response:"
+    INDEX_KEY = "llm:response_index"
+    STATS_KEY_PREFIX = "llm:response_stats:"
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        settings: CacheSettings | None = None,
+    ) -> None:
+        """Initialize response cache.
+
+        Args:
+            redis_client: Connected Redis client
+            settings: Cache settings (default: get_cache_settings())
+        """
+        self.redis = redis_client
+        self.settings = settings or get_cache_settings()
+
+    @staticmethod
+    def make_key(params: dict[str, Any]) -> str:
+        """Build the cache key for a completion request.
+
+        Args:
+            params: LiteLLM completion parameters
+
+        Returns:
+            Redis key derived from a canonical hash of the request
+        """
+        canonical = json.dumps(
+            {name: params.get(name) for name in KEY_PARAMS},
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return f"{LLMResponseCache.KEY_PREFIX}{digest}"
+
+    def is_cacheable(self, params: dict[str, Any], agent_type: str | None) -> bool:
+        """Check whether a request may be served from or stored in the cache.
+
+        Args:
+            params: LiteLLM completion parameters
+            agent_type: Agent making the call (None outside workflow nodes)
+
+        Returns:
+            True if the request's temperature and agent allow caching
+        """
+        if params.get("tools") or params.get("stream"):
+            return False
+        if agent_type not in self.settings.llm_response_cache_agents:
+            return False
+        temperature = params.get("temperature")
+        if temperature is None:
+            return False
+        return float(temperature) <= self.settings.llm_response_cache_max_temperature
+
+    async def get(self, key: str, agent_type: str) -> LLMResponse | None:
+        """Look up a cached response.
+
+        Records a hit or miss for the agent. Redis errors count as misses.
+
+        Args:
+            key: Key from make_key()
+            agent_type: Agent making the call
+
+        Returns:
+            Cached response with ``usage.cached`` set, or None
+        """
+        try:
+            raw = await self.redis.client.get(key)
+        except Exception as e:
+            logger.warning("llm_response_cache_get_failed", error=str(e))
+            return None
+
+        if raw is None:
+            await self._record(agent_type, misses=1)
+            return None
+
+        try:
+            data = json.loads(raw)
+            usage = UsageInfo(**data["usage"], cached=True)
+            response = LLMResponse(
+                content=data["content"],
+                usage=usage,
+                model=data["model"],
+                finish_reason=data.get("finish_reason"),
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("llm_response_cache_corrupt", key=key, error=str(e))
+            await self._record(agent_type, misses=1)
+            return None
+
+        await self._record(
+            agent_type,
+            hits=1,
+            saved_input_tokens=usage.input_tokens,
+            saved_output_tokens=usage.output_tokens,
+        )
+        logger.info(
+            "llm_response_cache_hit",
+            agent=agent_type,
+            model=response.model,
+            saved_tokens=usage.total_tokens,
+        )
+        return response
+
+    async def put(self, key: str, response: LLMResponse) -> None:
+        """Store a response, evicting the oldest entries beyond the cap.
+
+        Responses larger than the entry size cap are skipped. Redis errors
+        are logged and ignored.
+
+        Args:
+            key: Key from make_key()
+            response: Provider response to cache
+        """
+        payload = json.dumps(
+            {
+                "content": response.content,
+                "model": response.model,
+                "finish_reason": response.finish_reason,
+                "usage": {
+                    "input_tokens": response.usage.input_tokens,
+                    "output_tokens": response.usage.output_tokens,
+                    "total_tokens": response.usage.total_tokens,
+                },
+            },
+            ensure_ascii=False,
+        )
+        if len(payload.encode("utf-8")) > self.settings.llm_response_cache_max_entry_bytes:
+            logger.debug("llm_response_cache_entry_too_large", size=len(payload))
+            return
+
+        ttl = self.settings.llm_response_cache_ttl
+        now = time.time()
+        try:
+            async with self.redis.client.pipeline(transaction=False) as pipe:
+                pipe.set(key, payload, ex=ttl)
+                pipe.zadd(self.INDEX_KEY, {key: now})
+                # Drop index members whose entries already expired
+                pipe.zremrangebyscore(self.INDEX_KEY, "-inf", now - ttl)
+                pipe.zcard(self.INDEX_KEY)
+                results = await pipe.execute()
+
+            overflow = int(results[-1]) - self.settings.llm_response_cache_max_entries
+            if overflow > 0:
+                evicted = await self.redis.client.zpopmin(self.INDEX_KEY, overflow)
+                if evicted:
+                    await self.redis.client.delete(*(member for member, _ in evicted))
+        except Exception as e:
+            logger.warning("llm_response_cache_put_failed", error=str(e))
+
+    async def get_stats(self, agent_types: list[str] | None = None) -> dict[str, dict[str, int]]:
+        """Get hit/miss counters and saved tokens per agent.
+
+        Args:
+            agent_types: Agents to report (default: the configured cacheable agents)
+
+        Returns:
+            Mapping of agent type to counters
+        """
+        stats: dict[str, dict[str, int]] = {}
+        for agent_type in agent_types or self.settings.llm_response_cache_agents:
+            raw = await self.redis.client.hgetall(f"{self.STATS_KEY_PREFIX}{agent_type}")
+            stats[agent_type] = {
+                field: int(raw.get(field, 0))
+                for field in ("hits", "misses", "saved_input_tokens", "saved_output_tokens")
+            }
+        return stats
+
+    async def _record(self, agent_type: str, **counters: int) -> None:
+        try:
+            async with self.redis.client.pipeline(transaction=False) as pipe:
+                for field, amount in counters.items():
+                    pipe.hincrby(f"{self.STATS_KEY_PREFIX}{agent_type}", field, amount)
+                await pipe.execute()
+        except Exception as e:
+            logger.debug("llm_response_cache_stats_failed", error=str(e))
@@ -1,17 +1,28 @@
 """LLM router for model selection and cost calculation.
 
 Selects optimal LLM based on task complexity and calculates costs.
+
+With routing enabled, each complexity can have an ordered fallback chain.
+Models that recently failed often or became very slow are tried last, and
+the client hedges slow tool-free calls with the next model in the chain.
 """
 
 from decimal import Decimal
+from typing import Any
 
-import tiktoken
+import structlog
 from tiktoken import Encoding
 
+from bsai.api.config import RoutingSettings, get_routing_settings
 from bsai.db.models.enums import TaskComplexity
 
+from .context_window import get_default_encoding
 from .models import FALLBACK_MODEL_NAME, LLMModel
 from .registry import ModelRegistry
+from .routing import ModelHealth, get_model_health
+from .schemas import UsageInfo
+
+logger = structlog.get_logger()
 
 
 class LLMRouter:
@@ -21,6 +32,8 @@ class LLMRouter:
         self,
         registry: ModelRegistry,
         complexity_mapping: dict[str, str] | None = None,
+        routing: RoutingSettings | None = None,
+        health: ModelHealth | None = None,
     ) -> None:
         """Initialize LLM router.
 
@@ -29,17 +42,16 @@ class LLMRouter:
             complexity_mapping: Optional complexity-to-model-name mapping from user settings.
                               Key is TaskComplexity enum name (e.g., "MODERATE").
                               If None, uses fallback model for all complexities.
+            routing: Routing settings (default: get_routing_settings())
+            health: Model health tracker (default: process-wide tracker)
         """
         self.registry = registry
         self.complexity_mapping = complexity_mapping or {}
+        self.routing = routing or get_routing_settings()
+        self.health = health or get_model_health()
 
-        # Token encoding for estimation (using OpenAI's cl100k_base)
-        self.encoding: Encoding | None
-        try:
-            self.encoding = tiktoken.get_encoding("cl100k_base")
-        except Exception:
-            # Fallback if tiktoken has issues
-            self.encoding = None
+        # Token encoding for estimation (OpenAI's cl100k_base, loaded once per process)
+        self.encoding: Encoding | None = get_default_encoding()
 
     def select_model(
         self,
@@ -61,6 +73,18 @@ class LLMRouter:
         # Determine model name
         if preferred_model is not None:
             model_name = preferred_model
+        elif self.routing.enabled and complexity.name in self.routing.fallback_chains:
+            chain = self._rank_chain(self.routing.fallback_chains[complexity.name])
+            if chain:
+                self.health.record_event(chain[0].name, "selected")
+                logger.debug(
+                    "llm_route_selected",
+                    complexity=complexity.name,
+                    model=chain[0].name,
+                    chain=[m.name for m in chain],
+                )
+                return chain[0]
+            model_name = self.complexity_mapping.get(complexity.name, FALLBACK_MODEL_NAME)
         else:
             # Use complexity mapping or fallback
             model_name = self.complexity_mapping.get(complexity.name, FALLBACK_MODEL_NAME)
@@ -75,6 +99,123 @@ class LLMRouter:
 
         return model
 
+    def fallback_models(self, model_name: str) -> list[LLMModel]:
+        """Get the models to hedge or fall back to for a selected model.
+
+        Args:
+            model_name: Model the request was built for
+
+        Returns:
+            Remaining models of the first fallback chain containing the model,
+            in routing order (empty if routing is disabled)
+        """
+        if not self.routing.enabled:
+            return []
+        for chain in self.routing.fallback_chains.values():
+            if model_name in chain:
+                return [m for m in self._rank_chain(chain) if m.name != model_name]
+        return []
+
+    def larger_context_model(
+        self,
+        model_name: str,
+        required_tokens: int,
+        candidates: list[str] | None = None,
+    ) -> LLMModel | None:
+        """Find a model whose context window fits a request that overflows its model.
+
+        Considers the models of the complexity mapping, the fallback chains
+        and any extra candidates.
+
+        Args:
+            model_name: Model the request was built for
+            required_tokens: Prompt plus reserved output tokens
+            candidates: Additional model names to consider
+
+        Returns:
+            Model with the smallest sufficient context window (cheapest on
+            ties), or None if no known model fits
+        """
+        current = self.registry.get(model_name)
+        current_window = current.context_window if current else 0
+        names = [
+            *self.complexity_mapping.values(),
+            *(name for chain in self.routing.fallback_chains.values() for name in chain),
+            *(candidates or []),
+        ]
+
+        fitting: list[LLMModel] = []
+        for name in dict.fromkeys(names):
+            model = self.registry.get(name) if name != model_name else None
+            if (
+                model is not None
+                and model.context_window > current_window
+                and model.context_window >= required_tokens
+            ):
+                fitting.append(model)
+        if not fitting:
+            return None
+        return min(fitting, key=lambda m: (m.context_window, m.input_price_per_1k))
+
+    def hedge_delay(self, model_name: str) -> float:
+        """Get how long to wait for a model before sending a hedged request.
+
+        Args:
+            model_name: Model of the in-flight request
+
+        Returns:
+            Recent latency percentile of the model in seconds, clamped to the
+            configured bounds (default delay with too few samples)
+        """
+        latency = self.health.latency_percentile(
+            model_name, self.routing.hedge_percentile, self.routing.min_samples
+        )
+        if latency is None:
+            return self.routing.hedge_default_delay
+        return min(max(latency, self.routing.hedge_min_delay), self.routing.hedge_max_delay)
+
+    def get_routing_metrics(self) -> dict[str, dict[str, Any]]:
+        """Export per-model latency, error and routing decision metrics.
+
+        Returns:
+            Mapping of model name to metrics, including the current hedge delay
+        """
+        metrics = self.health.snapshot()
+        for model_name, values in metrics.items():
+            values["hedge_delay"] = self.hedge_delay(model_name)
+            values["degraded"] = self._is_degraded(model_name)
+        return metrics
+
+    def _rank_chain(self, chain: list[str]) -> list[LLMModel]:
+        """Resolve a fallback chain, moving degraded models to the end.
+
+        Args:
+            chain: Configured model names in preference order
+
+        Returns:
+            Available models in routing order
+        """
+        models: list[LLMModel] = []
+        for name in chain:
+            model = self.registry.get(name)
+            if model is None:
+                logger.warning("llm_route_model_unavailable", model=name)
+                continue
+            models.append(model)
+        # Stable sort keeps the configured order within healthy/degraded groups
+        return sorted(models, key=lambda m: self._is_degraded(m.name))
+
+    def _is_degraded(self, model_name: str) -> bool:
+        """Check whether recent calls to a model failed often or ran too long."""
+        if self.health.samples(model_name) < self.routing.min_samples:
+            return False
+        if self.health.error_rate(model_name) > self.routing.max_error_rate:
+            return True
+        p95 = self.health.latency_percentile(
+            model_name, self.routing.hedge_percentile, self.routing.min_samples
+        )
+        return p95 is not None and p95 > self.routing.hedge_max_delay
+
     def set_complexity_mapping(
         self,
         mapping: dict[str, str],
@@ -92,20 +233,68 @@ class LLMRouter:
         model: LLMModel,
         input_tokens: int,
         output_tokens: int,
+        cached_input_tokens: int = 0,
     ) -> Decimal:
         """Calculate cost for given token usage.
 
+        Cached input tokens are billed at the model's prompt-cache read
+        price, or at the regular input price if the model has none.
+
         Args:
             model: LLM model used
-            input_tokens: Number of input tokens
+            input_tokens: Number of input tokens (including cached ones)
             output_tokens: Number of output tokens
+            cached_input_tokens: Input tokens read from the provider's prompt cache
 
         Returns:
             Total cost in USD
         """
-        input_cost = (Decimal(input_tokens) / Decimal("1000")) * model.input_price_per_1k
-        output_cost = (Decimal(output_tokens) / Decimal("1000")) * model.output_price_per_1k
-        return input_cost + output_cost
+        cached_tokens = min(cached_input_tokens, input_tokens)
+        cached_price = model.cached_input_price_per_1k
+        if cached_price is None:
+            cached_price = model.input_price_per_1k
+        per_1k = Decimal("1000")
+        input_cost = (Decimal(input_tokens - cached_tokens) / per_1k) * model.input_price_per_1k
+        cached_cost = (Decimal(cached_tokens) / per_1k) * cached_price
+        output_cost = (Decimal(output_tokens) / per_1k) * model.output_price_per_1k
+        return input_cost + cached_cost + output_cost
+
+    def calculate_usage_cost(self, model: LLMModel, usage: UsageInfo) -> Decimal:
+        """Calculate the cost actually spent for a response's usage.
+
+        Args:
+            model: LLM model used
+            usage: Usage reported with the response
+
+        Returns:
+            Total cost in USD (zero for responses served from the cache)
+        """
+        if usage.cached:
+            return Decimal("0")
+        return self.calculate_cost(
+            model,
+            usage.input_tokens,
+            usage.output_tokens,
+            cached_input_tokens=usage.cached_input_tokens,
+        )
+
+    def served_model(self, model: LLMModel, response_model: str) -> LLMModel:
+        """Get the model that served a response.
+
+        A request may be answered by another model: a fallback model when
+        hedged, or a larger-window model when escalated. Its response
+        carries that model's name.
+
+        Args:
+            model: Model the request was built for
+            response_model: Model name reported with the response
+
+        Returns:
+            Registered model named by the response, or the requested model
+        """
+        if response_model == model.name:
+            return model
+        return self.registry.get(response_model) or model
 
     def estimate_tokens(self, text: str) -> int:
         """Estimate token count using tiktoken.
@@ -0,0 +1,130 @@
+"""Rolling per-model health statistics for latency-aware routing.
+
+Every provider round-trip reports its latency (or failure) here. The
+router uses the recent window to order fallback chains and to derive the
+hedge delay (the model's recent p95 latency), and records each routing
+decision so it can be exported as metrics.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter, deque
+from functools import lru_cache
+from typing import Any
+
+from bsai.api.config import get_routing_settings
+
+# Routing decisions counted per model
+ROUTING_EVENTS = ("selected", "hedged", "hedge_won", "fallback", "fallback_won")
+
+
+class ModelHealth:
+    """Rolling latency/error window and routing counters per model."""
+
+    def __init__(self, window_size: int = 100) -> None:
+        """Initialize model health tracker.
+
+        Args:
+            window_size: Number of recent calls kept per model
+        """
+        self.window_size = window_size
+        self._latencies: dict[str, deque[float]] = {}
+        self._outcomes: dict[str, deque[bool]] = {}
+        self._events: dict[str, Counter[str]] = {}
+
+    def record_success(self, model: str, latency: float) -> None:
+        """Record a successful call.
+
+        Args:
+            model: Model name
+            latency: Call duration in seconds
+        """
+        self._window(self._latencies, model).append(latency)
+        self._window(self._outcomes, model).append(True)
+
+    def record_failure(self, model: str) -> None:
+        """Record a failed call.
+
+        Args:
+            model: Model name
+        """
+        self._window(self._outcomes, model).append(False)
+
+    def record_event(self, model: str, event: str) -> None:
+        """Count a routing decision for a model.
+
+        Args:
+            model: Model the decision concerns
+            event: One of ROUTING_EVENTS
+        """
+        self._events.setdefault(model, Counter())[event] += 1
+
+    def samples(self, model: str) -> int:
+        """Number of calls in the model's window."""
+        return len(self._outcomes.get(model, ()))
+
+    def error_rate(self, model: str) -> float:
+        """Share of failed calls in the model's window (0.0 without data)."""
+        outcomes = self._outcomes.get(model)
+        if not outcomes:
+            return 0.0
+        return outcomes.count(False) / len(outcomes)
+
+    def latency_percentile(
+        self, model: str, percentile: float, min_samples: int = 1
+    ) -> float | None:
+        """Latency percentile over the model's successful calls.
+
+        Args:
+            model: Model name
+            percentile: Percentile as a fraction (e.g. 0.95)
+            min_samples: Minimum successful calls required
+
+        Returns:
+            Latency in seconds, or None with too few samples
+        """
+        latencies = self._latencies.get(model)
+        if not latencies or len(latencies) < min_samples:
+            return None
+        ordered = sorted(latencies)
+        # Nearest-rank percentile
+        index = max(math.ceil(percentile * len(ordered)) - 1, 0)
+        return ordered[index]
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Export statistics and routing counters per model.
+
+        Returns:
+            Mapping of model name to metrics
+        """
+        models = set(self._outcomes) | set(self._events)
+        return {
+            model: {
+                "samples": self.samples(model),
+                "error_rate": round(self.error_rate(model), 4),
+                "p50_latency": self.latency_percentile(model, 0.5),
+                "p95_latency": self.latency_percentile(model, 0.95),
+                **{event: self._events.get(model, Counter())[event] for event in ROUTING_EVENTS},
+            }
+            for model in sorted(models)
+        }
+
+    def _window(self, windows: dict[str, deque[Any]], model: str) -> deque[Any]:
+        window = windows.get(model)
+        if window is None:
+            window = deque(maxlen=self.window_size)
+            windows[model] = window
+        return window
+
+
+@lru_cache(maxsize=1)
+def get_model_health() -> ModelHealth:
+    """Get the process-wide model health tracker (cached singleton).
+
+    Shared by all routers so statistics survive across workflow runs.
+
+    Returns:
+        ModelHealth instance
+    """
+    return ModelHealth(window_size=get_routing_settings().window_size)
@@ -5,17 +5,38 @@ Type-safe Pydantic models for LLM interactions.
 
 from __future__ import annotations
 
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
 
+class MessagePriority(IntEnum):
+    """How readily a message may be trimmed to fit the context window.
+
+    Higher values are trimmed first.
+    """
+
+    REQUIRED = 0  # Never trimmed
+    CONTEXT = 1  # Supporting context (e.g. session file list)
+    HISTORY = 2  # Earlier conversation turns
+
+
 class ChatMessage(BaseModel):
-    """Individual chat message."""
+    """Individual chat message.
+
+    ``cache_control`` marks a prompt-caching breakpoint: the conversation
+    prefix up to and including this message may be cached by providers
+    that support it. Place breakpoints on stable content only.
+
+    ``priority`` allows the client to trim the message when the request
+    would not fit the model's context window.
+    """
 
     role: Literal["system", "user", "assistant"]
     content: str
+    cache_control: bool = False
+    priority: MessagePriority = MessagePriority.REQUIRED
 
 
 class LLMRequest(BaseModel):
@@ -129,11 +150,25 @@ class WorkerReActOutput(BaseModel):
 
 
 class UsageInfo(BaseModel):
-    """Token usage information."""
+    """Token usage information.
+
+    ``cached`` responses were served from the response cache: the token
+    counts describe the original call, but no provider tokens were spent.
+
+    ``cached_input_tokens`` is the part of ``input_tokens`` the provider
+    read from its prompt cache (billed at the discounted cache rate).
+    """
 
     input_tokens: int = Field(ge=0)
     output_tokens: int = Field(ge=0)
     total_tokens: int = Field(ge=0)
+    cached: bool = False
+    cached_input_tokens: int = Field(default=0, ge=0)
+
+    @property
+    def uncached_input_tokens(self) -> int:
+        """Input tokens billed at the regular input rate."""
+        return max(self.input_tokens - self.cached_input_tokens, 0)
 
 
 class LLMResponse(BaseModel):
@@ -273,6 +308,19 @@ class QAConfig(BaseModel):
     build_command: str | None = None
     allow_lint_warnings: bool = True
     require_all_tests_pass: bool = True
+    blocking_validations: list[Literal["lint", "typecheck", "test", "build"]] = Field(
+        default=["build"],
+        description="Validations whose failure cancels the remaining dynamic validations",
+    )
+    incremental: bool = Field(
+        default=True,
+        description="Scope lint/typecheck/test to files changed by the milestone and their dependents",
+    )
+    incremental_max_files: int = Field(
+        default=50,
+        ge=1,
+        description="Affected file count above which validations fall back to a full run",
+    )
 
 
 # =============================================================================
@@ -26,6 +26,7 @@ from bsai.api.websocket.manager import ConnectionManager
 from bsai.db.models.mcp_server_config import McpServerConfig
 from bsai.db.repository.mcp_tool_log_repo import McpToolLogRepository
 from bsai.mcp.security import McpSecurityValidator, build_mcp_auth_headers
+from bsai.resilience import CircuitOpenError, circuit_guard, get_circuit_breaker
 
 logger = structlog.get_logger()
 
@@ -104,6 +105,7 @@ class McpToolExecutor:
         self.ws_manager = ws_manager
         self.settings = get_mcp_settings()
         self.validator = McpSecurityValidator(self.settings)
+        self.circuit_breaker = get_circuit_breaker()
 
         # Pending stdio calls (request_id -> Future)
         self._pending_stdio_calls: dict[str, asyncio.Future[McpToolResult]] = {}
@@ -425,6 +427,7 @@ class McpToolExecutor:
         """Execute HTTP/SSE tool via MCP client.
 
         Connects to the MCP server and executes the tool call directly.
+        Servers whose circuit is open are not contacted.
 
         Args:
             tool_call: Tool call to execute
@@ -459,63 +462,75 @@ class McpToolExecutor:
             )
 
         try:
-            if server.transport_type == "sse":
-                async with sse_client(url=server.server_url, headers=headers) as (read, write):
-                    async with ClientSession(read, write) as session:
-                        await session.initialize()
-                        result = await session.call_tool(
-                            tool_call.tool_name,
-                            tool_call.tool_input,
-                        )
-                        execution_time_ms = int((time.time() - start_time) * 1000)
-
-                        # Extract content from result
-                        output = self._extract_tool_output(result)
-
-                        logger.info(
-                            "mcp_remote_tool_success",
-                            tool_name=tool_call.tool_name,
-                            execution_time_ms=execution_time_ms,
-                        )
-
-                        return McpToolResult(
-                            success=True,
-                            output=output,
-                            execution_time_ms=execution_time_ms,
-                        )
-            else:  # http
-                # Create httpx client with headers for authentication
-                http_client = httpx.AsyncClient(headers=headers) if headers else None
-                async with streamable_http_client(
-                    url=server.server_url, http_client=http_client
-                ) as (
-                    read,
-                    write,
-                    _,
-                ):
-                    async with ClientSession(read, write) as session:
-                        await session.initialize()
-                        result = await session.call_tool(
-                            tool_call.tool_name,
-                            tool_call.tool_input,
-                        )
-                        execution_time_ms = int((time.time() - start_time) * 1000)
-
-                        # Extract content from result
-                        output = self._extract_tool_output(result)
-
-                        logger.info(
-                            "mcp_remote_tool_success",
-                            tool_name=tool_call.tool_name,
-                            execution_time_ms=execution_time_ms,
-                        )
-
-                        return McpToolResult(
-                            success=True,
-                            output=output,
-                            execution_time_ms=execution_time_ms,
-                        )
-
+            async with circuit_guard(self.circuit_breaker, f"mcp:{server.id}"):
+                if server.transport_type == "sse":
+                    async with sse_client(url=server.server_url, headers=headers) as (read, write):
+                        async with ClientSession(read, write) as session:
+                            await session.initialize()
+                            result = await session.call_tool(
+                                tool_call.tool_name,
+                                tool_call.tool_input,
+                            )
+                            execution_time_ms = int((time.time() - start_time) * 1000)
+
+                            # Extract content from result
+                            output = self._extract_tool_output(result)
+
+                            logger.info(
+                                "mcp_remote_tool_success",
+                                tool_name=tool_call.tool_name,
+                                execution_time_ms=execution_time_ms,
+                            )
+
+                            return McpToolResult(
+                                success=True,
+                                output=output,
+                                execution_time_ms=execution_time_ms,
+                            )
+                else:  # http
+                    # Create httpx client with headers for authentication
+                    http_client = httpx.AsyncClient(headers=headers) if headers else None
+                    async with streamable_http_client(
+                        url=server.server_url, http_client=http_client
+                    ) as (
+                        read,
+                        write,
+                        _,
+                    ):
+                        async with ClientSession(read, write) as session:
+                            await session.initialize()
+                            result = await session.call_tool(
+                                tool_call.tool_name,
+                                tool_call.tool_input,
+                            )
+                            execution_time_ms = int((time.time() - start_time) * 1000)
+
+                            # Extract content from result
+                            output = self._extract_tool_output(result)
+
+                            logger.info(
+                                "mcp_remote_tool_success",
+                                tool_name=tool_call.tool_name,
+                                execution_time_ms=execution_time_ms,
+                            )
+
+                            return McpToolResult(
+                                success=True,
+                                output=output,
+                                execution_time_ms=execution_time_ms,
+                            )
+
+        except CircuitOpenError as e:
+            logger.warning(
+                "mcp_remote_tool_circuit_open",
+                tool_name=tool_call.tool_name,
+                server=server.name,
+                retry_after=round(e.retry_after, 1),
+            )
+            return McpToolResult(
+                success=False,
+                error=f"MCP server {server.name} is temporarily unavailable after repeated failures",
+            )
         except Exception as e:
             execution_time_ms = int((time.time() - start_time) * 1000)
             logger.error(
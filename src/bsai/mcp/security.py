@@ -2,25 +2,176 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import ipaddress
 import json
 import re
 import shlex
 import socket
+import time
 from base64 import b64decode, b64encode
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urlparse
+from uuid import UUID
 
 import httpx
 import structlog
 from cryptography.fernet import Fernet
 
-from ..api.config import McpSettings
+from ..api.config import McpSettings, get_mcp_settings
 from ..db.models.mcp_server_config import McpServerConfig
 
 logger = structlog.get_logger()
 
 
+AddrInfo = tuple[Any, Any, Any, str, tuple[Any, ...]]
+
+
+def _unique_addresses(addr_info: list[AddrInfo]) -> tuple[str, ...]:
+    """Extract distinct IP strings from getaddrinfo results, keeping resolver order."""
+    return tuple(dict.fromkeys(str(sockaddr[0]) for *_, sockaddr in addr_info))
+
+
+class HostResolutionCache:
+    """TTL cache of hostname resolutions shared by SSRF checks.
+
+    ``getaddrinfo`` does not expose record TTLs, so successful lookups are
+    reused for ``ttl`` seconds (an upper bound on staleness) and failed
+    lookups for ``negative_ttl`` seconds. Only addresses are cached; whether
+    they are allowed is re-evaluated by each validator.
+    """
+
+    def __init__(self, ttl: float = 60, negative_ttl: float = 10, max_size: int = 1024) -> None:
+        """Initialize resolution cache.
+
+        Args:
+            ttl: Seconds a successful resolution is reused (0 disables)
+            negative_ttl: Seconds a failed resolution is remembered (0 disables)
+            max_size: Maximum number of cached hostnames
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, tuple[str, ...]]] = OrderedDict()
+
+    def get(self, hostname: str) -> tuple[str, ...] | None:
+        """Get unexpired addresses for a hostname.
+
+        Args:
+            hostname: Hostname (case-insensitive)
+
+        Returns:
+            Cached addresses (empty if resolution failed), or None on a miss
+        """
+        key = hostname.lower()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, addresses = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return addresses
+
+    def put(self, hostname: str, addresses: tuple[str, ...]) -> None:
+        """Cache a resolution result.
+
+        Args:
+            hostname: Hostname (case-insensitive)
+            addresses: Resolved addresses (empty if resolution failed)
+        """
+        ttl = self.ttl if addresses else self.negative_ttl
+        if ttl <= 0:
+            return
+        key = hostname.lower()
+        self._entries[key] = (time.monotonic() + ttl, addresses)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def resolve(self, hostname: str) -> tuple[str, ...]:
+        """Resolve a hostname without blocking the event loop.
+
+        Args:
+            hostname: Hostname to resolve
+
+        Returns:
+            Resolved addresses (empty if resolution failed)
+        """
+        cached = self.get(hostname)
+        if cached is not None:
+            return cached
+        loop = asyncio.get_running_loop()
+        try:
+            addr_info = await loop.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)
+        except socket.gaierror:
+            addr_info = []
+        addresses = _unique_addresses(addr_info)
+        self.put(hostname, addresses)
+        return addresses
+
+    def resolve_sync(self, hostname: str) -> tuple[str, ...]:
+        """Resolve a hostname from synchronous code.
+
+        Args:
+            hostname: Hostname to resolve
+
+        Returns:
+            Resolved addresses (empty if resolution failed)
+        """
+        cached = self.get(hostname)
+        if cached is not None:
+            return cached
+        try:
+            addr_info = socket.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)
+        except socket.gaierror:
+            addr_info = []
+        addresses = _unique_addresses(addr_info)
+        self.put(hostname, addresses)
+        return addresses
+
+    def clear(self) -> None:
+        """Remove all cached resolutions."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@lru_cache(maxsize=1)
+def get_host_resolution_cache() -> HostResolutionCache:
+    """Get the process-wide hostname resolution cache (cached singleton).
+
+    Returns:
+        HostResolutionCache configured from McpSettings
+    """
+    settings = get_mcp_settings()
+    return HostResolutionCache(
+        ttl=settings.dns_cache_ttl,
+        negative_ttl=settings.dns_negative_cache_ttl,
+    )
+
+
+@dataclass(frozen=True)
+class ResolvedUrl:
+    """SSRF-validated URL together with the addresses it may connect to.
+
+    Attributes:
+        url: Sanitized URL
+        hostname: Hostname the URL names
+        addresses: Validated IP addresses (empty if the hostname did not resolve)
+    """
+
+    url: str
+    hostname: str
+    addresses: tuple[str, ...]
+
+
 class McpSecurityValidator:
     """Security validation for MCP configurations.
 
@@ -30,13 +181,19 @@ class McpSecurityValidator:
     - Tool risk assessment (evaluate risk level of tool calls)
     """
 
-    def __init__(self, settings: McpSettings | None = None):
+    def __init__(
+        self,
+        settings: McpSettings | None = None,
+        resolver: HostResolutionCache | None = None,
+    ):
         """Initialize security validator.
 
         Args:
             settings: MCP settings (if None, creates default settings)
+            resolver: Hostname resolution cache (defaults to the shared cache)
         """
         self.settings = settings or McpSettings()
+        self.resolver = resolver or get_host_resolution_cache()
         self.allowed_stdio_commands = set(self.settings.allowed_stdio_commands)
         self.blocked_url_patterns = self.settings.blocked_url_patterns
         self.high_risk_keywords = self.settings.high_risk_keywords
@@ -77,7 +234,8 @@ class McpSecurityValidator:
 
         Validates the URL against blocked patterns, resolves the hostname,
         and checks that it does not point to a private/internal IP.
-        Returns a sanitized URL string.
+        Returns a sanitized URL string. Async callers should prefer
+        resolve_server_url(), which does not block the event loop.
 
         Args:
             url: Server URL to validate
@@ -85,6 +243,42 @@ class McpSecurityValidator:
         Returns:
             Sanitized and validated URL string
 
+        Raises:
+            ValueError: If URL fails validation
+        """
+        sanitized_url, hostname = self._parse_server_url(url)
+        self._validate_addresses(hostname, self.resolver.resolve_sync(hostname))
+        return sanitized_url
+
+    async def resolve_server_url(self, url: str) -> ResolvedUrl:
+        """Validate HTTP/SSE URL and return the addresses to pin requests to.
+
+        Same checks as validate_server_url(), but resolves the hostname
+        through the event loop's resolver and the shared resolution cache.
+
+        Args:
+            url: Server URL to validate
+
+        Returns:
+            ResolvedUrl with the sanitized URL and its validated addresses
+
+        Raises:
+            ValueError: If URL fails validation
+        """
+        sanitized_url, hostname = self._parse_server_url(url)
+        addresses = await self.resolver.resolve(hostname)
+        self._validate_addresses(hostname, addresses)
+        return ResolvedUrl(url=sanitized_url, hostname=hostname, addresses=addresses)
+
+    def _parse_server_url(self, url: str) -> tuple[str, str]:
+        """Run the resolution-independent URL checks.
+
+        Args:
+            url: Server URL to validate
+
+        Returns:
+            Tuple of (sanitized URL, hostname)
+
         Raises:
             ValueError: If URL fails validation
         """
@@ -116,9 +310,6 @@ class McpSecurityValidator:
         if scheme not in ("http", "https"):
             raise ValueError("URL must use HTTP or HTTPS protocol")
 
-        # Resolve hostname and validate all IPs are public
-        self._validate_resolved_ip(hostname)
-
         # Return sanitized URL reconstructed from validated components
         sanitized_url = f"{scheme}://{parsed.netloc}{parsed.path}"
         if parsed.query:
@@ -126,38 +317,33 @@ class McpSecurityValidator:
         if parsed.fragment:
             sanitized_url += f"#{parsed.fragment}"
 
-        return sanitized_url
+        return sanitized_url, hostname
+
+    @staticmethod
+    def _validate_addresses(hostname: str, addresses: tuple[str, ...]) -> None:
+        """Validate that a hostname's resolved addresses are all public.
 
-    def _validate_resolved_ip(self, hostname: str) -> None:
-        """Validate that hostname resolves to a public IP address.
+        An empty address list (DNS resolution failed) is allowed; the
+        request will fail naturally when it tries to connect.
 
         Args:
-            hostname: Hostname to validate
+            hostname: Hostname the addresses belong to
+            addresses: Resolved IP address strings
 
         Raises:
-            ValueError: If hostname resolves to private/internal IP
+            ValueError: If any address is private/internal
         """
-        try:
-            # Get all IP addresses for the hostname
-            addr_info = socket.getaddrinfo(hostname, None, socket.AF_UNSPEC)
-            for _family, _, _, _, sockaddr in addr_info:
-                ip_str = sockaddr[0]
-                try:
-                    ip = ipaddress.ip_address(ip_str)
-                    if ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_reserved:
-                        raise ValueError(
-                            f"URL blocked: Hostname '{hostname}' resolves to "
-                            f"private/internal IP address '{ip_str}'"
-                        )
-                except ValueError as e:
-                    if "private/internal" in str(e):
-                        raise
-                    # If IP parsing fails, continue checking other addresses
-                    continue
-        except socket.gaierror:
-            # DNS resolution failed - allow the request to proceed
-            # (it will fail naturally when httpx tries to connect)
-            pass
+        for ip_str in addresses:
+            try:
+                ip = ipaddress.ip_address(ip_str)
+            except ValueError:
+                # If IP parsing fails, continue checking other addresses
+                continue
+            if ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_reserved:
+                raise ValueError(
+                    f"URL blocked: Hostname '{hostname}' resolves to "
+                    f"private/internal IP address '{ip_str}'"
+                )
 
     def assess_tool_risk(
         self,
@@ -231,10 +417,10 @@ class CredentialEncryption:
         """Initialize credential encryption.
 
         Args:
-            settings: MCP settings containing encryption key.
+            settings: MCP settings containing encryption key (uses get_mcp_settings() if None).
                      If key is not configured, auto-generates one (won't persist across restarts)
         """
-        settings = settings or McpSettings()
+        settings = settings or get_mcp_settings()
         encryption_key = settings.get_encryption_key()
 
         try:
@@ -305,6 +491,113 @@ class CredentialEncryption:
             raise ValueError(f"Failed to decrypt credentials: {e}") from e
 
 
+@lru_cache(maxsize=1)
+def get_credential_encryption() -> CredentialEncryption:
+    """Get credential encryption for the shared MCP settings (cached singleton).
+
+    Returns:
+        CredentialEncryption using get_mcp_settings()
+    """
+    return CredentialEncryption(get_mcp_settings())
+
+
+AuthHeaderCacheKey = tuple[UUID, str, str]
+
+
+class McpAuthHeaderCache:
+    """LRU cache of auth headers derived from encrypted server credentials.
+
+    Entries are keyed by (server id, auth type, ciphertext hash), so any
+    credential change - including an OAuth token refresh, which always
+    produces new ciphertext - misses the cache. ``invalidate`` drops the
+    stale plaintext entries of a server eagerly. Memory only; headers are
+    never persisted.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """Initialize header cache.
+
+        Args:
+            max_size: Maximum number of cached header sets (0 disables caching)
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[AuthHeaderCacheKey, dict[str, str] | None] = OrderedDict()
+
+    @staticmethod
+    def make_key(server: McpServerConfig) -> AuthHeaderCacheKey:
+        """Build the cache key for a server's current credentials.
+
+        Args:
+            server: MCP server configuration with encrypted credentials
+
+        Returns:
+            (server id, auth type, SHA-256 of the ciphertext)
+        """
+        digest = hashlib.sha256((server.auth_credentials or "").encode()).hexdigest()
+        return (server.id, server.auth_type or "none", digest)
+
+    def lookup(self, key: AuthHeaderCacheKey) -> tuple[bool, dict[str, str] | None]:
+        """Look up cached headers.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Tuple of (hit, headers). Headers may be None on a hit when the
+            credentials were decrypted but yielded no usable token.
+        """
+        if key not in self._entries:
+            return False, None
+        self._entries.move_to_end(key)
+        headers = self._entries[key]
+        return True, dict(headers) if headers is not None else None
+
+    def put(self, key: AuthHeaderCacheKey, headers: dict[str, str] | None) -> None:
+        """Cache derived headers, evicting the least recently used entry when full.
+
+        Args:
+            key: Key from make_key()
+            headers: Headers to cache (None if credentials yield no headers)
+        """
+        if self.max_size <= 0:
+            return
+        self._entries[key] = dict(headers) if headers is not None else None
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, server_id: UUID) -> int:
+        """Drop all cached headers of a server.
+
+        Args:
+            server_id: MCP server UUID
+
+        Returns:
+            Number of entries removed
+        """
+        stale = [key for key in self._entries if key[0] == server_id]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove all cached headers."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@lru_cache(maxsize=1)
+def get_mcp_auth_header_cache() -> McpAuthHeaderCache:
+    """Get the process-wide MCP auth header cache (cached singleton).
+
+    Returns:
+        McpAuthHeaderCache configured from McpSettings
+    """
+    return McpAuthHeaderCache(get_mcp_settings().auth_header_cache_size)
+
+
 def build_mcp_auth_headers(
     server: McpServerConfig,
     settings: McpSettings | None = None,
@@ -312,10 +605,12 @@ def build_mcp_auth_headers(
     """Build authentication headers for MCP server requests.
 
     Decrypts stored credentials and constructs appropriate headers based on auth type.
+    With the shared settings, headers are served from the in-memory header cache
+    so repeated tool calls skip decryption.
 
     Args:
         server: MCP server configuration
-        settings: MCP settings for decryption (uses default if None)
+        settings: MCP settings for decryption (uses get_mcp_settings() if None)
 
     Returns:
         Dictionary of headers or None if no auth configured/decryption fails
@@ -326,8 +621,16 @@ def build_mcp_auth_headers(
     if not server.auth_type or server.auth_type == "none":
         return None
 
-    settings = settings or McpSettings()
-    encryptor = CredentialEncryption(settings)
+    # Only the shared settings share a key with the cache; explicit settings bypass it
+    shared = settings is None or settings is get_mcp_settings()
+    cache = get_mcp_auth_header_cache() if shared else None
+    key = McpAuthHeaderCache.make_key(server)
+    if cache is not None:
+        hit, cached = cache.lookup(key)
+        if hit:
+            return cached
+
+    encryptor = get_credential_encryption() if shared else CredentialEncryption(settings)
 
     try:
         credentials = encryptor.decrypt(server.auth_credentials)
@@ -339,20 +642,7 @@ def build_mcp_auth_headers(
         )
         return None
 
-    headers: dict[str, str] | None = None
-
-    if server.auth_type == "bearer":
-        token = credentials.get("token", "")
-        if token:
-            headers = {"Authorization": f"Bearer {token}"}
-    elif server.auth_type == "api_key":
-        api_key = credentials.get("api_key", "")
-        if api_key:
-            headers = {credentials.get("header_name", "X-API-Key"): api_key}
-    elif server.auth_type == "oauth2":
-        access_token = credentials.get("access_token", "")
-        if access_token:
-            headers = {"Authorization": f"Bearer {access_token}"}
+    headers = _headers_from_credentials(server.auth_type, credentials)
 
     if not headers and server.auth_type and server.auth_type != "none":
         logger.warning(
@@ -361,25 +651,52 @@ def build_mcp_auth_headers(
             auth_type=server.auth_type,
         )
 
+    if cache is not None:
+        cache.put(key, headers)
     return headers
 
 
-async def ssrf_safe_get(
+def _headers_from_credentials(
+    auth_type: str,
+    credentials: dict[str, Any],
+) -> dict[str, str] | None:
+    """Map decrypted credentials to request headers for an auth type."""
+    if auth_type == "bearer":
+        token = credentials.get("token", "")
+        if token:
+            return {"Authorization": f"Bearer {token}"}
+    elif auth_type == "api_key":
+        api_key = credentials.get("api_key", "")
+        if api_key:
+            return {credentials.get("header_name", "X-API-Key"): api_key}
+    elif auth_type == "oauth2":
+        access_token = credentials.get("access_token", "")
+        if access_token:
+            return {"Authorization": f"Bearer {access_token}"}
+    return None
+
+
+async def _ssrf_safe_request(
+    method: str,
     url: str,
     validator: McpSecurityValidator,
-    timeout: float = 10.0,
-    headers: dict[str, str] | None = None,
+    timeout: float,
+    headers: dict[str, str] | None,
+    **kwargs: Any,
 ) -> httpx.Response:
-    """Perform an SSRF-safe HTTP GET request.
+    """Send a request pinned to the addresses validated for its hostname.
 
-    Validates the URL against SSRF patterns and disables redirects
-    to prevent redirect-based SSRF attacks.
+    The request connects to the validated IP directly, with the original
+    Host header and TLS server name, so a DNS change between validation
+    and connect cannot redirect it to an internal address.
 
     Args:
-        url: URL to fetch
+        method: HTTP method
+        url: URL to request
         validator: Security validator for URL validation
         timeout: Request timeout in seconds
         headers: Optional headers to include
+        **kwargs: Extra arguments for httpx.AsyncClient.request
 
     Returns:
         httpx.Response object
@@ -389,19 +706,68 @@ async def ssrf_safe_get(
         httpx.HTTPError: If request fails
     """
     # Full SSRF validation: blocked patterns, hostname resolution, private IP check
-    validator.validate_server_url(url)
+    resolved = await validator.resolve_server_url(url)
 
     # CodeQL StringRestrictionSanitizerGuard: re.fullmatch with url as 2nd arg
     # acts as a barrier guard that restricts url to safe characters only.
     if not re.fullmatch(r"https?://[a-zA-Z0-9._\-]+(:\d+)?(/[^\s]*)?", url):
         raise ValueError("URL contains unsafe characters")
 
+    if not resolved.addresses:
+        raise httpx.ConnectError(f"Could not resolve host '{resolved.hostname}'")
+
+    target = httpx.URL(url)
+    request_headers = {**(headers or {}), "Host": target.netloc.decode("ascii")}
+    extensions = {"sni_hostname": resolved.hostname} if target.scheme == "https" else {}
+
     # Use follow_redirects=False to prevent redirect-based SSRF
     async with httpx.AsyncClient(
         timeout=timeout,
         follow_redirects=False,
     ) as client:
-        return await client.get(url, headers=headers)
+        # Replaced by the error of each address tried (there is at least one)
+        last_error = httpx.ConnectError(f"Could not connect to host '{resolved.hostname}'")
+        for address in resolved.addresses:
+            try:
+                return await client.request(
+                    method,
+                    target.copy_with(host=address),
+                    headers=request_headers,
+                    extensions=extensions,
+                    **kwargs,
+                )
+            except httpx.ConnectError as e:
+                # Try the next validated address
+                last_error = e
+        raise last_error
+
+
+async def ssrf_safe_get(
+    url: str,
+    validator: McpSecurityValidator,
+    timeout: float = 10.0,
+    headers: dict[str, str] | None = None,
+) -> httpx.Response:
+    """Perform an SSRF-safe HTTP GET request.
+
+    Validates the URL against SSRF patterns, pins the connection to the
+    validated address and disables redirects to prevent redirect-based
+    SSRF attacks.
+
+    Args:
+        url: URL to fetch
+        validator: Security validator for URL validation
+        timeout: Request timeout in seconds
+        headers: Optional headers to include
+
+    Returns:
+        httpx.Response object
+
+    Raises:
+        ValueError: If URL fails SSRF validation
+        httpx.HTTPError: If request fails
+    """
+    return await _ssrf_safe_request("GET", url, validator, timeout, headers)
 
 
 async def ssrf_safe_post(
@@ -414,8 +780,9 @@ async def ssrf_safe_post(
 ) -> httpx.Response:
     """Perform an SSRF-safe HTTP POST request.
 
-    Validates the URL against SSRF patterns and disables redirects
-    to prevent redirect-based SSRF attacks.
+    Validates the URL against SSRF patterns, pins the connection to the
+    validated address and disables redirects to prevent redirect-based
+    SSRF attacks.
 
     Args:
         url: URL to post to
@@ -432,17 +799,6 @@ async def ssrf_safe_post(
         ValueError: If URL fails SSRF validation
         httpx.HTTPError: If request fails
     """
-    # Full SSRF validation: blocked patterns, hostname resolution, private IP check
-    validator.validate_server_url(url)
-
-    # CodeQL StringRestrictionSanitizerGuard: re.fullmatch with url as 2nd arg
-    # acts as a barrier guard that restricts url to safe characters only.
-    if not re.fullmatch(r"https?://[a-zA-Z0-9._\-]+(:\d+)?(/[^\s]*)?", url):
-        raise ValueError("URL contains unsafe characters")
-
-    # Use follow_redirects=False to prevent redirect-based SSRF
-    async with httpx.AsyncClient(
-        timeout=timeout,
-        follow_redirects=False,
-    ) as client:
-        return await client.post(url, data=data, json=json_data, headers=headers)
+    return await _ssrf_safe_request(
+        "POST", url, validator, timeout, headers, data=data, json=json_data
+    )
@@ -3,8 +3,7 @@
 from __future__ import annotations
 
 import hashlib
-import json
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import litellm
 import numpy as np
@@ -18,8 +17,12 @@ from litellm.exceptions import (
 )
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from bsai.llm.rate_limiter import LLMPriority, provider_for_model
+from bsai.serialization import dumps, loads
+
 if TYPE_CHECKING:
     from bsai.cache import SessionCache
+    from bsai.llm.rate_limiter import LLMRateLimiter
 
 logger = structlog.get_logger()
 
@@ -41,16 +44,19 @@ class EmbeddingService:
         self,
         model: str = "text-embedding-ada-002",
         cache: SessionCache | None = None,
+        rate_limiter: LLMRateLimiter | None = None,
     ) -> None:
         """Initialize embedding service.
 
         Args:
             model: Embedding model identifier
             cache: Optional session cache for embedding caching
+            rate_limiter: Optional rate limiter (embeddings queue as background work)
         """
         self.model = model
         self.dimension = 1536  # ada-002 dimension
         self._cache = cache
+        self._rate_limiter = rate_limiter
 
     @retry(
         stop=stop_after_attempt(3),
@@ -77,10 +83,7 @@ class EmbeddingService:
         """
         logger.debug("embedding_text_start", text_length=len(text))
 
-        response = await litellm.aembedding(
-            model=self.model,
-            input=[text],
-        )
+        response = await self._aembedding([text])
 
         embedding: list[float] = response.data[0]["embedding"]
 
@@ -105,10 +108,7 @@ class EmbeddingService:
 
         logger.info("embedding_batch_start", count=len(texts))
 
-        response = await litellm.aembedding(
-            model=self.model,
-            input=texts,
-        )
+        response = await self._aembedding(texts)
 
         embeddings: list[list[float]] = [item["embedding"] for item in response.data]
 
@@ -116,6 +116,33 @@ class EmbeddingService:
 
         return embeddings
 
+    async def _aembedding(self, texts: list[str]) -> Any:
+        """Call the embedding API within the background rate limit budget.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Raw LiteLLM embedding response
+        """
+        reservation = None
+        if self._rate_limiter is not None:
+            reservation = await self._rate_limiter.acquire(
+                provider_for_model(self.model),
+                self.model,
+                sum(len(text) for text in texts) // 4,
+                LLMPriority.BACKGROUND,
+            )
+
+        response = await litellm.aembedding(model=self.model, input=texts)
+
+        usage = getattr(response, "usage", None)
+        if reservation is not None and self._rate_limiter is not None and usage is not None:
+            await self._rate_limiter.reconcile(
+                reservation, int(getattr(usage, "prompt_tokens", 0) or 0)
+            )
+        return response
+
     async def embed_with_cache(self, text: str) -> list[float]:
         """Generate embedding with Redis caching.
 
@@ -136,7 +163,7 @@ class EmbeddingService:
         cached = await self._cache.client.get(cache_key)
         if cached:
             logger.debug("embedding_cache_hit", cache_key=cache_key)
-            result: list[float] = json.loads(cached)
+            result: list[float] = loads(cached)
             return result
 
         # Generate and cache
@@ -144,7 +171,7 @@ class EmbeddingService:
         await self._cache.client.setex(
             cache_key,
             self.EMBEDDING_CACHE_TTL,
-            json.dumps(embedding),
+            dumps(embedding),
         )
 
         logger.debug("embedding_cached", cache_key=cache_key)
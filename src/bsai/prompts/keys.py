@@ -13,6 +13,7 @@ class WorkerPrompts(StrEnum):
 class QAAgentPrompts(StrEnum):
     """Prompt keys for QA Agent."""
 
+    SYSTEM_PROMPT = "system_prompt"
     VALIDATION_PROMPT = "validation_prompt"
 
 
@@ -38,6 +39,8 @@ class MemoryPrompts(StrEnum):
 class ArchitectPrompts(StrEnum):
     """Prompt keys for Architect agent."""
 
+    SYSTEM_PROMPT = "system_prompt"
     PLANNING_PROMPT = "planning_prompt"
     REVISE_PROMPT = "revise_prompt"
+    REPLAN_SYSTEM_PROMPT = "replan_system_prompt"
     REPLAN_PROMPT = "replan_prompt"
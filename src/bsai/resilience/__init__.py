@@ -0,0 +1,19 @@
+"""Resilience module for calls to LLM providers and MCP servers.
+
+Provides error classification for retry/fallback decisions and circuit
+breakers shared across workers through Redis.
+"""
+
+from .circuit_breaker import CircuitBreaker, CircuitState, circuit_guard, get_circuit_breaker
+from .errors import CircuitOpenError, ErrorClass, classify_error, is_retryable
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "ErrorClass",
+    "circuit_guard",
+    "classify_error",
+    "get_circuit_breaker",
+    "is_retryable",
+]
@@ -0,0 +1,288 @@
+"""Circuit breakers shared across workers through Redis.
+
+Each circuit protects one target, such as "llm:gpt-4o" or
+"mcp:<server id>". Transient failures (see ``classify_error``) are counted
+per target; after ``failure_threshold`` consecutive failures the circuit
+opens and calls fail fast with ``CircuitOpenError`` instead of waiting on
+a target that is down. After ``recovery_timeout`` one worker wins the
+probe key and lets a single call through (half-open): success closes the
+circuit, failure reopens it for another recovery period.
+
+Redis keys per circuit:
+- ``<prefix><name>:failures``: consecutive failure count (expires after
+  ``failure_window`` without failures)
+- ``<prefix><name>:open``: time the circuit opened
+- ``<prefix><name>:probe``: held by the worker running the half-open probe
+
+Without a Redis connection, state is kept in process memory. Redis errors
+never block calls: the breaker then lets calls through.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import lru_cache
+
+import structlog
+
+from bsai.api.config import CircuitBreakerSettings, get_circuit_breaker_settings
+from bsai.cache import RedisClient, get_redis
+
+from .errors import CircuitOpenError, ErrorClass, classify_error
+
+logger = structlog.get_logger()
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class _LocalCircuit:
+    """In-process circuit state, used when Redis is unavailable."""
+
+    failures: int = 0
+    last_failure_at: float = 0.0
+    opened_at: float | None = None
+    probe_until: float = 0.0
+
+
+class CircuitBreaker:
+    """Per-target circuit breakers with shared state."""
+
+    KEY_PREFIX = "circuit:"
+
+    def __init__(
+        self,
+        redis_client: RedisClient | None = None,
+        settings: CircuitBreakerSettings | None = None,
+    ) -> None:
+        """Initialize circuit breaker.
+
+        Args:
+            redis_client: Redis client for shared state (None for process-local state)
+            settings: Circuit breaker settings (default: get_circuit_breaker_settings())
+        """
+        self.redis_client = redis_client
+        self.settings = settings or get_circuit_breaker_settings()
+        self._local: dict[str, _LocalCircuit] = {}
+
+    @asynccontextmanager
+    async def guard(self, name: str) -> AsyncIterator[None]:
+        """Run a call through the circuit.
+
+        Args:
+            name: Circuit name
+
+        Raises:
+            CircuitOpenError: If the circuit is open (the call is not made)
+        """
+        probe = await self._admit(name)
+        try:
+            yield
+        except Exception as e:
+            if classify_error(e) is ErrorClass.RETRYABLE:
+                await self._record_failure(name, probe)
+            elif probe:
+                # Not a health signal: let the next call probe again
+                await self._release_probe(name)
+            raise
+        except BaseException:
+            # Cancelled or abandoned (e.g. a losing hedged request)
+            if probe:
+                await self._release_probe(name)
+            raise
+        else:
+            await self._record_success(name, probe)
+
+    async def get_state(self, name: str) -> CircuitState:
+        """Get the current state of a circuit.
+
+        Args:
+            name: Circuit name
+
+        Returns:
+            CLOSED, OPEN, or HALF_OPEN once a probe may be attempted
+        """
+        opened_at = await self._opened_at(name)
+        if opened_at is None:
+            return CircuitState.CLOSED
+        if time.time() - opened_at < self.settings.recovery_timeout:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    async def _admit(self, name: str) -> bool:
+        """Check the circuit before a call.
+
+        Returns:
+            True if the call is the half-open probe
+
+        Raises:
+            CircuitOpenError: If the call must not be made
+        """
+        opened_at = await self._opened_at(name)
+        if opened_at is None:
+            return False
+
+        remaining = opened_at + self.settings.recovery_timeout - time.time()
+        if remaining > 0:
+            raise CircuitOpenError(name, remaining)
+        if not await self._acquire_probe(name):
+            raise CircuitOpenError(name, self.settings.recovery_timeout)
+
+        logger.info("circuit_half_open_probe", circuit=name)
+        return True
+
+    async def _opened_at(self, name: str) -> float | None:
+        if self._use_redis() and self.redis_client is not None:
+            try:
+                value = await self.redis_client.client.get(self._key(name, "open"))
+                return float(value) if value is not None else None
+            except Exception as e:
+                logger.warning("circuit_redis_failed", circuit=name, error=str(e))
+                return None
+
+        local = self._local.get(name)
+        return local.opened_at if local else None
+
+    async def _acquire_probe(self, name: str) -> bool:
+        probe_ms = int(self.settings.probe_timeout * 1000)
+        if self._use_redis() and self.redis_client is not None:
+            try:
+                acquired = await self.redis_client.client.set(
+                    self._key(name, "probe"), "1", nx=True, px=probe_ms
+                )
+                return bool(acquired)
+            except Exception as e:
+                logger.warning("circuit_redis_failed", circuit=name, error=str(e))
+                return True
+
+        local = self._local.setdefault(name, _LocalCircuit())
+        now = time.time()
+        if local.probe_until > now:
+            return False
+        local.probe_until = now + self.settings.probe_timeout
+        return True
+
+    async def _release_probe(self, name: str) -> None:
+        if self._use_redis() and self.redis_client is not None:
+            try:
+                await self.redis_client.client.delete(self._key(name, "probe"))
+            except Exception as e:
+                logger.warning("circuit_redis_failed", circuit=name, error=str(e))
+            return
+
+        local = self._local.get(name)
+        if local is not None:
+            local.probe_until = 0.0
+
+    async def _record_success(self, name: str, probe: bool) -> None:
+        if probe:
+            logger.info("circuit_closed", circuit=name)
+
+        if self._use_redis() and self.redis_client is not None:
+            keys = [self._key(name, "failures")]
+            if probe:
+                keys += [self._key(name, "open"), self._key(name, "probe")]
+            try:
+                await self.redis_client.client.delete(*keys)
+            except Exception as e:
+                logger.warning("circuit_redis_failed", circuit=name, error=str(e))
+            return
+
+        local = self._local.get(name)
+        if probe or (local is not None and local.opened_at is None):
+            self._local.pop(name, None)
+        elif local is not None:
+            # A call admitted before the circuit opened does not close it
+            local.failures = 0
+
+    async def _record_failure(self, name: str, probe: bool) -> None:
+        now = time.time()
+        if self._use_redis() and self.redis_client is not None:
+            try:
+                failures = await self._count_failure_redis(self.redis_client, name)
+            except Exception as e:
+                logger.warning("circuit_redis_failed", circuit=name, error=str(e))
+                return
+        else:
+            local = self._local.setdefault(name, _LocalCircuit())
+            if now - local.last_failure_at > self.settings.failure_window:
+                local.failures = 0
+            local.failures += 1
+            local.last_failure_at = now
+            failures = local.failures
+
+        if probe or failures >= self.settings.failure_threshold:
+            await self._open(name, now)
+            logger.warning(
+                "circuit_opened",
+                circuit=name,
+                failures=failures,
+                probe_failed=probe,
+                recovery_timeout=self.settings.recovery_timeout,
+            )
+
+    async def _count_failure_redis(self, redis_client: RedisClient, name: str) -> int:
+        key = self._key(name, "failures")
+        async with redis_client.client.pipeline(transaction=True) as pipe:
+            pipe.incr(key)
+            pipe.pexpire(key, int(self.settings.failure_window * 1000))
+            failures, _ = await pipe.execute()
+        return int(failures)
+
+    async def _open(self, name: str, now: float) -> None:
+        if self._use_redis() and self.redis_client is not None:
+            try:
+                # Kept for ten recovery periods so an unprobed circuit is not lost
+                ttl_ms = int(self.settings.recovery_timeout * 1000) * 10
+                await self.redis_client.client.set(self._key(name, "open"), str(now), px=ttl_ms)
+                await self.redis_client.client.delete(
+                    self._key(name, "failures"), self._key(name, "probe")
+                )
+            except Exception as e:
+                logger.warning("circuit_redis_failed", circuit=name, error=str(e))
+            return
+
+        self._local[name] = _LocalCircuit(opened_at=now)
+
+    def _use_redis(self) -> bool:
+        return self.redis_client is not None and self.redis_client.is_connected
+
+    def _key(self, name: str, part: str) -> str:
+        return f"{self.KEY_PREFIX}{name}:{part}"
+
+
+def circuit_guard(breaker: CircuitBreaker | None, name: str) -> AbstractAsyncContextManager[None]:
+    """Guard a call with a circuit breaker, if one is configured.
+
+    Args:
+        breaker: Circuit breaker (None disables the guard)
+        name: Circuit name
+
+    Returns:
+        Async context manager wrapping the call
+    """
+    if breaker is None:
+        return nullcontext()
+    return breaker.guard(name)
+
+
+@lru_cache(maxsize=1)
+def get_circuit_breaker() -> CircuitBreaker | None:
+    """Get the process-wide circuit breaker (cached singleton).
+
+    Returns:
+        CircuitBreaker using the shared Redis client, or None if disabled
+    """
+    if not get_circuit_breaker_settings().enabled:
+        return None
+    return CircuitBreaker(get_redis())
@@ -0,0 +1,130 @@
+"""Error classification for external calls.
+
+Failures of LLM providers and MCP servers fall into three classes:
+
+- RETRYABLE: transient trouble (rate limits, timeouts, connection errors,
+  5xx responses). Retrying the same call later may succeed, and repeated
+  occurrences count against the target's circuit breaker.
+- FALLBACK: the call cannot succeed on this target but may on another
+  model (context window exceeded, content policy, unknown model, bad
+  credentials, open circuit, rate limit wait exceeded).
+- FATAL: the request itself is wrong (malformed request, invalid
+  parameters, programming errors). Neither retrying nor another model helps.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from enum import StrEnum
+
+import httpx
+from litellm.exceptions import (
+    APIConnectionError,
+    AuthenticationError,
+    BadRequestError,
+    ContentPolicyViolationError,
+    ContextWindowExceededError,
+    InternalServerError,
+    NotFoundError,
+    PermissionDeniedError,
+    RateLimitError,
+    ServiceUnavailableError,
+    Timeout,
+    UnprocessableEntityError,
+)
+
+
+class ErrorClass(StrEnum):
+    """How a failed call should be handled."""
+
+    RETRYABLE = "retryable"
+    FALLBACK = "fallback"
+    FATAL = "fatal"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because its circuit is open."""
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        """Initialize error.
+
+        Args:
+            name: Circuit name (e.g. "llm:gpt-4o")
+            retry_after: Seconds until a probe call may be attempted
+        """
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"Circuit {name} is open, retry in {retry_after:.0f}s")
+
+
+# Checked in order: the specific BadRequestError subclasses come first
+_FALLBACK_ERRORS: tuple[type[BaseException], ...] = (
+    ContextWindowExceededError,
+    ContentPolicyViolationError,
+    NotFoundError,
+    AuthenticationError,
+    PermissionDeniedError,
+    CircuitOpenError,
+)
+_FATAL_ERRORS: tuple[type[BaseException], ...] = (
+    BadRequestError,
+    UnprocessableEntityError,
+)
+_RETRYABLE_ERRORS: tuple[type[BaseException], ...] = (
+    RateLimitError,
+    Timeout,
+    APIConnectionError,
+    ServiceUnavailableError,
+    InternalServerError,
+    httpx.TransportError,
+    asyncio.TimeoutError,
+    ConnectionError,
+)
+_RETRYABLE_STATUS_CODES = frozenset({408, 409, 425, 429})
+_FALLBACK_STATUS_CODES = frozenset({401, 403, 404})
+
+
+def classify_error(error: BaseException) -> ErrorClass:
+    """Classify a failed LLM or MCP call.
+
+    Exception groups (raised by MCP client task groups) are classified by
+    their first exception. Unknown errors are FATAL unless they carry a
+    retryable HTTP status code.
+
+    Args:
+        error: Exception raised by the call
+
+    Returns:
+        Error class
+    """
+    if isinstance(error, BaseExceptionGroup) and error.exceptions:
+        return classify_error(error.exceptions[0])
+    # Late import: the rate limiter lives in bsai.llm, which imports this module
+    from bsai.llm.rate_limiter import LLMRateLimitTimeoutError
+
+    if isinstance(error, (*_FALLBACK_ERRORS, LLMRateLimitTimeoutError)):
+        return ErrorClass.FALLBACK
+    if isinstance(error, _FATAL_ERRORS):
+        return ErrorClass.FATAL
+    if isinstance(error, _RETRYABLE_ERRORS):
+        return ErrorClass.RETRYABLE
+
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        if status_code >= 500 or status_code in _RETRYABLE_STATUS_CODES:
+            return ErrorClass.RETRYABLE
+        if status_code in _FALLBACK_STATUS_CODES:
+            return ErrorClass.FALLBACK
+    return ErrorClass.FATAL
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Retry predicate for tenacity's ``retry_if_exception``.
+
+    Args:
+        error: Exception raised by the attempt
+
+    Returns:
+        Whether the attempt should be retried
+    """
+    return classify_error(error) is ErrorClass.RETRYABLE
@@ -2,16 +2,32 @@
 
 from .agent_step_service import AgentStepService
 from .breakpoint_service import BreakpointService
+from .cancellation import (
+    CancellationService,
+    CancellationToken,
+    TaskCancelledError,
+    get_cancellation_service,
+)
+from .partition_maintenance import (
+    PartitionMaintenanceService,
+    get_partition_maintenance_service,
+)
 from .plan_service import InvalidPlanStateError, PlanNotFoundError, PlanService
 from .qa_runner import QARunner
 
 __all__ = [
     "AgentStepService",
     "BreakpointService",
+    "CancellationService",
+    "CancellationToken",
     "InvalidPlanStateError",
+    "PartitionMaintenanceService",
     "PlanNotFoundError",
     "PlanService",
     "QARunner",
+    "TaskCancelledError",
+    "get_cancellation_service",
+    "get_partition_maintenance_service",
 ]
 
 # Task services are available via agent.services.task
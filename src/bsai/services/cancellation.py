@@ -0,0 +1,234 @@
+"""Event-driven task cancellation.
+
+Each running task gets an in-process cancellation token (an asyncio.Event).
+Cancelling a task publishes its ID on a Redis channel; every API process
+listens on that channel and sets the matching local token, so the process
+running the workflow learns about the cancellation immediately instead of
+polling the database between nodes.
+
+Workflows run under ``CancellationService.run``, which cancels the whole
+asyncio task as soon as the token is set. That aborts in-flight LLM
+requests, MCP tool calls and QA subprocesses instead of waiting for them
+to finish.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine
+from contextlib import suppress
+from functools import lru_cache
+from typing import Any, TypeVar
+from uuid import UUID
+
+import structlog
+
+from bsai.cache import RedisClient, get_redis
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+
+class TaskCancelledError(Exception):
+    """Raised when a task's work is aborted by a cancellation request."""
+
+    def __init__(self, task_id: UUID) -> None:
+        """Initialize error.
+
+        Args:
+            task_id: Cancelled task
+        """
+        self.task_id = task_id
+        super().__init__(f"Task {task_id} was cancelled")
+
+
+class CancellationToken:
+    """In-process cancellation signal for one task."""
+
+    def __init__(self, task_id: UUID) -> None:
+        """Initialize token.
+
+        Args:
+            task_id: Task the token belongs to
+        """
+        self.task_id = task_id
+        self._event = asyncio.Event()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Whether cancellation was requested."""
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Signal cancellation."""
+        self._event.set()
+
+    async def wait(self) -> None:
+        """Wait until cancellation is requested."""
+        await self._event.wait()
+
+
+class CancellationService:
+    """Registry of cancellation tokens with Redis pub/sub fan-out."""
+
+    CHANNEL = "bsai:task_cancel"
+
+    def __init__(self, redis_client: RedisClient | None = None) -> None:
+        """Initialize cancellation service.
+
+        Args:
+            redis_client: Redis client for pub/sub (None for local-only signalling)
+        """
+        self.redis_client = redis_client
+        self._tokens: dict[UUID, CancellationToken] = {}
+        self._listener: asyncio.Task[None] | None = None
+        self._subscribed = False
+
+    @property
+    def listening(self) -> bool:
+        """Whether remote cancellations are being received.
+
+        Nodes only trust a token over the database while this is True.
+        """
+        return self._subscribed
+
+    def register(self, task_id: UUID) -> CancellationToken:
+        """Get or create the token for a task about to run.
+
+        Args:
+            task_id: Task UUID
+
+        Returns:
+            CancellationToken for the task
+        """
+        token = self._tokens.get(task_id)
+        if token is None:
+            token = CancellationToken(task_id)
+            self._tokens[task_id] = token
+        return token
+
+    def get(self, task_id: UUID) -> CancellationToken | None:
+        """Get the token of a task running in this process.
+
+        Args:
+            task_id: Task UUID
+
+        Returns:
+            CancellationToken or None if the task does not run here
+        """
+        return self._tokens.get(task_id)
+
+    def release(self, task_id: UUID) -> None:
+        """Forget a task's token once its workflow stopped.
+
+        Args:
+            task_id: Task UUID
+        """
+        self._tokens.pop(task_id, None)
+
+    async def cancel(self, task_id: UUID) -> None:
+        """Request cancellation of a task in whichever process runs it.
+
+        Falls back to signalling only this process if Redis is unavailable.
+
+        Args:
+            task_id: Task UUID
+        """
+        self._signal(task_id)
+        if self.redis_client is None or not self.redis_client.is_connected:
+            return
+        try:
+            await self.redis_client.client.publish(self.CHANNEL, str(task_id))
+        except Exception as e:
+            logger.warning("task_cancel_publish_failed", task_id=str(task_id), error=str(e))
+
+    async def run(self, task_id: UUID, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine until it finishes or the task is cancelled.
+
+        Args:
+            task_id: Task the work belongs to
+            coro: Work to run (typically a workflow run or resume)
+
+        Returns:
+            Result of the coroutine
+
+        Raises:
+            TaskCancelledError: If cancellation was requested first
+        """
+        token = self.register(task_id)
+        if token.is_cancelled:
+            coro.close()
+            raise TaskCancelledError(task_id)
+
+        work = asyncio.ensure_future(coro)
+        waiter = asyncio.ensure_future(token.wait())
+        try:
+            await asyncio.wait({work, waiter}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+            if not work.done():
+                # Propagates CancelledError into in-flight LLM, MCP and QA calls
+                work.cancel()
+                with suppress(asyncio.CancelledError):
+                    await work
+
+        if work.cancelled():
+            raise TaskCancelledError(task_id)
+        return work.result()
+
+    async def start(self) -> None:
+        """Start listening for remote cancellations (call in lifespan)."""
+        if self._listener is not None or self.redis_client is None:
+            return
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop the listener (call in lifespan)."""
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._listener
+        self._listener = None
+        self._subscribed = False
+
+    def _signal(self, task_id: UUID) -> None:
+        token = self._tokens.get(task_id)
+        if token is not None and not token.is_cancelled:
+            logger.info("task_cancellation_signalled", task_id=str(task_id))
+            token.cancel()
+
+    async def _listen(self) -> None:
+        """Mirror published cancellations into local tokens, reconnecting on errors."""
+        if self.redis_client is None:
+            return
+        while True:
+            try:
+                pubsub = self.redis_client.client.pubsub()
+                async with pubsub:
+                    await pubsub.subscribe(self.CHANNEL)
+                    self._subscribed = True
+                    logger.info("task_cancel_listener_subscribed", channel=self.CHANNEL)
+                    async for message in pubsub.listen():
+                        if message.get("type") != "message":
+                            continue
+                        try:
+                            task_id = UUID(str(message["data"]))
+                        except ValueError:
+                            continue
+                        self._signal(task_id)
+            except Exception as e:
+                self._subscribed = False
+                logger.warning("task_cancel_listener_error", error=str(e))
+                await asyncio.sleep(1.0)
+
+
+@lru_cache(maxsize=1)
+def get_cancellation_service() -> CancellationService:
+    """Get the process-wide cancellation service (cached singleton).
+
+    Returns:
+        CancellationService using the shared Redis client
+    """
+    return CancellationService(get_redis())
@@ -0,0 +1,80 @@
+"""Background maintenance of the monthly log table partitions.
+
+Runs ``maintain_log_partitions`` at startup and then every
+``check_interval`` seconds, so partitions for the coming months exist
+before rows arrive and expired months are dropped (see bsai.db.partitions).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from functools import lru_cache
+
+import structlog
+
+from bsai.api.config import LogPartitionSettings, get_log_partition_settings
+from bsai.db.partitions import PartitionMaintenanceResult, maintain_log_partitions
+from bsai.db.session import get_session_manager
+
+logger = structlog.get_logger()
+
+
+class PartitionMaintenanceService:
+    """Periodic partition maintenance loop."""
+
+    def __init__(self, settings: LogPartitionSettings | None = None) -> None:
+        """Initialize partition maintenance service.
+
+        Args:
+            settings: Partition settings (default: get_log_partition_settings())
+        """
+        self.settings = settings or get_log_partition_settings()
+        self._runner: asyncio.Task[None] | None = None
+
+    async def run_once(self) -> PartitionMaintenanceResult | None:
+        """Run one maintenance pass.
+
+        Returns:
+            Result, or None if skipped or failed
+        """
+        try:
+            async with get_session_manager().session_factory() as session:
+                return await maintain_log_partitions(
+                    session,
+                    months_ahead=self.settings.months_ahead,
+                    retention_months=self.settings.retention_months,
+                )
+        except Exception as e:
+            logger.warning("log_partition_maintenance_failed", error=str(e))
+            return None
+
+    async def start(self) -> None:
+        """Start the maintenance loop (call in lifespan)."""
+        if self._runner is not None or not self.settings.enabled:
+            return
+        self._runner = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop the maintenance loop (call in lifespan)."""
+        if self._runner is None:
+            return
+        self._runner.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._runner
+        self._runner = None
+
+    async def _loop(self) -> None:
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self.settings.check_interval)
+
+
+@lru_cache(maxsize=1)
+def get_partition_maintenance_service() -> PartitionMaintenanceService:
+    """Get the process-wide partition maintenance service (cached singleton).
+
+    Returns:
+        PartitionMaintenanceService with the configured settings
+    """
+    return PartitionMaintenanceService()
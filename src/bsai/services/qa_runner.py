@@ -10,11 +10,20 @@ Executes various validation commands:
 from __future__ import annotations
 
 import asyncio
+import os
 import re
+import shlex
+import signal
+import time
+import weakref
+from collections.abc import Callable, Coroutine
+from contextlib import suppress
 from dataclasses import dataclass
+from typing import Any
 
 import structlog
 
+from bsai.api.config import get_agent_settings
 from bsai.llm.schemas import (
     BuildResult,
     LintResult,
@@ -23,9 +32,32 @@ from bsai.llm.schemas import (
     TestResult,
     TypecheckResult,
 )
+from bsai.services.qa_scope import ValidationScope
+from bsai.services.qa_workspace import QAResultCache, QAWorkspace
 
 logger = structlog.get_logger()
 
+ValidationResult = LintResult | TypecheckResult | TestResult | BuildResult
+
+# One subprocess limiter per event loop, shared by every QARunner in the process
+_command_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_command_semaphore() -> asyncio.Semaphore:
+    """Get the process-wide semaphore limiting concurrent QA subprocesses.
+
+    Returns:
+        Semaphore sized by AgentSettings.qa_max_concurrent_commands
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _command_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(get_agent_settings().qa_max_concurrent_commands)
+        _command_semaphores[loop] = semaphore
+    return semaphore
+
 
 @dataclass
 class CommandResult:
@@ -40,8 +72,8 @@ class CommandResult:
 class QARunner:
     """Service for running dynamic QA validations.
 
-    Executes lint, type check, test, and build commands based on
-    QAConfig settings. Supports Python, JavaScript, and TypeScript
+    Executes lint, type check, test, and build commands concurrently based
+    on QAConfig settings. Supports Python, JavaScript, and TypeScript
     project types with configurable or default commands.
 
     Example:
@@ -74,45 +106,135 @@ class QARunner:
         },
     }
 
-    def __init__(self, config: QAConfig, project_type: str = "python") -> None:
+    # Commands that accept a file list for incremental runs, by project type
+    INCREMENTAL_COMMANDS: dict[str, dict[str, str]] = {
+        "python": {
+            "lint": "ruff check",
+            "typecheck": "mypy",
+            "test": "pytest --tb=short -q",
+        },
+        "javascript": {
+            "lint": "eslint",
+        },
+        "typescript": {
+            "lint": "eslint",
+        },
+    }
+
+    SKIPPED_OUTPUT = "Skipped: no changed files affect this validation"
+
+    def __init__(
+        self,
+        config: QAConfig,
+        project_type: str = "python",
+        workspace: QAWorkspace | None = None,
+        result_cache: QAResultCache | None = None,
+        scope: ValidationScope | None = None,
+    ) -> None:
         """Initialize QA Runner.
 
         Args:
             config: QA configuration with validation types and commands
             project_type: Type of project (python, javascript, typescript)
+            workspace: Materialized artifact snapshot to run commands in
+                (current working directory if None)
+            result_cache: Cache of command results per snapshot (requires workspace)
+            scope: Files to validate incrementally (full runs if None)
         """
         self.config = config
         self.project_type = project_type
         self.default_commands = self.DEFAULT_COMMANDS.get(project_type, {})
+        self.workspace = workspace
+        self.result_cache = result_cache
+        self.scope = scope
+        # Per-validation run mode (full, incremental, skipped, cached) and wall time
+        self.modes: dict[str, str] = {}
+        self.durations: dict[str, float] = {}
 
     async def run_all_validations(
         self,
     ) -> dict[str, LintResult | TypecheckResult | TestResult | BuildResult | None]:
         """Run all configured validations.
 
-        Executes each validation type specified in the config sequentially.
+        Executes the validation types specified in the config concurrently;
+        the number of live subprocesses is bounded per process. When a
+        validation listed in ``blocking_validations`` fails, the remaining
+        ones are cancelled and reported as None.
         STATIC validation is skipped here as it's handled by QA Agent's LLM analysis.
 
         Returns:
-            Dictionary of validation results keyed by type name.
-            Each value is the corresponding result type or None if not configured.
+            Dictionary of validation results keyed by type name, in config order.
+            Each value is the corresponding result type or None if cancelled.
         """
-        results: dict[str, LintResult | TypecheckResult | TestResult | BuildResult | None] = {}
-
-        for validation_type in self.config.validations:
-            # Compare against string values (QAConfig uses string literals)
-            if validation_type == QAValidationType.LINT.value:
-                results["lint"] = await self.run_lint()
-            elif validation_type == QAValidationType.TYPECHECK.value:
-                results["typecheck"] = await self.run_typecheck()
-            elif validation_type == QAValidationType.TEST.value:
-                results["test"] = await self.run_test()
-            elif validation_type == QAValidationType.BUILD.value:
-                results["build"] = await self.run_build()
-            # STATIC is handled by QA Agent's LLM analysis, not here
+        runners: dict[str, Callable[[], Coroutine[Any, Any, ValidationResult]]] = {
+            QAValidationType.LINT.value: self.run_lint,
+            QAValidationType.TYPECHECK.value: self.run_typecheck,
+            QAValidationType.TEST.value: self.run_test,
+            QAValidationType.BUILD.value: self.run_build,
+        }
+        # STATIC is handled by QA Agent's LLM analysis, not here
+        configured = [v for v in dict.fromkeys(self.config.validations) if v in runners]
+        results: dict[str, LintResult | TypecheckResult | TestResult | BuildResult | None] = (
+            dict.fromkeys(configured)
+        )
+
+        tasks: dict[asyncio.Task[ValidationResult], str] = {
+            asyncio.create_task(self._timed(name, runners[name]), name=f"qa-{name}"): name
+            for name in configured
+        }
+        pending: set[asyncio.Task[ValidationResult]] = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = tasks[task]
+                    result = task.result()
+                    results[name] = result
+                    if not result.success and name in self.config.blocking_validations:
+                        if pending:
+                            logger.info(
+                                "qa_runner_fail_fast",
+                                failed=name,
+                                cancelled=sorted(tasks[t] for t in pending),
+                            )
+                        await self._cancel_tasks(pending)
+                        pending = set()
+        finally:
+            await self._cancel_tasks(pending)
 
         return results
 
+    async def _timed(
+        self,
+        name: str,
+        runner: Callable[[], Coroutine[Any, Any, ValidationResult]],
+    ) -> ValidationResult:
+        """Run one validation and record its wall time.
+
+        Args:
+            name: Validation type name
+            runner: Validation coroutine function
+
+        Returns:
+            The validation result
+        """
+        start = time.monotonic()
+        result = await runner()
+        self.durations[name] = time.monotonic() - start
+        return result
+
+    @staticmethod
+    async def _cancel_tasks(tasks: set[asyncio.Task[ValidationResult]]) -> None:
+        """Cancel validation tasks and wait for their subprocesses to be reaped.
+
+        Args:
+            tasks: Tasks to cancel
+        """
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def run_lint(self) -> LintResult:
         """Run lint validation.
 
@@ -122,7 +244,15 @@ class QARunner:
         Returns:
             LintResult with success status, counts, issues, and raw output.
         """
-        command = self.config.lint_command or self.default_commands.get("lint", "")
+        command = self._resolve_command("lint")
+        if command is None:
+            return LintResult(
+                success=True,
+                errors=0,
+                warnings=0,
+                issues=[],
+                output=self.SKIPPED_OUTPUT,
+            )
         if not command:
             return LintResult(
                 success=True,
@@ -134,7 +264,7 @@ class QARunner:
 
         logger.info("qa_runner_lint_start", command=command)
 
-        result = await self._run_command(command)
+        result = await self._run_validation_command("lint", command)
 
         # Parse lint output
         errors, warnings, issues = self._parse_lint_output(result.stdout + result.stderr)
@@ -168,7 +298,14 @@ class QARunner:
         Returns:
             TypecheckResult with success status, error count, issues, and raw output.
         """
-        command = self.config.typecheck_command or self.default_commands.get("typecheck", "")
+        command = self._resolve_command("typecheck")
+        if command is None:
+            return TypecheckResult(
+                success=True,
+                errors=0,
+                issues=[],
+                output=self.SKIPPED_OUTPUT,
+            )
         if not command:
             return TypecheckResult(
                 success=True,
@@ -179,7 +316,7 @@ class QARunner:
 
         logger.info("qa_runner_typecheck_start", command=command)
 
-        result = await self._run_command(command)
+        result = await self._run_validation_command("typecheck", command)
 
         # Parse typecheck output
         errors, issues = self._parse_typecheck_output(result.stdout + result.stderr)
@@ -209,7 +346,18 @@ class QARunner:
         Returns:
             TestResult with success status, counts, coverage, failed tests, and output.
         """
-        command = self.config.test_command or self.default_commands.get("test", "")
+        command = self._resolve_command("test")
+        if command is None:
+            return TestResult(
+                success=True,
+                passed=0,
+                failed=0,
+                skipped=0,
+                total=0,
+                coverage=None,
+                failed_tests=[],
+                output=self.SKIPPED_OUTPUT,
+            )
         if not command:
             return TestResult(
                 success=True,
@@ -224,7 +372,8 @@ class QARunner:
 
         logger.info("qa_runner_test_start", command=command)
 
-        result = await self._run_command(command, timeout=300)  # 5 min timeout for tests
+        # 5 min timeout for tests
+        result = await self._run_validation_command("test", command, timeout=300)
 
         # Parse test output
         passed, failed, skipped, failed_tests, coverage = self._parse_test_output(
@@ -263,7 +412,7 @@ class QARunner:
         Returns:
             BuildResult with success status, output, and error message if failed.
         """
-        command = self.config.build_command or self.default_commands.get("build", "")
+        command = self._resolve_command("build")
         if not command:
             return BuildResult(
                 success=True,
@@ -273,7 +422,8 @@ class QARunner:
 
         logger.info("qa_runner_build_start", command=command)
 
-        result = await self._run_command(command, timeout=600)  # 10 min timeout for build
+        # 10 min timeout for build
+        result = await self._run_validation_command("build", command, timeout=600)
 
         success = result.return_code == 0
         error_message = result.stderr if not success else None
@@ -286,9 +436,83 @@ class QARunner:
             error_message=error_message,
         )
 
+    def _resolve_command(self, validation_type: str) -> str | None:
+        """Resolve the command for a validation, narrowed to the scope if possible.
+
+        Custom commands from QAConfig always run as configured.
+
+        Args:
+            validation_type: Validation type name (lint, typecheck, test, build)
+
+        Returns:
+            Command to run, "" if none is configured, or None if the scope
+            leaves nothing to check
+        """
+        configured = getattr(self.config, f"{validation_type}_command")
+        if configured:
+            self.modes[validation_type] = "full"
+            return str(configured)
+
+        default = self.default_commands.get(validation_type, "")
+        base = self.INCREMENTAL_COMMANDS.get(self.project_type, {}).get(validation_type)
+        files = (
+            self.scope.files_for(validation_type, self.project_type)
+            if self.scope is not None and base
+            else None
+        )
+        if files is None:
+            self.modes[validation_type] = "full"
+            return default
+        if not files:
+            self.modes[validation_type] = "skipped"
+            return None
+
+        self.modes[validation_type] = "incremental"
+        return f"{base} {' '.join(shlex.quote(f) for f in files)}"
+
+    async def _run_validation_command(
+        self, validation_type: str, command: str, timeout: int = 120
+    ) -> CommandResult:
+        """Run a validation command, reusing the result for an unchanged snapshot.
+
+        Results are cached by (snapshot hash, validation type, command).
+        Timeouts and launch errors are never cached.
+
+        Args:
+            validation_type: Validation type name (lint, typecheck, test, build)
+            command: Shell command to execute
+            timeout: Timeout in seconds
+
+        Returns:
+            CommandResult from the cache or a fresh run
+        """
+        key: tuple[str, str, str] | None = None
+        if self.workspace is not None and self.result_cache is not None:
+            key = (self.workspace.snapshot_hash, validation_type, command)
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                self.modes[validation_type] = "cached"
+                logger.info(
+                    "qa_runner_cache_hit",
+                    validation=validation_type,
+                    command=command,
+                    snapshot_hash=self.workspace.snapshot_hash[:12],
+                )
+                return cached
+
+        result = await self._run_command(command, timeout=timeout)
+
+        if key is not None and self.result_cache is not None and result.return_code != -1:
+            self.result_cache.put(key, result)
+        return result
+
     async def _run_command(self, command: str, timeout: int = 120) -> CommandResult:
         """Run a shell command asynchronously.
 
+        Waits for a slot on the process-wide subprocess limiter first. The
+        command runs in the workspace directory (if any), in its own process group so that the whole tree is
+        killed on timeout or cancellation.
+
         Args:
             command: Shell command to execute
             timeout: Timeout in seconds (default 120)
@@ -296,40 +520,59 @@ class QARunner:
         Returns:
             CommandResult with stdout, stderr, success status, and return code.
         """
-        try:
-            process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+        async with _get_command_semaphore():
+            process: asyncio.subprocess.Process | None = None
+            try:
+                process = await asyncio.create_subprocess_shell(
+                    command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=self.workspace.path if self.workspace is not None else None,
+                    start_new_session=True,
+                )
+
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(),
+                    timeout=timeout,
+                )
+
+                return CommandResult(
+                    success=process.returncode == 0,
+                    stdout=stdout.decode("utf-8", errors="replace"),
+                    stderr=stderr.decode("utf-8", errors="replace"),
+                    return_code=process.returncode or 0,
+                )
+            except TimeoutError:
+                logger.warning("qa_runner_command_timeout", command=command, timeout=timeout)
+                return CommandResult(
+                    success=False,
+                    stdout="",
+                    stderr=f"Command timed out after {timeout} seconds",
+                    return_code=-1,
+                )
+            except Exception as e:
+                logger.error("qa_runner_command_error", command=command, error=str(e))
+                return CommandResult(
+                    success=False,
+                    stdout="",
+                    stderr=str(e),
+                    return_code=-1,
+                )
+            finally:
+                if process is not None and process.returncode is None:
+                    await self._kill_process(process)
+
+    @staticmethod
+    async def _kill_process(process: asyncio.subprocess.Process) -> None:
+        """Kill a command's process group and reap it.
 
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=timeout,
-            )
-
-            return CommandResult(
-                success=process.returncode == 0,
-                stdout=stdout.decode("utf-8", errors="replace"),
-                stderr=stderr.decode("utf-8", errors="replace"),
-                return_code=process.returncode or 0,
-            )
-        except TimeoutError:
-            logger.warning("qa_runner_command_timeout", command=command, timeout=timeout)
-            return CommandResult(
-                success=False,
-                stdout="",
-                stderr=f"Command timed out after {timeout} seconds",
-                return_code=-1,
-            )
-        except Exception as e:
-            logger.error("qa_runner_command_error", command=command, error=str(e))
-            return CommandResult(
-                success=False,
-                stdout="",
-                stderr=str(e),
-                return_code=-1,
-            )
+        Args:
+            process: Process started by _run_command
+        """
+        with suppress(ProcessLookupError):
+            os.killpg(process.pid, signal.SIGKILL)
+        with suppress(ProcessLookupError):
+            await process.wait()
 
     def _parse_lint_output(self, output: str) -> tuple[int, int, list[str]]:
         """Parse lint command output.
@@ -0,0 +1,313 @@
+"""Incremental QA scoping.
+
+Narrows lint, typecheck and test runs to the files a milestone changed
+and the workspace files that (transitively) import them. Anything the
+scope cannot reason about - configuration files, custom commands, an
+unknown change set or too many affected files - falls back to a full run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import posixpath
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+
+import structlog
+
+from bsai.llm.schemas import QAConfig
+from bsai.services.qa_workspace import QAWorkspace
+
+logger = structlog.get_logger()
+
+# Source files the import graph understands, by project type
+SOURCE_EXTENSIONS: dict[str, tuple[str, ...]] = {
+    "python": (".py", ".pyi"),
+    "javascript": (".js", ".jsx", ".mjs", ".cjs"),
+    "typescript": (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs"),
+}
+
+# Files that never affect lint, typecheck or test results
+IGNORED_EXTENSIONS = (".md", ".rst", ".txt", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".ico")
+
+# Source files that configure tooling rather than hold importable code
+CONFIG_FILENAMES = frozenset({"conftest.py", "setup.py", "noxfile.py"})
+
+# Validations whose default command accepts a file list, by project type
+SCOPABLE_VALIDATIONS: dict[str, frozenset[str]] = {
+    "python": frozenset({"lint", "typecheck", "test"}),
+    "javascript": frozenset({"lint"}),
+    "typescript": frozenset({"lint"}),
+}
+
+_PY_IMPORT = re.compile(r"^\s*import\s+([\w.]+(?:\s*,\s*[\w.]+)*)", re.MULTILINE)
+_PY_FROM_IMPORT = re.compile(r"^\s*from\s+(\.*[\w.]*)\s+import\s+\(?\s*([\w\s,]+)", re.MULTILINE)
+_JS_IMPORT = re.compile(
+    r"""(?:from\s+|require\s*\(\s*|import\s*\(\s*|import\s+)['"](\.{1,2}/[^'"]+)['"]"""
+)
+
+
+@dataclass(frozen=True)
+class ValidationScope:
+    """Files a QA pass has to look at.
+
+    Attributes:
+        full_run: Whether validations run project-wide
+        reason: Why a full run was chosen (None when incremental)
+        changed: Changed files still present in the workspace
+        deleted: Files removed by the milestone
+        dependents: Workspace files importing a changed or deleted file
+    """
+
+    full_run: bool
+    reason: str | None = None
+    changed: tuple[str, ...] = ()
+    deleted: tuple[str, ...] = ()
+    dependents: tuple[str, ...] = ()
+
+    @classmethod
+    def full(cls, reason: str) -> ValidationScope:
+        """Create a scope that runs everything.
+
+        Args:
+            reason: Why incremental validation does not apply
+
+        Returns:
+            Full-run ValidationScope
+        """
+        return cls(full_run=True, reason=reason)
+
+    def files_for(self, validation_type: str, project_type: str) -> list[str] | None:
+        """Get the files a validation should check.
+
+        Args:
+            validation_type: Validation type name (lint, typecheck, test, build)
+            project_type: Project type (python, javascript, typescript)
+
+        Returns:
+            Sorted file list (possibly empty), or None to run the full command
+        """
+        if self.full_run or validation_type not in SCOPABLE_VALIDATIONS.get(
+            project_type, frozenset()
+        ):
+            return None
+
+        extensions = SOURCE_EXTENSIONS.get(project_type, ())
+        if validation_type == "lint":
+            # Linters work per file, importers are unaffected
+            candidates = set(self.changed)
+        else:
+            candidates = set(self.changed) | set(self.dependents)
+
+        files = [f for f in candidates if f.endswith(extensions)]
+        if validation_type == "test":
+            files = [f for f in files if _is_python_test_file(f)]
+        return sorted(files)
+
+
+@dataclass
+class IncrementalReport:
+    """Outcome of an incremental QA pass for the summary.
+
+    Attributes:
+        scope: Scope the validations ran with
+        modes: Per-validation mode (incremental, full, skipped, cached)
+        time_saved_seconds: Seconds saved versus the last full runs (None if no baseline)
+    """
+
+    scope: ValidationScope
+    modes: dict[str, str] = field(default_factory=dict)
+    time_saved_seconds: float | None = None
+
+    def summary_line(self) -> str:
+        """Render a one-line summary.
+
+        Returns:
+            Human-readable summary of the scope and time saved
+        """
+        if self.scope.full_run:
+            return f"- Scope: full run ({self.scope.reason})"
+
+        parts = [
+            f"{len(self.scope.changed)} changed",
+            f"{len(self.scope.deleted)} deleted",
+            f"{len(self.scope.dependents)} dependent files",
+        ]
+        line = f"- Scope: incremental ({', '.join(parts)})"
+        if self.modes:
+            modes = ", ".join(f"{name} {mode}" for name, mode in self.modes.items())
+            line += f"; {modes}"
+        if self.time_saved_seconds is not None:
+            line += f"; ~{self.time_saved_seconds:.1f}s saved vs last full run"
+        return line
+
+
+def _is_python_test_file(path: str) -> bool:
+    name = PurePosixPath(path).name
+    return name.startswith("test_") or name.endswith("_test.py")
+
+
+def _python_module_names(path: str) -> set[str]:
+    """Dotted module names a workspace file may be imported as.
+
+    Every path suffix is a candidate so that src-layouts and packages
+    rooted anywhere in the workspace are matched (over-approximation).
+    """
+    parts = list(PurePosixPath(path).with_suffix("").parts)
+    if parts and parts[-1] == "__init__":
+        parts = parts[:-1]
+    return {".".join(parts[i:]) for i in range(len(parts))}
+
+
+def _python_imports(path: str, source: str) -> set[str]:
+    """Dotted module names imported by a Python file."""
+    imports: set[str] = set()
+    for match in _PY_IMPORT.finditer(source):
+        imports.update(name.strip() for name in match.group(1).split(","))
+
+    package = list(PurePosixPath(path).parent.parts)
+    for match in _PY_FROM_IMPORT.finditer(source):
+        module = match.group(1)
+        level = len(module) - len(module.lstrip("."))
+        module = module.lstrip(".")
+        if level:
+            base = package[: len(package) - (level - 1)] if level > 1 else package
+            module = ".".join([*base, module] if module else base)
+        if not module:
+            continue
+        imports.add(module)
+        for name in match.group(2).split(","):
+            name = name.strip().split(" ")[0]
+            if name:
+                imports.add(f"{module}.{name}")
+    return imports
+
+
+def _js_imports(path: str, source: str, extensions: tuple[str, ...]) -> set[str]:
+    """Workspace paths a JS/TS file may import through relative specifiers."""
+    imports: set[str] = set()
+    directory = posixpath.dirname(path)
+    for match in _JS_IMPORT.finditer(source):
+        target = posixpath.normpath(posixpath.join(directory, match.group(1)))
+        imports.add(target)
+        imports.update(f"{target}{ext}" for ext in extensions)
+        imports.update(f"{target}/index{ext}" for ext in extensions)
+    return imports
+
+
+def _find_dependents(
+    workspace: QAWorkspace,
+    project_type: str,
+    targets: set[str],
+) -> set[str]:
+    """Find workspace files that transitively import any target file.
+
+    Args:
+        workspace: Materialized snapshot
+        project_type: Project type (python, javascript, typescript)
+        targets: Changed or deleted file paths
+
+    Returns:
+        Dependent file paths (excluding the targets themselves)
+    """
+    extensions = SOURCE_EXTENSIONS.get(project_type, ())
+    sources = [p for p in workspace.file_hashes if p.endswith(extensions)]
+
+    # Reverse edges: imported key -> importing files
+    importers: dict[str, set[str]] = {}
+    for path in sources:
+        try:
+            text = (workspace.path / path).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        if project_type == "python":
+            keys = _python_imports(path, text)
+        else:
+            keys = _js_imports(path, text, extensions)
+        for key in keys:
+            importers.setdefault(key, set()).add(path)
+
+    def keys_for(path: str) -> set[str]:
+        if project_type == "python":
+            return _python_module_names(path)
+        stem = PurePosixPath(path).with_suffix("").as_posix()
+        return {path, stem}
+
+    dependents: set[str] = set()
+    queue = deque(targets)
+    seen = set(targets)
+    while queue:
+        current = queue.popleft()
+        for key in keys_for(current):
+            for importer in importers.get(key, ()):
+                if importer not in seen:
+                    seen.add(importer)
+                    dependents.add(importer)
+                    queue.append(importer)
+    return dependents
+
+
+async def compute_scope(
+    config: QAConfig,
+    project_type: str,
+    workspace: QAWorkspace | None,
+    changed_files: list[str] | None,
+    deleted_files: list[str] | None,
+) -> ValidationScope:
+    """Decide which files a QA pass needs to validate.
+
+    Args:
+        config: QA configuration (incremental settings)
+        project_type: Project type (python, javascript, typescript)
+        workspace: Materialized snapshot (required for incremental runs)
+        changed_files: Files written by the milestone (None if unknown)
+        deleted_files: Files deleted by the milestone
+
+    Returns:
+        ValidationScope for the run
+    """
+    if not config.incremental:
+        return ValidationScope.full("incremental validation disabled")
+    if workspace is None or changed_files is None:
+        return ValidationScope.full("changed files unknown")
+    if project_type not in SOURCE_EXTENSIONS:
+        return ValidationScope.full(f"unsupported project type {project_type}")
+
+    deleted = sorted({p.strip("/") for p in deleted_files or []})
+    changed = sorted({p.strip("/") for p in changed_files} - set(deleted))
+    if not changed and not deleted:
+        return ValidationScope.full("no changed files recorded")
+
+    extensions = SOURCE_EXTENSIONS[project_type]
+    for path in [*changed, *deleted]:
+        name = PurePosixPath(path).name
+        if name in CONFIG_FILENAMES or not path.endswith(extensions + IGNORED_EXTENSIONS):
+            return ValidationScope.full(f"configuration changed: {path}")
+
+    # Only files the snapshot still holds can be checked
+    changed = [p for p in changed if p in workspace.file_hashes]
+    source_targets = {p for p in [*changed, *deleted] if p.endswith(extensions)}
+    dependents = await asyncio.to_thread(_find_dependents, workspace, project_type, source_targets)
+    dependents -= set(changed)
+
+    affected = len(changed) + len(dependents)
+    if affected > config.incremental_max_files:
+        return ValidationScope.full(
+            f"{affected} affected files exceed limit of {config.incremental_max_files}"
+        )
+
+    scope = ValidationScope(
+        full_run=False,
+        changed=tuple(changed),
+        deleted=tuple(deleted),
+        dependents=tuple(sorted(dependents)),
+    )
+    logger.info(
+        "qa_incremental_scope",
+        changed=len(scope.changed),
+        deleted=len(scope.deleted),
+        dependents=len(scope.dependents),
+    )
+    return scope
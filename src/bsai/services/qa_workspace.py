@@ -0,0 +1,306 @@
+"""Isolated workspaces for dynamic QA validation.
+
+Materializes a task's artifact snapshot into a per-task directory so that
+lint, typecheck, test and build commands run against the Worker's files
+instead of the server's working directory. Files are rewritten only when
+their content hash changes, which also keeps tool caches (.ruff_cache,
+.mypy_cache, ...) warm across retries.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import shutil
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import structlog
+
+from bsai.api.config import get_agent_settings
+
+if TYPE_CHECKING:
+    from bsai.db.models.artifact import Artifact
+    from bsai.services.qa_runner import CommandResult
+
+logger = structlog.get_logger()
+
+ResultCacheKey = tuple[str, str, str]
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _relative_path(artifact: Artifact) -> PurePosixPath | None:
+    """Resolve an artifact to a safe path inside the workspace.
+
+    Args:
+        artifact: Artifact from the task snapshot
+
+    Returns:
+        Relative path, or None if it would escape the workspace
+    """
+    path = artifact.path.strip("/") if artifact.path else ""
+    relative = PurePosixPath(path) / artifact.filename if path else PurePosixPath(artifact.filename)
+    if relative.is_absolute() or ".." in relative.parts or not relative.parts:
+        return None
+    return relative
+
+
+@dataclass(frozen=True)
+class QAWorkspace:
+    """Materialized artifact snapshot.
+
+    Attributes:
+        task_id: Task the snapshot belongs to
+        path: Directory containing the snapshot files
+        snapshot_hash: Hash over all (path, content hash) pairs
+        file_hashes: Content hash per relative path
+    """
+
+    task_id: UUID
+    path: Path
+    snapshot_hash: str
+    file_hashes: dict[str, str] = field(default_factory=dict)
+
+
+class QAResultCache:
+    """LRU cache of command results keyed by (snapshot hash, validation type, command)."""
+
+    def __init__(self, max_size: int = 256) -> None:
+        """Initialize result cache.
+
+        Args:
+            max_size: Maximum number of cached results
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[ResultCacheKey, CommandResult] = OrderedDict()
+
+    def get(self, key: ResultCacheKey) -> CommandResult | None:
+        """Get a cached result.
+
+        Args:
+            key: (snapshot hash, validation type, command)
+
+        Returns:
+            Cached CommandResult or None
+        """
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: ResultCacheKey, result: CommandResult) -> None:
+        """Cache a result, evicting the least recently used entry when full.
+
+        Args:
+            key: (snapshot hash, validation type, command)
+            result: Result to cache
+        """
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class QAWorkspaceManager:
+    """Manages per-task QA workspaces and the shared result cache.
+
+    Each task gets its own directory under ``root``. Re-materializing a
+    task only writes files whose content changed and removes files that
+    left the snapshot. The least recently used workspaces are deleted
+    once more than ``max_workspaces`` exist.
+    """
+
+    def __init__(
+        self,
+        root: Path | str | None = None,
+        max_workspaces: int = 32,
+        result_cache_size: int = 256,
+    ) -> None:
+        """Initialize workspace manager.
+
+        Args:
+            root: Parent directory for workspaces (defaults to a temp directory)
+            max_workspaces: Maximum number of task workspaces kept on disk
+            result_cache_size: Maximum number of cached command results
+        """
+        self.root = Path(root) if root else Path(tempfile.gettempdir()) / "bsai-qa"
+        self.max_workspaces = max_workspaces
+        self.result_cache = QAResultCache(result_cache_size)
+        self._manifests: OrderedDict[UUID, dict[str, str]] = OrderedDict()
+        self._locks: dict[UUID, asyncio.Lock] = {}
+        self._full_run_seconds: dict[tuple[UUID, str], float] = {}
+
+    def workspace_path(self, task_id: UUID) -> Path:
+        """Get the directory used for a task's workspace.
+
+        Args:
+            task_id: Task UUID
+
+        Returns:
+            Workspace directory path
+        """
+        return self.root / str(task_id)
+
+    async def materialize(self, task_id: UUID, artifacts: list[Artifact]) -> QAWorkspace:
+        """Write a task's artifact snapshot into its workspace.
+
+        Args:
+            task_id: Task UUID
+            artifacts: Current artifacts of the task snapshot
+
+        Returns:
+            QAWorkspace describing the materialized snapshot
+        """
+        files: dict[str, str] = {}
+        for artifact in artifacts:
+            relative = _relative_path(artifact)
+            if relative is None:
+                logger.warning(
+                    "qa_workspace_unsafe_path",
+                    task_id=str(task_id),
+                    path=artifact.path,
+                    filename=artifact.filename,
+                )
+                continue
+            files[relative.as_posix()] = artifact.content
+
+        lock = self._locks.setdefault(task_id, asyncio.Lock())
+        async with lock:
+            previous = self._manifests.pop(task_id, None)
+            manifest, written, removed = await asyncio.to_thread(
+                self._sync_files, self.workspace_path(task_id), files, previous
+            )
+            self._manifests[task_id] = manifest
+            await self._evict()
+
+        snapshot_hash = hashlib.sha256(
+            json.dumps(sorted(manifest.items())).encode("utf-8")
+        ).hexdigest()
+
+        logger.info(
+            "qa_workspace_materialized",
+            task_id=str(task_id),
+            files=len(manifest),
+            written=written,
+            removed=removed,
+            snapshot_hash=snapshot_hash[:12],
+        )
+
+        return QAWorkspace(
+            task_id=task_id,
+            path=self.workspace_path(task_id),
+            snapshot_hash=snapshot_hash,
+            file_hashes=manifest,
+        )
+
+    def record_full_run(self, task_id: UUID, validation_type: str, seconds: float) -> None:
+        """Remember how long a project-wide validation took for a task.
+
+        Args:
+            task_id: Task UUID
+            validation_type: Validation type name
+            seconds: Wall time of the full run
+        """
+        self._full_run_seconds[(task_id, validation_type)] = seconds
+
+    def full_run_baseline(self, task_id: UUID, validation_type: str) -> float | None:
+        """Get the last full-run duration of a validation for a task.
+
+        Args:
+            task_id: Task UUID
+            validation_type: Validation type name
+
+        Returns:
+            Seconds, or None if no full run was recorded
+        """
+        return self._full_run_seconds.get((task_id, validation_type))
+
+    async def release(self, task_id: UUID) -> None:
+        """Delete a task's workspace.
+
+        Args:
+            task_id: Task UUID
+        """
+        self._manifests.pop(task_id, None)
+        self._locks.pop(task_id, None)
+        for key in [k for k in self._full_run_seconds if k[0] == task_id]:
+            del self._full_run_seconds[key]
+        await asyncio.to_thread(shutil.rmtree, self.workspace_path(task_id), True)
+
+    async def _evict(self) -> None:
+        while len(self._manifests) > self.max_workspaces:
+            oldest = next(iter(self._manifests))
+            logger.debug("qa_workspace_evicted", task_id=str(oldest))
+            await self.release(oldest)
+
+    @staticmethod
+    def _sync_files(
+        directory: Path,
+        files: dict[str, str],
+        previous: dict[str, str] | None,
+    ) -> tuple[dict[str, str], int, int]:
+        """Bring a workspace directory in line with the snapshot.
+
+        Args:
+            directory: Workspace directory
+            files: Snapshot content keyed by relative path
+            previous: Manifest from the last materialization (None if unknown)
+
+        Returns:
+            Tuple of (manifest, files_written, files_removed)
+        """
+        if previous is None:
+            # Unknown state (first use or process restart): start clean
+            shutil.rmtree(directory, ignore_errors=True)
+            previous = {}
+        directory.mkdir(parents=True, exist_ok=True)
+
+        manifest: dict[str, str] = {}
+        written = 0
+        for relative, content in files.items():
+            digest = _content_hash(content)
+            manifest[relative] = digest
+            target = directory / relative
+            if previous.get(relative) == digest and target.is_file():
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(content, encoding="utf-8")
+            written += 1
+
+        removed = 0
+        for relative in previous.keys() - manifest.keys():
+            (directory / relative).unlink(missing_ok=True)
+            removed += 1
+
+        return manifest, written, removed
+
+
+@lru_cache(maxsize=1)
+def get_qa_workspace_manager() -> QAWorkspaceManager:
+    """Get the process-wide QA workspace manager (cached singleton).
+
+    Returns:
+        QAWorkspaceManager configured from AgentSettings
+    """
+    settings = get_agent_settings()
+    return QAWorkspaceManager(
+        root=settings.qa_workspace_root or None,
+        max_workspaces=settings.qa_max_workspaces,
+        result_cache_size=settings.qa_result_cache_size,
+    )
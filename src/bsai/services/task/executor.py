@@ -26,6 +26,11 @@ from bsai.events import EventBus
 from bsai.graph.state import AgentState
 from bsai.graph.workflow import WorkflowResult, WorkflowRunner
 from bsai.services import BreakpointService
+from bsai.services.cancellation import (
+    CancellationService,
+    TaskCancelledError,
+    get_cancellation_service,
+)
 
 from .notifier import TaskNotifier
 
@@ -44,6 +49,7 @@ class TaskExecutor:
         event_bus: EventBus,
         notifier: TaskNotifier,
         breakpoint_service: BreakpointService,
+        cancellation: CancellationService | None = None,
     ) -> None:
         """Initialize task executor.
 
@@ -52,11 +58,13 @@ class TaskExecutor:
             event_bus: EventBus for event-driven notifications
             notifier: TaskNotifier for WebSocket broadcasts
             breakpoint_service: Service for HITL workflows
+            cancellation: Cancellation token registry (default: process-wide service)
         """
         self.cache = cache
         self.event_bus = event_bus
         self.notifier = notifier
         self.breakpoint_service = breakpoint_service
+        self.cancellation = cancellation or get_cancellation_service()
 
     async def execute(
         self,
@@ -81,6 +89,9 @@ class TaskExecutor:
         """
         start_time = datetime.now(UTC)
 
+        # Register before the task becomes cancellable (IN_PROGRESS)
+        self.cancellation.register(task_id)
+
         try:
             # Update task status to IN_PROGRESS
             async for db_session in get_db_session():
@@ -88,6 +99,7 @@ class TaskExecutor:
                 await task_repo.update(task_id, status=TaskStatus.IN_PROGRESS.value)
                 await db_session.commit()
                 break
+            await self.cache.invalidate_session_state(session_id)
 
             # Notify task started (streaming only)
             if stream:
@@ -109,13 +121,16 @@ class TaskExecutor:
                     breakpoint_service=self.breakpoint_service,
                 )
 
-                result: WorkflowResult = await runner.run(
-                    session_id=session_id,
-                    task_id=task_id,
-                    original_request=original_request,
-                    max_context_tokens=max_context_tokens,
-                    breakpoint_enabled=breakpoint_enabled,
-                    breakpoint_nodes=breakpoint_nodes,
+                result: WorkflowResult = await self.cancellation.run(
+                    task_id,
+                    runner.run(
+                        session_id=session_id,
+                        task_id=task_id,
+                        original_request=original_request,
+                        max_context_tokens=max_context_tokens,
+                        breakpoint_enabled=breakpoint_enabled,
+                        breakpoint_nodes=breakpoint_nodes,
+                    ),
                 )
 
                 final_state = result.state
@@ -187,6 +202,9 @@ class TaskExecutor:
                         duration_seconds=duration,
                     )
 
+        except TaskCancelledError:
+            await self._handle_cancelled(session_id, task_id)
+
         except Exception as e:
             logger.exception(
                 "task_execution_failed",
@@ -210,9 +228,14 @@ class TaskExecutor:
                     final_result=str(e),
                 )
                 await db_session.commit()
+            await self.cache.invalidate_session_state(session_id)
+            await self.cache.invalidate_task_progress(task_id)
 
             self.breakpoint_service.cleanup_task(task_id)
 
+        finally:
+            self.cancellation.release(task_id)
+
     async def resume(
         self,
         session_id: UUID,
@@ -228,6 +251,8 @@ class TaskExecutor:
             user_input: Optional user input to pass to workflow
             rejected: If True, pass rejected flag to workflow
         """
+        self.cancellation.register(task_id)
+
         try:
             async for db_session in get_db_session():
                 runner = WorkflowRunner(
@@ -249,9 +274,12 @@ class TaskExecutor:
                         resume_data["reason"] = "Task cancelled by user"
 
                 # Resume workflow
-                result: WorkflowResult = await runner.resume(
-                    task_id=task_id,
-                    user_input=resume_data,
+                result: WorkflowResult = await self.cancellation.run(
+                    task_id,
+                    runner.resume(
+                        task_id=task_id,
+                        user_input=resume_data,
+                    ),
                 )
 
                 if result is None:
@@ -301,6 +329,7 @@ class TaskExecutor:
                     final_result=final_result,
                 )
                 await db_session.commit()
+                await self.cache.invalidate_session_state(session_id)
 
                 self.breakpoint_service.cleanup_task(task_id)
 
@@ -315,6 +344,9 @@ class TaskExecutor:
                     duration_seconds=0,  # Not tracked for resumed tasks
                 )
 
+        except TaskCancelledError:
+            await self._handle_cancelled(session_id, task_id)
+
         except Exception as e:
             logger.exception(
                 "task_resume_execution_failed",
@@ -336,6 +368,23 @@ class TaskExecutor:
                     )
                 break
 
+        finally:
+            self.cancellation.release(task_id)
+
+    async def _handle_cancelled(self, session_id: UUID, task_id: UUID) -> None:
+        """Clean up after a workflow aborted by a cancellation request.
+
+        The task was already marked FAILED by whoever cancelled it.
+
+        Args:
+            session_id: Session ID
+            task_id: Task ID
+        """
+        logger.info("task_execution_cancelled", task_id=str(task_id))
+        await self.cache.invalidate_session_state(session_id)
+        await self.cache.invalidate_task_progress(task_id)
+        self.breakpoint_service.cleanup_task(task_id)
+
     async def _get_previous_milestones(self, session_id: UUID) -> list[PreviousMilestoneInfo]:
         """Get previous milestones for session continuity."""
         from bsai.api.schemas import PreviousMilestoneInfo
@@ -411,6 +460,7 @@ class TaskExecutor:
             )
 
         await db_session.commit()
+        await self.cache.invalidate_session_state(session_id)
 
         # Cache context for next task
         await self._save_context_to_cache(session_id, final_state)
@@ -461,6 +511,8 @@ class TaskExecutor:
             )
 
         await db_session.commit()
+        await self.cache.invalidate_session_state(session_id)
+        await self.cache.invalidate_task_progress(task_id)
 
         self.breakpoint_service.cleanup_task(task_id)
 
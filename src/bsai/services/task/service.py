@@ -34,9 +34,11 @@ from bsai.db.models import Task
 from bsai.db.models.enums import SessionStatus, TaskStatus
 from bsai.db.repository.agent_step_repo import AgentStepRepository
 from bsai.db.repository.milestone_repo import MilestoneRepository
+from bsai.db.repository.project_plan_repo import ProjectPlanRepository
 from bsai.db.repository.session_repo import SessionRepository
 from bsai.db.repository.task_repo import TaskRepository
 from bsai.events import EventBus
+from bsai.graph.utils import count_task_statuses, get_tasks_from_plan
 from bsai.llm.schemas import BreakpointConfig, QAConfig, QAResult
 from bsai.services import BreakpointService
 
@@ -80,6 +82,7 @@ class TaskService:
         self.session_repo = SessionRepository(db_session)
         self.task_repo = TaskRepository(db_session)
         self.milestone_repo = MilestoneRepository(db_session)
+        self.plan_repo = ProjectPlanRepository(db_session)
         self.agent_step_repo = AgentStepRepository(db_session)
 
         # Composed services
@@ -132,6 +135,7 @@ class TaskService:
             status=TaskStatus.PENDING.value,
         )
         await self.db.commit()
+        await self.cache.invalidate_session_state(session_id)
 
         logger.info(
             "task_created",
@@ -217,6 +221,7 @@ class TaskService:
         status: TaskStatus | None = None,
         limit: int = 20,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> PaginatedResponse[TaskResponse]:
         """List session tasks.
 
@@ -225,10 +230,11 @@ class TaskService:
             user_id: User ID
             status: Optional status filter
             limit: Maximum results
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored with cursor)
+            cursor: Cursor from the previous page
 
         Returns:
-            Paginated task response
+            Paginated task response (total only without cursor)
         """
         # Verify session ownership
         session = await self.session_repo.get_by_id(session_id)
@@ -237,28 +243,20 @@ class TaskService:
         if session.user_id != user_id:
             raise AccessDeniedError("Session", session_id)
 
-        # Get tasks
-        tasks = await self.task_repo.get_by_session_id(
-            session_id,
-            limit=limit + 1,
-            offset=offset,
+        status_value = status.value if status else None
+        page = await self.task_repo.list_by_session(
+            session_id, status=status_value, limit=limit, cursor=cursor, offset=offset
         )
-
-        # Filter by status if provided
-        if status:
-            tasks = [t for t in tasks if t.status == status.value]
-
-        # Check if there are more
-        has_more = len(tasks) > limit
-        if has_more:
-            tasks = tasks[:limit]
+        # Counted for the first request only; cursor pages reuse the client's total
+        total = None if cursor else await self.task_repo.count_by_session(session_id, status_value)
 
         return PaginatedResponse(
-            items=[TaskResponse.model_validate(t) for t in tasks],
-            total=len(tasks),
+            items=[TaskResponse.model_validate(t) for t in page.items],
+            total=total,
             limit=limit,
-            offset=offset,
-            has_more=has_more,
+            offset=0 if cursor else offset,
+            has_more=page.next_cursor is not None,
+            next_cursor=page.next_cursor,
         )
 
     async def cancel_task(
@@ -294,8 +292,12 @@ class TaskService:
             raise NotFoundError("Task", task_id)
         await self.db.commit()
 
+        # Abort in-flight work wherever the workflow runs
+        await self.executor.cancellation.cancel(task_id)
+
         # Invalidate progress cache
         await self.cache.invalidate_task_progress(task_id)
+        await self.cache.invalidate_session_state(task.session_id)
 
         # Cleanup breakpoint state
         self.breakpoint_service.cleanup_task(task_id)
@@ -388,8 +390,12 @@ class TaskService:
             raise NotFoundError("Task", task_id)
         await self.db.commit()
 
+        # Abort in-flight work wherever the workflow runs
+        await self.executor.cancellation.cancel(task_id)
+
         # Invalidate progress cache
         await self.cache.invalidate_task_progress(task_id)
+        await self.cache.invalidate_session_state(task.session_id)
 
         # Cleanup breakpoint state
         self.breakpoint_service.cleanup_task(task_id)
@@ -463,6 +469,9 @@ class TaskService:
         - Task/Feature/Epic level progress
         - Current breakpoint reason (if paused)
 
+        Counts come from the Redis progress counters the workflow nodes
+        maintain; the database is only read on a cache miss.
+
         Args:
             task_id: Task ID
             user_id: User ID
@@ -470,28 +479,24 @@ class TaskService:
         Returns:
             Progress dictionary compatible with ProgressResponse
         """
-        await self._get_task_for_user(task_id, user_id)
+        counters = await self.cache.get_task_progress_counters(task_id)
+        if counters is None or counters["user_id"] != user_id:
+            # Cache miss (or foreign owner): check access and seed from the database
+            task = await self._get_task_for_user(task_id, user_id)
+            counts, current_task = await self._count_progress(task)
+            await self.cache.seed_task_progress_counters(task_id, user_id, counts, current_task)
+        else:
+            counts = counters
+            current_task = counters["current_task"]
 
-        # Get milestones for the task
-        milestones = await self.milestone_repo.get_by_task_id(task_id)
-
-        # Calculate progress
-        total_tasks = len(milestones)
-        completed_tasks = sum(1 for m in milestones if m.status == "passed")
-        pending_tasks = sum(1 for m in milestones if m.status == "pending")
-        failed_tasks = sum(1 for m in milestones if m.status == "failed")
-        in_progress_tasks = sum(1 for m in milestones if m.status == "in_progress")
+        total_tasks = sum(counts.get(status, 0) for status in SessionCache.PROGRESS_STATUSES)
+        completed_tasks = counts.get("completed", 0)
+        pending_tasks = counts.get("pending", 0) + counts.get("in_progress", 0)
+        failed_tasks = counts.get("failed", 0)
 
         # Calculate overall percentage
         overall_percent = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
 
-        # Find current task (first in_progress milestone)
-        current_task = None
-        for m in milestones:
-            if m.status == "in_progress":
-                current_task = str(m.id)
-                break
-
         # Get breakpoint state
         breakpoint_state = self.breakpoint_service.get_state(task_id)
         breakpoint_reason = None
@@ -506,7 +511,7 @@ class TaskService:
         return {
             "total_tasks": total_tasks,
             "completed_tasks": completed_tasks,
-            "pending_tasks": pending_tasks + in_progress_tasks,
+            "pending_tasks": pending_tasks,
             "failed_tasks": failed_tasks,
             "overall_percent": overall_percent,
             "current_task": current_task,
@@ -515,6 +520,37 @@ class TaskService:
             "epic_progress": epic_progress,
         }
 
+    async def _count_progress(self, task: Task) -> tuple[dict[str, int], str | None]:
+        """Count plan task statuses for a task from the database.
+
+        Uses the project plan when one exists and falls back to milestone
+        rows otherwise. Plan tasks still in progress when the task failed
+        count as failed, matching what the workflow records.
+
+        Args:
+            task: Task model
+
+        Returns:
+            Tuple of (count per status, current plan task or milestone ID)
+        """
+        project_plan = await self.plan_repo.get_by_task_id(task.id)
+        if project_plan is not None:
+            counts, current_task = count_task_statuses(get_tasks_from_plan(project_plan))
+            if task.status == TaskStatus.FAILED.value and counts.get("in_progress"):
+                counts["failed"] = counts.get("failed", 0) + counts.pop("in_progress")
+                current_task = None
+            return counts, current_task
+
+        milestones = await self.milestone_repo.get_by_task_id(task.id)
+        milestone_counts: dict[str, int] = {}
+        milestone_current: str | None = None
+        for m in milestones:
+            status = "completed" if m.status == "passed" else m.status
+            milestone_counts[status] = milestone_counts.get(status, 0) + 1
+            if m.status == "in_progress" and milestone_current is None:
+                milestone_current = str(m.id)
+        return milestone_counts, milestone_current
+
     async def update_breakpoint_config(
         self,
         task_id: UUID,
@@ -0,0 +1,18 @@
+"""Write-behind telemetry for LLM usage and agent steps.
+
+Populates ``llm_usage_logs`` and ``agent_steps`` without blocking the
+workflow: records are buffered in memory and flushed in batches.
+"""
+
+from .context import TelemetryContext, get_telemetry_context, telemetry_context
+from .writer import TelemetryWriter, close_telemetry, get_telemetry_writer, init_telemetry
+
+__all__ = [
+    "TelemetryContext",
+    "TelemetryWriter",
+    "close_telemetry",
+    "get_telemetry_context",
+    "get_telemetry_writer",
+    "init_telemetry",
+    "telemetry_context",
+]
@@ -0,0 +1,75 @@
+"""Per-task telemetry context.
+
+Workflow nodes set the context once; LLM calls made anywhere below them
+read it to attribute usage to the right session, task and agent.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class TelemetryContext:
+    """Attribution for telemetry records.
+
+    Attributes:
+        session_id: Session the work belongs to
+        task_id: Task being executed
+        agent_type: Agent (or node) performing the work
+        milestone_id: Optional milestone row the work belongs to
+    """
+
+    session_id: UUID
+    task_id: UUID | None = None
+    agent_type: str | None = None
+    milestone_id: UUID | None = None
+
+
+_current_context: ContextVar[TelemetryContext | None] = ContextVar(
+    "bsai_telemetry_context", default=None
+)
+
+
+def get_telemetry_context() -> TelemetryContext | None:
+    """Get the telemetry context of the running task.
+
+    Returns:
+        Current TelemetryContext or None outside a workflow node
+    """
+    return _current_context.get()
+
+
+@contextmanager
+def telemetry_context(
+    session_id: UUID,
+    task_id: UUID | None = None,
+    agent_type: str | None = None,
+    milestone_id: UUID | None = None,
+) -> Iterator[TelemetryContext]:
+    """Set the telemetry context for the enclosed block.
+
+    Args:
+        session_id: Session UUID
+        task_id: Task UUID
+        agent_type: Agent or node name
+        milestone_id: Optional milestone UUID
+
+    Yields:
+        The active TelemetryContext
+    """
+    context = TelemetryContext(
+        session_id=session_id,
+        task_id=task_id,
+        agent_type=agent_type,
+        milestone_id=milestone_id,
+    )
+    token = _current_context.set(context)
+    try:
+        yield context
+    finally:
+        _current_context.reset(token)
@@ -0,0 +1,357 @@
+"""Write-behind telemetry writer.
+
+Buffers LLM usage records and agent step start/complete events in memory
+and flushes them with multi-row INSERTs on a dedicated database session.
+Recording never awaits the database, so node transactions and LLM calls
+are not slowed down by telemetry.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import Callable
+from contextlib import suppress
+from datetime import UTC, datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any
+from uuid import UUID, uuid4
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bsai.api.config import get_telemetry_settings
+from bsai.db.repository.agent_step_repo import AgentStepRepository
+from bsai.db.repository.llm_usage_log_repo import LLMUsageLogRepository
+from bsai.db.session import get_session_manager
+
+logger = structlog.get_logger()
+
+
+def _utcnow() -> datetime:
+    """Naive UTC timestamp (telemetry columns are TIMESTAMP WITHOUT TIME ZONE)."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _default_session_factory() -> AsyncSession:
+    return get_session_manager().session_factory()
+
+
+class TelemetryWriter:
+    """Batched write-behind queue for ``llm_usage_logs`` and ``agent_steps``.
+
+    Records are accepted only while the writer is running. A background task
+    flushes when ``flush_at`` records are pending or every ``flush_interval``
+    seconds, whichever comes first. A step completed before its start record
+    was flushed is written as a single INSERT.
+    """
+
+    # Step status values (same as AgentStepService)
+    STATUS_STARTED = "started"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        flush_at: int = 100,
+        flush_interval: float = 2.0,
+        max_buffer_size: int = 10000,
+    ) -> None:
+        """Initialize telemetry writer.
+
+        Args:
+            session_factory: Factory for flush sessions (defaults to the global session manager)
+            flush_at: Pending record count that triggers an immediate flush
+            flush_interval: Maximum seconds between flushes
+            max_buffer_size: Pending record count above which new records are dropped
+        """
+        self._session_factory = session_factory or _default_session_factory
+        self.flush_at = flush_at
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+
+        self._usage_rows: list[dict[str, Any]] = []
+        self._step_inserts: dict[UUID, dict[str, Any]] = {}
+        self._step_updates: dict[UUID, dict[str, Any]] = {}
+        self._step_clock: dict[UUID, float] = {}
+        # created_at of started steps: part of the (partitioned) primary key
+        self._step_created_at: dict[UUID, datetime] = {}
+
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self.dropped = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background flusher is active."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered records awaiting flush."""
+        return len(self._usage_rows) + len(self._step_inserts) + len(self._step_updates)
+
+    def start(self) -> None:
+        """Start the background flusher (call from a running event loop)."""
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._run(), name="telemetry-writer")
+        logger.info(
+            "telemetry_writer_started",
+            flush_at=self.flush_at,
+            flush_interval=self.flush_interval,
+        )
+
+    async def close(self) -> None:
+        """Stop the background flusher and flush remaining records."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        await self.flush()
+        logger.info("telemetry_writer_closed", dropped=self.dropped)
+
+    def record_llm_call(
+        self,
+        session_id: UUID,
+        agent_type: str,
+        provider: str,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        cost_usd: Decimal,
+        latency_ms: int,
+        milestone_id: UUID | None = None,
+    ) -> None:
+        """Buffer one LLM provider round-trip.
+
+        Args:
+            session_id: Session UUID
+            agent_type: Agent that made the call
+            provider: LLM provider name
+            model: Model name
+            input_tokens: Prompt tokens
+            output_tokens: Completion tokens
+            cost_usd: Cost in USD
+            latency_ms: Provider round-trip latency in milliseconds
+            milestone_id: Optional milestone UUID
+        """
+        if not self._accepting():
+            return
+        self._usage_rows.append(
+            {
+                "id": uuid4(),
+                "session_id": session_id,
+                "milestone_id": milestone_id,
+                "agent_type": agent_type[:20],
+                "llm_provider": provider[:50],
+                "llm_model": model[:100],
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cost": cost_usd,
+                "latency_ms": latency_ms,
+                "created_at": _utcnow(),
+            }
+        )
+        self._maybe_wake()
+
+    def start_step(
+        self,
+        task_id: UUID,
+        agent_type: str,
+        milestone_id: UUID | None = None,
+        input_summary: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> UUID | None:
+        """Buffer the start of an agent step.
+
+        Args:
+            task_id: Task UUID
+            agent_type: Agent or node name
+            milestone_id: Optional milestone UUID
+            input_summary: Brief summary of input
+            metadata: Additional metadata
+
+        Returns:
+            Step ID to pass to complete_step, or None if not recorded
+        """
+        if not self._accepting():
+            return None
+        step_id = uuid4()
+        now = _utcnow()
+        self._step_inserts[step_id] = {
+            "id": step_id,
+            "task_id": task_id,
+            "milestone_id": milestone_id,
+            "agent_type": agent_type[:50],
+            "status": self.STATUS_STARTED,
+            "started_at": now,
+            "ended_at": None,
+            "duration_ms": None,
+            "input_summary": input_summary,
+            "output_summary": None,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cost_usd": Decimal("0"),
+            "error_message": None,
+            "metadata_json": json.dumps(metadata) if metadata else None,
+            "created_at": now,
+        }
+        self._step_clock[step_id] = time.monotonic()
+        self._step_created_at[step_id] = now
+        self._maybe_wake()
+        return step_id
+
+    def complete_step(
+        self,
+        step_id: UUID | None,
+        output_summary: str | None = None,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cost_usd: Decimal = Decimal("0"),
+        error_message: str | None = None,
+    ) -> None:
+        """Buffer the completion of an agent step.
+
+        Status is 'failed' when error_message is set, 'completed' otherwise.
+
+        Args:
+            step_id: ID returned by start_step (None is ignored)
+            output_summary: Brief summary of output
+            input_tokens: Tokens consumed for input
+            output_tokens: Tokens generated
+            cost_usd: Cost in USD
+            error_message: Error message if failed
+        """
+        if step_id is None:
+            return
+        started = self._step_clock.pop(step_id, None)
+        created_at = self._step_created_at.pop(step_id, None)
+        if not self.is_running:
+            return
+
+        values: dict[str, Any] = {
+            "status": (self.STATUS_FAILED if error_message else self.STATUS_COMPLETED),
+            "ended_at": _utcnow(),
+            "duration_ms": int((time.monotonic() - started) * 1000) if started else None,
+            "output_summary": output_summary,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cost_usd": cost_usd,
+            "error_message": error_message,
+        }
+
+        pending_insert = self._step_inserts.get(step_id)
+        if pending_insert is not None:
+            pending_insert.update(values)
+            return
+
+        if created_at is None or not self._accepting():
+            # Without created_at the row cannot be addressed by primary key
+            return
+        self._step_updates[step_id] = {"id": step_id, "created_at": created_at, **values}
+        self._maybe_wake()
+
+    async def flush(self) -> None:
+        """Write all buffered records in one transaction.
+
+        Failures are logged and the batch is dropped; telemetry never
+        propagates errors to callers.
+        """
+        async with self._flush_lock:
+            usage_rows, self._usage_rows = self._usage_rows, []
+            step_inserts = list(self._step_inserts.values())
+            step_updates = list(self._step_updates.values())
+            self._step_inserts = {}
+            self._step_updates = {}
+
+            if not (usage_rows or step_inserts or step_updates):
+                return
+
+            start = time.monotonic()
+            try:
+                async with self._session_factory() as session:
+                    await LLMUsageLogRepository(session).create_many(usage_rows)
+                    step_repo = AgentStepRepository(session)
+                    await step_repo.create_many(step_inserts)
+                    await step_repo.update_many(step_updates)
+                    await session.commit()
+            except Exception as e:
+                logger.warning(
+                    "telemetry_flush_failed",
+                    error=str(e),
+                    usage_rows=len(usage_rows),
+                    step_inserts=len(step_inserts),
+                    step_updates=len(step_updates),
+                )
+                return
+
+            logger.debug(
+                "telemetry_flushed",
+                usage_rows=len(usage_rows),
+                step_inserts=len(step_inserts),
+                step_updates=len(step_updates),
+                flush_ms=int((time.monotonic() - start) * 1000),
+            )
+
+    def _accepting(self) -> bool:
+        """Check whether a new record can be buffered."""
+        if not self.is_running:
+            return False
+        if self.pending >= self.max_buffer_size:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning("telemetry_buffer_full", dropped=self.dropped)
+            return False
+        return True
+
+    def _maybe_wake(self) -> None:
+        if self.pending >= self.flush_at:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Flush on size threshold or interval until cancelled."""
+        while True:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            self._wakeup.clear()
+            await self.flush()
+
+
+@lru_cache(maxsize=1)
+def get_telemetry_writer() -> TelemetryWriter:
+    """Get the process-wide telemetry writer (cached singleton).
+
+    Returns:
+        TelemetryWriter configured from TelemetrySettings
+    """
+    settings = get_telemetry_settings()
+    return TelemetryWriter(
+        flush_at=settings.flush_at,
+        flush_interval=settings.flush_interval,
+        max_buffer_size=settings.max_buffer_size,
+    )
+
+
+def init_telemetry() -> TelemetryWriter:
+    """Start the telemetry writer if enabled (call in lifespan).
+
+    Returns:
+        The process-wide TelemetryWriter
+    """
+    writer = get_telemetry_writer()
+    if get_telemetry_settings().enabled:
+        writer.start()
+    return writer
+
+
+async def close_telemetry() -> None:
+    """Flush pending records and stop the writer (call in lifespan)."""
+    if get_telemetry_writer.cache_info().currsize:
+        await get_telemetry_writer().close()
+    get_telemetry_writer.cache_clear()
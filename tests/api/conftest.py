@@ -12,7 +12,7 @@ from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 
 from bsai.api.auth import get_current_user_id
-from bsai.api.dependencies import get_db
+from bsai.api.dependencies import get_db, get_read_db
 from bsai.cache import SessionCache
 
 if TYPE_CHECKING:
@@ -124,6 +124,7 @@ def app(
         return test_user_id
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_id] = override_get_current_user_id
 
     return app
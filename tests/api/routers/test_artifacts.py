@@ -11,7 +11,7 @@ from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
 from bsai.api.auth import get_current_user_id
-from bsai.api.dependencies import get_db
+from bsai.api.dependencies import get_db, get_read_db
 from bsai.api.handlers import register_exception_handlers
 from bsai.api.routers.artifacts import router
 
@@ -25,6 +25,13 @@ def _create_mock_session(user_id: str, **kwargs) -> MagicMock:
     return mock
 
 
+def _create_count_result(total: int) -> MagicMock:
+    """Create a mock COUNT query result."""
+    mock = MagicMock()
+    mock.scalar_one.return_value = total
+    return mock
+
+
 def _create_mock_artifact(
     session_id,
     task_id,
@@ -47,6 +54,7 @@ def _create_mock_artifact(
     mock.kind = kind
     mock.language = kwargs.get("language", "python")
     mock.content = content
+    mock.size = kwargs.get("size")
     mock.path = path
     mock.sequence_number = sequence_number
     mock.created_at = kwargs.get("created_at", datetime.now(UTC))
@@ -92,6 +100,7 @@ def app(db_session: AsyncMock, user_id: str) -> FastAPI:
         return user_id
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user_id] = override_get_user_id
 
     return app
@@ -132,12 +141,17 @@ class TestListArtifacts:
         mock_task_result = MagicMock()
         mock_task_result.scalar_one_or_none.return_value = task_id
 
-        # Mock artifacts lookup
+        # Mock artifacts count and page lookup
         mock_artifacts_result = MagicMock()
         mock_artifacts_result.scalars.return_value.all.return_value = [artifact1, artifact2]
 
         db_session.execute = AsyncMock(
-            side_effect=[mock_session_result, mock_task_result, mock_artifacts_result]
+            side_effect=[
+                mock_session_result,
+                mock_task_result,
+                _create_count_result(2),
+                mock_artifacts_result,
+            ]
         )
 
         response = client.get(f"/sessions/{session_id}/artifacts")
@@ -147,6 +161,8 @@ class TestListArtifacts:
         assert data["total"] == 2
         assert len(data["items"]) == 2
         assert data["items"][0]["filename"] == "main.py"
+        assert data["items"][0]["content"] == "print('hello')"
+        assert data["items"][0]["size"] == len("print('hello')")
         assert data["items"][1]["filename"] == "utils.py"
 
     def test_list_artifacts_pagination(
@@ -164,7 +180,7 @@ class TestListArtifacts:
             _create_mock_artifact(
                 session_id, task_id, f"file{i}.py", f"content{i}", sequence_number=i
             )
-            for i in range(5)
+            for i in range(1, 3)
         ]
 
         mock_session_result = MagicMock()
@@ -173,11 +189,17 @@ class TestListArtifacts:
         mock_task_result = MagicMock()
         mock_task_result.scalar_one_or_none.return_value = task_id
 
+        # Only the requested page is loaded; the total comes from COUNT
         mock_artifacts_result = MagicMock()
         mock_artifacts_result.scalars.return_value.all.return_value = artifacts
 
         db_session.execute = AsyncMock(
-            side_effect=[mock_session_result, mock_task_result, mock_artifacts_result]
+            side_effect=[
+                mock_session_result,
+                mock_task_result,
+                _create_count_result(5),
+                mock_artifacts_result,
+            ]
         )
 
         response = client.get(
@@ -245,11 +267,13 @@ class TestListArtifacts:
         mock_session_result = MagicMock()
         mock_session_result.scalar_one_or_none.return_value = mock_session
 
-        # When task_id is provided, get_by_task_id is called directly
+        # When task_id is provided, the snapshot is paged directly
         mock_artifacts_result = MagicMock()
         mock_artifacts_result.scalars.return_value.all.return_value = [artifact]
 
-        db_session.execute = AsyncMock(side_effect=[mock_session_result, mock_artifacts_result])
+        db_session.execute = AsyncMock(
+            side_effect=[mock_session_result, _create_count_result(1), mock_artifacts_result]
+        )
 
         response = client.get(f"/sessions/{session_id}/artifacts", params={"task_id": str(task_id)})
 
@@ -258,6 +282,68 @@ class TestListArtifacts:
         assert data["total"] == 1
         assert data["items"][0]["filename"] == "main.py"
 
+    def test_list_artifacts_without_content(
+        self,
+        client: TestClient,
+        db_session: AsyncMock,
+        user_id: str,
+    ):
+        """Test that content-free listings return sizes but never read content."""
+        session_id = uuid4()
+        task_id = uuid4()
+
+        mock_session = _create_mock_session(user_id, id=session_id)
+        artifact = _create_mock_artifact(session_id, task_id, "main.py", "", size=2048)
+        # Accessing unloaded content must not happen
+        type(artifact).content = property(lambda self: pytest.fail("content was read"))
+
+        mock_session_result = MagicMock()
+        mock_session_result.scalar_one_or_none.return_value = mock_session
+
+        mock_artifacts_result = MagicMock()
+        mock_artifacts_result.scalars.return_value.all.return_value = [artifact]
+
+        db_session.execute = AsyncMock(
+            side_effect=[mock_session_result, _create_count_result(1), mock_artifacts_result]
+        )
+
+        response = client.get(
+            f"/sessions/{session_id}/artifacts",
+            params={"all_tasks": True, "include_content": False},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total"] == 1
+        assert data["has_more"] is False
+        assert data["items"][0]["content"] is None
+        assert data["items"][0]["size"] == 2048
+
+    def test_list_artifacts_no_completed_task(
+        self,
+        client: TestClient,
+        db_session: AsyncMock,
+        user_id: str,
+    ):
+        """Test that a session without a completed task lists nothing."""
+        session_id = uuid4()
+
+        mock_session = _create_mock_session(user_id, id=session_id)
+        mock_session_result = MagicMock()
+        mock_session_result.scalar_one_or_none.return_value = mock_session
+
+        mock_task_result = MagicMock()
+        mock_task_result.scalar_one_or_none.return_value = None
+
+        db_session.execute = AsyncMock(side_effect=[mock_session_result, mock_task_result])
+
+        response = client.get(f"/sessions/{session_id}/artifacts")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total"] == 0
+        assert data["items"] == []
+
 
 class TestGetArtifact:
     """Test GET /sessions/{session_id}/artifacts/{artifact_id} endpoint."""
@@ -75,12 +75,12 @@ def _create_mock_server(
 class TestBuildWellknownUrl:
     """Tests for _build_wellknown_url helper."""
 
-    def test_build_wellknown_url_valid_path(self):
+    async def test_build_wellknown_url_valid_path(self):
         """Test building well-known URL with valid path."""
         settings = McpSettings()
         validator = McpSecurityValidator(settings)
 
-        result = _build_wellknown_url(
+        result = await _build_wellknown_url(
             "https://example.com",
             "/.well-known/oauth-authorization-server",
             validator,
@@ -88,12 +88,12 @@ class TestBuildWellknownUrl:
 
         assert result == "https://example.com/.well-known/oauth-authorization-server"
 
-    def test_build_wellknown_url_strips_path(self):
+    async def test_build_wellknown_url_strips_path(self):
         """Test that URL path is stripped before appending well-known path."""
         settings = McpSettings()
         validator = McpSecurityValidator(settings)
 
-        result = _build_wellknown_url(
+        result = await _build_wellknown_url(
             "https://example.com/some/path?query=param",
             "/.well-known/openid-configuration",
             validator,
@@ -101,13 +101,13 @@ class TestBuildWellknownUrl:
 
         assert result == "https://example.com/.well-known/openid-configuration"
 
-    def test_build_wellknown_url_invalid_path(self):
+    async def test_build_wellknown_url_invalid_path(self):
         """Test that invalid well-known paths are rejected."""
         settings = McpSettings()
         validator = McpSecurityValidator(settings)
 
         with pytest.raises(ValueError, match="Invalid well-known path"):
-            _build_wellknown_url(
+            await _build_wellknown_url(
                 "https://example.com",
                 "/.well-known/malicious",
                 validator,
@@ -12,9 +12,10 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from bsai.api.auth import get_current_user_id
-from bsai.api.dependencies import get_cache, get_db
+from bsai.api.dependencies import get_cache, get_db, get_read_db
 from bsai.db.models.enums import MemoryType
 from bsai.db.models.episodic_memory import EpisodicMemory
+from bsai.db.repository.base import Page
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
@@ -108,6 +109,7 @@ def app(
         return test_user_id
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_cache] = override_get_cache
     app.dependency_overrides[get_current_user_id] = override_get_current_user_id
 
@@ -190,7 +192,9 @@ class TestMemoriesList:
         """Test listing memories."""
         with patch("bsai.api.routers.memories.EpisodicMemoryRepository") as mock_repo_class:
             mock_repo = MagicMock()
-            mock_repo.get_by_user_id = AsyncMock(return_value=[sample_memory])
+            mock_repo.list_by_user = AsyncMock(
+                return_value=Page(items=[sample_memory], next_cursor=None)
+            )
             mock_repo.count_by_user = AsyncMock(return_value=1)
             mock_repo_class.return_value = mock_repo
 
@@ -203,6 +207,7 @@ class TestMemoriesList:
             assert len(data["items"]) == 1
             assert data["items"][0]["summary"] == sample_memory.summary
             assert data["total"] == 1
+            assert data["next_cursor"] is None
 
     def test_list_memories_with_pagination(
         self,
@@ -211,18 +216,42 @@ class TestMemoriesList:
         """Test listing memories with pagination."""
         with patch("bsai.api.routers.memories.EpisodicMemoryRepository") as mock_repo_class:
             mock_repo = MagicMock()
-            mock_repo.get_by_user_id = AsyncMock(return_value=[])
+            mock_repo.list_by_user = AsyncMock(return_value=Page(items=[], next_cursor=None))
             mock_repo.count_by_user = AsyncMock(return_value=0)
             mock_repo_class.return_value = mock_repo
 
             response = client.get("/api/v1/memories?limit=10&offset=20")
 
             assert response.status_code == 200
-            mock_repo.get_by_user_id.assert_called_once()
-            call_kwargs = mock_repo.get_by_user_id.call_args[1]
+            mock_repo.list_by_user.assert_called_once()
+            call_kwargs = mock_repo.list_by_user.call_args[1]
             assert call_kwargs["limit"] == 10
             assert call_kwargs["offset"] == 20
 
+    def test_list_memories_with_cursor(
+        self,
+        client: TestClient,
+        sample_memory: MagicMock,
+    ) -> None:
+        """Test that cursor pages skip the total count."""
+        with patch("bsai.api.routers.memories.EpisodicMemoryRepository") as mock_repo_class:
+            mock_repo = MagicMock()
+            mock_repo.list_by_user = AsyncMock(
+                return_value=Page(items=[sample_memory], next_cursor="next")
+            )
+            mock_repo.count_by_user = AsyncMock(return_value=50)
+            mock_repo_class.return_value = mock_repo
+
+            response = client.get("/api/v1/memories?cursor=abc")
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] is None
+            assert data["has_more"] is True
+            assert data["next_cursor"] == "next"
+            assert mock_repo.list_by_user.call_args[1]["cursor"] == "abc"
+            mock_repo.count_by_user.assert_not_called()
+
     def test_list_memories_with_type_filter(
         self,
         client: TestClient,
@@ -230,13 +259,14 @@ class TestMemoriesList:
         """Test listing memories with type filter."""
         with patch("bsai.api.routers.memories.EpisodicMemoryRepository") as mock_repo_class:
             mock_repo = MagicMock()
-            mock_repo.get_by_user_id = AsyncMock(return_value=[])
+            mock_repo.list_by_user = AsyncMock(return_value=Page(items=[], next_cursor=None))
             mock_repo.count_by_user = AsyncMock(return_value=0)
             mock_repo_class.return_value = mock_repo
 
             response = client.get("/api/v1/memories?memory_type=task_result")
 
             assert response.status_code == 200
+            mock_repo.count_by_user.assert_called_once_with("test-user-123", ["task_result"])
 
 
 class TestMemoriesGet:
@@ -6,14 +6,14 @@ from datetime import UTC, datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from bsai.api.auth import get_current_user_id
-from bsai.api.dependencies import get_cache, get_db
+from bsai.api.dependencies import get_cache, get_db, get_read_db
 from bsai.api.exceptions import AccessDeniedError, InvalidStateError, NotFoundError
 from bsai.api.handlers import register_exception_handlers
 from bsai.api.routers.sessions import router
@@ -46,6 +46,7 @@ def app() -> FastAPI:
         return "test-user-123"
 
     app.dependency_overrides[get_db] = mock_get_db
+    app.dependency_overrides[get_read_db] = mock_get_db
     app.dependency_overrides[get_cache] = mock_get_cache
     app.dependency_overrides[get_current_user_id] = mock_get_user_id
 
@@ -201,6 +202,16 @@ class TestGetSession:
             assert response.status_code == 200
             data = response.json()
             assert data["tasks"] == []
+            assert response.headers["ETag"]
+
+            etag = response.headers["ETag"]
+            not_modified = client.get(
+                f"/api/v1/sessions/{session_id}", headers={"If-None-Match": etag}
+            )
+
+            assert not_modified.status_code == 304
+            assert not_modified.content == b""
+            assert not_modified.headers["ETag"] == etag
 
     def test_returns_404_for_missing_session(self, client: TestClient) -> None:
         """Returns 404 when session not found."""
@@ -331,7 +342,9 @@ class TestBulkSessionAction:
 
         with patch("bsai.api.routers.sessions.SessionService") as mock_service_class:
             mock_service = MagicMock()
-            mock_service.pause_session = AsyncMock(return_value=None)
+            mock_service.bulk_action = AsyncMock(
+                return_value=([UUID(sid) for sid in session_ids], {})
+            )
             mock_service_class.return_value = mock_service
 
             response = client.post(
@@ -350,7 +363,9 @@ class TestBulkSessionAction:
 
         with patch("bsai.api.routers.sessions.SessionService") as mock_service_class:
             mock_service = MagicMock()
-            mock_service.complete_session = AsyncMock(return_value=None)
+            mock_service.bulk_action = AsyncMock(
+                return_value=([UUID(sid) for sid in session_ids], {})
+            )
             mock_service_class.return_value = mock_service
 
             response = client.post(
@@ -368,7 +383,9 @@ class TestBulkSessionAction:
 
         with patch("bsai.api.routers.sessions.SessionService") as mock_service_class:
             mock_service = MagicMock()
-            mock_service.delete_session = AsyncMock(return_value=None)
+            mock_service.bulk_action = AsyncMock(
+                return_value=([UUID(sid) for sid in session_ids], {})
+            )
             mock_service_class.return_value = mock_service
 
             response = client.post(
@@ -387,7 +404,9 @@ class TestBulkSessionAction:
 
         with patch("bsai.api.routers.sessions.SessionService") as mock_service_class:
             mock_service = MagicMock()
-            mock_service.pause_session = AsyncMock(side_effect=[None, Exception("Not found")])
+            mock_service.bulk_action = AsyncMock(
+                return_value=([UUID(sid1)], {UUID(sid2): "Session not found"})
+            )
             mock_service_class.return_value = mock_service
 
             response = client.post(
@@ -400,6 +419,7 @@ class TestBulkSessionAction:
             assert len(data["success"]) == 1
             assert len(data["failed"]) == 1
             assert data["failed"][0]["session_id"] == sid2
+            assert data["failed"][0]["error"] == "Session not found"
 
 
 class TestDeleteSession:
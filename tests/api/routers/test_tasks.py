@@ -580,6 +580,34 @@ class TestGetTaskProgress:
             data = response.json()
             assert data["total_tasks"] == 5
             assert data["overall_percent"] == 60.0
+            assert response.headers["ETag"]
+
+    def test_returns_304_when_etag_matches(self, client: TestClient) -> None:
+        """Returns 304 Not Modified while progress is unchanged."""
+        url = f"/api/v1/sessions/{uuid4()}/tasks/{uuid4()}/progress"
+        progress = {
+            "total_tasks": 2,
+            "completed_tasks": 1,
+            "pending_tasks": 1,
+            "failed_tasks": 0,
+            "overall_percent": 50.0,
+        }
+
+        with patch("bsai.api.routers.tasks.TaskService") as mock_service_class:
+            mock_service = MagicMock()
+            mock_service.get_progress = AsyncMock(return_value=progress)
+            mock_service_class.return_value = mock_service
+
+            etag = client.get(url).headers["ETag"]
+            not_modified = client.get(url, headers={"If-None-Match": f"W/{etag}"})
+
+            progress["completed_tasks"] = 2
+            modified = client.get(url, headers={"If-None-Match": etag})
+
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert modified.status_code == 200
+        assert modified.headers["ETag"] != etag
 
     def test_returns_404_for_missing_task(self, client: TestClient) -> None:
         """Returns 404 when task not found."""
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -12,6 +12,7 @@ import pytest
 from bsai.api.exceptions import AccessDeniedError, InvalidStateError, NotFoundError
 from bsai.api.services.session_service import SessionService
 from bsai.db.models.enums import SessionStatus
+from bsai.db.repository.base import Page
 
 if TYPE_CHECKING:
     pass
@@ -22,6 +23,7 @@ def mock_db() -> AsyncMock:
     """Create mock database session."""
     session = AsyncMock()
     session.commit = AsyncMock()
+    session.info = {}
     return session
 
 
@@ -29,6 +31,7 @@ def mock_db() -> AsyncMock:
 def mock_cache() -> MagicMock:
     """Create mock session cache."""
     cache = MagicMock()
+    cache.get_session_state = AsyncMock(return_value=None)
     cache.set_session_state = AsyncMock()
     cache.invalidate_session_state = AsyncMock()
     cache.invalidate_user_sessions = AsyncMock()
@@ -125,6 +128,87 @@ class TestGetSession:
 
             assert result.id == session_id
             assert result.tasks == []
+            cached = session_service.cache.set_session_state.call_args[0][1]
+            assert cached["user_id"] == user_id
+            assert cached["detail"]["id"] == str(session_id)
+
+    @pytest.mark.asyncio
+    async def test_replica_read_does_not_fill_cache(
+        self,
+        session_service: SessionService,
+        mock_cache: MagicMock,
+    ) -> None:
+        """Details read from a replica after an invalidation are not cached."""
+        session_id = uuid4()
+        mock_session = MagicMock()
+        mock_session.id = session_id
+        mock_session.user_id = "user-123"
+        mock_session.status = SessionStatus.ACTIVE.value
+        mock_session.title = None
+        mock_session.created_at = datetime.now(UTC)
+        mock_session.updated_at = datetime.now(UTC)
+        mock_session.total_input_tokens = 0
+        mock_session.total_output_tokens = 0
+        mock_session.total_cost_usd = 0
+        mock_session.context_usage_ratio = 0.0
+        # Invalidated by a task status write: the cache misses
+        mock_cache.get_session_state.return_value = None
+
+        with (
+            patch.object(
+                session_service.session_repo,
+                "get_by_id",
+                new_callable=AsyncMock,
+                return_value=mock_session,
+            ),
+            patch.object(
+                session_service.task_repo,
+                "get_by_session_id",
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
+            patch(
+                "bsai.api.services.session_service.is_replica_session", return_value=True
+            ) as mock_is_replica,
+        ):
+            result = await session_service.get_session(session_id, "user-123")
+
+        assert result.id == session_id
+        mock_is_replica.assert_called_once_with(session_service.db)
+        mock_cache.set_session_state.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_returns_cached_details_without_database(
+        self,
+        session_service: SessionService,
+        mock_cache: MagicMock,
+    ) -> None:
+        """Serves the owner's cached session details without querying."""
+        session_id = uuid4()
+        now = datetime.now(UTC).isoformat()
+        mock_cache.get_session_state.return_value = {
+            "user_id": "user-123",
+            "detail": {
+                "id": str(session_id),
+                "user_id": "user-123",
+                "status": SessionStatus.ACTIVE.value,
+                "created_at": now,
+                "updated_at": now,
+                "total_input_tokens": 0,
+                "total_output_tokens": 0,
+                "total_cost_usd": "0",
+                "context_usage_ratio": 0.0,
+                "tasks": [],
+            },
+        }
+
+        with patch.object(
+            session_service.session_repo, "get_by_id", new_callable=AsyncMock
+        ) as mock_get:
+            result = await session_service.get_session(session_id, "user-123")
+
+        assert result.id == session_id
+        mock_get.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_raises_not_found_when_session_missing(
@@ -198,22 +282,111 @@ class TestListSessions:
         with (
             patch.object(
                 session_service.session_repo,
-                "get_by_user_id",
+                "list_by_user",
                 new_callable=AsyncMock,
             ) as mock_get,
+            patch.object(
+                session_service.session_repo,
+                "count_by_user",
+                new_callable=AsyncMock,
+            ) as mock_count,
             patch.object(
                 session_service.task_repo,
-                "get_by_session_id",
+                "get_first_requests",
                 new_callable=AsyncMock,
-            ) as mock_tasks,
+            ) as mock_titles,
         ):
-            mock_get.return_value = mock_sessions
-            mock_tasks.return_value = []  # No tasks for sessions
+            mock_get.return_value = Page(items=mock_sessions, next_cursor=None)
+            mock_count.return_value = 3
+            mock_titles.return_value = {}  # No tasks for sessions
 
             result = await session_service.list_sessions(user_id, limit=10)
 
             assert len(result.items) == 3
+            assert result.total == 3
             assert result.has_more is False
+            assert all(item.title == "New session" for item in result.items)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("page_size", [1, 5, 25])
+    async def test_query_count_is_constant_per_page(
+        self,
+        session_service: SessionService,
+        mock_db: AsyncMock,
+        page_size: int,
+    ) -> None:
+        """Lists a page with the same number of queries regardless of its size."""
+        sessions = [
+            MagicMock(
+                id=uuid4(),
+                user_id="user-123",
+                status=SessionStatus.ACTIVE.value,
+                title=None,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC),
+                total_input_tokens=0,
+                total_output_tokens=0,
+                total_cost_usd=0,
+                context_usage_ratio=0.0,
+            )
+            for _ in range(page_size)
+        ]
+        first_requests = [(sessions[0].id, "x" * 51)]
+        statements: list[str] = []
+
+        async def execute(stmt: Any) -> MagicMock:
+            sql = str(stmt)
+            statements.append(sql)
+            result = MagicMock()
+            if "count(" in sql:
+                result.scalar_one.return_value = page_size
+            elif "DISTINCT" in sql:
+                result.all.return_value = first_requests
+            else:
+                result.scalars.return_value.all.return_value = sessions
+            return result
+
+        mock_db.execute = AsyncMock(side_effect=execute)
+
+        result = await session_service.list_sessions("user-123", limit=page_size)
+
+        # Page, total and all titles
+        assert len(statements) == 3
+        assert len(result.items) == page_size
+        assert result.items[0].title == "x" * 50 + "..."
+        assert all(item.title == "New session" for item in result.items[1:])
+
+    @pytest.mark.asyncio
+    async def test_status_filter_and_cursor_are_applied_in_sql(
+        self,
+        session_service: SessionService,
+    ) -> None:
+        """Filters by status in the query and skips the count on cursor pages."""
+        with (
+            patch.object(
+                session_service.session_repo,
+                "list_by_user",
+                new_callable=AsyncMock,
+            ) as mock_get,
+            patch.object(
+                session_service.session_repo,
+                "count_by_user",
+                new_callable=AsyncMock,
+            ) as mock_count,
+        ):
+            mock_get.return_value = Page(items=[], next_cursor="next-page")
+
+            result = await session_service.list_sessions(
+                "user-123", status=SessionStatus.PAUSED, limit=5, cursor="page-2"
+            )
+
+            mock_get.assert_awaited_once_with(
+                "user-123", status="paused", limit=5, cursor="page-2", offset=0
+            )
+            mock_count.assert_not_called()
+            assert result.total is None
+            assert result.has_more is True
+            assert result.next_cursor == "next-page"
 
 
 class TestPauseSession:
@@ -492,3 +665,120 @@ class TestDeleteSession:
 
             mock_delete.assert_called_once_with(session_id)
             mock_cache.invalidate_session_state.assert_called_once()
+
+
+class TestBulkAction:
+    """Tests for bulk_action method."""
+
+    @pytest.mark.asyncio
+    async def test_reports_failures_per_session(
+        self,
+        session_service: SessionService,
+        mock_db: AsyncMock,
+        mock_cache: MagicMock,
+    ) -> None:
+        """Checks all sessions in one query and pauses the eligible ones in one statement."""
+        user_id = "user-123"
+        active, paused, foreign, missing = uuid4(), uuid4(), uuid4(), uuid4()
+        mock_cache.invalidate_sessions = AsyncMock()
+
+        with (
+            patch.object(
+                session_service.session_repo,
+                "get_owners_and_statuses",
+                new_callable=AsyncMock,
+                return_value={
+                    active: (user_id, SessionStatus.ACTIVE.value),
+                    paused: (user_id, SessionStatus.PAUSED.value),
+                    foreign: ("other-user", SessionStatus.ACTIVE.value),
+                },
+            ),
+            patch.object(
+                session_service.session_repo,
+                "update_status_many",
+                new_callable=AsyncMock,
+                return_value=[active],
+            ) as mock_update,
+        ):
+            succeeded, failed = await session_service.bulk_action(
+                [missing, active, paused, foreign, active], user_id, "pause"
+            )
+
+        assert succeeded == [active]
+        assert list(failed) == [missing, paused, foreign]
+        assert "not found" in failed[missing]
+        assert "paused" in failed[paused]
+        mock_update.assert_awaited_once_with(
+            [active], user_id, SessionStatus.PAUSED.value, [SessionStatus.ACTIVE.value]
+        )
+        mock_db.commit.assert_awaited_once()
+        mock_cache.invalidate_sessions.assert_awaited_once_with([active], user_id=None)
+
+    @pytest.mark.asyncio
+    async def test_delete_reports_concurrently_removed_sessions(
+        self,
+        session_service: SessionService,
+        mock_cache: MagicMock,
+    ) -> None:
+        """Sessions the statement did not delete are reported as failed."""
+        user_id = "user-123"
+        first, second = uuid4(), uuid4()
+        mock_cache.invalidate_sessions = AsyncMock()
+
+        with (
+            patch.object(
+                session_service.session_repo,
+                "get_owners_and_statuses",
+                new_callable=AsyncMock,
+                return_value={
+                    first: (user_id, SessionStatus.ACTIVE.value),
+                    second: (user_id, SessionStatus.COMPLETED.value),
+                },
+            ),
+            patch.object(
+                session_service.session_repo,
+                "delete_many",
+                new_callable=AsyncMock,
+                return_value=[second],
+            ),
+        ):
+            succeeded, failed = await session_service.bulk_action(
+                [first, second], user_id, "delete"
+            )
+
+        assert succeeded == [second]
+        assert failed == {first: "Session was modified concurrently"}
+        mock_cache.invalidate_sessions.assert_awaited_once_with([second], user_id=user_id)
+
+    @pytest.mark.asyncio
+    async def test_rolls_back_when_statement_fails(
+        self,
+        session_service: SessionService,
+        mock_db: AsyncMock,
+        mock_cache: MagicMock,
+    ) -> None:
+        """A failing statement fails all eligible sessions and touches no cache."""
+        user_id = "user-123"
+        session_id = uuid4()
+        mock_cache.invalidate_sessions = AsyncMock()
+
+        with (
+            patch.object(
+                session_service.session_repo,
+                "get_owners_and_statuses",
+                new_callable=AsyncMock,
+                return_value={session_id: (user_id, SessionStatus.PAUSED.value)},
+            ),
+            patch.object(
+                session_service.session_repo,
+                "update_status_many",
+                new_callable=AsyncMock,
+                side_effect=RuntimeError("connection lost"),
+            ),
+        ):
+            succeeded, failed = await session_service.bulk_action([session_id], user_id, "complete")
+
+        assert succeeded == []
+        assert failed == {session_id: "connection lost"}
+        mock_db.rollback.assert_awaited_once()
+        mock_cache.invalidate_sessions.assert_not_called()
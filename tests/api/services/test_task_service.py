@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, cast
@@ -14,6 +15,7 @@ from bsai.api.exceptions import AccessDeniedError, InvalidStateError, NotFoundEr
 from bsai.api.schemas import TaskCreate
 from bsai.api.services.task_service import TaskService
 from bsai.db.models.enums import SessionStatus, TaskStatus
+from bsai.db.repository.base import Page
 from bsai.services import BreakpointService
 from bsai.services.task import TaskExecutor, TaskNotifier
 
@@ -36,6 +38,9 @@ def mock_cache() -> MagicMock:
     """Create mock session cache."""
     cache = MagicMock()
     cache.invalidate_task_progress = AsyncMock()
+    cache.invalidate_session_state = AsyncMock()
+    cache.get_task_progress_counters = AsyncMock(return_value=None)
+    cache.seed_task_progress_counters = AsyncMock()
     return cache
 
 
@@ -332,16 +337,23 @@ class TestListTasks:
             ) as mock_get_session,
             patch.object(
                 task_service.task_repo,
-                "get_by_session_id",
+                "list_by_session",
                 new_callable=AsyncMock,
             ) as mock_get_tasks,
+            patch.object(
+                task_service.task_repo,
+                "count_by_session",
+                new_callable=AsyncMock,
+            ) as mock_count_tasks,
         ):
             mock_get_session.return_value = mock_session
-            mock_get_tasks.return_value = mock_tasks
+            mock_get_tasks.return_value = Page(items=mock_tasks, next_cursor=None)
+            mock_count_tasks.return_value = 3
 
             result = await task_service.list_tasks(session_id, user_id)
 
             assert len(result.items) == 3
+            assert result.total == 3
             assert result.has_more is False
 
 
@@ -593,6 +605,89 @@ class TestListMilestones:
             assert len(result) == 2
 
 
+class TestGetProgress:
+    """Tests for get_progress method."""
+
+    async def test_reads_cached_counters_without_database(
+        self,
+        task_service: TaskService,
+        mock_cache: MagicMock,
+    ) -> None:
+        """Serves progress from Redis counters on a cache hit."""
+        mock_cache.get_task_progress_counters.return_value = {
+            "pending": 1,
+            "in_progress": 1,
+            "completed": 2,
+            "failed": 0,
+            "user_id": "user-123",
+            "current_task": "T2",
+        }
+
+        with patch.object(task_service, "_get_task_for_user", new_callable=AsyncMock) as mock_get:
+            result = await task_service.get_progress(uuid4(), "user-123")
+
+        mock_get.assert_not_called()
+        assert result["total_tasks"] == 4
+        assert result["completed_tasks"] == 2
+        assert result["pending_tasks"] == 2
+        assert result["overall_percent"] == 50.0
+        assert result["current_task"] == "T2"
+
+    async def test_seeds_counters_from_plan_on_miss(
+        self,
+        task_service: TaskService,
+        mock_cache: MagicMock,
+    ) -> None:
+        """Counts plan tasks and seeds the counters on a cache miss."""
+        task_id = uuid4()
+        task = MagicMock(id=task_id, status=TaskStatus.FAILED.value)
+        plan = MagicMock()
+        plan.plan_data = {
+            "tasks": [
+                {"id": "T1", "status": "completed"},
+                {"id": "T2", "status": "in_progress"},
+                {"id": "T3", "status": "pending"},
+            ]
+        }
+
+        with (
+            patch.object(task_service, "_get_task_for_user", AsyncMock(return_value=task)),
+            patch.object(task_service.plan_repo, "get_by_task_id", AsyncMock(return_value=plan)),
+        ):
+            result = await task_service.get_progress(task_id, "user-123")
+
+        assert result["failed_tasks"] == 1
+        assert result["current_task"] is None
+        mock_cache.seed_task_progress_counters.assert_awaited_once_with(
+            task_id, "user-123", {"completed": 1, "pending": 1, "failed": 1}, None
+        )
+
+    async def test_foreign_counters_check_access(
+        self,
+        task_service: TaskService,
+        mock_cache: MagicMock,
+    ) -> None:
+        """Falls back to the access check when counters belong to another user."""
+        mock_cache.get_task_progress_counters.return_value = {
+            "pending": 1,
+            "in_progress": 0,
+            "completed": 0,
+            "failed": 0,
+            "user_id": "owner",
+            "current_task": None,
+        }
+
+        with (
+            patch.object(
+                task_service,
+                "_get_task_for_user",
+                AsyncMock(side_effect=AccessDeniedError("Task", uuid4())),
+            ),
+            pytest.raises(AccessDeniedError),
+        ):
+            await task_service.get_progress(uuid4(), "intruder")
+
+
 class TestResumeTask:
     """Tests for resume_task method."""
 
@@ -1117,17 +1212,27 @@ class TestListTasksWithFiltering:
             ) as mock_get_session,
             patch.object(
                 task_service.task_repo,
-                "get_by_session_id",
+                "list_by_session",
                 new_callable=AsyncMock,
             ) as mock_get_tasks,
+            patch.object(
+                task_service.task_repo,
+                "count_by_session",
+                new_callable=AsyncMock,
+            ) as mock_count_tasks,
         ):
             mock_get_session.return_value = mock_session
-            mock_get_tasks.return_value = mock_tasks
+            # The status filter is applied by the query
+            mock_get_tasks.return_value = Page(items=mock_tasks[:1], next_cursor=None)
+            mock_count_tasks.return_value = 1
 
             result = await task_service.list_tasks(session_id, user_id, status=TaskStatus.COMPLETED)
 
             assert len(result.items) == 1
             assert result.items[0].status == TaskStatus.COMPLETED.value
+            assert result.total == 1
+            assert mock_get_tasks.call_args.kwargs["status"] == TaskStatus.COMPLETED.value
+            mock_count_tasks.assert_awaited_once_with(session_id, TaskStatus.COMPLETED.value)
 
     @pytest.mark.asyncio
     async def test_detects_has_more(
@@ -1142,7 +1247,6 @@ class TestListTasksWithFiltering:
         mock_session.id = session_id
         mock_session.user_id = user_id
 
-        # Create limit+1 tasks to trigger has_more
         mock_tasks = [
             MagicMock(
                 id=uuid4(),
@@ -1154,7 +1258,7 @@ class TestListTasksWithFiltering:
                 final_result="Result",
                 retry_count=0,
             )
-            for i in range(3)  # limit=2, so 3 means has_more=True
+            for i in range(2)
         ]
 
         with (
@@ -1165,17 +1269,26 @@ class TestListTasksWithFiltering:
             ) as mock_get_session,
             patch.object(
                 task_service.task_repo,
-                "get_by_session_id",
+                "list_by_session",
                 new_callable=AsyncMock,
             ) as mock_get_tasks,
+            patch.object(
+                task_service.task_repo,
+                "count_by_session",
+                new_callable=AsyncMock,
+            ) as mock_count_tasks,
         ):
             mock_get_session.return_value = mock_session
-            mock_get_tasks.return_value = mock_tasks
+            mock_get_tasks.return_value = Page(items=mock_tasks, next_cursor="next-page")
 
-            result = await task_service.list_tasks(session_id, user_id, limit=2)
+            result = await task_service.list_tasks(session_id, user_id, limit=2, cursor="page-2")
 
             assert len(result.items) == 2
             assert result.has_more is True
+            assert result.next_cursor == "next-page"
+            # Cursor pages do not repeat the count
+            assert result.total is None
+            mock_count_tasks.assert_not_called()
 
 
 class TestGetTaskWithCostBreakdown:
@@ -1927,6 +2040,56 @@ class TestExecuteTask:
             # Should notify failure via websocket
             assert mock_ws_manager.broadcast_to_session.call_count >= 1
 
+    @pytest.mark.asyncio
+    async def test_cancellation_aborts_running_workflow(
+        self,
+        mock_db: AsyncMock,
+        mock_cache: MagicMock,
+        mock_breakpoint_service: MagicMock,
+    ) -> None:
+        """Cancelling stops the in-flight workflow without overwriting the status."""
+        mock_ws_manager = MagicMock()
+        mock_ws_manager.broadcast_to_session = AsyncMock()
+        task_service = TaskService(
+            mock_db, mock_cache, MagicMock(), mock_ws_manager, mock_breakpoint_service
+        )
+        task_id = uuid4()
+        workflow_started = asyncio.Event()
+
+        async def hanging_run(**kwargs: object) -> None:
+            workflow_started.set()
+            await asyncio.Event().wait()
+
+        async def mock_get_db_session():
+            db = AsyncMock()
+            db.commit = AsyncMock()
+            yield db
+
+        with (
+            patch("bsai.services.task.executor.get_db_session", mock_get_db_session),
+            patch("bsai.services.task.executor.WorkflowRunner") as mock_runner_class,
+            patch("bsai.services.task.executor.TaskRepository") as mock_task_repo_class,
+        ):
+            mock_runner_class.return_value.run = hanging_run
+            mock_task_repo_class.return_value.update = AsyncMock()
+
+            execution = asyncio.create_task(
+                task_service._execute_task(
+                    session_id=uuid4(),
+                    task_id=task_id,
+                    original_request="Test request",
+                    max_context_tokens=4000,
+                )
+            )
+            await workflow_started.wait()
+            await task_service.executor.cancellation.cancel(task_id)
+            await asyncio.wait_for(execution, timeout=1)
+
+            # Only the IN_PROGRESS update; cancel_task owns the FAILED status
+            mock_task_repo_class.return_value.update.assert_awaited_once()
+            mock_cache.invalidate_task_progress.assert_awaited_with(task_id)
+            assert task_service.executor.cancellation.get(task_id) is None
+
     @pytest.mark.asyncio
     async def test_uses_fallback_result_from_milestone(
         self,
@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import time
+from collections.abc import Generator
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from fastapi import WebSocketDisconnect
+from jwcrypto import jwt
+from jwcrypto.jwk import JWK, JWKSet
 
 from bsai.api.auth import (
+    JWKSCache,
+    VerifiedTokenCache,
     authenticate_websocket,
     authenticate_websocket_connection,
     get_current_user_id,
     get_keycloak_config,
+    get_token_cache,
     user_mapper,
 )
 from bsai.api.exceptions import AuthenticationError
@@ -93,60 +102,208 @@ class TestGetCurrentUserId:
             assert exc_info.value.message == "Not authenticated"
 
 
+class StubIssuer:
+    """Local stand-in for a Keycloak realm that signs tokens and serves its JWKS."""
+
+    def __init__(self) -> None:
+        self.keys: list[JWK] = [JWK.generate(kty="RSA", size=2048, kid="key-1")]
+        self.jwks_requests = 0
+        self.available = True
+
+    def rotate(self, kid: str) -> None:
+        """Add a new signing key (as Keycloak does on rotation)."""
+        self.keys.append(JWK.generate(kty="RSA", size=2048, kid=kid))
+
+    def sign(self, sub: str, kid: str = "key-1", exp_in: int = 300) -> str:
+        key = next(k for k in self.keys if k.get("kid") == kid)
+        token = jwt.JWT(
+            header={"alg": "RS256", "kid": kid},
+            claims={"sub": sub, "exp": int(time.time()) + exp_in},
+        )
+        token.make_signed_token(key)
+        return str(token.serialize())
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.jwks_requests += 1
+        if not self.available:
+            return httpx.Response(503)
+        jwks = JWKSet()
+        for key in self.keys:
+            jwks.add(key)
+        return httpx.Response(200, text=jwks.export(private_keys=False))
+
+    def jwks_cache(self, **kwargs: Any) -> JWKSCache:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        return JWKSCache("https://issuer.test/certs", client=client, **kwargs)
+
+
+@pytest.fixture
+def issuer() -> Generator[StubIssuer, None, None]:
+    """Stub issuer wired into the process-wide auth caches."""
+    stub = StubIssuer()
+    cache = stub.jwks_cache(min_refresh_interval=0.0)
+    get_token_cache.cache_clear()
+    with (
+        patch("bsai.api.auth.get_jwks_cache", return_value=cache),
+        patch("bsai.api.auth.get_token_cache", return_value=VerifiedTokenCache(max_size=8)),
+    ):
+        yield stub
+
+
 class TestAuthenticateWebsocket:
     """Tests for authenticate_websocket function."""
 
     @pytest.mark.asyncio
-    async def test_returns_user_id_on_valid_token(self) -> None:
+    async def test_returns_user_id_on_valid_token(self, issuer: StubIssuer) -> None:
         """authenticate_websocket returns user ID on valid token."""
-        mock_response = MagicMock()
-        mock_response.text = '{"keys": []}'
+        result = await authenticate_websocket(issuer.sign("user-123"))
+        assert result == "user-123"
 
-        mock_jwt = MagicMock()
-        mock_jwt.claims = '{"sub": "user-123"}'
+    @pytest.mark.asyncio
+    async def test_reuses_jwks_across_tokens(self, issuer: StubIssuer) -> None:
+        """JWKS is downloaded once for multiple connects."""
+        await authenticate_websocket(issuer.sign("user-1"))
+        await authenticate_websocket(issuer.sign("user-2"))
+        assert issuer.jwks_requests == 1
 
-        with (
-            patch("bsai.api.auth.get_auth_settings") as mock_settings,
-            patch("bsai.api.auth.httpx.AsyncClient") as mock_client,
-            patch("bsai.api.auth.JWKSet") as mock_jwkset,
-            patch("bsai.api.auth.jwt.JWT", return_value=mock_jwt),
-        ):
-            mock_settings.return_value = MagicMock(
-                keycloak_url="https://auth.example.com",
-                keycloak_realm="test-realm",
-            )
-            mock_client.return_value.__aenter__ = AsyncMock(return_value=MagicMock())
-            mock_client.return_value.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
-            mock_jwkset.from_json.return_value = MagicMock()
+    @pytest.mark.asyncio
+    async def test_reconnect_with_same_token_hits_token_cache(self, issuer: StubIssuer) -> None:
+        """Verified tokens are served from the token cache."""
+        token = issuer.sign("user-123")
+        await authenticate_websocket(token)
 
-            result = await authenticate_websocket("valid-token")
-            assert result == "user-123"
+        with patch("bsai.api.auth.jwt.JWT", side_effect=AssertionError("re-verified")):
+            result = await authenticate_websocket(token)
+
+        assert result == "user-123"
 
     @pytest.mark.asyncio
-    async def test_raises_401_on_invalid_token(self) -> None:
+    async def test_refreshes_on_unknown_kid(self, issuer: StubIssuer) -> None:
+        """A token signed with a rotated key triggers a JWKS refresh."""
+        await authenticate_websocket(issuer.sign("user-1"))
+        issuer.rotate("key-2")
+
+        result = await authenticate_websocket(issuer.sign("user-2", kid="key-2"))
+
+        assert result == "user-2"
+        assert issuer.jwks_requests == 2
+
+    @pytest.mark.asyncio
+    async def test_raises_401_on_invalid_token(self, issuer: StubIssuer) -> None:
         """authenticate_websocket raises 401 on invalid token."""
+        with pytest.raises(AuthenticationError) as exc_info:
+            await authenticate_websocket("invalid-token")
+
+        assert exc_info.value.status_code == 401
+        assert exc_info.value.message == "Invalid token"
+
+    @pytest.mark.asyncio
+    async def test_raises_401_on_expired_token(self, issuer: StubIssuer) -> None:
+        """Expired tokens are rejected."""
+        with pytest.raises(AuthenticationError):
+            await authenticate_websocket(issuer.sign("user-123", exp_in=-120))
+
+    @pytest.mark.asyncio
+    async def test_raises_401_when_issuer_unreachable(self) -> None:
+        """authenticate_websocket raises 401 when JWKS cannot be fetched."""
+
+        def fail(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Connection failed")
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(fail))
+        cache = JWKSCache("https://issuer.test/certs", client=client)
         with (
-            patch("bsai.api.auth.get_auth_settings") as mock_settings,
-            patch("bsai.api.auth.httpx.AsyncClient") as mock_client,
+            patch("bsai.api.auth.get_jwks_cache", return_value=cache),
+            patch("bsai.api.auth.get_token_cache", return_value=VerifiedTokenCache()),
         ):
-            mock_settings.return_value = MagicMock(
-                keycloak_url="https://auth.example.com",
-                keycloak_realm="test-realm",
-            )
-            mock_client.return_value.__aenter__ = AsyncMock(return_value=MagicMock())
-            mock_client.return_value.__aexit__ = AsyncMock(return_value=None)
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                side_effect=Exception("Connection failed")
-            )
-
             with pytest.raises(AuthenticationError) as exc_info:
-                await authenticate_websocket("invalid-token")
+                await authenticate_websocket("some-token")
 
-            assert exc_info.value.status_code == 401
-            assert exc_info.value.message == "Invalid token"
+        assert exc_info.value.status_code == 401
+
+
+class TestJWKSCache:
+    """Tests for JWKSCache."""
+
+    @pytest.mark.asyncio
+    async def test_refetches_after_ttl(self) -> None:
+        """Keys are fetched again once the TTL has expired."""
+        issuer = StubIssuer()
+        cache = issuer.jwks_cache(ttl=0.0)
+
+        await cache.get_keys()
+        await cache.get_keys()
+
+        assert issuer.jwks_requests == 2
+
+    @pytest.mark.asyncio
+    async def test_forced_refresh_is_rate_limited(self) -> None:
+        """Forced refreshes within min_refresh_interval reuse cached keys."""
+        issuer = StubIssuer()
+        cache = issuer.jwks_cache(min_refresh_interval=60.0)
+
+        await cache.get_keys()
+        await cache.get_keys(force_refresh=True)
+
+        assert issuer.jwks_requests == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_fetch(self) -> None:
+        """Concurrent cold lookups result in a single fetch."""
+        issuer = StubIssuer()
+        cache = issuer.jwks_cache()
+
+        await asyncio.gather(*(cache.get_keys() for _ in range(5)))
+
+        assert issuer.jwks_requests == 1
+
+    @pytest.mark.asyncio
+    async def test_serves_stale_keys_when_refresh_fails(self) -> None:
+        """Last known keys are kept if Keycloak is temporarily unavailable."""
+        issuer = StubIssuer()
+        cache = issuer.jwks_cache(ttl=0.0)
+        keys = await cache.get_keys()
+
+        issuer.available = False
+
+        assert await cache.get_keys() is keys
+
+
+class TestVerifiedTokenCache:
+    """Tests for VerifiedTokenCache."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Oldest entry is evicted when max_size is exceeded."""
+        cache = VerifiedTokenCache(max_size=2)
+        exp = int(time.time()) + 60
+        cache.put("a", {"sub": "a", "exp": exp})
+        cache.put("b", {"sub": "b", "exp": exp})
+        cache.get("a")
+        cache.put("c", {"sub": "c", "exp": exp})
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    def test_expired_entries_are_not_returned(self) -> None:
+        """Entries are dropped once the token expires."""
+        cache = VerifiedTokenCache()
+        cache.put("a", {"sub": "a", "exp": int(time.time()) + 60})
+
+        with patch("bsai.api.auth.time.time", return_value=time.time() + 120):
+            assert cache.get("a") is None
+
+    def test_tokens_without_exp_are_not_cached(self) -> None:
+        """Tokens without an exp claim are never cached."""
+        cache = VerifiedTokenCache()
+        cache.put("a", {"sub": "a"})
+        assert cache.get("a") is None
+
+    def test_disabled_when_max_size_zero(self) -> None:
+        """max_size=0 disables caching."""
+        cache = VerifiedTokenCache(max_size=0)
+        cache.put("a", {"sub": "a", "exp": int(time.time()) + 60})
+        assert len(cache) == 0
 
 
 class TestAuthenticateWebsocketConnection:
@@ -8,19 +8,25 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from bsai.api.dependencies import get_cache, get_db
+from bsai.api.dependencies import get_cache, get_db, get_read_db
+from bsai.db.session import _WROTE_INFO, STICKY_KEY_INFO
 
 if TYPE_CHECKING:
     pass
 
 
+def _request(user_id: str | None) -> MagicMock:
+    """Build a request whose scope carries the authenticated user."""
+    return MagicMock(scope={"user": user_id} if user_id else {})
+
+
 class TestGetDB:
     """Tests for get_db dependency."""
 
     @pytest.mark.asyncio
     async def test_yields_database_session(self) -> None:
         """get_db yields a database session."""
-        mock_session = AsyncMock()
+        mock_session = MagicMock(info={})
 
         with patch(
             "bsai.api.dependencies.get_db_session",
@@ -33,16 +39,17 @@ class TestGetDB:
 
             # Call get_db
             result = None
-            async for session in get_db():
+            async for session in get_db(_request("user-1")):
                 result = session
                 break
 
             assert result is mock_session
+            assert mock_session.info[STICKY_KEY_INFO] == "user-1"
 
     @pytest.mark.asyncio
     async def test_session_generator_pattern(self) -> None:
         """get_db follows generator pattern for proper cleanup."""
-        mock_session = AsyncMock()
+        mock_session = MagicMock(info={})
 
         with patch(
             "bsai.api.dependencies.get_db_session",
@@ -55,10 +62,86 @@ class TestGetDB:
 
             # Exhaust the generator
             sessions = []
-            async for session in get_db():
+            async for session in get_db(_request(None)):
                 sessions.append(session)
 
             assert len(sessions) == 1
+            assert STICKY_KEY_INFO not in mock_session.info
+
+    @pytest.mark.asyncio
+    async def test_shares_write_with_other_workers(self) -> None:
+        """A session that wrote marks the user's recent write in Redis."""
+        mock_session = MagicMock(info={})
+        manager = MagicMock(has_replicas=True, sticky_seconds=5.0)
+        cache = MagicMock(mark_recent_write=AsyncMock())
+
+        async def mock_generator() -> AsyncGenerator[Any, None]:
+            yield mock_session
+
+        with (
+            patch("bsai.api.dependencies.get_db_session", return_value=mock_generator()),
+            patch("bsai.api.dependencies.get_session_manager", return_value=manager),
+            patch("bsai.api.dependencies.get_redis"),
+            patch("bsai.api.dependencies.SessionCache", return_value=cache),
+        ):
+            async for session in get_db(_request("user-1")):
+                session.info[_WROTE_INFO] = True
+
+        cache.mark_recent_write.assert_awaited_once_with("user-1", 5.0)
+
+
+class TestGetReadDB:
+    """Tests for get_read_db dependency."""
+
+    async def _read(self, manager: MagicMock, cache: MagicMock, user_id: str | None) -> Any:
+        calls: list[tuple[Any, ...]] = []
+
+        async def mock_read_session(*args: Any) -> AsyncGenerator[Any, None]:
+            calls.append(args)
+            yield MagicMock()
+
+        with (
+            patch("bsai.api.dependencies.get_read_db_session", mock_read_session),
+            patch("bsai.api.dependencies.get_session_manager", return_value=manager),
+            patch("bsai.api.dependencies.get_redis"),
+            patch("bsai.api.dependencies.SessionCache", return_value=cache),
+        ):
+            async for _ in get_read_db(_request(user_id)):
+                pass
+        return calls[0]
+
+    @pytest.mark.asyncio
+    async def test_replica_read_without_recent_write(self) -> None:
+        """Reads may use a replica when the user has not written recently."""
+        manager = MagicMock(has_replicas=True, is_pinned=MagicMock(return_value=False))
+        cache = MagicMock(has_recent_write=AsyncMock(return_value=False))
+
+        assert await self._read(manager, cache, "user-1") == ("user-1", False)
+
+    @pytest.mark.asyncio
+    async def test_primary_after_write_in_other_worker(self) -> None:
+        """A write recorded by another worker pins reads to the primary."""
+        manager = MagicMock(has_replicas=True, is_pinned=MagicMock(return_value=False))
+        cache = MagicMock(has_recent_write=AsyncMock(return_value=True))
+
+        assert await self._read(manager, cache, "user-1") == ("user-1", True)
+
+    @pytest.mark.asyncio
+    async def test_primary_when_redis_fails(self) -> None:
+        """Without the shared marker, reads use the primary."""
+        manager = MagicMock(has_replicas=True, is_pinned=MagicMock(return_value=False))
+        cache = MagicMock(has_recent_write=AsyncMock(side_effect=ConnectionError("down")))
+
+        assert await self._read(manager, cache, "user-1") == ("user-1", True)
+
+    @pytest.mark.asyncio
+    async def test_no_redis_lookup_without_replicas(self) -> None:
+        """Without replicas, no recent-write lookup is made."""
+        manager = MagicMock(has_replicas=False)
+        cache = MagicMock(has_recent_write=AsyncMock())
+
+        assert await self._read(manager, cache, "user-1") == ("user-1", False)
+        cache.has_recent_write.assert_not_awaited()
 
 
 class TestGetCache:
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, WebSocket
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from fastapi.testclient import TestClient
 
-from bsai.api.middleware import CORSMiddleware, LoggingMiddleware, RequestIDMiddleware
+from bsai.api.middleware import (
+    CORSMiddleware,
+    LoggingMiddleware,
+    RequestIDMiddleware,
+    SelectiveGZipMiddleware,
+)
 
 if TYPE_CHECKING:
     pass
@@ -70,6 +77,43 @@ class TestRequestIDMiddleware:
         assert captured_request_id is not None
         assert captured_request_id == response.headers["X-Request-ID"]
 
+    def test_streaming_response_is_passed_through(self) -> None:
+        """Streamed bodies arrive intact with the request ID header."""
+        app = FastAPI()
+        app.add_middleware(LoggingMiddleware)
+        app.add_middleware(RequestIDMiddleware)
+
+        async def chunks() -> AsyncIterator[bytes]:
+            for i in range(3):
+                yield f"chunk-{i};".encode()
+
+        @app.get("/stream")
+        async def stream_endpoint() -> StreamingResponse:
+            return StreamingResponse(chunks(), media_type="text/plain")
+
+        client = TestClient(app)
+        response = client.get("/stream", headers={"X-Request-ID": "stream-id"})
+
+        assert response.text == "chunk-0;chunk-1;chunk-2;"
+        assert response.headers["X-Request-ID"] == "stream-id"
+        assert "X-Response-Time" in response.headers
+
+    def test_websocket_is_passed_through(self) -> None:
+        """WebSocket connections are not touched."""
+        app = FastAPI()
+        app.add_middleware(LoggingMiddleware)
+        app.add_middleware(RequestIDMiddleware)
+
+        @app.websocket("/ws")
+        async def ws_endpoint(websocket: WebSocket) -> None:
+            await websocket.accept()
+            await websocket.send_text("hello")
+            await websocket.close()
+
+        client = TestClient(app)
+        with client.websocket_connect("/ws") as websocket:
+            assert websocket.receive_text() == "hello"
+
 
 class TestLoggingMiddleware:
     """Tests for LoggingMiddleware."""
@@ -127,6 +171,60 @@ class TestLoggingMiddleware:
             # Should still work with "unknown" request_id
             mock_logger.info.assert_called()
 
+    def test_logs_status_and_path(self) -> None:
+        """request_completed carries the response status and path."""
+        app = FastAPI()
+        app.add_middleware(LoggingMiddleware)
+        app.add_middleware(RequestIDMiddleware)
+
+        @app.get("/missing")
+        async def missing_endpoint() -> PlainTextResponse:
+            return PlainTextResponse("nope", status_code=404)
+
+        with patch("bsai.api.middleware.logger") as mock_logger:
+            client = TestClient(app)
+            client.get("/missing?x=1", headers={"X-Request-ID": "log-id"})
+
+        started, completed = (c.kwargs for c in mock_logger.info.call_args_list)
+        assert started["query"] == "x=1"
+        assert completed["request_id"] == "log-id"
+        assert completed["path"] == "/missing"
+        assert completed["status_code"] == 404
+
+
+class TestSelectiveGZipMiddleware:
+    """Tests for SelectiveGZipMiddleware."""
+
+    def _client(self) -> TestClient:
+        app = FastAPI()
+        app.add_middleware(SelectiveGZipMiddleware, minimum_size=10)
+
+        @app.get("/text")
+        async def text_endpoint() -> PlainTextResponse:
+            return PlainTextResponse("x" * 1000)
+
+        @app.get("/artifacts/download/zip")
+        async def zip_endpoint() -> PlainTextResponse:
+            return PlainTextResponse("x" * 1000, media_type="application/x-zip-compressed")
+
+        return TestClient(app)
+
+    def test_compresses_regular_responses(self) -> None:
+        """Large regular responses are gzip encoded."""
+        response = self._client().get("/text", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.text == "x" * 1000
+
+    def test_skips_zip_downloads(self) -> None:
+        """ZIP downloads are served as-is."""
+        response = self._client().get(
+            "/artifacts/download/zip", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert "Content-Encoding" not in response.headers
+        assert response.text == "x" * 1000
+
 
 class TestCORSMiddleware:
     """Tests for CORSMiddleware configuration helper."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
@@ -30,8 +31,8 @@ class MockWebSocket:
         self.closed = True
         self.close_code = code
 
-    async def send_json(self, data: dict[str, Any]) -> None:
-        self.messages_sent.append(data)
+    async def send_text(self, data: str) -> None:
+        self.messages_sent.append(json.loads(data))
 
 
 class MockSessionCache:
@@ -36,7 +36,7 @@ def mock_websocket() -> AsyncMock:
     """Create mock WebSocket."""
     ws = AsyncMock()
     ws.accept = AsyncMock()
-    ws.send_json = AsyncMock()
+    ws.send_text = AsyncMock()
     ws.close = AsyncMock()
     return ws
 
@@ -172,11 +172,11 @@ class TestSendMessage:
         connection = await manager.connect(mock_websocket)
 
         message = MagicMock()
-        message.model_dump.return_value = {"type": "test", "payload": {}}
+        message.model_dump_json.return_value = '{"type":"test","payload":{}}'
 
         await manager.send_message(connection, message)
 
-        mock_websocket.send_json.assert_called_once()
+        mock_websocket.send_text.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handles_send_error(
@@ -186,10 +186,10 @@ class TestSendMessage:
     ) -> None:
         """Handles error when sending message."""
         connection = await manager.connect(mock_websocket)
-        mock_websocket.send_json.side_effect = Exception("Send failed")
+        mock_websocket.send_text.side_effect = Exception("Send failed")
 
         message = MagicMock()
-        message.model_dump.return_value = {"type": "test"}
+        message.model_dump_json.return_value = '{"type":"test"}'
 
         # Should not raise
         await manager.send_message(connection, message)
@@ -209,7 +209,7 @@ class TestBroadcastToSession:
         # Create multiple connections
         ws1, ws2 = AsyncMock(), AsyncMock()
         ws1.accept, ws2.accept = AsyncMock(), AsyncMock()
-        ws1.send_json, ws2.send_json = AsyncMock(), AsyncMock()
+        ws1.send_text, ws2.send_text = AsyncMock(), AsyncMock()
 
         conn1 = await manager.connect(ws1, user_id="user-1")
         conn2 = await manager.connect(ws2, user_id="user-2")
@@ -218,12 +218,14 @@ class TestBroadcastToSession:
         await manager.subscribe_to_session(conn2, session_id)
 
         message = MagicMock()
-        message.model_dump.return_value = {"type": "test"}
+        message.model_dump_json.return_value = '{"type":"test"}'
 
         await manager.broadcast_to_session(session_id, message)
 
-        ws1.send_json.assert_called_once()
-        ws2.send_json.assert_called_once()
+        ws1.send_text.assert_called_once_with('{"type":"test"}')
+        ws2.send_text.assert_called_once_with('{"type":"test"}')
+        # Encoded once for all connections
+        message.model_dump_json.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_skips_session_with_no_connections(
@@ -233,7 +235,7 @@ class TestBroadcastToSession:
         """Does nothing when session has no connections."""
         session_id = uuid4()
         message = MagicMock()
-        message.model_dump.return_value = {"type": "test"}
+        message.model_dump_json.return_value = '{"type":"test"}'
 
         # Should not raise
         await manager.broadcast_to_session(session_id, message)
@@ -371,19 +373,20 @@ class TestBroadcastToUser:
         """Broadcasts message to all connections for a user."""
         ws1, ws2 = AsyncMock(), AsyncMock()
         ws1.accept, ws2.accept = AsyncMock(), AsyncMock()
-        ws1.send_json, ws2.send_json = AsyncMock(), AsyncMock()
+        ws1.send_text, ws2.send_text = AsyncMock(), AsyncMock()
 
         await manager.connect(ws1, user_id="user-123")
         await manager.connect(ws2, user_id="user-123")
 
         message = MagicMock()
-        message.model_dump.return_value = {"type": "test"}
+        message.model_dump_json.return_value = '{"type":"test"}'
 
         count = await manager.broadcast_to_user("user-123", message)
 
         assert count == 2
-        ws1.send_json.assert_called_once()
-        ws2.send_json.assert_called_once()
+        ws1.send_text.assert_called_once()
+        ws2.send_text.assert_called_once()
+        message.model_dump_json.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_returns_zero_for_unknown_user(
@@ -392,7 +395,7 @@ class TestBroadcastToUser:
     ) -> None:
         """Returns 0 when user has no connections."""
         message = MagicMock()
-        message.model_dump.return_value = {"type": "test"}
+        message.model_dump_json.return_value = '{"type":"test"}'
 
         count = await manager.broadcast_to_user("unknown-user", message)
 
@@ -406,19 +409,19 @@ class TestBroadcastToUser:
         """Does not send to other users' connections."""
         ws1, ws2 = AsyncMock(), AsyncMock()
         ws1.accept, ws2.accept = AsyncMock(), AsyncMock()
-        ws1.send_json, ws2.send_json = AsyncMock(), AsyncMock()
+        ws1.send_text, ws2.send_text = AsyncMock(), AsyncMock()
 
         await manager.connect(ws1, user_id="user-123")
         await manager.connect(ws2, user_id="user-456")
 
         message = MagicMock()
-        message.model_dump.return_value = {"type": "test"}
+        message.model_dump_json.return_value = '{"type":"test"}'
 
         count = await manager.broadcast_to_user("user-123", message)
 
         assert count == 1
-        ws1.send_json.assert_called_once()
-        ws2.send_json.assert_not_called()
+        ws1.send_text.assert_called_once()
+        ws2.send_text.assert_not_called()
 
 
 class TestMcpExecutor:
@@ -504,10 +507,10 @@ class TestSendMessageEdgeCases:
         from fastapi import WebSocketDisconnect
 
         connection = await manager.connect(mock_websocket)
-        mock_websocket.send_json.side_effect = WebSocketDisconnect()
+        mock_websocket.send_text.side_effect = WebSocketDisconnect()
 
         message = MagicMock()
-        message.model_dump.return_value = {"type": "test"}
+        message.model_dump_json.return_value = '{"type":"test"}'
 
         result = await manager.send_message(connection, message)
 
@@ -530,8 +533,8 @@ class TestBroadcastToSessionEdgeCases:
 
         ws1, ws2 = AsyncMock(), AsyncMock()
         ws1.accept, ws2.accept = AsyncMock(), AsyncMock()
-        ws1.send_json = AsyncMock()
-        ws2.send_json = AsyncMock(side_effect=WebSocketDisconnect())
+        ws1.send_text = AsyncMock()
+        ws2.send_text = AsyncMock(side_effect=WebSocketDisconnect())
 
         conn1 = await manager.connect(ws1, user_id="user-1")
         conn2 = await manager.connect(ws2, user_id="user-2")
@@ -541,7 +544,7 @@ class TestBroadcastToSessionEdgeCases:
 
         message = MagicMock()
         message.type = "test"
-        message.model_dump.return_value = {"type": "test"}
+        message.model_dump_json.return_value = '{"type":"test"}'
 
         count = await manager.broadcast_to_session(session_id, message)
 
@@ -559,8 +562,8 @@ class TestBroadcastToSessionEdgeCases:
 
         ws1, ws2 = AsyncMock(), AsyncMock()
         ws1.accept, ws2.accept = AsyncMock(), AsyncMock()
-        ws1.send_json = AsyncMock()
-        ws2.send_json = AsyncMock(side_effect=Exception("Network error"))
+        ws1.send_text = AsyncMock()
+        ws2.send_text = AsyncMock(side_effect=Exception("Network error"))
 
         conn1 = await manager.connect(ws1, user_id="user-1")
         conn2 = await manager.connect(ws2, user_id="user-2")
@@ -570,7 +573,7 @@ class TestBroadcastToSessionEdgeCases:
 
         message = MagicMock()
         message.type = "test"
-        message.model_dump.return_value = {"type": "test"}
+        message.model_dump_json.return_value = '{"type":"test"}'
 
         count = await manager.broadcast_to_session(session_id, message)
 
@@ -0,0 +1,326 @@
+"""Integration tests for the monthly partitioned log tables.
+
+Run against PostgreSQL (see ``postgres_engine``).
+"""
+
+import importlib.util
+import json
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import Connection, event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from bsai.db.models import (
+    AgentStep,
+    McpServerConfig,
+    McpToolExecutionLog,
+    Session,
+    Task,
+)
+from bsai.db.partitions import maintain_log_partitions
+from bsai.db.repository.agent_step_repo import AgentStepRepository
+from bsai.db.repository.mcp_tool_log_repo import McpToolLogRepository
+
+MIGRATION_PATH = (
+    Path(__file__).parents[2]
+    / "migrations"
+    / "versions"
+    / "20261019_0900_partition_log_tables_by_month.py"
+)
+
+USER_ID = "partition-user"
+
+# Seeded rows: three tool logs and one agent step per month
+SEED_MONTHS = [date(2026, month, 1) for month in (6, 7, 8, 9, 10)]
+LOGS_PER_MONTH = 3
+
+
+def _load_migration() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("log_partitions_migration", MIGRATION_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _migrate(connection: Connection, step: Callable[[], None]) -> None:
+    with Operations.context(MigrationContext.configure(connection)):
+        step()
+
+
+async def _seed(session: AsyncSession) -> None:
+    chat_session = Session(id=uuid4(), user_id=USER_ID)
+    task = Task(id=uuid4(), session_id=chat_session.id, original_request="seed")
+    server = McpServerConfig(id=uuid4(), user_id=USER_ID, name="seed", transport_type="http")
+    session.add_all([chat_session, task, server])
+    await session.flush()
+    for month in SEED_MONTHS:
+        session.add(
+            AgentStep(
+                task_id=task.id,
+                agent_type="worker",
+                status="started",
+                created_at=datetime(month.year, month.month, 10),
+            )
+        )
+        for day in range(LOGS_PER_MONTH):
+            session.add(
+                McpToolExecutionLog(
+                    user_id=USER_ID,
+                    session_id=chat_session.id,
+                    mcp_server_id=server.id,
+                    tool_name="search",
+                    tool_input={},
+                    agent_type="worker",
+                    status="success",
+                    required_approval=False,
+                    created_at=datetime(month.year, month.month, 5 + day * 7),
+                )
+            )
+    await session.commit()
+
+
+@pytest.fixture
+async def engine(postgres_engine: AsyncEngine) -> AsyncEngine:
+    """Database migrated to partitioned log tables with seeded rows.
+
+    The schema created from the models is taken back to unpartitioned
+    tables by the migration's downgrade and partitioned again by its
+    upgrade, so both directions run on a real server.
+    """
+    migration = _load_migration()
+    async with postgres_engine.begin() as conn:
+        await conn.run_sync(_migrate, migration.downgrade)
+    async with AsyncSession(postgres_engine) as session:
+        await _seed(session)
+    async with postgres_engine.begin() as conn:
+        await conn.run_sync(_migrate, migration.upgrade)
+    return postgres_engine
+
+
+@pytest.fixture
+def session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Session factory bound to the test database."""
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def _partition_counts(engine: AsyncEngine, table: str) -> dict[str, int]:
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text(f"SELECT tableoid::regclass::text, count(*) FROM {table} GROUP BY 1")
+        )
+        return dict(result.all())
+
+
+def _relations(plan: Any) -> set[str]:
+    """Collect the relations scanned anywhere in a JSON query plan."""
+    if isinstance(plan, list):
+        return set().union(*(_relations(item) for item in plan))
+    if not isinstance(plan, dict):
+        return set()
+    found = {plan["Relation Name"]} if "Relation Name" in plan else set()
+    return found.union(*(_relations(value) for value in plan.values()))
+
+
+async def _scanned_partitions(
+    engine: AsyncEngine,
+    session: AsyncSession,
+    query: Callable[[], Awaitable[Any]],
+) -> set[str]:
+    """EXPLAIN the last statement a repository call sends, as sent."""
+    statements: list[tuple[str, Any]] = []
+
+    def capture(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        await query()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    statement, parameters = statements[-1]
+    connection = await session.connection()
+    plan = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+    raw = plan.scalar_one()
+    return _relations(json.loads(raw) if isinstance(raw, str) else raw)
+
+
+class TestMigration:
+    """The partitioning migration on a real server."""
+
+    @pytest.mark.asyncio
+    async def test_upgrade_moves_rows_into_monthly_partitions(self, engine: AsyncEngine) -> None:
+        """Existing rows land in the partition of their month."""
+        counts = await _partition_counts(engine, "mcp_tool_execution_logs")
+
+        assert counts == {
+            f"mcp_tool_execution_logs_p{month:%Y%m}": LOGS_PER_MONTH for month in SEED_MONTHS
+        }
+        assert await _partition_counts(engine, "agent_steps") == {
+            f"agent_steps_p{month:%Y%m}": 1 for month in SEED_MONTHS
+        }
+
+    @pytest.mark.asyncio
+    async def test_downgrade_and_upgrade_keep_rows(self, engine: AsyncEngine) -> None:
+        """Downgrading restores plain tables with every row, upgrading again works."""
+        migration = _load_migration()
+        async with engine.begin() as conn:
+            await conn.run_sync(_migrate, migration.downgrade)
+            kind = await conn.execute(
+                text("SELECT relkind::text FROM pg_class WHERE relname = 'mcp_tool_execution_logs'")
+            )
+            assert kind.scalar_one() == "r"
+            total = await conn.execute(text("SELECT count(*) FROM mcp_tool_execution_logs"))
+            assert total.scalar_one() == LOGS_PER_MONTH * len(SEED_MONTHS)
+
+        async with engine.begin() as conn:
+            await conn.run_sync(_migrate, migration.upgrade)
+
+        counts = await _partition_counts(engine, "mcp_tool_execution_logs")
+        assert sum(counts.values()) == LOGS_PER_MONTH * len(SEED_MONTHS)
+        assert "mcp_tool_execution_logs_default" not in counts
+
+
+class TestPartitionMaintenance:
+    """Partition routines installed by the migration."""
+
+    @pytest.mark.asyncio
+    async def test_new_partition_takes_rows_from_default(
+        self, engine: AsyncEngine, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """Rows of a month without partition move when its partition is created."""
+        async with engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "INSERT INTO agent_steps (id, task_id, agent_type, status, input_tokens,"
+                    " output_tokens, cost_usd, created_at)"
+                    " SELECT gen_random_uuid(), task_id, 'worker', 'started', 0, 0, 0,"
+                    " '2030-01-15' FROM agent_steps LIMIT 1"
+                )
+            )
+        assert (await _partition_counts(engine, "agent_steps"))["agent_steps_default"] == 1
+
+        async with session_factory() as session:
+            result = await maintain_log_partitions(session, months_ahead=0, today=date(2030, 1, 20))
+
+        assert result is not None
+        counts = await _partition_counts(engine, "agent_steps")
+        assert "agent_steps_default" not in counts
+        assert counts["agent_steps_p203001"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retention_drops_expired_partitions(
+        self, engine: AsyncEngine, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """Retention drops whole months before the kept range."""
+        async with session_factory() as session:
+            result = await maintain_log_partitions(
+                session, months_ahead=0, retention_months=2, today=date(2026, 10, 19)
+            )
+
+        assert result is not None
+        counts = await _partition_counts(engine, "mcp_tool_execution_logs")
+        assert sorted(counts) == [
+            "mcp_tool_execution_logs_p202608",
+            "mcp_tool_execution_logs_p202609",
+            "mcp_tool_execution_logs_p202610",
+        ]
+
+
+class TestPartitionPruning:
+    """Queries on created_at only scan the matching partitions."""
+
+    @pytest.mark.asyncio
+    async def test_since_until_scans_matching_months(
+        self, engine: AsyncEngine, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """A since/until window scans only its months."""
+        async with session_factory() as session:
+            repo = McpToolLogRepository(session)
+            scanned = await _scanned_partitions(
+                engine,
+                session,
+                lambda: repo.list_by_user(
+                    USER_ID, since=datetime(2026, 8, 1), until=datetime(2026, 10, 1)
+                ),
+            )
+
+        assert scanned == {"mcp_tool_execution_logs_p202608", "mcp_tool_execution_logs_p202609"}
+
+    @pytest.mark.asyncio
+    async def test_keyset_page_skips_newer_months(
+        self, engine: AsyncEngine, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """A keyset page never scans the months after its cursor."""
+        async with session_factory() as session:
+            repo = McpToolLogRepository(session)
+            first = await repo.list_by_user(USER_ID, limit=2, until=datetime(2026, 9, 1))
+            assert first.next_cursor is not None
+            cursor = first.next_cursor
+
+            scanned = await _scanned_partitions(
+                engine, session, lambda: repo.list_by_user(USER_ID, limit=2, cursor=cursor)
+            )
+
+        # Without a lower bound the default partition (rows before the first
+        # month) may hold older rows and is scanned as well
+        assert scanned == {
+            "mcp_tool_execution_logs_p202606",
+            "mcp_tool_execution_logs_p202607",
+            "mcp_tool_execution_logs_p202608",
+            "mcp_tool_execution_logs_default",
+        }
+
+    @pytest.mark.asyncio
+    async def test_keyset_page_within_window_scans_matching_months(
+        self, engine: AsyncEngine, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """The next page of a since/until window stays within its months."""
+        window = {"since": datetime(2026, 7, 1), "until": datetime(2026, 10, 1)}
+        async with session_factory() as session:
+            repo = McpToolLogRepository(session)
+            first = await repo.list_by_user(USER_ID, limit=4, **window)
+            assert first.next_cursor is not None
+            cursor = first.next_cursor
+
+            scanned = await _scanned_partitions(
+                engine,
+                session,
+                lambda: repo.list_by_user(USER_ID, limit=4, cursor=cursor, **window),
+            )
+
+        # The cursor is in August (newest four rows: three of September, one of August)
+        assert scanned == {"mcp_tool_execution_logs_p202607", "mcp_tool_execution_logs_p202608"}
+
+
+class TestAgentStepBulkUpdate:
+    """AgentStepRepository.update_many on the partitioned table."""
+
+    @pytest.mark.asyncio
+    async def test_update_many_by_partitioned_primary_key(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """Rows addressed by id and created_at are updated in place."""
+        async with session_factory() as session:
+            result = await session.execute(text("SELECT id, created_at FROM agent_steps"))
+            rows = [
+                {"id": step_id, "created_at": created_at, "status": "completed"}
+                for step_id, created_at in result.all()
+            ]
+
+            await AgentStepRepository(session).update_many(rows)
+            await session.commit()
+
+            statuses = await session.execute(text("SELECT DISTINCT status FROM agent_steps"))
+            assert statuses.scalars().all() == ["completed"]
@@ -650,12 +650,18 @@ class TestGetMcpLogs:
         mock_list_result = MagicMock()
         mock_list_result.scalars.return_value.all.return_value = []
 
+        # Mock for the planner estimate (small table: counted exactly)
+        mock_estimate_result = MagicMock()
+        mock_estimate_result.scalar_one.return_value = [{"Plan": {"Plan Rows": 1}}]
+
         # Mock for count_by_user (returns int)
         mock_count_result = MagicMock()
         mock_count_result.scalar_one.return_value = 0
 
         # Return different results for consecutive calls
-        db_session.execute = AsyncMock(side_effect=[mock_list_result, mock_count_result])
+        db_session.execute = AsyncMock(
+            side_effect=[mock_list_result, mock_estimate_result, mock_count_result]
+        )
 
         response = client.get("/api/v1/mcp/logs", headers=auth_headers)
 
@@ -675,12 +681,18 @@ class TestGetMcpLogs:
         mock_list_result = MagicMock()
         mock_list_result.scalars.return_value.all.return_value = []
 
+        # Mock for the planner estimate (small table: counted exactly)
+        mock_estimate_result = MagicMock()
+        mock_estimate_result.scalar_one.return_value = [{"Plan": {"Plan Rows": 1}}]
+
         # Mock for count_by_user (returns int)
         mock_count_result = MagicMock()
         mock_count_result.scalar_one.return_value = 0
 
         # Return different results for consecutive calls
-        db_session.execute = AsyncMock(side_effect=[mock_list_result, mock_count_result])
+        db_session.execute = AsyncMock(
+            side_effect=[mock_list_result, mock_estimate_result, mock_count_result]
+        )
 
         response = client.get(
             "/api/v1/mcp/logs",
@@ -692,3 +704,38 @@ class TestGetMcpLogs:
         data = response.json()
         assert data["limit"] == 50
         assert data["offset"] == 10
+
+    def test_get_logs_estimates_large_totals(
+        self,
+        client: TestClient,
+        db_session: AsyncMock,
+        auth_headers: dict[str, str],
+    ):
+        """Test that large log volumes report the planner estimate instead of counting."""
+        mock_list_result = MagicMock()
+        mock_list_result.scalars.return_value.all.return_value = []
+
+        mock_estimate_result = MagicMock()
+        mock_estimate_result.scalar_one.return_value = '[{"Plan": {"Plan Rows": 250000}}]'
+
+        db_session.execute = AsyncMock(side_effect=[mock_list_result, mock_estimate_result])
+
+        response = client.get("/api/v1/mcp/logs", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total"] == 250000
+        assert data["total_estimated"] is True
+        assert db_session.execute.await_count == 2
+
+    def test_get_logs_invalid_cursor(
+        self,
+        client: TestClient,
+        auth_headers: dict[str, str],
+    ):
+        """Test that a malformed cursor is rejected."""
+        response = client.get(
+            "/api/v1/mcp/logs", params={"cursor": "not-a-cursor"}, headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
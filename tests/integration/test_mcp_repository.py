@@ -4,10 +4,12 @@ These tests use mocked database session to verify repository logic.
 For true integration tests, a real database setup is required.
 """
 
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from bsai.db.repository.mcp_server_repo import McpServerRepository
 from bsai.db.repository.mcp_tool_log_repo import McpToolLogRepository
@@ -325,6 +327,31 @@ class TestMcpToolLogRepository:
         assert len(logs) == 1
         assert logs[0].status == "error"
 
+    @pytest.mark.asyncio
+    async def test_list_by_user_time_range_bounds_partition_key(
+        self, mock_session: AsyncMock, user_id: str
+    ):
+        """Test that time filters are applied to created_at, the partition key."""
+        repo = McpToolLogRepository(mock_session)
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        await repo.list_by_user(
+            user_id,
+            since=datetime(2026, 9, 1, 2, 0, tzinfo=timezone(timedelta(hours=2))),
+            until=datetime(2026, 10, 1),
+        )
+
+        stmt = mock_session.execute.call_args.args[0]
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        assert "mcp_tool_execution_logs.created_at >= %(created_at_1)s" in sql
+        assert "mcp_tool_execution_logs.created_at < %(created_at_2)s" in sql
+        # Aware bounds are compared as naive UTC, like the column
+        assert compiled.params["created_at_1"] == datetime(2026, 9, 1, 0, 0)
+        assert compiled.params["created_at_2"] == datetime(2026, 10, 1)
+
     @pytest.mark.asyncio
     async def test_get_by_mcp_server(self, mock_session: AsyncMock, user_id: str):
         """Test retrieving logs by MCP server."""
@@ -0,0 +1,116 @@
+"""Statements issued by repository updates, counted on PostgreSQL.
+
+Run against PostgreSQL (see ``postgres_engine``).
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from bsai.db.models import Milestone, ProjectPlan, Session, Task
+from bsai.db.repository.milestone_repo import MilestoneRepository
+from bsai.db.repository.project_plan_repo import ProjectPlanRepository
+from bsai.db.repository.task_repo import TaskRepository
+
+
+@dataclass
+class Workflow:
+    """IDs of a seeded task with one milestone and a plan."""
+
+    task_id: UUID
+    milestone_id: UUID
+    plan_id: UUID
+
+
+@pytest.fixture
+async def workflow(postgres_engine: AsyncEngine) -> Workflow:
+    """Seed a session, task, milestone and project plan."""
+    chat_session = Session(id=uuid4(), user_id="statements-user")
+    task = Task(id=uuid4(), session_id=chat_session.id, original_request="build")
+    milestone = Milestone(id=uuid4(), task_id=task.id, sequence_number=1, complexity="simple")
+    plan = ProjectPlan(id=uuid4(), task_id=task.id, session_id=chat_session.id, title="plan")
+    async with AsyncSession(postgres_engine, expire_on_commit=False) as session:
+        session.add(chat_session)
+        await session.flush()
+        session.add(task)
+        await session.flush()
+        session.add_all([milestone, plan])
+        await session.commit()
+    return Workflow(task_id=task.id, milestone_id=milestone.id, plan_id=plan.id)
+
+
+@pytest.fixture
+def statements(postgres_engine: AsyncEngine) -> Iterator[list[str]]:
+    """Leading keyword of every statement sent to the database."""
+    sent: list[str] = []
+
+    def record(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        sent.append(statement.split(None, 1)[0].upper())
+
+    event.listen(postgres_engine.sync_engine, "before_cursor_execute", record)
+    yield sent
+    event.remove(postgres_engine.sync_engine, "before_cursor_execute", record)
+
+
+class TestUpdateStatements:
+    """BaseRepository.update runs one UPDATE ... RETURNING."""
+
+    @pytest.mark.asyncio
+    async def test_workflow_status_changes_issue_one_statement_each(
+        self, postgres_engine: AsyncEngine, workflow: Workflow, statements: list[str]
+    ) -> None:
+        """Task, milestone and plan status changes skip the eager relationship loaders."""
+        async with AsyncSession(postgres_engine) as session:
+            await session.connection()
+            statements.clear()
+
+            task = await TaskRepository(session).update(workflow.task_id, status="in_progress")
+            milestone = await MilestoneRepository(session).update(
+                workflow.milestone_id, status="passed"
+            )
+            plan = await ProjectPlanRepository(session).update(workflow.plan_id, status="completed")
+
+        assert statements == ["UPDATE", "UPDATE", "UPDATE"]
+        assert task is not None and task.status == "in_progress"
+        assert milestone is not None and milestone.status == "passed"
+        assert plan is not None and plan.status == "completed"
+
+    @pytest.mark.asyncio
+    async def test_returned_instance_has_no_relationships_loaded(
+        self, postgres_engine: AsyncEngine, workflow: Workflow
+    ) -> None:
+        """Relationships of an instance loaded by the update raise instead of querying."""
+        async with AsyncSession(postgres_engine) as session:
+            task = await TaskRepository(session).update(workflow.task_id, status="in_progress")
+
+            assert task is not None
+            with pytest.raises(InvalidRequestError):
+                _ = task.milestones
+
+    @pytest.mark.asyncio
+    async def test_loaded_instance_keeps_relationships(
+        self, postgres_engine: AsyncEngine, workflow: Workflow, statements: list[str]
+    ) -> None:
+        """An instance already in the session gets the new values and keeps its collections."""
+        async with AsyncSession(postgres_engine) as session:
+            repo = TaskRepository(session)
+            loaded = await repo.get_by_id(workflow.task_id)
+            assert loaded is not None
+            updated_at = loaded.updated_at
+            statements.clear()
+
+            task = await repo.update(workflow.task_id, status="completed")
+
+            assert statements == ["UPDATE"]
+            assert task is loaded
+            assert loaded.status == "completed"
+            assert loaded.updated_at > updated_at
+            assert [milestone.id for milestone in loaded.milestones] == [workflow.milestone_id]
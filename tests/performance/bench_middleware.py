@@ -0,0 +1,136 @@
+"""In-process throughput benchmark of the API middleware stack.
+
+Compares the plain ASGI request ID / logging / gzip middleware with the
+previous BaseHTTPMiddleware implementations on a small JSON endpoint and a
+streamed download. Requests go through httpx's ASGI transport, so the
+numbers measure middleware and framework overhead only (no network, no
+server).
+
+Run with:
+    python tests/performance/bench_middleware.py [--requests 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import AsyncIterator
+
+import httpx
+import structlog
+from fastapi import FastAPI, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+
+from bsai.api.middleware import LoggingMiddleware, RequestIDMiddleware, SelectiveGZipMiddleware
+
+logger = structlog.get_logger()
+
+
+class BaseHTTPRequestIDMiddleware(BaseHTTPMiddleware):
+    """Previous RequestIDMiddleware, for comparison."""
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+        request.state.request_id = request_id
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+class BaseHTTPLoggingMiddleware(BaseHTTPMiddleware):
+    """Previous LoggingMiddleware, for comparison."""
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        start_time = time.perf_counter()
+        request_id = getattr(request.state, "request_id", "unknown")
+        logger.info(
+            "request_started",
+            request_id=request_id,
+            method=request.method,
+            path=request.url.path,
+            query=str(request.query_params),
+        )
+        response = await call_next(request)
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        logger.info(
+            "request_completed",
+            request_id=request_id,
+            method=request.method,
+            path=request.url.path,
+            status_code=response.status_code,
+            duration_ms=round(duration_ms, 2),
+        )
+        response.headers["X-Response-Time"] = f"{duration_ms:.2f}ms"
+        return response
+
+
+def build_app(pure_asgi: bool) -> FastAPI:
+    """Build a minimal app with the old or new middleware stack."""
+    app = FastAPI()
+    if pure_asgi:
+        app.add_middleware(SelectiveGZipMiddleware, minimum_size=1000)
+        app.add_middleware(LoggingMiddleware)
+        app.add_middleware(RequestIDMiddleware)
+    else:
+        app.add_middleware(GZipMiddleware, minimum_size=1000)
+        app.add_middleware(BaseHTTPLoggingMiddleware)
+        app.add_middleware(BaseHTTPRequestIDMiddleware)
+
+    @app.get("/items")
+    async def items() -> dict[str, list[int]]:
+        return {"items": list(range(20))}
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for _ in range(16):
+            yield b"x" * 4096
+
+    @app.get("/artifacts/download/zip")
+    async def download() -> StreamingResponse:
+        return StreamingResponse(chunks(), media_type="application/zip")
+
+    return app
+
+
+async def measure(app: FastAPI, path: str, requests: int, concurrency: int) -> float:
+    """Send requests to the app and return requests per second."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        headers = {"Accept-Encoding": "gzip"}
+        await client.get(path, headers=headers)  # warm-up
+
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                response = await client.get(path, headers=headers)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        per_worker = requests // concurrency
+        await asyncio.gather(*(worker(per_worker) for _ in range(concurrency)))
+        return per_worker * concurrency / (time.perf_counter() - start)
+
+
+async def main(requests: int, concurrency: int) -> None:
+    """Run the benchmark for both stacks and print requests per second."""
+    # Keep log rendering out of the measurement
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    for path in ("/items", "/artifacts/download/zip"):
+        before = await measure(build_app(pure_asgi=False), path, requests, concurrency)
+        after = await measure(build_app(pure_asgi=True), path, requests, concurrency)
+        print(
+            f"{path:<28} BaseHTTPMiddleware {before:8.0f} req/s   "
+            f"pure ASGI {after:8.0f} req/s   ({after / before:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
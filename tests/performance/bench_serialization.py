@@ -0,0 +1,124 @@
+"""Serialization benchmark for large context payloads.
+
+Compares the standard library ``json`` paths the API used before with
+``bsai.serialization`` on:
+
+- a cached session context (``SessionCache.cache_context`` payload)
+  with a long message history
+- an embedding vector (``EmbeddingService`` cache entry)
+- a WebSocket broadcast of one message to many connections
+  (encoded per connection before, once per broadcast now)
+- an explicit JSON response body
+
+Run with:
+    python tests/performance/bench_serialization.py [--messages 200] [--repeat 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import string
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from bsai.api.schemas.websocket import WSMessage, WSMessageType
+from bsai.serialization import FastJSONResponse, dumps, dumps_model, loads
+
+
+def _text(length: int) -> str:
+    return "".join(random.choices(string.ascii_letters + " \n", k=length))
+
+
+def context_payload(messages: int) -> dict[str, Any]:
+    """Build a cache_context payload with a long message history."""
+    return {
+        "messages": [
+            {"role": "user" if i % 2 else "assistant", "content": _text(2000)}
+            for i in range(messages)
+        ],
+        "summary": _text(1000),
+        "token_count": messages * 500,
+        "cached_at": datetime.now(UTC).isoformat(),
+    }
+
+
+def timed(func: Callable[[], Any], repeat: int) -> float:
+    """Return the mean milliseconds per call."""
+    func()  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def report(name: str, before: float, after: float) -> None:
+    """Print one comparison line."""
+    print(f"{name:<36} json {before:9.3f} ms   orjson {after:9.3f} ms   ({before / after:.1f}x)")
+
+
+def main(messages: int, repeat: int, connections: int) -> None:
+    """Run all comparisons."""
+    context = context_payload(messages)
+    encoded = json.dumps(context)
+    print(f"context payload: {messages} messages, {len(encoded) / 1024:.0f} KiB")
+
+    report(
+        "context encode",
+        timed(lambda: json.dumps(context), repeat),
+        timed(lambda: dumps(context), repeat),
+    )
+    report(
+        "context decode",
+        timed(lambda: json.loads(encoded), repeat),
+        timed(lambda: loads(encoded), repeat),
+    )
+
+    embedding = [random.uniform(-1, 1) for _ in range(1536)]
+    embedding_json = json.dumps(embedding)
+    report(
+        "embedding encode (1536 floats)",
+        timed(lambda: json.dumps(embedding), repeat),
+        timed(lambda: dumps(embedding), repeat),
+    )
+    report(
+        "embedding decode (1536 floats)",
+        timed(lambda: json.loads(embedding_json), repeat),
+        timed(lambda: loads(embedding_json), repeat),
+    )
+
+    message = WSMessage(type=WSMessageType.LLM_CHUNK, payload={"context": context["messages"][:20]})
+
+    def broadcast_before() -> None:
+        for _ in range(connections):
+            json.dumps(message.model_dump(mode="json"), separators=(",", ":"))
+
+    def broadcast_after() -> None:
+        payload = dumps_model(message)
+        for _ in range(connections):
+            payload.encode()
+
+    report(
+        f"ws broadcast ({connections} connections)",
+        timed(broadcast_before, repeat),
+        timed(broadcast_after, repeat),
+    )
+    report(
+        "response body render",
+        timed(lambda: JSONResponse(context), repeat),
+        timed(lambda: FastJSONResponse(context), repeat),
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--connections", type=int, default=20)
+    args = parser.parse_args()
+    main(args.messages, args.repeat, args.connections)
@@ -9,6 +9,7 @@ import pytest
 
 from bsai.core.qa_agent import QAAgent, QADecision
 from bsai.llm import LLMModel, LLMResponse, UsageInfo
+from bsai.prompts import QAAgentPrompts
 
 
 @pytest.fixture
@@ -332,12 +333,17 @@ class TestQAAgent:
             session_id=session_id,
         )
 
-        # Verify prompt was rendered with correct arguments
-        mock_prompt_manager.render.assert_called_once()
-        render_call = mock_prompt_manager.render.call_args
-        assert render_call.kwargs["milestone_description"] == "Test milestone"
-        assert render_call.kwargs["acceptance_criteria"] == "Must be done"
-        assert render_call.kwargs["worker_output"] == "Output content"
+        # Verify prompts were rendered: validation prompt, then static system prompt
+        validation_call, system_call = mock_prompt_manager.render.call_args_list
+        assert validation_call.kwargs["milestone_description"] == "Test milestone"
+        assert validation_call.kwargs["acceptance_criteria"] == "Must be done"
+        assert validation_call.kwargs["worker_output"] == "Output content"
+        assert system_call.args == ("qa_agent", QAAgentPrompts.SYSTEM_PROMPT)
+
+        # Static instructions form a cacheable prefix before the dynamic content
+        system, user = mock_llm_client.chat_completion.call_args.kwargs["request"].messages
+        assert (system.role, system.cache_control) == ("system", True)
+        assert (user.role, user.cache_control) == ("user", False)
 
     @pytest.mark.asyncio
     async def test_validate_output_cost_tracking(
@@ -8,7 +8,7 @@ import pytest
 
 from bsai.core.worker import WorkerAgent
 from bsai.db.models.enums import TaskComplexity
-from bsai.llm import LLMModel, LLMResponse, UsageInfo
+from bsai.llm import ChatMessage, LLMModel, LLMResponse, UsageInfo
 
 
 @pytest.fixture
@@ -31,7 +31,7 @@ def mock_router() -> MagicMock:
         context_window=128000,
         supports_streaming=True,
     )
-    router.calculate_cost.return_value = Decimal("0.005")
+    router.calculate_usage_cost.return_value = Decimal("0.005")
     return router
 
 
@@ -194,11 +194,15 @@ class TestWorkerAgent:
             session_id=uuid4(),
         )
 
-        # Verify cost calculation
-        mock_router.calculate_cost.assert_called_once()
-        call_args = mock_router.calculate_cost.call_args
-        assert call_args.kwargs["input_tokens"] == 1000
-        assert call_args.kwargs["output_tokens"] == 500
+        # Verify cost calculation uses the model that served the response
+        mock_router.served_model.assert_called_once_with(
+            mock_router.select_model.return_value, "test-model"
+        )
+        mock_router.calculate_usage_cost.assert_called_once()
+        call_args = mock_router.calculate_usage_cost.call_args
+        assert call_args.kwargs["model"] is mock_router.served_model.return_value
+        assert call_args.kwargs["usage"].input_tokens == 1000
+        assert call_args.kwargs["usage"].output_tokens == 500
 
     @pytest.mark.asyncio
     async def test_retry_with_feedback(
@@ -246,6 +250,49 @@ class TestWorkerAgent:
         assert first_call.kwargs["qa_feedback"] == qa_feedback
         assert first_call.kwargs["original_prompt"] == original_prompt
 
+    @pytest.mark.asyncio
+    async def test_retry_keeps_cacheable_prefix(
+        self,
+        worker: WorkerAgent,
+        mock_llm_client: MagicMock,
+        mock_prompt_manager: MagicMock,
+    ) -> None:
+        """Test that system prompt and history precede the volatile file list."""
+        mock_prompt_manager.render.side_effect = ["Retry prompt", "System prompt"]
+        mock_llm_client.chat_completion.return_value = LLMResponse(
+            content="Improved implementation",
+            usage=UsageInfo(input_tokens=600, output_tokens=400, total_tokens=1000),
+            model="test-model",
+        )
+        history = [
+            ChatMessage(role="user", content="Earlier request"),
+            ChatMessage(role="assistant", content="Earlier answer"),
+        ]
+        files = ChatMessage(role="system", content="## Session Files")
+
+        await worker.retry_with_feedback(
+            milestone_id=uuid4(),
+            original_prompt="Implement feature X",
+            previous_output="Incomplete implementation",
+            qa_feedback="Missing error handling",
+            complexity=TaskComplexity.MODERATE,
+            user_id="test-user",
+            session_id=uuid4(),
+            context_messages=history,
+            artifacts_context=files,
+        )
+
+        messages = mock_llm_client.chat_completion.call_args.kwargs["request"].messages
+        assert [m.content for m in messages] == [
+            "System prompt",
+            "Earlier request",
+            "Earlier answer",
+            "## Session Files",
+            "Retry prompt",
+        ]
+        assert [m.cache_control for m in messages] == [True, False, True, False, False]
+        assert history[-1].cache_control is False
+
     @pytest.mark.asyncio
     async def test_execute_milestone_all_complexities(
         self,
@@ -198,7 +198,85 @@ class TestSessionCache:
 
         await cache.invalidate_task_progress(task_id)
 
-        mock_redis_client.client.delete.assert_called_once_with(f"task:{task_id}:progress")
+        mock_redis_client.client.delete.assert_called_once_with(
+            f"task:{task_id}:progress", f"task:{task_id}:progress_counters"
+        )
+
+    # Task Progress Counter Tests
+
+    @pytest.mark.asyncio
+    async def test_seed_task_progress_counters(self, cache, mock_redis_client):
+        """Test seeding progress counters in one transaction."""
+        task_id = uuid4()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        mock_redis_client.client.pipeline = MagicMock()
+        mock_redis_client.client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+        mock_redis_client.client.pipeline.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        await cache.seed_task_progress_counters(task_id, "user-1", {"pending": 3}, "T1")
+
+        key = f"task:{task_id}:progress_counters"
+        pipe.delete.assert_called_once_with(key)
+        pipe.hset.assert_called_once_with(
+            key,
+            mapping={
+                "pending": 3,
+                "in_progress": 0,
+                "completed": 0,
+                "failed": 0,
+                "user_id": "user-1",
+                "current_task": "T1",
+            },
+        )
+        pipe.expire.assert_called_once_with(key, SessionCache.TASK_PROGRESS_TTL)
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_apply_task_progress_transition(self, cache, mock_redis_client):
+        """Test that transitions run as a single script and report cache misses."""
+        task_id = uuid4()
+        mock_redis_client.client.eval = AsyncMock(return_value=0)
+
+        applied = await cache.apply_task_progress_transition(
+            task_id, "pending", "in_progress", current_task="T1"
+        )
+
+        assert applied is False
+        args = mock_redis_client.client.eval.call_args[0]
+        assert args[1:] == (
+            1,
+            f"task:{task_id}:progress_counters",
+            "pending",
+            "in_progress",
+            "T1",
+            SessionCache.TASK_PROGRESS_TTL,
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_task_progress_counters(self, cache, mock_redis_client):
+        """Test reading progress counters."""
+        mock_redis_client.client.hgetall = AsyncMock(
+            return_value={"pending": "2", "completed": "1", "user_id": "u", "current_task": ""}
+        )
+
+        result = await cache.get_task_progress_counters(uuid4())
+
+        assert result == {
+            "pending": 2,
+            "in_progress": 0,
+            "completed": 1,
+            "failed": 0,
+            "user_id": "u",
+            "current_task": None,
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_task_progress_counters_missing(self, cache, mock_redis_client):
+        """Test reading missing progress counters."""
+        mock_redis_client.client.hgetall = AsyncMock(return_value={})
+
+        assert await cache.get_task_progress_counters(uuid4()) is None
 
     # User Sessions Tests
 
@@ -235,6 +313,23 @@ class TestSessionCache:
 
         mock_redis_client.client.delete.assert_called_once_with(f"user:{user_id}:sessions")
 
+    @pytest.mark.asyncio
+    async def test_mark_recent_write(self, cache, mock_redis_client):
+        """Test recording a user's recent write with a millisecond TTL."""
+        await cache.mark_recent_write("test-user-123", 2.5)
+
+        mock_redis_client.client.set.assert_called_once_with(
+            "user:test-user-123:recent_write", "1", px=2500
+        )
+
+    @pytest.mark.asyncio
+    async def test_has_recent_write(self, cache, mock_redis_client):
+        """Test checking a user's recent write."""
+        mock_redis_client.client.exists = AsyncMock(return_value=1)
+
+        assert await cache.has_recent_write("test-user-123") is True
+        mock_redis_client.client.exists.assert_called_once_with("user:test-user-123:recent_write")
+
     # WebSocket Connection Tests
 
     @pytest.mark.asyncio
@@ -0,0 +1,161 @@
+"""Tests for QAAgent."""
+
+import asyncio
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from bsai.core.qa_agent import QAAgent, QADecision
+from bsai.llm.schemas import LintResult, QAConfig, QAOutput
+from bsai.services.qa_scope import ValidationScope
+from bsai.services.qa_workspace import QAWorkspace, QAWorkspaceManager
+
+
+def _qa_output(decision: str = "PASS") -> QAOutput:
+    return QAOutput(
+        decision=decision,  # type: ignore[arg-type]
+        feedback="looks good",
+        issues=[],
+        suggestions=[],
+        plan_viability="VIABLE",
+        plan_viability_reason=None,
+        confidence=0.9,
+    )
+
+
+@pytest.fixture
+def agent(tmp_path: Path) -> QAAgent:
+    """Create a QAAgent with mocked dependencies."""
+    qa = QAAgent(
+        llm_client=MagicMock(),
+        router=MagicMock(),
+        prompt_manager=MagicMock(),
+        session=MagicMock(),
+        qa_config=QAConfig(validations=["static", "lint"]),
+        workspace_manager=QAWorkspaceManager(root=tmp_path),
+    )
+    qa._update_milestone_status = AsyncMock()  # type: ignore[method-assign]
+    return qa
+
+
+async def _validate(agent: QAAgent, **kwargs: object) -> tuple[QADecision, str, QAOutput]:
+    return await agent.validate_output(  # type: ignore[arg-type]
+        milestone_id=uuid4(),
+        milestone_description="desc",
+        acceptance_criteria="criteria",
+        worker_output="output",
+        user_id="user-1",
+        session_id=uuid4(),
+        **kwargs,
+    )
+
+
+class TestValidateOutputConcurrency:
+    """Tests for running static and dynamic validation together."""
+
+    async def test_static_and_dynamic_overlap(self, agent: QAAgent) -> None:
+        """Test that the LLM review and dynamic validations run concurrently."""
+
+        async def static(**kwargs: object) -> QAOutput:
+            await asyncio.sleep(0.2)
+            return _qa_output()
+
+        async def dynamic(*args: object) -> dict[str, LintResult | None]:
+            await asyncio.sleep(0.2)
+            return {"lint": LintResult(success=False, errors=1, warnings=0, output="E1")}
+
+        with (
+            patch.object(agent, "_run_static_analysis", side_effect=static),
+            patch.object(agent, "_run_dynamic_validations", side_effect=dynamic),
+        ):
+            start = time.monotonic()
+            decision, feedback, output = await _validate(agent)
+            elapsed = time.monotonic() - start
+
+        assert elapsed < 0.35
+        assert decision == QADecision.RETRY
+        assert "Lint: FAIL" in feedback
+        assert output.decision == "PASS"
+
+    async def test_static_failure_cancels_dynamic(self, agent: QAAgent) -> None:
+        """Test that dynamic validations are cancelled when the LLM review fails."""
+        dynamic_cancelled = asyncio.Event()
+
+        async def dynamic(*args: object) -> dict[str, LintResult | None]:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                dynamic_cancelled.set()
+                raise
+            return {}
+
+        async def static(**kwargs: object) -> QAOutput:
+            await asyncio.sleep(0.05)
+            raise ValueError("Failed to parse QA response")
+
+        with (
+            patch.object(agent, "_run_static_analysis", side_effect=static),
+            patch.object(agent, "_run_dynamic_validations", side_effect=dynamic),
+            pytest.raises(ValueError, match="Failed to parse QA"),
+        ):
+            await asyncio.wait_for(_validate(agent), timeout=2)
+
+        assert dynamic_cancelled.is_set()
+        agent._update_milestone_status.assert_not_called()  # type: ignore[attr-defined]
+
+
+class TestValidateOutputWorkspace:
+    """Tests for running dynamic validations against the task snapshot."""
+
+    async def test_dynamic_validations_run_in_task_workspace(self, agent: QAAgent) -> None:
+        """Test that the task's artifacts are materialized and passed to the runner."""
+        task_id = uuid4()
+        artifact = MagicMock(filename="app.py", path="src", content="x = 1\n")
+        agent.artifact_repo.get_by_task_id = AsyncMock(return_value=[artifact])  # type: ignore[method-assign]
+
+        with (
+            patch.object(agent, "_run_static_analysis", AsyncMock(return_value=_qa_output())),
+            patch("bsai.core.qa_agent.QARunner") as MockRunner,
+        ):
+            MockRunner.return_value.run_all_validations = AsyncMock(return_value={})
+            decision, _, _ = await _validate(agent, task_id=task_id)
+
+        workspace = MockRunner.call_args.kwargs["workspace"]
+        assert decision == QADecision.PASS
+        assert workspace.task_id == task_id
+        assert (workspace.path / "src" / "app.py").read_text() == "x = 1\n"
+        assert MockRunner.call_args.kwargs["result_cache"] is agent.workspace_manager.result_cache
+
+    async def test_static_only_skips_workspace(self, agent: QAAgent) -> None:
+        """Test that no snapshot is loaded when only static analysis is configured."""
+        agent.qa_config = QAConfig(validations=["static"])
+        agent.artifact_repo.get_by_task_id = AsyncMock()  # type: ignore[method-assign]
+
+        with patch.object(agent, "_run_static_analysis", AsyncMock(return_value=_qa_output())):
+            await _validate(agent, task_id=uuid4())
+
+        agent.artifact_repo.get_by_task_id.assert_not_called()
+
+
+class TestIncrementalReport:
+    """Tests for incremental validation reporting."""
+
+    def test_time_saved_against_full_run_baseline(self, agent: QAAgent) -> None:
+        """Test that full runs become baselines and scoped runs report savings."""
+        task_id = uuid4()
+        workspace = QAWorkspace(task_id=task_id, path=Path("."), snapshot_hash="h")
+        scope = ValidationScope(full_run=False, changed=("a.py",))
+        agent.workspace_manager.record_full_run(task_id, "lint", 10.0)
+        runner = MagicMock(
+            modes={"lint": "incremental", "build": "full"},
+            durations={"lint": 2.5, "build": 30.0},
+        )
+
+        report = agent._build_incremental_report(runner, workspace, scope)
+
+        assert report.time_saved_seconds == pytest.approx(7.5)
+        assert agent.workspace_manager.full_run_baseline(task_id, "build") == 30.0
+        assert "~7.5s saved" in report.summary_line()
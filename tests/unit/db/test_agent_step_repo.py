@@ -4,11 +4,13 @@ Note: Business logic methods (start_step, complete_step) have been moved
 to AgentStepService. This file tests only the pure query methods.
 """
 
+from datetime import datetime
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from bsai.db.repository.agent_step_repo import AgentStepRepository
 
@@ -132,6 +134,62 @@ class TestAgentStepRepository:
         assert result == []
 
 
+class TestAgentStepRepositoryBulkUpdate:
+    """Tests for AgentStepRepository.update_many."""
+
+    @pytest.mark.asyncio
+    async def test_update_many_sends_rows_as_executemany(self) -> None:
+        """update_many binds the full primary key and sends one batch."""
+        session = AsyncMock()
+        repository = AgentStepRepository(session)
+        created_at = datetime(2026, 10, 19, 12, 0)
+        rows = [
+            {"id": uuid4(), "created_at": created_at, "status": "completed"},
+            {"id": uuid4(), "created_at": created_at, "status": "failed"},
+        ]
+
+        count = await repository.update_many(rows)
+
+        assert count == 2
+        session.execute.assert_awaited_once()
+        params = session.execute.await_args.args[1]
+        assert params == [
+            {"b_id": row["id"], "b_created_at": created_at, "status": row["status"]} for row in rows
+        ]
+
+    @pytest.mark.asyncio
+    async def test_update_many_batches_by_column_set(self) -> None:
+        """Rows updating different columns go to separate statements."""
+        session = AsyncMock()
+        created_at = datetime(2026, 10, 19, 12, 0)
+        rows = [
+            {"id": uuid4(), "created_at": created_at, "status": "completed"},
+            {"id": uuid4(), "created_at": created_at, "status": "failed", "error_message": "x"},
+        ]
+
+        await AgentStepRepository(session).update_many(rows)
+
+        assert session.execute.await_count == 2
+
+    def test_update_statement_addresses_partitioned_primary_key(self) -> None:
+        """The UPDATE matches on id and the created_at partition key."""
+        statement = AgentStepRepository.update_by_key_statement(("status", "output_tokens"))
+
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("UPDATE agent_steps SET status=")
+        assert "output_tokens=%(output_tokens)s" in sql
+        assert "WHERE agent_steps.id = %(b_id)s" in sql
+        assert "AND agent_steps.created_at = %(b_created_at)s" in sql
+
+    @pytest.mark.asyncio
+    async def test_update_many_empty_is_noop(self) -> None:
+        """update_many with no rows skips the database."""
+        session = AsyncMock()
+        assert await AgentStepRepository(session).update_many([]) == 0
+        session.execute.assert_not_called()
+
+
 class TestAgentStepRepositoryCostBreakdown:
     """Tests for cost breakdown functionality."""
 
@@ -137,6 +137,49 @@ class TestGetLatestSnapshot:
         assert result == []
 
 
+class TestListPages:
+    """Tests for SQL-side paginated listings."""
+
+    async def test_list_task_page_without_content(
+        self,
+        repo: ArtifactRepository,
+        mock_session: AsyncMock,
+    ):
+        """Test that a page is limited in SQL and does not select content."""
+        artifact = _create_mock_artifact(uuid4(), "main.py", "")
+
+        count_result = MagicMock()
+        count_result.scalar_one.return_value = 3
+        page_result = MagicMock()
+        page_result.scalars.return_value.all.return_value = [artifact]
+        mock_session.execute.side_effect = [count_result, page_result]
+
+        items, total = await repo.list_task_page(uuid4(), limit=1, offset=2, include_content=False)
+
+        assert items == [artifact]
+        assert total == 3
+        sql = str(mock_session.execute.call_args_list[1].args[0])
+        assert "LIMIT" in sql and "OFFSET" in sql
+        assert "octet_length(artifacts.content)" in sql
+        assert "artifacts.content," not in sql
+
+    async def test_list_session_page_offset_past_end(
+        self,
+        repo: ArtifactRepository,
+        mock_session: AsyncMock,
+    ):
+        """Test that no page query runs when the offset is past the total."""
+        count_result = MagicMock()
+        count_result.scalar_one.return_value = 2
+        mock_session.execute.return_value = count_result
+
+        items, total = await repo.list_session_page(uuid4(), limit=10, offset=5)
+
+        assert items == []
+        assert total == 2
+        assert mock_session.execute.call_count == 1
+
+
 class TestSaveTaskSnapshot:
     """Tests for save_task_snapshot method with upsert logic."""
 
@@ -0,0 +1,96 @@
+"""Tests for log table partition maintenance."""
+
+from __future__ import annotations
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from bsai.db.partitions import PARTITIONED_LOG_TABLES, add_months, maintain_log_partitions
+
+
+def _scalar(value: object) -> MagicMock:
+    result = MagicMock()
+    result.scalar_one.return_value = value
+    return result
+
+
+def _sql(call: object) -> tuple[str, dict[str, object]]:
+    compiled = call.args[0].compile(dialect=postgresql.dialect())  # type: ignore[attr-defined]
+    return str(compiled), compiled.params
+
+
+class TestAddMonths:
+    """Tests for month arithmetic."""
+
+    @pytest.mark.parametrize(
+        ("month", "months", "expected"),
+        [
+            (date(2026, 10, 18), 0, date(2026, 10, 1)),
+            (date(2026, 10, 18), 3, date(2027, 1, 1)),
+            (date(2026, 1, 31), -1, date(2025, 12, 1)),
+            (date(2026, 10, 1), -12, date(2025, 10, 1)),
+        ],
+    )
+    def test_add_months(self, month: date, months: int, expected: date) -> None:
+        """Test that results are first days of the shifted month."""
+        assert add_months(month, months) == expected
+
+
+class TestMaintainLogPartitions:
+    """Tests for maintain_log_partitions."""
+
+    @pytest.mark.asyncio
+    async def test_creates_upcoming_and_drops_expired_partitions(self) -> None:
+        """Test that every log table gets its partitions created and trimmed."""
+        session = AsyncMock()
+        session.execute = AsyncMock(
+            side_effect=[_scalar(True)] + [_scalar(1), _scalar(2)] * len(PARTITIONED_LOG_TABLES)
+        )
+
+        result = await maintain_log_partitions(
+            session, months_ahead=3, retention_months=12, today=date(2026, 10, 18)
+        )
+
+        assert result is not None
+        assert (result.created, result.dropped) == (3, 6)
+        session.commit.assert_awaited_once()
+
+        calls = session.execute.call_args_list
+        create_sql, create_params = _sql(calls[1])
+        assert "bsai_create_log_partitions" in create_sql
+        assert list(create_params.values()) == [
+            "agent_steps",
+            date(2026, 10, 1),
+            date(2027, 1, 1),
+        ]
+        drop_sql, drop_params = _sql(calls[2])
+        assert "bsai_drop_log_partitions" in drop_sql
+        assert list(drop_params.values()) == ["agent_steps", date(2025, 10, 1)]
+
+    @pytest.mark.asyncio
+    async def test_keeps_all_partitions_without_retention(self) -> None:
+        """Test that no partition is dropped when retention is disabled."""
+        session = AsyncMock()
+        session.execute = AsyncMock(
+            side_effect=[_scalar(True)] + [_scalar(0)] * len(PARTITIONED_LOG_TABLES)
+        )
+
+        result = await maintain_log_partitions(session, months_ahead=1, today=date(2026, 10, 18))
+
+        assert result is not None
+        assert result.dropped == 0
+        assert session.execute.await_count == 1 + len(PARTITIONED_LOG_TABLES)
+
+    @pytest.mark.asyncio
+    async def test_skips_when_another_process_holds_the_lock(self) -> None:
+        """Test that concurrent maintenance runs do nothing."""
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=_scalar(False))
+
+        assert await maintain_log_partitions(session, months_ahead=3) is None
+        session.execute.assert_awaited_once()
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_called()
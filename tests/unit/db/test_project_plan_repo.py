@@ -0,0 +1,68 @@
+"""Project plan repository tests."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from bsai.db.repository.project_plan_repo import ProjectPlanRepository
+
+
+@pytest.fixture
+def mock_session() -> AsyncMock:
+    """Create mock database session."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def plan_repo(mock_session: AsyncMock) -> ProjectPlanRepository:
+    """Create project plan repository."""
+    return ProjectPlanRepository(mock_session)
+
+
+class TestUpdateTaskFields:
+    """Tests for update_task_fields method."""
+
+    @pytest.mark.asyncio
+    async def test_sets_only_task_fields_at_index_path(
+        self,
+        plan_repo: ProjectPlanRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Merges the changed fields into one task with jsonb_set."""
+        plan_id = uuid4()
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = plan_id
+        mock_session.execute.return_value = mock_result
+
+        updated = await plan_repo.update_task_fields(
+            plan_id, 3, "T1.2", {"status": "completed"}, completed_tasks=4
+        )
+
+        assert updated is True
+        compiled = mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        assert "SET plan_data=jsonb_set(project_plans.plan_data" in sql
+        assert "(project_plans.plan_data #> %(plan_data_1)s) || CAST(" in sql
+        assert "(project_plans.plan_data #>> %(plan_data_2)s) = " in sql
+        assert "completed_tasks=" in sql
+        assert compiled.params["param_1"] == ["tasks", "3"]
+        assert compiled.params["plan_data_2"] == ("tasks", "3", "id")
+        # Only the changed fields are sent, never the whole document
+        assert {"status": "completed"} in compiled.params.values()
+
+    @pytest.mark.asyncio
+    async def test_returns_false_for_stale_index(
+        self,
+        plan_repo: ProjectPlanRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Reports no update when the task ID at the index does not match."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        assert not await plan_repo.update_task_fields(uuid4(), 0, "T9", {"status": "failed"})
@@ -1,11 +1,15 @@
 """Tests for repository layer."""
 
+from datetime import datetime, timedelta
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
+from bsai.db.repository.base import InvalidCursorError, decode_cursor, encode_cursor
+from bsai.db.repository.episodic_memory_repo import EpisodicMemoryRepository
 from bsai.db.repository.session_repo import SessionRepository
 
 
@@ -249,9 +253,26 @@ class TestBaseRepositoryOperations:
         assert result == []
         mock_session.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_create_many_issues_single_insert(self, repository, mock_session):
+        """Test bulk insert uses one multi-row INSERT."""
+        rows = [{"id": uuid4(), "user_id": "u1"}, {"id": uuid4(), "user_id": "u2"}]
+
+        count = await repository.create_many(rows)
+
+        assert count == 2
+        mock_session.execute.assert_called_once()
+        mock_session.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_many_empty_is_noop(self, repository, mock_session):
+        """Test bulk insert with no rows skips the database."""
+        assert await repository.create_many([]) == 0
+        mock_session.execute.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_update(self, repository, mock_session):
-        """Test updating a record."""
+        """Test updating a record with a single UPDATE ... RETURNING."""
         record_id = uuid4()
         mock_instance = MagicMock()
         mock_result = MagicMock()
@@ -261,7 +282,25 @@ class TestBaseRepositoryOperations:
         result = await repository.update(record_id, status="completed")
 
         assert result == mock_instance
-        assert mock_instance.status == "completed"
+        mock_session.execute.assert_called_once()
+        mock_session.flush.assert_not_called()
+        mock_session.refresh.assert_not_called()
+        stmt = mock_session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE sessions SET status=")
+        assert "updated_at=now()" in sql
+        assert "RETURNING sessions.id" in sql
+        assert stmt.get_execution_options()["synchronize_session"] == "fetch"
+
+    @pytest.mark.asyncio
+    async def test_update_without_values_loads_record(self, repository, mock_session):
+        """Test that an update without attributes issues no UPDATE."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        assert await repository.update(uuid4()) is None
+        assert str(mock_session.execute.call_args.args[0]).startswith("SELECT")
 
     @pytest.mark.asyncio
     async def test_update_not_found(self, repository, mock_session):
@@ -300,3 +339,103 @@ class TestBaseRepositoryOperations:
         result = await repository.delete(record_id)
 
         assert result is False
+
+    @pytest.mark.asyncio
+    async def test_delete_without_cascades_is_single_statement(self, mock_session):
+        """Test that models without delete cascades use DELETE ... RETURNING."""
+        repository = EpisodicMemoryRepository(mock_session)
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = uuid4()
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.delete(uuid4())
+
+        assert result is True
+        mock_session.execute.assert_called_once()
+        mock_session.delete.assert_not_called()
+        sql = str(mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("DELETE FROM episodic_memories WHERE")
+        assert sql.endswith("RETURNING episodic_memories.id")
+
+
+class TestKeysetPagination:
+    """Tests for cursor pagination in the base repository."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Create a mock database session."""
+        session = AsyncMock()
+        session.execute = AsyncMock()
+        return session
+
+    @pytest.fixture
+    def repository(self, mock_session):
+        """Create repository with mock session."""
+        return SessionRepository(mock_session)
+
+    def _rows(self, count: int) -> list[MagicMock]:
+        start = datetime(2026, 1, 1, 12, 0, 0)
+        return [
+            MagicMock(id=uuid4(), created_at=start - timedelta(minutes=i)) for i in range(count)
+        ]
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes to the encoded position."""
+        created_at = datetime(2026, 1, 1, 12, 0, 0, 123456)
+        record_id = uuid4()
+
+        cursor = encode_cursor(created_at, record_id)
+
+        assert decode_cursor(cursor) == (created_at, record_id)
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "WyJ4Il0"])
+    def test_invalid_cursor(self, cursor):
+        """Test that malformed cursors are rejected."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+    @pytest.mark.asyncio
+    async def test_paginate_returns_cursor_of_last_row(self, repository, mock_session):
+        """Test that an extra row yields the cursor of the page's last row."""
+        rows = self._rows(3)
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = rows
+        mock_session.execute.return_value = mock_result
+
+        page = await repository.list_by_user("user-1", status="active", limit=2)
+
+        assert page.items == rows[:2]
+        assert page.next_cursor == encode_cursor(rows[1].created_at, rows[1].id)
+        sql = str(mock_session.execute.call_args.args[0])
+        assert "sessions.status = " in sql
+        assert "ORDER BY sessions.created_at DESC, sessions.id DESC" in sql
+        assert "OFFSET" not in sql
+
+    @pytest.mark.asyncio
+    async def test_paginate_seeks_past_cursor(self, repository, mock_session):
+        """Test that a cursor becomes a row-value comparison instead of an offset."""
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = self._rows(1)
+        mock_session.execute.return_value = mock_result
+        cursor = encode_cursor(datetime(2026, 1, 1), uuid4())
+
+        page = await repository.list_by_user("user-1", limit=2, cursor=cursor, offset=40)
+
+        assert page.next_cursor is None
+        sql = str(mock_session.execute.call_args.args[0])
+        assert "(sessions.created_at, sessions.id) < (" in sql
+        # Plain bound on created_at so partitioned tables are pruned
+        assert "sessions.created_at <= " in sql
+        assert "OFFSET" not in sql
+
+    @pytest.mark.asyncio
+    async def test_count_or_estimate(self, repository, mock_session):
+        """Test that the exact count only runs below the estimate threshold."""
+        estimate = MagicMock()
+        estimate.scalar_one.return_value = [{"Plan": {"Plan Rows": 50}}]
+        count = MagicMock()
+        count.scalar_one.return_value = 42
+        mock_session.execute.side_effect = [estimate, count, estimate]
+
+        assert await repository.count_or_estimate(threshold=100) == (42, False)
+        assert await repository.count_or_estimate(threshold=10) == (50, True)
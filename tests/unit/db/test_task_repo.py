@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from bsai.db.repository.task_repo import TaskRepository
 
@@ -226,8 +227,9 @@ class TestSaveHandoverContext:
 
         result = await task_repo.save_handover_context(task_id, handover)
 
-        assert result is not None
-        assert mock_task.handover_context == handover
+        assert result is mock_task
+        stmt = mock_session.execute.call_args.args[0]
+        assert stmt.compile().params["handover_context"] == handover
 
     @pytest.mark.asyncio
     async def test_returns_none_when_not_found(
@@ -284,3 +286,37 @@ class TestGetPreviousTaskHandover:
         result = await task_repo.get_previous_task_handover(session_id)
 
         assert result is None
+
+
+class TestGetFirstRequests:
+    """Tests for get_first_requests method."""
+
+    @pytest.mark.asyncio
+    async def test_uses_distinct_on_session(
+        self,
+        task_repo: TaskRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """One query keeps the oldest task of each session."""
+        session_id = uuid4()
+        mock_result = MagicMock()
+        mock_result.all.return_value = [(session_id, "Build a")]
+        mock_session.execute.return_value = mock_result
+
+        result = await task_repo.get_first_requests([session_id], max_length=7)
+
+        assert result == {session_id: "Build a"}
+        stmt = mock_session.execute.await_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("SELECT DISTINCT ON (tasks.session_id) tasks.session_id")
+        assert sql.endswith("ORDER BY tasks.session_id, tasks.created_at ASC, tasks.id ASC")
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_query(
+        self,
+        task_repo: TaskRepository,
+        mock_session: AsyncMock,
+    ) -> None:
+        """No session IDs means no query."""
+        assert await task_repo.get_first_requests([], max_length=10) == {}
+        mock_session.execute.assert_not_called()
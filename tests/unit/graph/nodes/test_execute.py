@@ -6,11 +6,12 @@ from uuid import uuid4
 import pytest
 from langchain_core.runnables import RunnableConfig
 
-from bsai.core.artifact_extractor import ExtractionResult
+from bsai.core.artifact_extractor import ExtractedArtifact, ExtractionResult
 from bsai.graph.nodes.execute import (
     _build_artifacts_context_message,
     _get_artifact_key,
     _prepare_worker_prompt,
+    _track_changed_files,
     execute_worker_node,
 )
 from bsai.graph.state import AgentState
@@ -93,7 +94,7 @@ class TestExecuteWorkerNode:
 
             # Setup mock repos
             mock_plan_repo = MagicMock()
-            mock_plan_repo.update = AsyncMock()
+            mock_plan_repo.update_task_fields = AsyncMock(return_value=True)
             MockPlanRepo.return_value = mock_plan_repo
 
             mock_artifact_repo = MagicMock()
@@ -107,6 +108,12 @@ class TestExecuteWorkerNode:
             assert len(result["context_messages"]) == 2  # user + assistant
             assert result["current_context_tokens"] == 150
 
+            task_fields = {"status": "in_progress", "worker_output": "Task completed successfully"}
+            mock_plan_repo.update_task_fields.assert_awaited_once_with(
+                mock_plan.id, 0, "T1", task_fields
+            )
+            assert mock_plan.plan_data["tasks"][0]["status"] == "in_progress"
+
     @pytest.mark.asyncio
     async def test_retry_with_feedback(
         self,
@@ -145,7 +152,7 @@ class TestExecuteWorkerNode:
 
             # Setup mock repos
             mock_plan_repo = MagicMock()
-            mock_plan_repo.update = AsyncMock()
+            mock_plan_repo.update_task_fields = AsyncMock(return_value=True)
             MockPlanRepo.return_value = mock_plan_repo
 
             mock_artifact_repo = MagicMock()
@@ -288,3 +295,44 @@ class TestHelperFunctions:
 
         assert "Must pass all tests" in prompt
         assert "Acceptance criteria:" in prompt
+
+
+class TestTrackChangedFiles:
+    """Tests for _track_changed_files."""
+
+    @staticmethod
+    def _extraction(paths: list[tuple[str, str]], deleted: list[str]) -> ExtractionResult:
+        return ExtractionResult(
+            artifacts=[
+                ExtractedArtifact(
+                    artifact_type="file", filename=name, kind="py", content="", path=path
+                )
+                for path, name in paths
+            ],
+            deleted_paths=deleted,
+        )
+
+    def test_first_attempt_starts_fresh(self) -> None:
+        """Test that a new task ignores files tracked for the previous one."""
+        state, _ = _create_state_with_plan()
+        state["changed_files"] = ["old.py"]
+
+        changed, deleted = _track_changed_files(
+            state, 0, self._extraction([("src", "a.py")], ["/gone.py"])
+        )
+
+        assert changed == ["src/a.py"]
+        assert deleted == ["gone.py"]
+
+    def test_retry_accumulates(self) -> None:
+        """Test that retries keep files from earlier attempts in scope."""
+        state, _ = _create_state_with_plan(retry_count=1)
+        state["changed_files"] = ["src/a.py", "src/b.py"]
+        state["deleted_files"] = ["src/c.py"]
+
+        changed, deleted = _track_changed_files(
+            state, 1, self._extraction([("src", "c.py")], ["src/b.py"])
+        )
+
+        assert changed == ["src/a.py", "src/c.py"]
+        assert deleted == ["src/b.py"]
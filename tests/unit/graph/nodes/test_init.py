@@ -19,6 +19,8 @@ from bsai.graph.nodes import (
     get_event_bus,
     get_mcp_executor,
     get_ws_manager_optional,
+    save_plan_task_fields,
+    update_progress_counters,
 )
 
 
@@ -269,6 +271,97 @@ class TestCheckTaskCancelled:
             assert result is True
 
 
+class TestUpdateProgressCounters:
+    """Tests for update_progress_counters."""
+
+    @pytest.mark.asyncio
+    async def test_applies_transition(self) -> None:
+        """Test that a cached counter set is updated in place."""
+        cache = MagicMock()
+        cache.apply_task_progress_transition = AsyncMock(return_value=True)
+        cache.seed_task_progress_counters = AsyncMock()
+        config = RunnableConfig(configurable={"cache": cache})
+        task_id = uuid4()
+
+        await update_progress_counters(
+            config, task_id, "user-1", [], "pending", "in_progress", current_task="T1"
+        )
+
+        cache.apply_task_progress_transition.assert_awaited_once_with(
+            task_id, "pending", "in_progress", "T1"
+        )
+        cache.seed_task_progress_counters.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_seeds_from_plan_when_missing(self) -> None:
+        """Test that missing counters are seeded from the plan tasks."""
+        cache = MagicMock()
+        cache.apply_task_progress_transition = AsyncMock(return_value=False)
+        cache.seed_task_progress_counters = AsyncMock()
+        config = RunnableConfig(configurable={"cache": cache})
+        task_id = uuid4()
+        tasks = [{"id": "T1", "status": "completed"}, {"id": "T2", "status": "pending"}]
+
+        await update_progress_counters(config, task_id, "user-1", tasks, "in_progress", "completed")
+
+        cache.seed_task_progress_counters.assert_awaited_once_with(
+            task_id, "user-1", {"completed": 1, "pending": 1}, None
+        )
+
+    @pytest.mark.asyncio
+    async def test_cache_errors_are_swallowed(self) -> None:
+        """Test that Redis failures never fail the node."""
+        cache = MagicMock()
+        cache.apply_task_progress_transition = AsyncMock(side_effect=ConnectionError("down"))
+        config = RunnableConfig(configurable={"cache": cache})
+
+        await update_progress_counters(config, uuid4(), "user-1", [], "pending", "completed")
+
+    @pytest.mark.asyncio
+    async def test_noop_without_cache(self) -> None:
+        """Test that nodes run without a configured cache."""
+        await update_progress_counters(
+            RunnableConfig(configurable={}), uuid4(), "user-1", [], None, "pending"
+        )
+
+
+class TestSavePlanTaskFields:
+    """Tests for save_plan_task_fields."""
+
+    @staticmethod
+    def _plan() -> MagicMock:
+        plan = MagicMock(id=uuid4())
+        plan.plan_data = {"tasks": [{"id": "T1", "status": "completed"}, {"id": "T2"}]}
+        return plan
+
+    @pytest.mark.asyncio
+    async def test_writes_only_task_fields(self) -> None:
+        """Test that a matching stored task is updated with jsonb_set only."""
+        plan = self._plan()
+        plan_repo = MagicMock()
+        plan_repo.update_task_fields = AsyncMock(return_value=True)
+        plan_repo.update = AsyncMock()
+
+        await save_plan_task_fields(plan_repo, plan, "T1", {"status": "completed"}, total_tasks=2)
+
+        plan_repo.update_task_fields.assert_awaited_once_with(
+            plan.id, 0, "T1", {"status": "completed"}, total_tasks=2
+        )
+        plan_repo.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_full_plan_write(self) -> None:
+        """Test that a missed task update writes the whole plan_data."""
+        plan = self._plan()
+        plan_repo = MagicMock()
+        plan_repo.update_task_fields = AsyncMock(return_value=False)
+        plan_repo.update = AsyncMock()
+
+        await save_plan_task_fields(plan_repo, plan, "T1", {"status": "completed"}, total_tasks=2)
+
+        plan_repo.update.assert_awaited_once_with(plan.id, plan_data=plan.plan_data, total_tasks=2)
+
+
 class TestNodeContext:
     """Tests for NodeContext class."""
 
@@ -270,3 +270,41 @@ class TestVerifyQaNode:
             assert result["current_qa_decision"] == "pass"
             # Verify store_qa_learning was called
             mock_store.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_uses_task_qa_config_and_snapshot(
+        self,
+        mock_config: RunnableConfig,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Test QA config stored for the task is applied and the task snapshot is validated."""
+        from bsai.core import QADecision
+        from bsai.llm.schemas import QAConfig
+
+        state = _create_state_with_plan()
+        qa_config = QAConfig(validations=["static", "lint"])
+        mock_redis = MagicMock()
+        mock_redis.client.get = AsyncMock(return_value=qa_config.model_dump_json())
+
+        with (
+            patch("bsai.graph.nodes.qa.QAAgent") as MockQA,
+            patch("bsai.graph.nodes.qa.get_redis", return_value=mock_redis),
+            patch(
+                "bsai.graph.nodes.qa.NodeContext.check_cancelled",
+                new_callable=AsyncMock,
+                return_value=False,
+            ),
+        ):
+            mock_qa = AsyncMock()
+            mock_qa.validate_output.return_value = (
+                QADecision.PASS,
+                "Looks good",
+                _make_qa_output("PASS", "Looks good"),
+            )
+            MockQA.return_value = mock_qa
+
+            await verify_qa_node(state, mock_config, mock_session)
+
+        mock_redis.client.get.assert_awaited_once_with(f"task:{state['task_id']}:qa_config")
+        assert MockQA.call_args.kwargs["qa_config"] == qa_config
+        assert mock_qa.validate_output.call_args.kwargs["task_id"] == state["task_id"]
@@ -0,0 +1,66 @@
+"""Tests for project plan graph utilities."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from bsai.graph.utils import get_plan_task, get_plan_task_index, set_plan_task_fields
+
+
+def _plan(count: int) -> MagicMock:
+    plan = MagicMock()
+    plan.plan_data = {"tasks": [{"id": f"T{i}", "status": "pending"} for i in range(count)]}
+    return plan
+
+
+class TestPlanTaskIndex:
+    """Tests for cached task lookups on a project plan."""
+
+    def test_lookup_uses_cached_index(self) -> None:
+        """Test that the id -> index map is built once per task list."""
+        plan = _plan(3)
+
+        assert get_plan_task_index(plan, "T2") == 2
+        cached = plan._task_index
+        assert get_plan_task(plan, "T1") == {"id": "T1", "status": "pending"}
+        assert plan._task_index is cached
+        assert get_plan_task_index(plan, "missing") == -1
+        assert get_plan_task(plan, "missing") is None
+
+    def test_index_is_rebuilt_for_new_task_list(self) -> None:
+        """Test that replacing plan_data invalidates the cached index."""
+        plan = _plan(2)
+        get_plan_task_index(plan, "T0")
+
+        plan.plan_data = {"tasks": [{"id": "T5"}]}
+
+        assert get_plan_task_index(plan, "T5") == 0
+        assert get_plan_task_index(plan, "T0") == -1
+
+    def test_index_is_rebuilt_after_in_place_changes(self) -> None:
+        """Test that tasks inserted or appended in place are found at their new index."""
+        plan = _plan(2)
+        get_plan_task_index(plan, "T0")
+        tasks = plan.plan_data["tasks"]
+
+        tasks.insert(0, {"id": "T9", "status": "pending"})
+        tasks.append({"id": "T10", "status": "pending"})
+
+        assert get_plan_task_index(plan, "T1") == 2
+        assert get_plan_task_index(plan, "T10") == 3
+        assert set_plan_task_fields(plan, "T0", {"status": "completed"}) == 1
+        assert tasks[0]["status"] == "pending"
+
+    def test_set_fields_replaces_only_the_task(self) -> None:
+        """Test that a task update keeps the list (and its index) valid."""
+        plan = _plan(2)
+        tasks = plan.plan_data["tasks"]
+        original = tasks[1]
+
+        index = set_plan_task_fields(plan, "T1", {"status": "completed"})
+
+        assert index == 1
+        assert plan.plan_data["tasks"] is tasks
+        assert tasks[1] == {"id": "T1", "status": "completed"}
+        assert original["status"] == "pending"
+        assert set_plan_task_fields(plan, "missing", {"status": "failed"}) == -1
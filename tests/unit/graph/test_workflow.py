@@ -665,6 +665,54 @@ class TestCreateNodeWithSession:
         assert result == {"result": "success"}
         assert captured_args["session"] is mock_session
 
+    @pytest.mark.asyncio
+    async def test_records_node_as_agent_step(self) -> None:
+        """Wrapper records step start/complete with usage derived from state."""
+        telemetry = MagicMock()
+        telemetry.start_step.return_value = "step-1"
+        task_id = uuid4()
+
+        async def sample_node(state, config, session):
+            return {"total_input_tokens": 150, "total_output_tokens": 30}
+
+        wrapped = _create_node_with_session(sample_node, MagicMock(), "execute_worker")
+        state = {
+            "session_id": uuid4(),
+            "task_id": task_id,
+            "total_input_tokens": 100,
+            "total_output_tokens": 10,
+            "total_cost_usd": "0",
+        }
+
+        with patch("bsai.graph.workflow.get_telemetry_writer", return_value=telemetry):
+            await wrapped(state, {"configurable": {}})
+
+        telemetry.start_step.assert_called_once_with(
+            task_id=task_id, agent_type="worker", metadata={"node": "execute_worker"}
+        )
+        kwargs = telemetry.complete_step.call_args.kwargs
+        assert kwargs["input_tokens"] == 50
+        assert kwargs["output_tokens"] == 20
+        assert kwargs["error_message"] is None
+
+    @pytest.mark.asyncio
+    async def test_records_failed_step_on_exception(self) -> None:
+        """Exceptions complete the step with an error and are re-raised."""
+        telemetry = MagicMock()
+
+        async def failing_node(state, config, session):
+            raise ValueError("boom")
+
+        wrapped = _create_node_with_session(failing_node, MagicMock(), "verify_qa")
+
+        with (
+            patch("bsai.graph.workflow.get_telemetry_writer", return_value=telemetry),
+            pytest.raises(ValueError),
+        ):
+            await wrapped({"session_id": uuid4(), "task_id": uuid4()}, {"configurable": {}})
+
+        assert telemetry.complete_step.call_args.kwargs["error_message"] == "boom"
+
     def test_preserves_function_name(self) -> None:
         """Test that wrapper preserves original function name."""
 
@@ -6,6 +6,7 @@ from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
+import litellm
 import pytest
 
 from bsai.llm.client import LiteLLMClient
@@ -180,7 +181,9 @@ class TestChatCompletion:
             nonlocal call_count
             call_count += 1
             if call_count < 3:
-                raise Exception("Transient error")
+                raise litellm.ServiceUnavailableError(
+                    message="Transient error", llm_provider="openai", model="gpt-4o"
+                )
             return mock_response
 
         with (
@@ -221,6 +224,64 @@ def create_stream_chunk(content: str | None = None) -> MagicMock:
     return chunk
 
 
+class TestPromptCaching:
+    """Tests for cache-control breakpoints and cached token accounting."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("supported", "expect_blocks"), [(True, True), (False, False)])
+    async def test_breakpoints_sent_only_to_supporting_models(
+        self,
+        client: LiteLLMClient,
+        supported: bool,
+        expect_blocks: bool,
+    ) -> None:
+        """Marked messages become cache-control content blocks when supported."""
+        request = LLMRequest(
+            model="claude-sonnet-4-20250514",
+            messages=[
+                ChatMessage(role="system", content="Static rules", cache_control=True),
+                ChatMessage(role="user", content="Dynamic input"),
+            ],
+        )
+
+        with (
+            patch("bsai.llm.client.supports_prompt_caching", return_value=supported),
+            patch("bsai.llm.client.litellm.acompletion") as mock_completion,
+        ):
+            mock_completion.return_value = create_mock_response()
+            await client.chat_completion(request, mcp_servers=[])
+
+        system, user = mock_completion.call_args[1]["messages"]
+        assert user == {"role": "user", "content": "Dynamic input"}
+        if expect_blocks:
+            assert system["content"] == [
+                {
+                    "type": "text",
+                    "text": "Static rules",
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        else:
+            assert system == {"role": "system", "content": "Static rules"}
+
+    @pytest.mark.asyncio
+    async def test_reports_cached_input_tokens(
+        self,
+        client: LiteLLMClient,
+        sample_request: LLMRequest,
+    ) -> None:
+        """Cached prompt tokens reported by the provider are kept in usage."""
+        mock_response = create_mock_response(prompt_tokens=1200, completion_tokens=30)
+        mock_response.usage.prompt_tokens_details.cached_tokens = 1024
+
+        with patch("bsai.llm.client.litellm.acompletion", return_value=mock_response):
+            result = await client.chat_completion(sample_request, mcp_servers=[])
+
+        assert result.usage.input_tokens == 1200
+        assert result.usage.cached_input_tokens == 1024
+        assert result.usage.uncached_input_tokens == 176
+
+
 class TestStreamCompletion:
     """Tests for stream_completion method."""
 
@@ -723,3 +784,82 @@ class TestBuildToolsFromMcpServers:
             tools, _ = await client._build_tools_from_mcp_servers([mock_server])
 
         assert len(tools) == 0
+
+
+class TestUsageTelemetry:
+    """Tests for write-behind usage recording."""
+
+    @pytest.mark.asyncio
+    async def test_records_each_round_trip_in_node_context(
+        self,
+        sample_request: LLMRequest,
+    ) -> None:
+        """Usage is recorded with session and agent from the telemetry context."""
+        from decimal import Decimal
+        from uuid import uuid4
+
+        from bsai.telemetry import telemetry_context
+
+        telemetry = MagicMock()
+        router = MagicMock()
+        router.registry.get.return_value = MagicMock(provider="openai", context_window=128000)
+        router.calculate_cost.return_value = Decimal("0.002")
+        client = LiteLLMClient(telemetry=telemetry, router=router)
+        session_id = uuid4()
+
+        with (
+            patch("bsai.llm.client.litellm.acompletion") as mock_completion,
+            telemetry_context(session_id=session_id, agent_type="worker"),
+        ):
+            mock_completion.return_value = create_mock_response(
+                prompt_tokens=20, completion_tokens=10
+            )
+            await client.chat_completion(sample_request, mcp_servers=[])
+
+        telemetry.record_llm_call.assert_called_once()
+        kwargs = telemetry.record_llm_call.call_args.kwargs
+        assert kwargs["session_id"] == session_id
+        assert kwargs["agent_type"] == "worker"
+        assert kwargs["provider"] == "openai"
+        assert kwargs["input_tokens"] == 20
+        assert kwargs["output_tokens"] == 10
+        assert kwargs["cost_usd"] == Decimal("0.002")
+        assert kwargs["latency_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_skips_recording_outside_node_context(
+        self,
+        sample_request: LLMRequest,
+    ) -> None:
+        """Calls made outside a workflow node are not recorded."""
+        telemetry = MagicMock()
+        client = LiteLLMClient(telemetry=telemetry)
+
+        with patch("bsai.llm.client.litellm.acompletion") as mock_completion:
+            mock_completion.return_value = create_mock_response()
+            await client.chat_completion(sample_request, mcp_servers=[])
+
+        telemetry.record_llm_call.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_recording_errors_do_not_fail_call(
+        self,
+        sample_request: LLMRequest,
+    ) -> None:
+        """A telemetry failure never breaks the completion."""
+        from uuid import uuid4
+
+        from bsai.telemetry import telemetry_context
+
+        telemetry = MagicMock()
+        telemetry.record_llm_call.side_effect = RuntimeError("buffer broken")
+        client = LiteLLMClient(telemetry=telemetry)
+
+        with (
+            patch("bsai.llm.client.litellm.acompletion") as mock_completion,
+            telemetry_context(session_id=uuid4(), agent_type="qa"),
+        ):
+            mock_completion.return_value = create_mock_response(content="ok")
+            result = await client.chat_completion(sample_request, mcp_servers=[])
+
+        assert result.content == "ok"
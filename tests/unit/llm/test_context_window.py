@@ -0,0 +1,246 @@
+"""Tests for context-window preflight."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from decimal import Decimal
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bsai.api.config import ContextWindowSettings, RoutingSettings
+from bsai.llm.client import LiteLLMClient
+from bsai.llm.context_window import count_prompt_tokens, fit_messages
+from bsai.llm.models import LLMModel
+from bsai.llm.router import LLMRouter
+from bsai.llm.schemas import ChatMessage, LLMRequest, LLMResponse, MessagePriority
+
+WINDOWS = {"small": 1000, "medium": 4000, "large": 16000, "huge": 200000}
+
+
+@pytest.fixture(autouse=True)
+def char_tokenizer() -> Iterator[None]:
+    """Count 4 characters per token so sizes are exact and offline."""
+    with patch("bsai.llm.context_window.get_encoding", return_value=None):
+        yield
+
+
+def _model(name: str) -> LLMModel:
+    return LLMModel(
+        name=name,
+        provider="openai",
+        # Larger windows cost more
+        input_price_per_1k=Decimal(WINDOWS[name]) / 1_000_000,
+        output_price_per_1k=Decimal(WINDOWS[name]) / 500_000,
+        context_window=WINDOWS[name],
+        supports_streaming=True,
+    )
+
+
+@pytest.fixture
+def router() -> LLMRouter:
+    """Router knowing models of increasing context windows."""
+    registry = MagicMock()
+    registry.get = MagicMock(side_effect=lambda name: _model(name) if name in WINDOWS else None)
+    return LLMRouter(
+        registry=registry,
+        complexity_mapping={"SIMPLE": "small", "COMPLEX": "huge"},
+        routing=RoutingSettings(fallback_chains={"MODERATE": ["medium", "large"]}),
+    )
+
+
+def _text(tokens: int) -> str:
+    return "abcd" * tokens
+
+
+def _message(tokens: int, role: str = "user") -> dict[str, Any]:
+    return {"role": role, "content": _text(tokens)}
+
+
+class TestFitMessages:
+    """Tests for fit_messages."""
+
+    def test_drops_lowest_priority_oldest_first(self) -> None:
+        """Test that history goes before context and required messages stay."""
+        messages = [
+            _message(100, "system"),
+            _message(300),
+            _message(300),
+            _message(300),
+            _message(100),
+        ]
+        priorities = [
+            MessagePriority.REQUIRED,
+            MessagePriority.HISTORY,
+            MessagePriority.HISTORY,
+            MessagePriority.CONTEXT,
+            MessagePriority.REQUIRED,
+        ]
+
+        fitted, tokens = fit_messages(messages, priorities, 600, "gpt-4o", min_kept_tokens=500)
+
+        assert fitted == [messages[0], messages[3], messages[4]]
+        assert tokens == count_prompt_tokens(fitted, "gpt-4o") <= 600
+        assert len(messages) == 5
+
+    def test_shortens_last_needed_message(self) -> None:
+        """Test that a message is cut in the middle when enough of it remains."""
+        messages = [_message(100, "system"), {"role": "user", "content": "HEAD" + _text(1000)}]
+
+        fitted, tokens = fit_messages(messages, [0, MessagePriority.HISTORY], 700, "gpt-4o")
+
+        assert tokens <= 700
+        content = fitted[1]["content"]
+        assert content.startswith("HEAD")
+        assert "tokens omitted to fit the context window" in content
+        assert count_prompt_tokens(fitted, "gpt-4o") > 600
+
+    def test_cached_prefix_is_trimmed_last(self) -> None:
+        """Test that a cache-breakpoint message outlives other trimmable messages."""
+        cached = {
+            "role": "system",
+            "content": [
+                {"type": "text", "text": _text(300), "cache_control": {"type": "ephemeral"}}
+            ],
+        }
+        messages = [cached, _message(300), _message(100)]
+        # Without the breakpoint the cached message would go first
+        priorities = [MessagePriority.HISTORY, MessagePriority.CONTEXT, 0]
+
+        fitted, tokens = fit_messages(messages, priorities, 500, "gpt-4o", min_kept_tokens=500)
+
+        assert fitted == [cached, messages[2]]
+        assert tokens <= 500
+
+    def test_shortens_text_of_content_blocks(self) -> None:
+        """Test that content blocks are shortened and keep their cache breakpoint."""
+        cached = {
+            "role": "system",
+            "content": [
+                {
+                    "type": "text",
+                    "text": "HEAD" + _text(1000),
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+        }
+        messages = [cached, _message(100)]
+
+        fitted, tokens = fit_messages(messages, [MessagePriority.CONTEXT, 0], 700, "gpt-4o")
+
+        assert tokens <= 700
+        [block] = fitted[0]["content"]
+        assert block["cache_control"] == {"type": "ephemeral"}
+        assert block["text"].startswith("HEAD")
+        assert "tokens omitted to fit the context window" in block["text"]
+        assert count_prompt_tokens(fitted, "gpt-4o") > 600
+
+    def test_untrimmable_overflow_is_reported(self) -> None:
+        """Test that required messages are kept even when they do not fit."""
+        messages = [_message(800, "system"), _message(100)]
+
+        fitted, tokens = fit_messages(messages, [0, 0], 500, "gpt-4o")
+
+        assert fitted == messages
+        assert tokens > 500
+
+
+class TestLargerContextModel:
+    """Tests for LLMRouter.larger_context_model."""
+
+    def test_picks_smallest_sufficient_window(self, router: LLMRouter) -> None:
+        """Test that escalation goes to the nearest larger known model."""
+        assert router.larger_context_model("small", 3000).name == "medium"
+        assert router.larger_context_model("small", 10000).name == "large"
+        assert router.larger_context_model("small", 500000) is None
+        assert router.larger_context_model("medium", 100, ["tiny", "small"]).name == "large"
+
+
+def _response(model: str) -> MagicMock:
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = "done"
+    response.choices[0].finish_reason = "stop"
+    response.usage.prompt_tokens = 10
+    response.usage.completion_tokens = 5
+    response.model = model
+    return response
+
+
+async def _send(
+    router: LLMRouter, messages: list[ChatMessage], **settings: Any
+) -> tuple[dict[str, Any], LLMResponse]:
+    client = LiteLLMClient(router=router)
+    request = LLMRequest(model="small", messages=messages, max_tokens=200)
+    config = ContextWindowSettings(safety_margin=0.0, **settings)
+
+    with (
+        patch("bsai.llm.client.get_context_window_settings", return_value=config),
+        patch("bsai.llm.client.litellm.acompletion", return_value=_response("x")) as call,
+    ):
+        response = await client.chat_completion(request, mcp_servers=[])
+
+    return call.call_args.kwargs, response
+
+
+class TestClientPreflight:
+    """Tests for LiteLLMClient preflight."""
+
+    async def test_small_request_is_untouched(self, router: LLMRouter) -> None:
+        """Test that requests within the window are sent as built."""
+        params, _ = await _send(router, [ChatMessage(role="user", content=_text(100))])
+
+        assert params["model"] == "small"
+        assert len(params["messages"]) == 1
+
+    async def test_trims_history_to_fit(self, router: LLMRouter) -> None:
+        """Test that history is dropped to fit context_window - max_tokens."""
+        messages = [
+            ChatMessage(role="system", content=_text(50)),
+            ChatMessage(role="user", content=_text(400), priority=MessagePriority.HISTORY),
+            ChatMessage(role="assistant", content=_text(400), priority=MessagePriority.HISTORY),
+            ChatMessage(role="user", content=_text(100)),
+        ]
+
+        params, _ = await _send(router, messages, min_kept_tokens=1000)
+
+        assert params["model"] == "small"
+        assert [m["content"] for m in params["messages"]] == [
+            _text(50),
+            _text(400),
+            _text(100),
+        ]
+
+    async def test_escalates_when_trimming_is_not_enough(self, router: LLMRouter) -> None:
+        """Test that an oversized required prompt goes to a larger-window model."""
+        messages = [ChatMessage(role="user", content=_text(2000))]
+
+        params, _ = await _send(router, messages)
+
+        assert params["model"] == "medium"
+        assert params["messages"][0]["content"] == _text(2000)
+
+    async def test_escalated_response_is_priced_as_escalated_model(self, router: LLMRouter) -> None:
+        """Test that an escalated response is attributed to and priced as its model."""
+        messages = [ChatMessage(role="user", content=_text(2000))]
+
+        _, response = await _send(router, messages)
+        served = router.served_model(_model("small"), response.model)
+
+        assert response.model == "medium"
+        assert served.name == "medium"
+        assert router.calculate_usage_cost(served, response.usage) == router.calculate_cost(
+            _model("medium"), 10, 5
+        )
+        assert router.calculate_usage_cost(served, response.usage) > router.calculate_cost(
+            _model("small"), 10, 5
+        )
+
+    async def test_escalation_can_be_disabled(self, router: LLMRouter) -> None:
+        """Test that without escalation the request is sent to its own model."""
+        messages = [ChatMessage(role="user", content=_text(2000))]
+
+        params, _ = await _send(router, messages, escalate=False)
+
+        assert params["model"] == "small"
@@ -0,0 +1,209 @@
+"""Tests for per-provider LLM rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from bsai.api.config import RateLimitSettings
+from bsai.llm.client import LiteLLMClient
+from bsai.llm.rate_limiter import (
+    LLMPriority,
+    LLMRateLimiter,
+    LLMRateLimitTimeoutError,
+    RateBudget,
+    RateLimitReservation,
+    _AdmissionQueue,
+)
+from bsai.llm.schemas import ChatMessage, LLMRequest
+from bsai.telemetry import telemetry_context
+
+
+class FakeClock:
+    """Monotonic clock that asyncio.sleep advances instantly."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Patch the limiter's clock and sleep."""
+    fake = FakeClock()
+    with (
+        patch("bsai.llm.rate_limiter.time.monotonic", fake.monotonic),
+        patch("bsai.llm.rate_limiter.asyncio.sleep", fake.sleep),
+    ):
+        yield fake
+
+
+def _limiter(**overrides: object) -> LLMRateLimiter:
+    settings = RateLimitSettings(enabled=True, **overrides)
+    return LLMRateLimiter(settings=settings)
+
+
+class TestLLMRateLimiter:
+    """Tests for LLMRateLimiter with process-local buckets."""
+
+    def test_budget_lookup_order(self) -> None:
+        """Test that model budgets override provider budgets and defaults."""
+        limiter = _limiter(
+            default_rpm=100,
+            default_tpm=1000,
+            budgets={"openai": {"rpm": 10}, "openai/gpt-4o": {"rpm": 5, "tpm": 500}},
+        )
+
+        assert limiter.budget_for("openai", "gpt-4o") == RateBudget(rpm=5, tpm=500)
+        assert limiter.budget_for("openai", "gpt-4o-mini") == RateBudget(rpm=10, tpm=1000)
+        assert limiter.budget_for("anthropic", "claude") == RateBudget(rpm=100, tpm=1000)
+
+    async def test_waits_for_request_budget(self, clock: FakeClock) -> None:
+        """Test that calls beyond the RPM budget sleep until the bucket refills."""
+        limiter = _limiter(default_rpm=60, default_tpm=100000)
+
+        await limiter.acquire("openai", "gpt-4o", 10)
+        assert clock.sleeps == []
+
+        # Bucket is full at 60 requests; drain it
+        for _ in range(59):
+            await limiter.acquire("openai", "gpt-4o", 10)
+        await limiter.acquire("openai", "gpt-4o", 10)
+
+        # 60 RPM refills one request per second
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    async def test_waits_for_token_budget(self, clock: FakeClock) -> None:
+        """Test that estimated input tokens are reserved against the TPM budget."""
+        limiter = _limiter(default_rpm=1000, default_tpm=6000)
+
+        await limiter.acquire("openai", "gpt-4o", 6000)
+        reservation = await limiter.acquire("openai", "gpt-4o", 3000)
+
+        # 6000 TPM refills 100 tokens per second
+        assert clock.sleeps == [pytest.approx(30.0)]
+        assert reservation.reserved_tokens == 3000
+
+    async def test_times_out_beyond_max_wait(self, clock: FakeClock) -> None:
+        """Test that calls that would wait too long fail instead of queueing."""
+        limiter = _limiter(default_rpm=1000, default_tpm=600, max_wait=5.0)
+        await limiter.acquire("openai", "gpt-4o", 600)
+
+        with pytest.raises(LLMRateLimitTimeoutError) as exc_info:
+            await limiter.acquire("openai", "gpt-4o", 600)
+
+        assert exc_info.value.bucket == "openai/gpt-4o"
+
+    async def test_reconcile_charges_actual_usage(self, clock: FakeClock) -> None:
+        """Test that output tokens are charged and over-estimates are refunded."""
+        limiter = _limiter(default_rpm=1000, default_tpm=6000)
+        reservation = await limiter.acquire("openai", "gpt-4o", 1000)
+
+        await limiter.reconcile(reservation, 4000)
+        assert limiter._local["openai/gpt-4o"].tokens == pytest.approx(2000)
+
+        await limiter.reconcile(
+            RateLimitReservation("openai/gpt-4o", reservation.budget, 1500), 500
+        )
+        assert limiter._local["openai/gpt-4o"].tokens == pytest.approx(3000)
+
+    async def test_uses_redis_buckets_when_connected(self) -> None:
+        """Test that buckets are shared through Redis scripts."""
+        redis_client = MagicMock()
+        redis_client.is_connected = True
+        redis_client.client.eval = AsyncMock(return_value="0")
+        limiter = LLMRateLimiter(
+            redis_client, RateLimitSettings(enabled=True, default_rpm=60, default_tpm=9000)
+        )
+
+        reservation = await limiter.acquire("openai", "gpt-4o", 100)
+        await limiter.reconcile(reservation, 250)
+
+        take, adjust = redis_client.client.eval.await_args_list
+        assert take.args[1:] == (1, "llm:ratelimit:openai/gpt-4o", 60, 9000, 100)
+        assert adjust.args[1:] == (1, "llm:ratelimit:openai/gpt-4o", -150, 9000)
+        assert limiter._local == {}
+
+
+class TestAdmissionQueue:
+    """Tests for priority ordering of waiting callers."""
+
+    async def test_admits_by_priority_then_arrival(self) -> None:
+        """Test that interactive callers overtake queued background work."""
+        queue = _AdmissionQueue()
+        admitted: list[str] = []
+
+        async def caller(name: str, priority: LLMPriority) -> None:
+            async with queue.turn(priority):
+                admitted.append(name)
+
+        async with queue.turn(LLMPriority.WORKFLOW):
+            tasks = [
+                asyncio.create_task(caller("memory", LLMPriority.BACKGROUND)),
+                asyncio.create_task(caller("worker", LLMPriority.WORKFLOW)),
+                asyncio.create_task(caller("responder", LLMPriority.INTERACTIVE)),
+                asyncio.create_task(caller("qa", LLMPriority.WORKFLOW)),
+            ]
+            await asyncio.sleep(0)
+
+        await asyncio.gather(*tasks)
+        assert admitted == ["responder", "worker", "qa", "memory"]
+
+    async def test_cancelled_waiter_does_not_block_queue(self) -> None:
+        """Test that a caller cancelled while queued is skipped."""
+        queue = _AdmissionQueue()
+        admitted: list[str] = []
+
+        async def caller(name: str) -> None:
+            async with queue.turn(LLMPriority.WORKFLOW):
+                admitted.append(name)
+
+        async with queue.turn(LLMPriority.WORKFLOW):
+            cancelled = asyncio.create_task(caller("cancelled"))
+            waiting = asyncio.create_task(caller("waiting"))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+
+        await waiting
+        assert admitted == ["waiting"]
+
+
+class TestClientRateLimiting:
+    """Tests for LiteLLMClient integration."""
+
+    async def test_admits_and_reconciles_each_round_trip(self) -> None:
+        """Test that calls reserve estimated tokens and settle actual usage."""
+        reservation = RateLimitReservation("openai/gpt-4o", RateBudget(60, 9000), 12)
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock(return_value=reservation)
+        limiter.reconcile = AsyncMock()
+        client = LiteLLMClient(rate_limiter=limiter)
+        request = LLMRequest(model="gpt-4o", messages=[ChatMessage(role="user", content="Hi")])
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = "Hello"
+        response.choices[0].finish_reason = "stop"
+        response.usage.prompt_tokens = 8
+        response.usage.completion_tokens = 4
+        response.model = "gpt-4o"
+
+        with (
+            patch("bsai.llm.client.litellm.acompletion", return_value=response),
+            telemetry_context(session_id=uuid4(), agent_type="responder"),
+        ):
+            await client.chat_completion(request, mcp_servers=[])
+
+        provider, model, tokens, priority = limiter.acquire.await_args.args
+        assert (provider, model, priority) == ("openai", "gpt-4o", LLMPriority.INTERACTIVE)
+        assert tokens > 0
+        limiter.reconcile.assert_awaited_once_with(reservation, 12)
@@ -0,0 +1,214 @@
+"""Tests for the exact-match LLM response cache."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from bsai.api.config import CacheSettings
+from bsai.llm.client import LiteLLMClient
+from bsai.llm.response_cache import LLMResponseCache
+from bsai.llm.schemas import ChatMessage, LLMRequest, LLMResponse, UsageInfo
+from bsai.telemetry import telemetry_context
+
+
+class FakeRedis:
+    """In-memory subset of redis.asyncio used by the response cache."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.values[key] = value
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def zadd(self, key: str, mapping: dict[str, float]) -> None:
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zremrangebyscore(self, key: str, low: Any, high: float) -> None:
+        zset = self.zsets.get(key, {})
+        for member in [m for m, score in zset.items() if score <= high]:
+            del zset[member]
+
+    async def zcard(self, key: str) -> int:
+        return len(self.zsets.get(key, {}))
+
+    async def zpopmin(self, key: str, count: int) -> list[tuple[str, float]]:
+        zset = self.zsets.get(key, {})
+        popped = sorted(zset.items(), key=lambda item: item[1])[:count]
+        for member, _ in popped:
+            del zset[member]
+        return popped
+
+    async def hincrby(self, key: str, field: str, amount: int) -> None:
+        values = self.hashes.setdefault(key, {})
+        values[field] = str(int(values.get(field, 0)) + amount)
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues calls and runs them on execute()."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.calls: list[Any] = []
+
+    async def __aenter__(self) -> FakePipeline:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any, **kwargs: Any) -> None:
+            self.calls.append(getattr(self.redis, name)(*args, **kwargs))
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        return [await call for call in self.calls]
+
+
+def _cache(**overrides: Any) -> tuple[LLMResponseCache, FakeRedis]:
+    fake = FakeRedis()
+    redis_client = MagicMock()
+    redis_client.client = fake
+    settings = CacheSettings(llm_response_cache_enabled=True, **overrides)
+    return LLMResponseCache(redis_client, settings), fake
+
+
+def _response(content: str = "plan") -> LLMResponse:
+    return LLMResponse(
+        content=content,
+        usage=UsageInfo(input_tokens=100, output_tokens=50, total_tokens=150),
+        model="gpt-4o",
+        finish_reason="stop",
+    )
+
+
+PARAMS: dict[str, Any] = {
+    "model": "gpt-4o",
+    "messages": [{"role": "user", "content": "Plan it"}],
+    "temperature": 0.2,
+    "api_key": "sk-secret",
+}
+
+
+class TestLLMResponseCache:
+    """Tests for LLMResponseCache."""
+
+    def test_key_is_canonical_and_ignores_api_key(self) -> None:
+        """Test that key order and credentials do not change the key."""
+        reordered = dict(reversed(list(PARAMS.items())))
+        reordered["api_key"] = "sk-other"
+
+        assert LLMResponseCache.make_key(PARAMS) == LLMResponseCache.make_key(reordered)
+        assert LLMResponseCache.make_key(PARAMS) != LLMResponseCache.make_key(
+            {**PARAMS, "temperature": 0.1}
+        )
+
+    @pytest.mark.parametrize(
+        ("params", "agent", "expected"),
+        [
+            (PARAMS, "architect", True),
+            (PARAMS, "worker", False),
+            (PARAMS, None, False),
+            ({**PARAMS, "temperature": 0.7}, "architect", False),
+            ({**PARAMS, "tools": [{"type": "function"}]}, "architect", False),
+        ],
+    )
+    def test_policy(self, params: dict[str, Any], agent: str | None, expected: bool) -> None:
+        """Test that only allow-listed, low-temperature, tool-free calls are cacheable."""
+        cache, _ = _cache()
+
+        assert cache.is_cacheable(params, agent) is expected
+
+    async def test_round_trip_flags_usage_as_cached(self) -> None:
+        """Test that hits keep the original token counts and count as saved."""
+        cache, _ = _cache()
+        key = cache.make_key(PARAMS)
+
+        assert await cache.get(key, "architect") is None
+        await cache.put(key, _response())
+        hit = await cache.get(key, "architect")
+
+        assert hit is not None
+        assert hit.content == "plan"
+        assert hit.usage.cached is True
+        assert hit.usage.total_tokens == 150
+        stats = await cache.get_stats(["architect"])
+        assert stats["architect"] == {
+            "hits": 1,
+            "misses": 1,
+            "saved_input_tokens": 100,
+            "saved_output_tokens": 50,
+        }
+
+    async def test_evicts_oldest_entries(self) -> None:
+        """Test that the entry count cap evicts the oldest responses."""
+        cache, fake = _cache(llm_response_cache_max_entries=2)
+        keys = [cache.make_key({**PARAMS, "messages": [{"content": str(i)}]}) for i in range(3)]
+
+        for i, key in enumerate(keys):
+            with patch("bsai.llm.response_cache.time.time", return_value=1000.0 + i):
+                await cache.put(key, _response())
+
+        assert keys[0] not in fake.values
+        assert keys[1] in fake.values and keys[2] in fake.values
+
+    async def test_skips_oversized_entries(self) -> None:
+        """Test that responses above the size cap are not stored."""
+        cache, fake = _cache(llm_response_cache_max_entry_bytes=100)
+
+        await cache.put(cache.make_key(PARAMS), _response("x" * 500))
+
+        assert fake.values == {}
+
+
+class TestClientResponseCache:
+    """Tests for LiteLLMClient integration."""
+
+    async def test_identical_request_skips_provider(self) -> None:
+        """Test that a replayed request is answered from the cache."""
+        cache, _ = _cache()
+        client = LiteLLMClient(response_cache=cache)
+        request = LLMRequest(
+            model="gpt-4o",
+            messages=[ChatMessage(role="user", content="Plan it")],
+            temperature=0.2,
+        )
+        provider_response = MagicMock()
+        provider_response.choices = [MagicMock()]
+        provider_response.choices[0].message.content = "plan"
+        provider_response.choices[0].finish_reason = "stop"
+        provider_response.usage.prompt_tokens = 10
+        provider_response.usage.completion_tokens = 5
+        provider_response.model = "gpt-4o"
+
+        with (
+            patch("bsai.llm.client.litellm.acompletion", return_value=provider_response) as call,
+            telemetry_context(session_id=uuid4(), agent_type="architect"),
+        ):
+            first = await client.chat_completion(request, mcp_servers=[])
+            second = await client.chat_completion(request, mcp_servers=[])
+
+        call.assert_called_once()
+        assert first.usage.cached is False
+        assert second.usage.cached is True
+        assert second.content == first.content
@@ -9,6 +9,7 @@ from bsai.db.models.enums import TaskComplexity
 from bsai.llm.models import LLMModel
 from bsai.llm.registry import ModelRegistry
 from bsai.llm.router import LLMRouter
+from bsai.llm.schemas import UsageInfo
 
 
 @pytest.fixture
@@ -117,6 +118,46 @@ class TestLLMRouter:
         # (1000 / 1000) * 0.001 + (500 / 1000) * 0.002 = 0.001 + 0.001 = 0.002
         assert cost == Decimal("0.002")
 
+    def test_calculate_usage_cost_is_zero_for_cached_responses(self, router: LLMRouter) -> None:
+        """Test that responses served from the cache cost nothing."""
+        model = LLMModel(
+            name="test-model",
+            provider="test",
+            input_price_per_1k=Decimal("0.001"),
+            output_price_per_1k=Decimal("0.002"),
+            context_window=1000,
+            supports_streaming=True,
+        )
+        usage = UsageInfo(input_tokens=1000, output_tokens=500, total_tokens=1500)
+
+        assert router.calculate_usage_cost(model, usage) == Decimal("0.002")
+        assert router.calculate_usage_cost(
+            model, usage.model_copy(update={"cached": True})
+        ) == Decimal("0")
+
+    def test_calculate_cost_prices_cached_input_tokens(self, router: LLMRouter) -> None:
+        """Test that prompt-cache reads are billed at the cache read price."""
+        model = LLMModel(
+            name="test-model",
+            provider="test",
+            input_price_per_1k=Decimal("0.002"),
+            output_price_per_1k=Decimal("0.004"),
+            context_window=10000,
+            supports_streaming=True,
+            cached_input_price_per_1k=Decimal("0.0005"),
+        )
+        usage = UsageInfo(
+            input_tokens=3000, output_tokens=1000, total_tokens=4000, cached_input_tokens=2000
+        )
+
+        # 1000 uncached * 0.002 + 2000 cached * 0.0005 + 1000 output * 0.004
+        assert router.calculate_usage_cost(model, usage) == Decimal("0.007")
+        assert usage.uncached_input_tokens == 1000
+
+        # Without a cache price, cached tokens cost the regular input price
+        model.cached_input_price_per_1k = None
+        assert router.calculate_usage_cost(model, usage) == Decimal("0.010")
+
     def test_estimate_tokens_with_tiktoken(self, router: LLMRouter) -> None:
         """Test token estimation with tiktoken."""
         text = "Hello, world!"
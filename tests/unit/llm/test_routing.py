@@ -0,0 +1,263 @@
+"""Tests for latency-aware routing and hedged requests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import litellm
+import pytest
+
+from bsai.api.config import RoutingSettings
+from bsai.db.models.enums import TaskComplexity
+from bsai.llm.client import LiteLLMClient
+from bsai.llm.models import LLMModel
+from bsai.llm.router import LLMRouter
+from bsai.llm.routing import ModelHealth
+from bsai.llm.schemas import ChatMessage, LLMRequest
+from bsai.telemetry import telemetry_context
+
+CHAIN = ["gpt-4o", "claude-sonnet-4-20250514", "gpt-4o-mini"]
+
+
+def _model(name: str) -> LLMModel:
+    return LLMModel(
+        name=name,
+        provider="test",
+        input_price_per_1k=Decimal("0.001"),
+        output_price_per_1k=Decimal("0.002"),
+        context_window=128000,
+        supports_streaming=True,
+    )
+
+
+@pytest.fixture
+def routed() -> LLMRouter:
+    """Router with a MODERATE fallback chain and fresh statistics."""
+    registry = MagicMock()
+    registry.get = MagicMock(side_effect=lambda name: _model(name) if name in CHAIN else None)
+    settings = RoutingSettings(
+        enabled=True,
+        fallback_chains={"MODERATE": [*CHAIN, "missing-model"]},
+        min_samples=3,
+        hedge_default_delay=0.05,
+        hedge_min_delay=0.01,
+        hedge_max_delay=1.0,
+    )
+    return LLMRouter(registry=registry, routing=settings, health=ModelHealth(window_size=10))
+
+
+class TestModelHealth:
+    """Tests for the rolling statistics window."""
+
+    def test_percentiles_and_error_rate_use_recent_window(self) -> None:
+        """Test that only the most recent calls count."""
+        health = ModelHealth(window_size=4)
+        for latency in (9.0, 1.0, 2.0, 3.0, 4.0):
+            health.record_success("m", latency)
+        health.record_failure("m")
+
+        assert health.samples("m") == 4
+        assert health.error_rate("m") == 0.25
+        assert health.latency_percentile("m", 0.95) == 4.0
+        assert health.latency_percentile("m", 0.5) == 2.0
+        assert health.latency_percentile("m", 0.5, min_samples=5) is None
+
+
+class TestLatencyAwareRouting:
+    """Tests for LLMRouter fallback chains."""
+
+    def test_selects_first_healthy_model(self, routed: LLMRouter) -> None:
+        """Test that a failing primary is moved behind healthy models."""
+        assert routed.select_model(TaskComplexity.MODERATE).name == "gpt-4o"
+
+        for _ in range(3):
+            routed.health.record_failure("gpt-4o")
+
+        assert routed.select_model(TaskComplexity.MODERATE).name == "claude-sonnet-4-20250514"
+        assert [m.name for m in routed.fallback_models("claude-sonnet-4-20250514")] == [
+            "gpt-4o-mini",
+            "gpt-4o",
+        ]
+
+    def test_disabled_routing_keeps_static_mapping(self, routed: LLMRouter) -> None:
+        """Test that routing off falls back to the complexity mapping."""
+        routed.routing = RoutingSettings(
+            enabled=False, fallback_chains=routed.routing.fallback_chains
+        )
+
+        assert routed.select_model(TaskComplexity.MODERATE).name == "gpt-4o-mini"
+        assert routed.fallback_models("gpt-4o") == []
+
+    def test_hedge_delay_follows_p95(self, routed: LLMRouter) -> None:
+        """Test that the hedge delay is the clamped recent p95 latency."""
+        assert routed.hedge_delay("gpt-4o") == 0.05
+
+        for latency in (0.2, 0.3, 0.4):
+            routed.health.record_success("gpt-4o", latency)
+        assert routed.hedge_delay("gpt-4o") == 0.4
+
+        for latency in (5.0, 6.0, 7.0):
+            routed.health.record_success("gpt-4o", latency)
+        assert routed.hedge_delay("gpt-4o") == 1.0
+
+    def test_served_model_resolves_fallback_models(self, routed: LLMRouter) -> None:
+        """Test that a response is attributed to the chain model that served it."""
+        primary = _model("gpt-4o")
+
+        assert routed.served_model(primary, "claude-sonnet-4-20250514").name == (
+            "claude-sonnet-4-20250514"
+        )
+        # Names unknown to the registry keep the requested model
+        assert routed.served_model(primary, "gpt-4o-2024-08-06") is primary
+
+    def test_metrics_report_decisions(self, routed: LLMRouter) -> None:
+        """Test that routing decisions are exported per model."""
+        routed.select_model(TaskComplexity.MODERATE)
+        routed.health.record_success("gpt-4o", 0.2)
+
+        metrics = routed.get_routing_metrics()["gpt-4o"]
+
+        assert metrics["selected"] == 1
+        assert metrics["samples"] == 1
+        assert metrics["hedge_delay"] == 0.05
+        assert metrics["degraded"] is False
+
+
+def _mock_provider(
+    delays: dict[str, float], failures: frozenset[str] = frozenset()
+) -> tuple[Any, list[str]]:
+    """Patch target running litellm's mock completions with per-model delays."""
+    real_acompletion = litellm.acompletion
+    started: list[str] = []
+
+    async def acompletion(**params: Any) -> Any:
+        model = params["model"]
+        started.append(model)
+        mock: Any = Exception(f"{model} down") if model in failures else f"answer from {model}"
+        return await real_acompletion(
+            **params, mock_response=mock, mock_delay=delays.get(model, 0.0)
+        )
+
+    return acompletion, started
+
+
+def _request() -> LLMRequest:
+    return LLMRequest(
+        model="gpt-4o", messages=[ChatMessage(role="user", content="Plan it")], temperature=0.2
+    )
+
+
+class TestHedgedCompletion:
+    """Tests for hedged execution in LiteLLMClient."""
+
+    async def test_hedge_wins_over_slow_primary(self, routed: LLMRouter) -> None:
+        """Test that a hedged request answers first and names the model that served it."""
+        acompletion, started = _mock_provider({"gpt-4o": 1.0})
+        client = LiteLLMClient(router=routed)
+
+        begin = time.monotonic()
+        with patch("bsai.llm.client.litellm.acompletion", side_effect=acompletion):
+            response = await client.chat_completion(_request(), mcp_servers=[])
+            assert time.monotonic() - begin < 0.5
+            # The primary is still in flight
+            assert routed.health.samples("gpt-4o") == 0
+            await asyncio.gather(*client._hedge_losers)
+
+        assert response.content == "answer from claude-sonnet-4-20250514"
+        assert response.model == "claude-sonnet-4-20250514"
+        assert started == ["gpt-4o", "claude-sonnet-4-20250514"]
+        metrics = routed.get_routing_metrics()
+        assert metrics["claude-sonnet-4-20250514"]["hedged"] == 1
+        assert metrics["claude-sonnet-4-20250514"]["hedge_won"] == 1
+        # The losing primary finished in the background
+        assert routed.health.samples("gpt-4o") == 1
+        assert not client._hedge_losers
+
+    async def test_losing_attempt_records_its_usage(self, routed: LLMRouter) -> None:
+        """Test that both the winner and the loser are recorded under their own model."""
+        acompletion, _ = _mock_provider({"gpt-4o": 0.3})
+        telemetry = MagicMock()
+        client = LiteLLMClient(telemetry=telemetry, router=routed)
+
+        with (
+            patch("bsai.llm.client.litellm.acompletion", side_effect=acompletion),
+            telemetry_context(session_id=uuid4(), agent_type="worker"),
+        ):
+            await client.chat_completion(_request(), mcp_servers=[])
+            await asyncio.gather(*client._hedge_losers)
+
+        calls = [call.kwargs for call in telemetry.record_llm_call.call_args_list]
+        assert [call["model"] for call in calls] == ["claude-sonnet-4-20250514", "gpt-4o"]
+        assert all(call["input_tokens"] > 0 and call["cost_usd"] > 0 for call in calls)
+
+    async def test_hedge_delay_starts_after_admission(self, routed: LLMRouter) -> None:
+        """Test that waiting for the rate limiter does not count toward the hedge delay."""
+
+        async def acquire(*args: Any) -> None:
+            await asyncio.sleep(0.3)
+
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock(side_effect=acquire)
+        acompletion, started = _mock_provider({})
+        client = LiteLLMClient(router=routed, rate_limiter=limiter)
+
+        with patch("bsai.llm.client.litellm.acompletion", side_effect=acompletion):
+            response = await client.chat_completion(_request(), mcp_servers=[])
+
+        assert response.content == "answer from gpt-4o"
+        assert started == ["gpt-4o"]
+        assert "hedged" not in routed.get_routing_metrics().get("claude-sonnet-4-20250514", {})
+
+    async def test_hedge_waiting_for_admission_is_cancelled(self, routed: LLMRouter) -> None:
+        """Test that a losing hedge that was never sent is cancelled."""
+        never = asyncio.Event()
+
+        async def acquire(provider: str, model: str, tokens: int, priority: Any) -> None:
+            if model != "gpt-4o":
+                await never.wait()
+
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock(side_effect=acquire)
+        acompletion, started = _mock_provider({"gpt-4o": 0.3})
+        client = LiteLLMClient(router=routed, rate_limiter=limiter)
+
+        with patch("bsai.llm.client.litellm.acompletion", side_effect=acompletion):
+            response = await client.chat_completion(_request(), mcp_servers=[])
+
+        assert response.content == "answer from gpt-4o"
+        assert started == ["gpt-4o"]
+        assert routed.get_routing_metrics()["claude-sonnet-4-20250514"]["hedged"] == 1
+        assert not client._hedge_losers
+
+    async def test_fast_primary_is_not_hedged(self, routed: LLMRouter) -> None:
+        """Test that no hedge is sent when the primary answers in time."""
+        acompletion, started = _mock_provider({})
+        client = LiteLLMClient(router=routed)
+
+        with patch("bsai.llm.client.litellm.acompletion", side_effect=acompletion):
+            response = await client.chat_completion(_request(), mcp_servers=[])
+
+        assert response.content == "answer from gpt-4o"
+        assert started == ["gpt-4o"]
+        assert routed.health.samples("gpt-4o") == 1
+
+    async def test_failure_falls_back_immediately(self, routed: LLMRouter) -> None:
+        """Test that a failing model is replaced without waiting for the hedge delay."""
+        routed.routing.hedge_default_delay = 30.0
+        acompletion, started = _mock_provider({}, failures=frozenset({"gpt-4o"}))
+        client = LiteLLMClient(router=routed)
+
+        with patch("bsai.llm.client.litellm.acompletion", side_effect=acompletion):
+            response = await LiteLLMClient.chat_completion.__wrapped__(  # type: ignore[attr-defined]
+                client, _request(), mcp_servers=[]
+            )
+
+        assert response.content == "answer from claude-sonnet-4-20250514"
+        assert started == ["gpt-4o", "claude-sonnet-4-20250514"]
+        assert routed.health.error_rate("gpt-4o") == 1.0
+        assert routed.get_routing_metrics()["claude-sonnet-4-20250514"]["fallback_won"] == 1
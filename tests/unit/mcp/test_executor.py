@@ -4,9 +4,12 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import httpx
 import pytest
 
+from bsai.api.config import CircuitBreakerSettings
 from bsai.mcp.executor import McpToolCall, McpToolExecutor, McpToolResult
+from bsai.resilience import CircuitBreaker
 
 
 def _create_mock_server(
@@ -427,6 +430,33 @@ class TestMcpToolExecutor:
         assert result.success is False
         assert "Authentication" in result.error
 
+    async def test_execute_remote_tool_circuit_open(self, executor: McpToolExecutor):
+        """Test that a server that keeps failing is not contacted while its circuit is open."""
+        executor.circuit_breaker = CircuitBreaker(
+            settings=CircuitBreakerSettings(enabled=True, failure_threshold=1)
+        )
+        tool_call = McpToolCall(
+            tool_name="test_tool",
+            tool_input={},
+            mcp_server=_create_mock_server(),
+        )
+
+        with (
+            patch("bsai.mcp.executor.build_mcp_auth_headers", return_value={}),
+            patch(
+                "bsai.mcp.executor.streamable_http_client",
+                side_effect=httpx.ConnectError("refused"),
+            ) as connect,
+        ):
+            first = await executor._execute_remote_tool(tool_call)
+            second = await executor._execute_remote_tool(tool_call)
+
+        assert first.success is False
+        assert "refused" in first.error
+        assert second.success is False
+        assert "temporarily unavailable" in second.error
+        connect.assert_called_once()
+
     async def test_log_execution_no_session(self, executor: McpToolExecutor):
         """Test logging execution without database session."""
         server = _create_mock_server()
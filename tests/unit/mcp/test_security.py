@@ -1,5 +1,7 @@
 """Unit tests for MCP security validators and encryption."""
 
+from unittest.mock import patch
+
 import pytest
 
 from bsai.api.config import McpSettings
@@ -471,3 +473,258 @@ class TestBuildMcpAuthHeaders:
 
         result = build_mcp_auth_headers(server, settings=settings)
         assert result is None
+
+
+class TestMcpAuthHeaderCache:
+    """Tests for cached auth header derivation."""
+
+    @pytest.fixture(autouse=True)
+    def shared_settings(self):
+        """Use a fresh shared settings instance and empty caches."""
+        from cryptography.fernet import Fernet
+
+        from bsai.mcp import security
+
+        settings = McpSettings(encryption_key=Fernet.generate_key().decode())
+        security.get_credential_encryption.cache_clear()
+        security.get_mcp_auth_header_cache.cache_clear()
+        with patch.object(security, "get_mcp_settings", return_value=settings):
+            yield settings
+        security.get_credential_encryption.cache_clear()
+        security.get_mcp_auth_header_cache.cache_clear()
+
+    def _server(self, settings: McpSettings, credentials: dict[str, str]):
+        from unittest.mock import MagicMock
+        from uuid import uuid4
+
+        from bsai.mcp.security import CredentialEncryption
+
+        server = MagicMock()
+        server.id = uuid4()
+        server.name = "cached-server"
+        server.auth_type = "oauth2"
+        server.auth_credentials = CredentialEncryption(settings).encrypt(credentials)
+        return server
+
+    def test_repeated_calls_skip_decryption(self, shared_settings: McpSettings) -> None:
+        """Test that a cache hit neither decrypts nor builds settings."""
+        from bsai.mcp import security
+
+        server = self._server(shared_settings, {"access_token": "tok"})
+        assert security.build_mcp_auth_headers(server) == {"Authorization": "Bearer tok"}
+
+        with (
+            patch.object(security.CredentialEncryption, "decrypt") as decrypt,
+            patch.object(security, "McpSettings") as settings_cls,
+        ):
+            headers = security.build_mcp_auth_headers(server, shared_settings)
+
+        decrypt.assert_not_called()
+        settings_cls.assert_not_called()
+        assert headers == {"Authorization": "Bearer tok"}
+
+    def test_returned_headers_are_copies(self, shared_settings: McpSettings) -> None:
+        """Test that callers cannot mutate cached headers."""
+        from bsai.mcp.security import build_mcp_auth_headers
+
+        server = self._server(shared_settings, {"access_token": "tok"})
+        first = build_mcp_auth_headers(server)
+        assert first is not None
+        first["X-Extra"] = "1"
+
+        assert build_mcp_auth_headers(server) == {"Authorization": "Bearer tok"}
+
+    def test_refreshed_credentials_miss_cache(self, shared_settings: McpSettings) -> None:
+        """Test that new ciphertext (e.g. refreshed OAuth tokens) is decrypted again."""
+        from bsai.mcp.security import CredentialEncryption, build_mcp_auth_headers
+
+        server = self._server(shared_settings, {"access_token": "old"})
+        build_mcp_auth_headers(server)
+
+        server.auth_credentials = CredentialEncryption(shared_settings).encrypt(
+            {"access_token": "new"}
+        )
+
+        assert build_mcp_auth_headers(server) == {"Authorization": "Bearer new"}
+
+    def test_invalidate_drops_server_entries(self, shared_settings: McpSettings) -> None:
+        """Test that invalidation only removes the given server's headers."""
+        from bsai.mcp.security import build_mcp_auth_headers, get_mcp_auth_header_cache
+
+        first = self._server(shared_settings, {"access_token": "a"})
+        second = self._server(shared_settings, {"access_token": "b"})
+        build_mcp_auth_headers(first)
+        build_mcp_auth_headers(second)
+        cache = get_mcp_auth_header_cache()
+
+        assert cache.invalidate(first.id) == 1
+        assert len(cache) == 1
+
+    def test_explicit_settings_bypass_cache(self, shared_settings: McpSettings) -> None:
+        """Test that non-shared settings never populate the cache."""
+        from cryptography.fernet import Fernet
+
+        from bsai.mcp.security import build_mcp_auth_headers, get_mcp_auth_header_cache
+
+        other = McpSettings(encryption_key=Fernet.generate_key().decode())
+        server = self._server(other, {"access_token": "tok"})
+
+        assert build_mcp_auth_headers(server, other) == {"Authorization": "Bearer tok"}
+        assert len(get_mcp_auth_header_cache()) == 0
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted."""
+        from uuid import uuid4
+
+        from bsai.mcp.security import McpAuthHeaderCache
+
+        cache = McpAuthHeaderCache(max_size=1)
+        first = (uuid4(), "bearer", "h1")
+        second = (uuid4(), "bearer", "h2")
+        cache.put(first, {"Authorization": "Bearer a"})
+        cache.put(second, {"Authorization": "Bearer b"})
+
+        assert cache.lookup(first) == (False, None)
+        assert cache.lookup(second) == (True, {"Authorization": "Bearer b"})
+
+
+def _addr_info(*ips: str) -> list[tuple]:
+    """Build getaddrinfo-style results."""
+    import socket
+
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (ip, 0)) for ip in ips]
+
+
+class TestHostResolutionCache:
+    """Tests for cached, non-blocking hostname resolution."""
+
+    async def test_resolution_is_cached(self) -> None:
+        """Test that a second lookup within the TTL skips the resolver."""
+        from bsai.mcp.security import HostResolutionCache
+
+        cache = HostResolutionCache(ttl=60)
+        with patch("socket.getaddrinfo", return_value=_addr_info("93.184.216.34")) as lookup:
+            first = await cache.resolve("Example.com")
+            second = await cache.resolve("example.com")
+
+        assert first == second == ("93.184.216.34",)
+        lookup.assert_called_once()
+
+    async def test_failed_resolution_uses_negative_ttl(self) -> None:
+        """Test that NXDOMAIN is remembered only when a negative TTL is set."""
+        import socket
+
+        from bsai.mcp.security import HostResolutionCache
+
+        cache = HostResolutionCache(ttl=60, negative_ttl=0)
+        with patch("socket.getaddrinfo", side_effect=socket.gaierror("nx")):
+            assert await cache.resolve("missing.example") == ()
+
+        assert cache.get("missing.example") is None
+
+    def test_expired_entries_miss(self) -> None:
+        """Test that entries past their TTL are dropped."""
+        from bsai.mcp.security import HostResolutionCache
+
+        cache = HostResolutionCache(ttl=60)
+        cache.put("example.com", ("93.184.216.34",))
+
+        with patch("bsai.mcp.security.time.monotonic", return_value=float("inf")):
+            assert cache.get("example.com") is None
+        assert len(cache) == 0
+
+
+class TestResolveServerUrl:
+    """Tests for async SSRF validation and request pinning."""
+
+    def _validator(self, *ips: str):
+        from bsai.mcp.security import HostResolutionCache, McpSecurityValidator
+
+        resolver = HostResolutionCache()
+        resolver.put("api.example.com", tuple(ips))
+        return McpSecurityValidator(McpSettings(), resolver=resolver)
+
+    async def test_returns_validated_addresses(self) -> None:
+        """Test that the sanitized URL and addresses are returned."""
+        validator = self._validator("93.184.216.34")
+
+        resolved = await validator.resolve_server_url("https://api.example.com/x")
+
+        assert resolved.url == "https://api.example.com/x"
+        assert resolved.addresses == ("93.184.216.34",)
+
+    async def test_rejects_private_resolution(self) -> None:
+        """Test that a hostname resolving to a private IP is blocked."""
+        validator = self._validator("93.184.216.34", "10.0.0.5")
+
+        with pytest.raises(ValueError, match="private/internal"):
+            await validator.resolve_server_url("https://api.example.com")
+
+    async def test_request_is_pinned_to_validated_ip(self) -> None:
+        """Test that the request connects to the validated IP with the original host."""
+        from unittest.mock import AsyncMock
+
+        import httpx
+
+        from bsai.mcp.security import ssrf_safe_get
+
+        validator = self._validator("93.184.216.34")
+        with patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock) as request:
+            await ssrf_safe_get("https://api.example.com:8443/meta", validator)
+
+        method, url = request.call_args.args
+        assert method == "GET"
+        assert str(url) == "https://93.184.216.34:8443/meta"
+        assert request.call_args.kwargs["headers"]["Host"] == "api.example.com:8443"
+        assert request.call_args.kwargs["extensions"] == {"sni_hostname": "api.example.com"}
+
+    async def test_falls_back_to_next_address(self) -> None:
+        """Test that a connect failure tries the next validated address."""
+        from unittest.mock import AsyncMock
+
+        import httpx
+
+        from bsai.mcp.security import ssrf_safe_post
+
+        validator = self._validator("93.184.216.34", "93.184.216.35")
+        response = httpx.Response(200)
+        with patch.object(
+            httpx.AsyncClient,
+            "request",
+            new_callable=AsyncMock,
+            side_effect=[httpx.ConnectError("refused"), response],
+        ) as request:
+            result = await ssrf_safe_post("http://api.example.com/reg", validator, json_data={})
+
+        assert result is response
+        assert str(request.call_args.args[1]) == "http://93.184.216.35/reg"
+
+    async def test_raises_last_error_when_every_address_fails(self) -> None:
+        """Test that the last connect error is raised once all addresses failed."""
+        from unittest.mock import AsyncMock
+
+        import httpx
+
+        from bsai.mcp.security import ssrf_safe_get
+
+        validator = self._validator("93.184.216.34", "93.184.216.35")
+        with (
+            patch.object(
+                httpx.AsyncClient,
+                "request",
+                new_callable=AsyncMock,
+                side_effect=[httpx.ConnectError("refused"), httpx.ConnectError("timed out")],
+            ),
+            pytest.raises(httpx.ConnectError, match="timed out"),
+        ):
+            await ssrf_safe_get("https://api.example.com", validator)
+
+    async def test_unresolvable_host_does_not_connect(self) -> None:
+        """Test that an unresolved hostname is never requested unpinned."""
+        import httpx
+
+        from bsai.mcp.security import ssrf_safe_get
+
+        validator = self._validator()
+        with pytest.raises(httpx.ConnectError, match="Could not resolve"):
+            await ssrf_safe_get("https://api.example.com", validator)
@@ -242,17 +242,16 @@ class TestEpisodicMemoryRepository:
         mock_session: AsyncMock,
         sample_memory: EpisodicMemory,
     ) -> None:
-        """Test deleting a memory."""
-        # Mock get_by_id to return sample_memory
+        """Test deleting a memory with a single DELETE ... RETURNING."""
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_memory
+        mock_result.scalar_one_or_none.return_value = sample_memory.id
         mock_session.execute.return_value = mock_result
 
         result = await repository.delete(sample_memory.id)
 
         assert result is True
-        mock_session.delete.assert_called_once_with(sample_memory)
-        mock_session.flush.assert_called_once()
+        mock_session.execute.assert_called_once()
+        mock_session.delete.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_delete_nonexistent_memory(
@@ -0,0 +1,332 @@
+"""Tests for error classification and circuit breakers."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpx
+import litellm
+import pytest
+
+from bsai.api.config import CircuitBreakerSettings
+from bsai.llm.client import LiteLLMClient
+from bsai.llm.rate_limiter import LLMRateLimitTimeoutError
+from bsai.llm.schemas import ChatMessage, LLMRequest
+from bsai.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    ErrorClass,
+    classify_error,
+)
+
+
+class FakeClock:
+    """Wall clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Patch the breaker's clock."""
+    fake = FakeClock()
+    with patch("bsai.resilience.circuit_breaker.time.time", fake.time):
+        yield fake
+
+
+class FakeRedis:
+    """In-memory subset of redis.asyncio used by the circuit breaker."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: Any, nx: bool = False, px: int | None = None) -> bool:
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return int(self.values[key])
+
+    async def pexpire(self, key: str, ms: int) -> None:
+        return None
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues calls and runs them on execute()."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.calls: list[Any] = []
+
+    async def __aenter__(self) -> FakePipeline:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any, **kwargs: Any) -> None:
+            self.calls.append(getattr(self.redis, name)(*args, **kwargs))
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        return [await call for call in self.calls]
+
+
+def _settings(**overrides: Any) -> CircuitBreakerSettings:
+    values: dict[str, Any] = {
+        "enabled": True,
+        "failure_threshold": 2,
+        "recovery_timeout": 30.0,
+        **overrides,
+    }
+    return CircuitBreakerSettings(**values)
+
+
+def _shared_breakers() -> tuple[CircuitBreaker, CircuitBreaker]:
+    """Two breakers (workers) sharing one Redis."""
+    redis_client = MagicMock()
+    redis_client.is_connected = True
+    redis_client.client = FakeRedis()
+    return (
+        CircuitBreaker(redis_client, _settings()),
+        CircuitBreaker(redis_client, _settings()),
+    )
+
+
+async def _fail(breaker: CircuitBreaker, name: str, error: Exception) -> None:
+    with pytest.raises(type(error)):
+        async with breaker.guard(name):
+            raise error
+
+
+async def _succeed(breaker: CircuitBreaker, name: str) -> None:
+    async with breaker.guard(name):
+        pass
+
+
+def _api_error(cls: type[Exception], **kwargs: Any) -> Exception:
+    return cls(message="boom", llm_provider="openai", model="gpt-4o", **kwargs)
+
+
+class TestClassifyError:
+    """Tests for classify_error."""
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (_api_error(litellm.RateLimitError), ErrorClass.RETRYABLE),
+            (_api_error(litellm.Timeout), ErrorClass.RETRYABLE),
+            (_api_error(litellm.InternalServerError), ErrorClass.RETRYABLE),
+            (httpx.ConnectError("refused"), ErrorClass.RETRYABLE),
+            (TimeoutError(), ErrorClass.RETRYABLE),
+            (_api_error(litellm.ContextWindowExceededError), ErrorClass.FALLBACK),
+            (_api_error(litellm.AuthenticationError), ErrorClass.FALLBACK),
+            (_api_error(litellm.NotFoundError), ErrorClass.FALLBACK),
+            (CircuitOpenError("llm:gpt-4o", 10.0), ErrorClass.FALLBACK),
+            (LLMRateLimitTimeoutError("openai/gpt-4o", 30.0), ErrorClass.FALLBACK),
+            (_api_error(litellm.BadRequestError), ErrorClass.FATAL),
+            (ValueError("bad input"), ErrorClass.FATAL),
+            (ExceptionGroup("tg", [httpx.ReadTimeout("slow")]), ErrorClass.RETRYABLE),
+        ],
+    )
+    def test_classification(self, error: Exception, expected: ErrorClass) -> None:
+        """Test that errors map to retry, fallback or fail decisions."""
+        assert classify_error(error) is expected
+
+    @pytest.mark.parametrize(
+        ("status_code", "expected"),
+        [(503, ErrorClass.RETRYABLE), (429, ErrorClass.RETRYABLE), (401, ErrorClass.FALLBACK)],
+    )
+    def test_unknown_errors_use_status_code(self, status_code: int, expected: ErrorClass) -> None:
+        """Test that generic API errors are classified by HTTP status."""
+        error = litellm.APIError(
+            status_code=status_code, message="boom", llm_provider="openai", model="gpt-4o"
+        )
+
+        assert classify_error(error) is expected
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker with process-local state."""
+
+    async def test_opens_after_consecutive_transient_failures(self, clock: FakeClock) -> None:
+        """Test that the circuit opens at the threshold and then fails fast."""
+        breaker = CircuitBreaker(settings=_settings())
+        error = httpx.ConnectError("refused")
+
+        await _fail(breaker, "llm:gpt-4o", error)
+        assert await breaker.get_state("llm:gpt-4o") is CircuitState.CLOSED
+        await _fail(breaker, "llm:gpt-4o", error)
+        assert await breaker.get_state("llm:gpt-4o") is CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            await _succeed(breaker, "llm:gpt-4o")
+        assert exc_info.value.retry_after == pytest.approx(30.0)
+        # Other targets are unaffected
+        await _succeed(breaker, "llm:gpt-4o-mini")
+
+    async def test_success_and_non_transient_errors_do_not_trip(self, clock: FakeClock) -> None:
+        """Test that only consecutive transient failures count."""
+        breaker = CircuitBreaker(settings=_settings())
+
+        await _fail(breaker, "mcp:server", httpx.ConnectError("refused"))
+        await _succeed(breaker, "mcp:server")
+        await _fail(breaker, "mcp:server", httpx.ConnectError("refused"))
+        await _fail(breaker, "mcp:server", ValueError("bad arguments"))
+
+        assert await breaker.get_state("mcp:server") is CircuitState.CLOSED
+
+    async def test_half_open_probe(self, clock: FakeClock) -> None:
+        """Test that one probe is let through after the recovery timeout."""
+        breaker = CircuitBreaker(settings=_settings(failure_threshold=1))
+        await _fail(breaker, "llm:gpt-4o", httpx.ConnectError("refused"))
+
+        clock.now += 31
+        assert await breaker.get_state("llm:gpt-4o") is CircuitState.HALF_OPEN
+        # A failed probe reopens the circuit for another recovery period
+        await _fail(breaker, "llm:gpt-4o", httpx.ConnectError("refused"))
+        assert await breaker.get_state("llm:gpt-4o") is CircuitState.OPEN
+
+        clock.now += 31
+        probe_started = asyncio.Event()
+        release_probe = asyncio.Event()
+
+        async def probe() -> None:
+            async with breaker.guard("llm:gpt-4o"):
+                probe_started.set()
+                await release_probe.wait()
+
+        task = asyncio.create_task(probe())
+        await probe_started.wait()
+        # Only one caller probes; the others still fail fast
+        with pytest.raises(CircuitOpenError):
+            await _succeed(breaker, "llm:gpt-4o")
+
+        release_probe.set()
+        await task
+        assert await breaker.get_state("llm:gpt-4o") is CircuitState.CLOSED
+
+    async def test_cancelled_probe_lets_next_call_probe(self, clock: FakeClock) -> None:
+        """Test that a cancelled probe neither closes nor reopens the circuit."""
+        breaker = CircuitBreaker(settings=_settings(failure_threshold=1))
+        await _fail(breaker, "llm:gpt-4o", httpx.ConnectError("refused"))
+        clock.now += 31
+
+        async def probe() -> None:
+            async with breaker.guard("llm:gpt-4o"):
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(probe())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        await _succeed(breaker, "llm:gpt-4o")
+        assert await breaker.get_state("llm:gpt-4o") is CircuitState.CLOSED
+
+    async def test_state_is_shared_through_redis(self, clock: FakeClock) -> None:
+        """Test that failures seen by one worker open the circuit for all."""
+        worker_a, worker_b = _shared_breakers()
+
+        await _fail(worker_a, "llm:gpt-4o", httpx.ConnectError("refused"))
+        await _fail(worker_b, "llm:gpt-4o", httpx.ConnectError("refused"))
+
+        with pytest.raises(CircuitOpenError):
+            await _succeed(worker_a, "llm:gpt-4o")
+
+        clock.now += 31
+        await _succeed(worker_b, "llm:gpt-4o")
+        assert await worker_a.get_state("llm:gpt-4o") is CircuitState.CLOSED
+        assert worker_a._local == {}
+
+    async def test_redis_errors_let_calls_through(self) -> None:
+        """Test that a failing Redis does not block calls."""
+        redis_client = MagicMock()
+        redis_client.is_connected = True
+        redis_client.client.get = MagicMock(side_effect=ConnectionError("redis down"))
+        breaker = CircuitBreaker(redis_client, _settings())
+
+        await _succeed(breaker, "llm:gpt-4o")
+
+
+def _request() -> LLMRequest:
+    return LLMRequest(model="gpt-4o", messages=[ChatMessage(role="user", content="Hi")])
+
+
+class TestClientResilience:
+    """Tests for LiteLLMClient retries and circuit breaking."""
+
+    async def test_fatal_errors_are_not_retried(self) -> None:
+        """Test that a malformed request fails on the first attempt."""
+        client = LiteLLMClient()
+        error = _api_error(litellm.BadRequestError)
+
+        with (
+            patch("bsai.llm.client.litellm.acompletion", side_effect=error) as call,
+            pytest.raises(litellm.BadRequestError),
+        ):
+            await client.chat_completion(_request(), mcp_servers=[])
+
+        call.assert_called_once()
+
+    async def test_transient_errors_are_retried(self) -> None:
+        """Test that transient errors are retried before succeeding."""
+        client = LiteLLMClient()
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = "Hello"
+        response.choices[0].finish_reason = "stop"
+        response.usage.prompt_tokens = 8
+        response.usage.completion_tokens = 4
+        response.model = "gpt-4o"
+
+        with (
+            patch(
+                "bsai.llm.client.litellm.acompletion",
+                side_effect=[_api_error(litellm.ServiceUnavailableError), response],
+            ) as call,
+            patch("asyncio.sleep"),
+        ):
+            result = await client.chat_completion(_request(), mcp_servers=[])
+
+        assert result.content == "Hello"
+        assert call.call_count == 2
+
+    async def test_open_circuit_skips_provider(self) -> None:
+        """Test that calls to a model with an open circuit fail fast without retries."""
+        breaker = CircuitBreaker(settings=_settings(failure_threshold=1))
+        client = LiteLLMClient(circuit_breaker=breaker)
+        error = _api_error(litellm.InternalServerError)
+
+        with patch("bsai.llm.client.litellm.acompletion", side_effect=error) as call:
+            with pytest.raises(litellm.InternalServerError):
+                await LiteLLMClient.chat_completion.__wrapped__(  # type: ignore[attr-defined]
+                    client, _request(), mcp_servers=[]
+                )
+            with pytest.raises(CircuitOpenError):
+                await client.chat_completion(_request(), mcp_servers=[])
+
+        call.assert_called_once()
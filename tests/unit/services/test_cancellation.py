@@ -0,0 +1,142 @@
+"""Tests for event-driven task cancellation."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from bsai.graph.nodes import check_task_cancelled
+from bsai.services.cancellation import CancellationService, TaskCancelledError
+
+
+class FakePubSub:
+    """Minimal redis.asyncio PubSub stand-in delivering queued messages."""
+
+    def __init__(self, messages: list[dict[str, Any]]) -> None:
+        self.messages = messages
+        self.subscribe = AsyncMock()
+
+    async def __aenter__(self) -> "FakePubSub":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+    async def listen(self) -> AsyncIterator[dict[str, Any]]:
+        for message in self.messages:
+            yield message
+        await asyncio.Event().wait()
+
+
+def _redis(pubsub: FakePubSub | None = None) -> MagicMock:
+    redis = MagicMock()
+    redis.is_connected = True
+    redis.client.publish = AsyncMock()
+    redis.client.pubsub = MagicMock(return_value=pubsub)
+    return redis
+
+
+class TestCancellationService:
+    """Tests for CancellationService."""
+
+    async def test_run_returns_result(self) -> None:
+        """Test that uncancelled work completes normally."""
+        service = CancellationService()
+
+        async def work() -> str:
+            return "done"
+
+        assert await service.run(uuid4(), work()) == "done"
+
+    async def test_cancel_aborts_in_flight_work(self) -> None:
+        """Test that cancelling interrupts the awaited call immediately."""
+        service = CancellationService()
+        task_id = uuid4()
+        started = asyncio.Event()
+        interrupted = False
+
+        async def slow_llm_call() -> None:
+            nonlocal interrupted
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                interrupted = True
+                raise
+
+        runner = asyncio.create_task(service.run(task_id, slow_llm_call()))
+        await started.wait()
+        await service.cancel(task_id)
+
+        with pytest.raises(TaskCancelledError):
+            await asyncio.wait_for(runner, timeout=1)
+        assert interrupted is True
+
+    async def test_run_refuses_already_cancelled_task(self) -> None:
+        """Test that work never starts for a task cancelled before it ran."""
+        service = CancellationService()
+        task_id = uuid4()
+        service.register(task_id)
+        await service.cancel(task_id)
+        work = AsyncMock()
+
+        with pytest.raises(TaskCancelledError):
+            await service.run(task_id, work())
+
+    async def test_cancel_publishes_to_redis(self) -> None:
+        """Test that cancellations fan out to other processes."""
+        redis = _redis()
+        service = CancellationService(redis)
+        task_id = uuid4()
+
+        await service.cancel(task_id)
+
+        redis.client.publish.assert_awaited_once_with(CancellationService.CHANNEL, str(task_id))
+
+    async def test_listener_sets_local_token(self) -> None:
+        """Test that published cancellations reach tokens in this process."""
+        task_id = uuid4()
+        pubsub = FakePubSub(
+            [
+                {"type": "subscribe", "data": 1},
+                {"type": "message", "data": "not-a-uuid"},
+                {"type": "message", "data": str(task_id)},
+            ]
+        )
+        service = CancellationService(_redis(pubsub))
+        token = service.register(task_id)
+
+        await service.start()
+        try:
+            await asyncio.wait_for(token.wait(), timeout=1)
+            assert service.listening is True
+        finally:
+            await service.stop()
+
+        pubsub.subscribe.assert_awaited_once_with(CancellationService.CHANNEL)
+        assert service.listening is False
+
+
+class TestCheckTaskCancelledToken:
+    """Tests for token-based cancellation checks in nodes."""
+
+    async def test_uses_token_without_database(self) -> None:
+        """Test that a listening service answers without a DB query."""
+        service = CancellationService()
+        service._subscribed = True
+        task_id = uuid4()
+        service.register(task_id)
+        session = AsyncMock()
+
+        with (
+            patch("bsai.graph.nodes.get_cancellation_service", return_value=service),
+            patch("bsai.graph.nodes.TaskRepository") as repo_cls,
+        ):
+            assert await check_task_cancelled(session, task_id) is False
+            await service.cancel(task_id)
+            assert await check_task_cancelled(session, task_id) is True
+
+        repo_cls.assert_not_called()
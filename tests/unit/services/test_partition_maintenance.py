@@ -0,0 +1,60 @@
+"""Tests for the partition maintenance service."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from bsai.api.config import LogPartitionSettings
+from bsai.db.partitions import PartitionMaintenanceResult
+from bsai.services.partition_maintenance import PartitionMaintenanceService
+
+
+class TestPartitionMaintenanceService:
+    """Tests for PartitionMaintenanceService."""
+
+    @pytest.mark.asyncio
+    async def test_run_once_uses_settings(self) -> None:
+        """Test that a pass runs with the configured horizon and retention."""
+        service = PartitionMaintenanceService(
+            LogPartitionSettings(months_ahead=2, retention_months=6)
+        )
+        manager = MagicMock()
+        manager.session_factory.return_value.__aenter__ = AsyncMock(return_value="session")
+        manager.session_factory.return_value.__aexit__ = AsyncMock(return_value=None)
+        expected = PartitionMaintenanceResult(created=1)
+
+        with (
+            patch("bsai.services.partition_maintenance.get_session_manager", return_value=manager),
+            patch(
+                "bsai.services.partition_maintenance.maintain_log_partitions",
+                new_callable=AsyncMock,
+                return_value=expected,
+            ) as mock_maintain,
+        ):
+            result = await service.run_once()
+
+        assert result is expected
+        mock_maintain.assert_awaited_once_with("session", months_ahead=2, retention_months=6)
+
+    @pytest.mark.asyncio
+    async def test_run_once_swallows_errors(self) -> None:
+        """Test that a failing pass does not stop the loop."""
+        service = PartitionMaintenanceService(LogPartitionSettings())
+
+        with patch(
+            "bsai.services.partition_maintenance.get_session_manager",
+            side_effect=RuntimeError("Database not initialized"),
+        ):
+            assert await service.run_once() is None
+
+    @pytest.mark.asyncio
+    async def test_disabled_service_does_not_start(self) -> None:
+        """Test that maintenance can be turned off."""
+        service = PartitionMaintenanceService(LogPartitionSettings(enabled=False))
+
+        await service.start()
+
+        assert service._runner is None
+        await service.stop()
@@ -0,0 +1,142 @@
+"""Tests for QARunner."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from bsai.llm.schemas import BuildResult, LintResult, QAConfig, TypecheckResult
+from bsai.llm.schemas import TestResult as QATestResult
+from bsai.services import qa_runner
+from bsai.services.qa_runner import QARunner
+
+
+@pytest.fixture(autouse=True)
+def reset_semaphores() -> None:
+    """Give each test a fresh subprocess limiter."""
+    qa_runner._command_semaphores.clear()
+
+
+def _lint(success: bool = True) -> LintResult:
+    return LintResult(success=success, errors=0 if success else 1, warnings=0, output="")
+
+
+def _typecheck(success: bool = True) -> TypecheckResult:
+    return TypecheckResult(success=success, errors=0 if success else 1, output="")
+
+
+def _build(success: bool = True) -> BuildResult:
+    return BuildResult(success=success, output="", error_message=None if success else "boom")
+
+
+class TestRunAllValidations:
+    """Tests for concurrent validation execution."""
+
+    async def test_runs_validations_concurrently(self) -> None:
+        """Test that configured validations overlap instead of running back to back."""
+        runner = QARunner(QAConfig(validations=["static", "lint", "typecheck"]))
+
+        async def slow_lint() -> LintResult:
+            await asyncio.sleep(0.2)
+            return _lint()
+
+        async def slow_typecheck() -> TypecheckResult:
+            await asyncio.sleep(0.2)
+            return _typecheck()
+
+        with (
+            patch.object(runner, "run_lint", slow_lint),
+            patch.object(runner, "run_typecheck", slow_typecheck),
+        ):
+            start = time.monotonic()
+            results = await runner.run_all_validations()
+            elapsed = time.monotonic() - start
+
+        assert list(results) == ["lint", "typecheck"]
+        assert all(r is not None and r.success for r in results.values())
+        assert elapsed < 0.35
+
+    async def test_blocking_failure_cancels_remaining(self) -> None:
+        """Test that a failed blocking validation cancels the others."""
+        runner = QARunner(QAConfig(validations=["build", "test"], blocking_validations=["build"]))
+        test_cancelled = asyncio.Event()
+
+        async def failing_build() -> BuildResult:
+            return _build(success=False)
+
+        async def slow_test() -> QATestResult:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                test_cancelled.set()
+                raise
+            raise AssertionError("unreachable")
+
+        with (
+            patch.object(runner, "run_build", failing_build),
+            patch.object(runner, "run_test", slow_test),
+        ):
+            results = await asyncio.wait_for(runner.run_all_validations(), timeout=2)
+
+        assert results["build"] is not None
+        assert results["build"].success is False
+        assert results["test"] is None
+        assert test_cancelled.is_set()
+
+    async def test_non_blocking_failure_keeps_running(self) -> None:
+        """Test that a non-blocking failure lets the other validations finish."""
+        runner = QARunner(QAConfig(validations=["lint", "build"], blocking_validations=["build"]))
+
+        async def failing_lint() -> LintResult:
+            return _lint(success=False)
+
+        async def slow_build() -> BuildResult:
+            await asyncio.sleep(0.05)
+            return _build()
+
+        with (
+            patch.object(runner, "run_lint", failing_lint),
+            patch.object(runner, "run_build", slow_build),
+        ):
+            results = await runner.run_all_validations()
+
+        assert results["lint"] is not None and results["lint"].success is False
+        assert results["build"] is not None and results["build"].success is True
+
+
+class TestRunCommand:
+    """Tests for subprocess execution."""
+
+    async def test_captures_output(self) -> None:
+        """Test that stdout and return code are captured."""
+        runner = QARunner(QAConfig())
+
+        result = await runner._run_command("echo hello")
+
+        assert result.success is True
+        assert result.stdout.strip() == "hello"
+
+    async def test_timeout_kills_process(self) -> None:
+        """Test that a timed-out command is reported and killed."""
+        runner = QARunner(QAConfig())
+
+        start = time.monotonic()
+        result = await runner._run_command("sleep 5", timeout=0.2)  # type: ignore[arg-type]
+
+        assert result.success is False
+        assert "timed out" in result.stderr
+        assert time.monotonic() - start < 2
+
+    async def test_concurrency_is_limited(self) -> None:
+        """Test that at most qa_max_concurrent_commands subprocesses run at once."""
+        runner = QARunner(QAConfig())
+        qa_runner._command_semaphores[asyncio.get_running_loop()] = asyncio.Semaphore(1)
+
+        start = time.monotonic()
+        await asyncio.gather(
+            runner._run_command("sleep 0.2"),
+            runner._run_command("sleep 0.2"),
+        )
+
+        assert time.monotonic() - start >= 0.4
@@ -0,0 +1,188 @@
+"""Tests for incremental QA scoping."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from bsai.llm.schemas import QAConfig
+from bsai.services.qa_runner import QARunner
+from bsai.services.qa_scope import IncrementalReport, ValidationScope, compute_scope
+from bsai.services.qa_workspace import QAWorkspace, QAWorkspaceManager
+
+PYTHON_PROJECT = {
+    "src/app/models.py": "class User: ...\n",
+    "src/app/service.py": "from app.models import User\n",
+    "src/app/api.py": "from .service import handler\n",
+    "src/app/unrelated.py": "import os\n",
+    "tests/test_service.py": "from app import service\n",
+    "tests/test_unrelated.py": "from app.unrelated import x\n",
+    "README.md": "# app",
+}
+
+
+def _artifact(full_path: str, content: str) -> MagicMock:
+    path, _, filename = full_path.rpartition("/")
+    artifact = MagicMock()
+    artifact.path = path
+    artifact.filename = filename
+    artifact.content = content
+    return artifact
+
+
+async def _workspace(tmp_path: Path, files: dict[str, str]) -> QAWorkspace:
+    manager = QAWorkspaceManager(root=tmp_path)
+    return await manager.materialize(uuid4(), [_artifact(p, c) for p, c in files.items()])
+
+
+class TestComputeScope:
+    """Tests for compute_scope."""
+
+    async def test_python_dependents_are_transitive(self, tmp_path: Path) -> None:
+        """Test that importers of importers are in scope."""
+        workspace = await _workspace(tmp_path, PYTHON_PROJECT)
+
+        scope = await compute_scope(QAConfig(), "python", workspace, ["src/app/models.py"], [])
+
+        assert scope.full_run is False
+        assert scope.changed == ("src/app/models.py",)
+        assert scope.dependents == (
+            "src/app/api.py",
+            "src/app/service.py",
+            "tests/test_service.py",
+        )
+
+    async def test_deleted_module_pulls_in_importers(self, tmp_path: Path) -> None:
+        """Test that files importing a deleted module are checked."""
+        files = {k: v for k, v in PYTHON_PROJECT.items() if k != "src/app/unrelated.py"}
+        workspace = await _workspace(tmp_path, files)
+
+        scope = await compute_scope(QAConfig(), "python", workspace, [], ["src/app/unrelated.py"])
+
+        assert scope.deleted == ("src/app/unrelated.py",)
+        assert scope.dependents == ("tests/test_unrelated.py",)
+
+    async def test_javascript_relative_imports(self, tmp_path: Path) -> None:
+        """Test that relative JS imports resolve to workspace files."""
+        workspace = await _workspace(
+            tmp_path,
+            {
+                "src/util.ts": "export const x = 1\n",
+                "src/index.ts": "import { x } from './util'\n",
+                "src/other.ts": "export {}\n",
+            },
+        )
+
+        scope = await compute_scope(QAConfig(), "typescript", workspace, ["src/util.ts"], [])
+
+        assert scope.dependents == ("src/index.ts",)
+
+    @pytest.mark.parametrize(
+        ("config", "changed", "reason"),
+        [
+            (QAConfig(incremental=False), ["src/app/models.py"], "disabled"),
+            (QAConfig(), None, "unknown"),
+            (QAConfig(), [], "no changed files"),
+            (QAConfig(), ["pyproject.toml"], "configuration changed"),
+            (QAConfig(), ["tests/conftest.py"], "configuration changed"),
+            (QAConfig(incremental_max_files=2), ["src/app/models.py"], "exceed limit"),
+        ],
+    )
+    async def test_full_run_fallbacks(
+        self,
+        tmp_path: Path,
+        config: QAConfig,
+        changed: list[str] | None,
+        reason: str,
+    ) -> None:
+        """Test the conditions that fall back to a full run."""
+        workspace = await _workspace(tmp_path, PYTHON_PROJECT)
+
+        scope = await compute_scope(config, "python", workspace, changed, [])
+
+        assert scope.full_run is True
+        assert scope.reason is not None and reason in scope.reason
+
+    async def test_documentation_changes_are_ignored(self, tmp_path: Path) -> None:
+        """Test that documentation does not force a full run."""
+        workspace = await _workspace(tmp_path, PYTHON_PROJECT)
+
+        scope = await compute_scope(QAConfig(), "python", workspace, ["README.md"], [])
+
+        assert scope.full_run is False
+        assert scope.files_for("lint", "python") == []
+
+
+class TestValidationScope:
+    """Tests for per-validation file selection."""
+
+    scope = ValidationScope(
+        full_run=False,
+        changed=("src/app/models.py", "README.md"),
+        dependents=("src/app/service.py", "tests/test_service.py"),
+    )
+
+    def test_lint_uses_changed_sources_only(self) -> None:
+        """Test that lint skips dependents and non-source files."""
+        assert self.scope.files_for("lint", "python") == ["src/app/models.py"]
+
+    def test_typecheck_includes_dependents(self) -> None:
+        """Test that typecheck covers importers."""
+        assert self.scope.files_for("typecheck", "python") == [
+            "src/app/models.py",
+            "src/app/service.py",
+            "tests/test_service.py",
+        ]
+
+    def test_test_selects_test_files(self) -> None:
+        """Test that only test modules are passed to pytest."""
+        assert self.scope.files_for("test", "python") == ["tests/test_service.py"]
+
+    def test_unscopable_validations_run_in_full(self) -> None:
+        """Test that build and TS typecheck are never narrowed."""
+        assert self.scope.files_for("build", "python") is None
+        assert self.scope.files_for("typecheck", "typescript") is None
+
+    def test_summary_reports_time_saved(self) -> None:
+        """Test the summary line of an incremental report."""
+        report = IncrementalReport(
+            scope=self.scope, modes={"lint": "incremental"}, time_saved_seconds=4.25
+        )
+
+        line = report.summary_line()
+
+        assert "incremental (2 changed, 0 deleted, 2 dependent files)" in line
+        assert "lint incremental" in line
+        assert "~4.2s saved" in line
+
+
+class TestRunnerScopedCommands:
+    """Tests for QARunner command narrowing."""
+
+    def test_default_command_is_narrowed(self) -> None:
+        """Test that default commands receive the scoped file list."""
+        scope = ValidationScope(full_run=False, changed=("src/a b.py",))
+        runner = QARunner(QAConfig(validations=["lint"]), scope=scope)
+
+        assert runner._resolve_command("lint") == "ruff check 'src/a b.py'"
+        assert runner.modes["lint"] == "incremental"
+
+    def test_custom_command_runs_in_full(self) -> None:
+        """Test that user-configured commands are never rewritten."""
+        scope = ValidationScope(full_run=False, changed=("src/a.py",))
+        runner = QARunner(QAConfig(lint_command="make lint"), scope=scope)
+
+        assert runner._resolve_command("lint") == "make lint"
+        assert runner.modes["lint"] == "full"
+
+    async def test_nothing_affected_skips_validation(self) -> None:
+        """Test that a validation with no affected files succeeds without running."""
+        scope = ValidationScope(full_run=False, changed=("src/a.py",))
+        runner = QARunner(QAConfig(validations=["test"]), scope=scope)
+
+        result = await runner.run_test()
+
+        assert result.success is True
+        assert result.output == QARunner.SKIPPED_OUTPUT
+        assert runner.modes["test"] == "skipped"
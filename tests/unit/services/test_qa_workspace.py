@@ -0,0 +1,165 @@
+"""Tests for QA workspaces and the validation result cache."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from bsai.llm.schemas import QAConfig
+from bsai.services.qa_runner import CommandResult, QARunner
+from bsai.services.qa_workspace import QAResultCache, QAWorkspaceManager
+
+
+def _artifact(filename: str, content: str, path: str = "") -> MagicMock:
+    artifact = MagicMock()
+    artifact.filename = filename
+    artifact.path = path
+    artifact.content = content
+    return artifact
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> QAWorkspaceManager:
+    """Create a workspace manager rooted in a temp directory."""
+    return QAWorkspaceManager(root=tmp_path, max_workspaces=2)
+
+
+class TestQAWorkspaceManager:
+    """Tests for QAWorkspaceManager."""
+
+    async def test_materializes_snapshot(self, manager: QAWorkspaceManager) -> None:
+        """Test that artifacts are written under the task directory."""
+        task_id = uuid4()
+
+        workspace = await manager.materialize(
+            task_id,
+            [_artifact("main.py", "print(1)\n", "src"), _artifact("README.md", "# hi")],
+        )
+
+        assert workspace.path == manager.workspace_path(task_id)
+        assert (workspace.path / "src" / "main.py").read_text() == "print(1)\n"
+        assert (workspace.path / "README.md").read_text() == "# hi"
+        assert set(workspace.file_hashes) == {"src/main.py", "README.md"}
+
+    async def test_unchanged_files_are_not_rewritten(self, manager: QAWorkspaceManager) -> None:
+        """Test that only files whose content hash changed are written."""
+        task_id = uuid4()
+        await manager.materialize(task_id, [_artifact("a.py", "a"), _artifact("b.py", "b")])
+        untouched = manager.workspace_path(task_id) / "a.py"
+        mtime = untouched.stat().st_mtime_ns
+
+        with patch.object(Path, "write_text", autospec=True, side_effect=Path.write_text) as write:
+            await manager.materialize(task_id, [_artifact("a.py", "a"), _artifact("b.py", "b2")])
+
+        assert [call.args[0].name for call in write.call_args_list] == ["b.py"]
+        assert untouched.stat().st_mtime_ns == mtime
+
+    async def test_removed_files_are_deleted(self, manager: QAWorkspaceManager) -> None:
+        """Test that files that left the snapshot are deleted."""
+        task_id = uuid4()
+        await manager.materialize(task_id, [_artifact("a.py", "a"), _artifact("old.py", "x")])
+
+        workspace = await manager.materialize(task_id, [_artifact("a.py", "a")])
+
+        assert not (workspace.path / "old.py").exists()
+        assert (workspace.path / "a.py").exists()
+
+    async def test_snapshot_hash_tracks_content(self, manager: QAWorkspaceManager) -> None:
+        """Test that the snapshot hash only changes when content changes."""
+        task_id = uuid4()
+        first = await manager.materialize(task_id, [_artifact("a.py", "a")])
+        same = await manager.materialize(task_id, [_artifact("a.py", "a")])
+        changed = await manager.materialize(task_id, [_artifact("a.py", "b")])
+
+        assert first.snapshot_hash == same.snapshot_hash
+        assert first.snapshot_hash != changed.snapshot_hash
+
+    async def test_rejects_paths_outside_workspace(
+        self, manager: QAWorkspaceManager, tmp_path: Path
+    ) -> None:
+        """Test that traversal paths are skipped."""
+        task_id = uuid4()
+
+        workspace = await manager.materialize(
+            task_id,
+            [_artifact("evil.py", "x", "../../outside"), _artifact("ok.py", "y")],
+        )
+
+        assert list(workspace.file_hashes) == ["ok.py"]
+        assert not (tmp_path.parent / "outside").exists()
+
+    async def test_evicts_least_recently_used(self, manager: QAWorkspaceManager) -> None:
+        """Test that workspaces beyond max_workspaces are removed."""
+        task_ids = [uuid4() for _ in range(3)]
+        for task_id in task_ids:
+            await manager.materialize(task_id, [_artifact("a.py", "a")])
+
+        assert not manager.workspace_path(task_ids[0]).exists()
+        assert manager.workspace_path(task_ids[2]).exists()
+
+
+class TestQAResultCache:
+    """Tests for QAResultCache."""
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted."""
+        cache = QAResultCache(max_size=2)
+        result = CommandResult(success=True, stdout="", stderr="", return_code=0)
+        cache.put(("h", "lint", "a"), result)
+        cache.put(("h", "lint", "b"), result)
+        cache.get(("h", "lint", "a"))
+        cache.put(("h", "lint", "c"), result)
+
+        assert cache.get(("h", "lint", "a")) is result
+        assert cache.get(("h", "lint", "b")) is None
+        assert len(cache) == 2
+
+
+class TestRunnerWorkspace:
+    """Tests for QARunner running inside a workspace."""
+
+    async def test_runs_in_workspace_and_caches_result(self, manager: QAWorkspaceManager) -> None:
+        """Test that commands run in the workspace and identical snapshots reuse results."""
+        workspace = await manager.materialize(uuid4(), [_artifact("marker.txt", "x")])
+        config = QAConfig(validations=["lint"], lint_command="ls")
+        runner = QARunner(config, workspace=workspace, result_cache=manager.result_cache)
+
+        first = await runner.run_lint()
+        assert "marker.txt" in first.output
+
+        with patch.object(QARunner, "_run_command", new_callable=AsyncMock) as run:
+            again = QARunner(config, workspace=workspace, result_cache=manager.result_cache)
+            second = await again.run_lint()
+
+        run.assert_not_called()
+        assert second.output == first.output
+
+    async def test_changed_snapshot_misses_cache(self, manager: QAWorkspaceManager) -> None:
+        """Test that a different snapshot hash re-runs the command."""
+        task_id = uuid4()
+        config = QAConfig(validations=["lint"], lint_command="ls")
+        first = await manager.materialize(task_id, [_artifact("a.txt", "a")])
+        await QARunner(config, workspace=first, result_cache=manager.result_cache).run_lint()
+
+        second = await manager.materialize(task_id, [_artifact("a.txt", "changed")])
+        with patch.object(
+            QARunner,
+            "_run_command",
+            new_callable=AsyncMock,
+            return_value=CommandResult(success=True, stdout="", stderr="", return_code=0),
+        ) as run:
+            await QARunner(config, workspace=second, result_cache=manager.result_cache).run_lint()
+
+        run.assert_awaited_once()
+
+    async def test_timeouts_are_not_cached(self, manager: QAWorkspaceManager) -> None:
+        """Test that failed launches and timeouts are retried next time."""
+        workspace = await manager.materialize(uuid4(), [_artifact("a.txt", "a")])
+        runner = QARunner(QAConfig(), workspace=workspace, result_cache=manager.result_cache)
+        timed_out = CommandResult(success=False, stdout="", stderr="timed out", return_code=-1)
+
+        with patch.object(runner, "_run_command", AsyncMock(return_value=timed_out)):
+            await runner._run_validation_command("test", "pytest")
+
+        assert len(manager.result_cache) == 0
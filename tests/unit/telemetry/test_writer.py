@@ -0,0 +1,240 @@
+"""Telemetry writer tests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from bsai.telemetry import TelemetryWriter, get_telemetry_context, telemetry_context
+
+
+@pytest.fixture
+def mock_session() -> MagicMock:
+    """Create mock flush session usable as an async context manager."""
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+    return session
+
+
+@pytest.fixture
+async def writer(mock_session: MagicMock) -> AsyncIterator[TelemetryWriter]:
+    """Create a running writer that only flushes when asked."""
+    telemetry = TelemetryWriter(
+        session_factory=lambda: mock_session,
+        flush_at=1000,
+        flush_interval=60.0,
+    )
+    telemetry.start()
+    yield telemetry
+    await telemetry.close()
+
+
+def _record_call(writer: TelemetryWriter, **overrides: object) -> None:
+    kwargs: dict[str, object] = {
+        "session_id": uuid4(),
+        "agent_type": "worker",
+        "provider": "openai",
+        "model": "gpt-4o",
+        "input_tokens": 100,
+        "output_tokens": 50,
+        "cost_usd": Decimal("0.01"),
+        "latency_ms": 420,
+    }
+    kwargs.update(overrides)
+    writer.record_llm_call(**kwargs)  # type: ignore[arg-type]
+
+
+class TestRecording:
+    """Tests for buffering records."""
+
+    def test_ignores_records_when_not_running(self) -> None:
+        """Records are dropped if the writer was never started."""
+        telemetry = TelemetryWriter(session_factory=MagicMock())
+
+        _record_call(telemetry)
+        step_id = telemetry.start_step(task_id=uuid4(), agent_type="worker")
+
+        assert step_id is None
+        assert telemetry.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_buffers_without_touching_database(
+        self,
+        writer: TelemetryWriter,
+        mock_session: MagicMock,
+    ) -> None:
+        """Recording only buffers; nothing is executed until flush."""
+        _record_call(writer)
+        writer.start_step(task_id=uuid4(), agent_type="worker")
+
+        assert writer.pending == 2
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_complete_before_flush_merges_into_insert(self, writer: TelemetryWriter) -> None:
+        """A step completed before flush stays a single pending insert."""
+        step_id = writer.start_step(task_id=uuid4(), agent_type="qa")
+        writer.complete_step(step_id, input_tokens=10, output_tokens=5)
+
+        assert writer.pending == 1
+        row = writer._step_inserts[step_id]  # noqa: SLF001
+        assert row["status"] == "completed"
+        assert row["input_tokens"] == 10
+        assert row["duration_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_complete_with_error_marks_failed(self, writer: TelemetryWriter) -> None:
+        """Steps completed with an error are marked failed."""
+        step_id = writer.start_step(task_id=uuid4(), agent_type="qa")
+        writer.complete_step(step_id, error_message="boom")
+
+        assert writer._step_inserts[step_id]["status"] == "failed"  # noqa: SLF001
+
+    @pytest.mark.asyncio
+    async def test_drops_records_when_buffer_full(self, mock_session: MagicMock) -> None:
+        """New records are dropped once max_buffer_size is reached."""
+        telemetry = TelemetryWriter(
+            session_factory=lambda: mock_session,
+            flush_at=1000,
+            flush_interval=60.0,
+            max_buffer_size=2,
+        )
+        telemetry.start()
+        try:
+            for _ in range(3):
+                _record_call(telemetry)
+            assert telemetry.pending == 2
+            assert telemetry.dropped == 1
+        finally:
+            await telemetry.close()
+
+
+class TestFlush:
+    """Tests for flushing buffered records."""
+
+    @pytest.mark.asyncio
+    async def test_flush_uses_one_statement_per_table(
+        self,
+        writer: TelemetryWriter,
+        mock_session: MagicMock,
+    ) -> None:
+        """All usage rows go out in one multi-row INSERT."""
+        for _ in range(5):
+            _record_call(writer)
+        writer.start_step(task_id=uuid4(), agent_type="worker")
+
+        await writer.flush()
+
+        # usage INSERT + step INSERT (no updates pending)
+        assert mock_session.execute.await_count == 2
+        usage_stmt = mock_session.execute.await_args_list[0].args[0]
+        assert usage_stmt.table.name == "llm_usage_logs"
+        assert len(usage_stmt._multi_values[0]) == 5  # noqa: SLF001
+        mock_session.commit.assert_awaited_once()
+        assert writer.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_completion_after_flush_becomes_update(
+        self,
+        writer: TelemetryWriter,
+        mock_session: MagicMock,
+    ) -> None:
+        """Completing an already-flushed step issues a bulk UPDATE."""
+        step_id = writer.start_step(task_id=uuid4(), agent_type="worker")
+        created_at = writer._step_inserts[step_id]["created_at"]  # noqa: SLF001
+        await writer.flush()
+        mock_session.execute.reset_mock()
+
+        writer.complete_step(step_id, output_tokens=7)
+        await writer.flush()
+
+        mock_session.execute.assert_awaited_once()
+        rows = mock_session.execute.await_args.args[1]
+        assert rows[0]["b_id"] == step_id
+        assert rows[0]["b_created_at"] == created_at
+        assert rows[0]["output_tokens"] == 7
+
+    @pytest.mark.asyncio
+    async def test_flush_failure_is_swallowed(
+        self,
+        writer: TelemetryWriter,
+        mock_session: MagicMock,
+    ) -> None:
+        """Database errors are logged, never raised to callers."""
+        mock_session.execute.side_effect = RuntimeError("db down")
+        _record_call(writer)
+
+        await writer.flush()
+
+        assert writer.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_size_threshold_triggers_background_flush(self, mock_session: MagicMock) -> None:
+        """Reaching flush_at wakes the background flusher."""
+        telemetry = TelemetryWriter(
+            session_factory=lambda: mock_session,
+            flush_at=2,
+            flush_interval=60.0,
+        )
+        telemetry.start()
+        try:
+            _record_call(telemetry)
+            _record_call(telemetry)
+            for _ in range(10):
+                await asyncio.sleep(0)
+            mock_session.commit.assert_awaited_once()
+        finally:
+            await telemetry.close()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_remaining(self, mock_session: MagicMock) -> None:
+        """close() writes whatever is still buffered."""
+        telemetry = TelemetryWriter(session_factory=lambda: mock_session, flush_interval=60.0)
+        telemetry.start()
+        _record_call(telemetry)
+
+        await telemetry.close()
+
+        mock_session.commit.assert_awaited_once()
+        assert not telemetry.is_running
+
+
+class TestTelemetryContext:
+    """Tests for telemetry context propagation."""
+
+    def test_context_is_scoped(self) -> None:
+        """Context is set inside the block and reset afterwards."""
+        session_id = uuid4()
+        assert get_telemetry_context() is None
+
+        with telemetry_context(session_id=session_id, agent_type="qa") as ctx:
+            assert get_telemetry_context() is ctx
+            assert ctx.session_id == session_id
+
+        assert get_telemetry_context() is None
+
+
+class TestLifecycle:
+    """Tests for init/close helpers."""
+
+    @pytest.mark.asyncio
+    async def test_init_respects_enabled_setting(self) -> None:
+        """init_telemetry does not start the writer when disabled."""
+        from bsai.telemetry import close_telemetry, init_telemetry
+
+        with patch("bsai.telemetry.writer.get_telemetry_settings") as mock_settings:
+            mock_settings.return_value = MagicMock(
+                enabled=False, flush_at=10, flush_interval=1.0, max_buffer_size=100
+            )
+            await close_telemetry()
+            writer = init_telemetry()
+            assert not writer.is_running
+            await close_telemetry()
@@ -0,0 +1,100 @@
+"""Serialization tests."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from decimal import Decimal
+from enum import StrEnum
+from uuid import UUID
+
+import orjson
+import pytest
+from pydantic import BaseModel
+
+from bsai.serialization import FastJSONResponse, dumps, dumps_model, dumps_str, loads
+
+
+class Color(StrEnum):
+    RED = "red"
+
+
+class Item(BaseModel):
+    id: UUID
+    created_at: datetime
+    tags: list[str]
+
+
+ITEM_ID = UUID("12345678-1234-5678-1234-567812345678")
+CREATED_AT = datetime(2026, 10, 19, 12, 30, tzinfo=UTC)
+
+
+class TestDumps:
+    """Tests for dumps/loads."""
+
+    def test_round_trip(self) -> None:
+        """Values survive a dumps/loads round trip."""
+        value = {"messages": [{"role": "user", "content": "héllo"}], "count": 2, "ok": None}
+
+        assert loads(dumps(value)) == value
+
+    def test_matches_standard_library_content(self) -> None:
+        """Output parses to the same value as json.dumps output."""
+        value = {"a": [1, 2.5, True], "b": {"c": "ü"}, 3: "int key"}
+
+        assert json.loads(dumps(value)) == json.loads(json.dumps(value))
+
+    def test_native_types(self) -> None:
+        """Datetimes, UUIDs and enums are serialized natively."""
+        data = loads(dumps({"at": CREATED_AT, "id": ITEM_ID, "color": Color.RED}))
+
+        assert data == {
+            "at": "2026-10-19T12:30:00+00:00",
+            "id": str(ITEM_ID),
+            "color": "red",
+        }
+
+    def test_fallback_types(self) -> None:
+        """Pydantic models dump in JSON mode, other types fall back to str()."""
+        item = Item(id=ITEM_ID, created_at=CREATED_AT, tags=["x"])
+
+        data = loads(dumps({"item": item, "amount": Decimal("1.50")}))
+
+        assert data["item"] == item.model_dump(mode="json")
+        assert data["amount"] == "1.50"
+
+    def test_dumps_str(self) -> None:
+        """dumps_str returns compact text."""
+        assert dumps_str({"a": [1, 2]}) == '{"a":[1,2]}'
+
+    def test_loads_accepts_text(self) -> None:
+        """loads parses str as returned by a decoding Redis client."""
+        assert loads('{"a": 1}') == {"a": 1}
+
+    def test_loads_invalid(self) -> None:
+        """Invalid JSON raises a ValueError."""
+        with pytest.raises(ValueError):
+            loads("{not json")
+        assert issubclass(orjson.JSONDecodeError, ValueError)
+
+
+class TestDumpsModel:
+    """Tests for dumps_model."""
+
+    def test_matches_model_dump(self) -> None:
+        """Encoded model equals its JSON-mode dump."""
+        item = Item(id=ITEM_ID, created_at=CREATED_AT, tags=["a", "b"])
+
+        assert json.loads(dumps_model(item)) == item.model_dump(mode="json")
+
+
+class TestFastJSONResponse:
+    """Tests for FastJSONResponse."""
+
+    def test_renders_with_orjson(self) -> None:
+        """Body is compact JSON with the JSON media type."""
+        response = FastJSONResponse({"at": CREATED_AT, "ok": True}, status_code=201)
+
+        assert response.status_code == 201
+        assert response.media_type == "application/json"
+        assert response.body == b'{"at":"2026-10-19T12:30:00+00:00","ok":true}'